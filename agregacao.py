@@ -0,0 +1,269 @@
+"""
+Agregados pré-binados de um lote de jogos (entrada leve para os gráficos).
+"""
+
+from dataclasses import dataclass, field
+from math import ceil
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import LOTTERY_CONFIG
+from core import GameResult
+from estendidos import tamanhos_aposta
+from padroes import colunas_por_linha
+from precomputo import tabelas_numeros
+
+# Quantidade aproximada de barras no histograma de somas
+BINS_SOMA = 30
+
+
+def faixa_soma(tipo: str, qtd: Optional[int] = None) -> Tuple[int, int]:
+    """
+    Menor e maior soma possíveis de um jogo da loteria.
+
+    Args:
+        tipo: Tipo de loteria.
+        qtd: Números do jogo (padrão: qtd_selecionados).
+
+    Returns:
+        Tupla (soma mínima, soma máxima).
+    """
+    config = LOTTERY_CONFIG[tipo]
+    k = config["qtd_selecionados"] if qtd is None else qtd
+    n = config["max_numero"]
+    return k * (k + 1) // 2, k * (2 * n - k + 1) // 2
+
+
+@dataclass
+class AgregadoLote:
+    """
+    Contagens de um lote, atualizadas em uma passada por jogo.
+
+    As tabelas começam dimensionadas para jogos de qtd_selecionados números
+    (a largura dos bins de soma vem desse tamanho) e crescem ao receber uma
+    aposta estendida, até max_selecionados.
+    """
+
+    tipo: str
+    total: int = 0
+    soma_total: int = 0
+    numeros_total: int = 0
+    capacidade: int = 0
+    largura_bin: int = 1
+    soma_minima: int = 0
+    histograma_soma: List[int] = field(default_factory=list)
+    pares: List[int] = field(default_factory=list)
+    primos: List[int] = field(default_factory=list)
+    fibo: List[int] = field(default_factory=list)
+    frequencia: List[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        config = LOTTERY_CONFIG[self.tipo]
+        k, n = config["qtd_selecionados"], config["max_numero"]
+        minima, maxima = faixa_soma(self.tipo)
+        self.soma_minima = minima
+        self.largura_bin = max(1, ceil((maxima - minima + 1) / BINS_SOMA))
+        bins = (maxima - minima) // self.largura_bin + 1
+        self.histograma_soma = self.histograma_soma or [0] * bins
+        self.pares = self.pares or [0] * (k + 1)
+        self.primos = self.primos or [0] * (k + 1)
+        self.fibo = self.fibo or [0] * (k + 1)
+        self.frequencia = self.frequencia or [0] * (n + 1)
+        self.capacidade = self.capacidade or k
+        self._tamanhos = tamanhos_aposta(self.tipo)
+        # Tabelas por número: evitam testes de pertinência no laço
+        tabelas = tabelas_numeros(self.tipo)
+        self._par = tabelas["par"]
+        self._primo = tabelas["primo"]
+        self._fibo = tabelas["fibo"]
+
+    def _crescer(self, qtd: int) -> None:
+        """
+        Estender as tabelas para jogos de `qtd` números.
+
+        Raises:
+            ValueError: Se `qtd` não for um tamanho de aposta da loteria.
+        """
+        if qtd not in self._tamanhos:
+            raise ValueError(
+                f"Jogo de {qtd} números fora dos tamanhos de aposta da "
+                f"{self.tipo} ({self._tamanhos.start} a {self._tamanhos.stop - 1})"
+            )
+        if qtd <= self.capacidade:
+            return
+        _, maxima = faixa_soma(self.tipo, qtd)
+        bins = (maxima - self.soma_minima) // self.largura_bin + 1
+        self.histograma_soma += [0] * (bins - len(self.histograma_soma))
+        for contagens in (self.pares, self.primos, self.fibo):
+            contagens += [0] * (qtd + 1 - len(contagens))
+        self.capacidade = qtd
+
+    def adicionar(self, numeros: List[int]) -> None:
+        """
+        Acumular um jogo.
+
+        Args:
+            numeros: Números do jogo.
+
+        Raises:
+            ValueError: Se a quantidade de números não for um tamanho de
+                aposta da loteria.
+        """
+        if len(numeros) != self.capacidade:
+            self._crescer(len(numeros))
+        soma = pares = primos = fibo = 0
+        frequencia = self.frequencia
+        for x in numeros:
+            soma += x
+            pares += self._par[x]
+            primos += self._primo[x]
+            fibo += self._fibo[x]
+            frequencia[x] += 1
+        self.total += 1
+        self.soma_total += soma
+        self.numeros_total += len(numeros)
+        self.histograma_soma[(soma - self.soma_minima) // self.largura_bin] += 1
+        self.pares[pares] += 1
+        self.primos[primos] += 1
+        self.fibo[fibo] += 1
+
+    def adicionar_jogos(self, jogos: Iterable[GameResult]) -> "AgregadoLote":
+        """Acumular vários jogos; retorna o próprio agregado."""
+        for jogo in jogos:
+            self.adicionar(jogo.numeros)
+        return self
+
+    def mesclar(self, outro: "AgregadoLote") -> "AgregadoLote":
+        """
+        Somar as contagens de outro agregado da mesma loteria.
+
+        Args:
+            outro: Agregado a incorporar.
+
+        Returns:
+            O próprio agregado.
+
+        Raises:
+            ValueError: Se os agregados forem de loterias diferentes.
+        """
+        if outro.tipo != self.tipo:
+            raise ValueError(f"Agregados incompatíveis: {self.tipo} e {outro.tipo}")
+        self._crescer(max(self.capacidade, outro.capacidade))
+        self.total += outro.total
+        self.soma_total += outro.soma_total
+        self.numeros_total += outro.numeros_total
+        for meu, dele in (
+            (self.histograma_soma, outro.histograma_soma),
+            (self.pares, outro.pares),
+            (self.primos, outro.primos),
+            (self.fibo, outro.fibo),
+            (self.frequencia, outro.frequencia),
+        ):
+            for i, c in enumerate(dele):
+                meu[i] += c
+        return self
+
+    @staticmethod
+    def _media(contagens: List[int]) -> float:
+        total = sum(contagens)
+        return sum(i * c for i, c in enumerate(contagens)) / total if total else 0.0
+
+    @property
+    def media_soma(self) -> float:
+        """Soma média por jogo."""
+        return self.soma_total / self.total if self.total else 0.0
+
+    @property
+    def media_pares(self) -> float:
+        """Quantidade média de pares por jogo."""
+        return self._media(self.pares)
+
+    @property
+    def media_impares(self) -> float:
+        """Quantidade média de ímpares por jogo."""
+        if not self.total:
+            return 0.0
+        return self.numeros_total / self.total - self.media_pares
+
+    @property
+    def media_primos(self) -> float:
+        """Quantidade média de primos por jogo."""
+        return self._media(self.primos)
+
+    def bins_soma(self) -> Tuple[List[int], List[int]]:
+        """
+        Barras não vazias do histograma de somas (do primeiro ao último bin usado).
+
+        Returns:
+            Tupla (início de cada bin, contagem de cada bin).
+        """
+        usados = [i for i, c in enumerate(self.histograma_soma) if c]
+        if not usados:
+            return [], []
+        indices = range(usados[0], usados[-1] + 1)
+        inicios = [self.soma_minima + i * self.largura_bin for i in indices]
+        return inicios, [self.histograma_soma[i] for i in indices]
+
+    def grade_frequencia(self, colunas: int = 10) -> List[List[int]]:
+        """
+        Frequência por número arrumada em linhas (como no volante).
+
+        Args:
+            colunas: Números por linha.
+
+        Returns:
+            Matriz linhas x colunas; posições além de max_numero ficam com 0.
+        """
+        n = LOTTERY_CONFIG[self.tipo]["max_numero"]
+        linhas = ceil(n / colunas)
+        return [
+            [
+                self.frequencia[x] if x <= n else 0
+                for x in range(linha * colunas + 1, (linha + 1) * colunas + 1)
+            ]
+            for linha in range(linhas)
+        ]
+
+
+def agregar(tipo: str, jogos: Iterable[GameResult]) -> AgregadoLote:
+    """
+    Calcular os agregados de um lote em uma passada.
+
+    Args:
+        tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+        jogos: Jogos do lote.
+
+    Returns:
+        AgregadoLote preenchido.
+
+    Raises:
+        ValueError: Se tipo de loteria não for reconhecido.
+    """
+    if tipo not in LOTTERY_CONFIG:
+        raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+    return AgregadoLote(tipo).adicionar_jogos(jogos)
+
+
+def colunas_volante(tipo: str) -> int:
+    """Números por linha no volante da loteria (5 na Lotofácil, 10 nas demais)."""
+    return colunas_por_linha(LOTTERY_CONFIG[tipo]["max_numero"])
+
+
+def resumo_graficos(agregado: AgregadoLote) -> Dict[str, tuple]:
+    """
+    Dados mínimos (e hasheáveis) para montar os gráficos do lote.
+
+    Args:
+        agregado: Agregado do lote.
+
+    Returns:
+        Dicionário com tuplas prontas para os gráficos.
+    """
+    inicios, contagens = agregado.bins_soma()
+    return {
+        "soma": (tuple(inicios), tuple(contagens), agregado.largura_bin),
+        "paridade": (agregado.media_pares, agregado.media_impares),
+        "frequencia": tuple(
+            tuple(linha)
+            for linha in agregado.grade_frequencia(colunas_volante(agregado.tipo))
+        ),
+    }
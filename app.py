@@ -4,22 +4,430 @@ LotoPro AI: Gerador de palpites otimizados para loterias.
 Interface Streamlit com análise estatística baseada em Fibonacci, números primos e paridades.
 """
 
+import importlib
+import importlib.util
+import io
+import os
+import secrets
+import sqlite3
+import threading
+from types import ModuleType
+
 import streamlit as st
-import streamlit.components.v1 as components
-import pandas as pd
-import plotly.express as px
-from core import GeradorLoteria
+
+from agregacao import agregar, colunas_volante, resumo_graficos
 from config import LOTTERY_CONFIG
-from pdf_generator import PDFGenerator
+from core import AnalisadorEstatistico, GeradorLoteria
+from exportacao import FORMATOS, ArtifactCache, ExportQueue, diretorio_padrao
+from faixas import (
+    DIMENSOES,
+    config_com_faixas,
+    dimensoes_disponiveis,
+    estimar,
+    faixas_config,
+    limites,
+)
+from importador import formato_arquivo, ler_historico
+from instrumentacao import Tracer
+from janelas import TAMANHOS_PADRAO, JanelasHistorico
+from ledger import TicketLedger
+from padroes import colunas_padroes
+from precomputo import cache_padrao, tabelas_numeros
+from renderizacao import renderizar_pagina
+from selecao import selecionar_melhores
+from similaridade import IndiceHistorico
+from simulador import simular
+from viabilidade import validar_configuracoes
+
+# Módulos caros de importar: carregados só quando a funcionalidade é usada e
+# aquecidos em segundo plano depois que a primeira tela já foi desenhada.
+# LOTOPRO_AQUECER=0 desliga o aquecimento (ex.: para medir a tela inicial isolada).
+MODULOS_PESADOS = ("pandas", "plotly.express", "streamlit.components.v1", "fpdf")
+AQUECER = os.environ.get("LOTOPRO_AQUECER", "1") != "0"
+
+# XLSX só é aceito com o pacote opcional openpyxl instalado
+TIPOS_HISTORICO = ["csv", "txt", "htm", "html"] + (
+    ["xlsx"] if importlib.util.find_spec("openpyxl") else []
+)
+
+
+def carregar(nome: str) -> ModuleType:
+    """
+    Importar um módulo pesado sob demanda.
+    Depois da primeira importação (ou do aquecimento) o custo é o de um dict lookup.
+    """
+    if AQUECER:
+        # Esperar as importações do aquecimento: bibliotecas como o plotly
+        # consultam sys.modules e veriam um pandas ainda pela metade
+        aquecer_modulos().join()
+    return importlib.import_module(nome)
+
+
+def _importar_pesados() -> None:
+    """
+    Importar os módulos pesados (executado na thread de aquecimento) e, em
+    seguida, disparar o aquecimento das tabelas numa thread própria.
+    """
+    for nome in MODULOS_PESADOS:
+        try:
+            importlib.import_module(nome)
+        except ImportError:
+            # A funcionalidade correspondente mostra o erro quando for usada
+            pass
+    # Só depois das importações, para não disputar o GIL com elas; ninguém
+    # espera por esta thread (carregar() aguarda apenas as importações)
+    threading.Thread(
+        target=_aquecer_tabelas, name="lotopro-warmup-tabelas", daemon=True
+    ).start()
+
+
+def _aquecer_tabelas() -> None:
+    """
+    Carregar (ou montar) as tabelas pré-calculadas de cada loteria.
+    """
+    for tipo, config in LOTTERY_CONFIG.items():
+        tabelas_numeros(tipo)
+        # Tabela das faixas da barra lateral, com as dimensões já configuradas
+        faixas = faixas_config(config)
+        estimar(
+            tipo,
+            {d: faixas[d] for d in dimensoes_disponiveis(tipo)},
+            config.get("evitar_sequencia", False),
+        )
+    try:
+        # Tabelas de contagem: lidas do cache em disco depois da primeira execução
+        validar_configuracoes()
+    except ValueError:
+        # gerar_jogos repete a verificação e o erro aparece na geração
+        pass
+
+
+@st.cache_resource(show_spinner=False)
+def aquecer_modulos() -> threading.Thread:
+    """
+    Disparar, uma vez por processo, a importação dos módulos pesados em segundo plano.
+    Devolve a thread das importações; as tabelas são aquecidas depois, à parte.
+    """
+    thread = threading.Thread(
+        target=_importar_pesados, name="lotopro-warmup", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+# Tempo máximo de uma geração no modo Aleatório; o restante fica para "Continuar"
+PRAZO_GERACAO = 5.0
+
+# Processos da simulação por clique: o servidor atende várias sessões ao mesmo tempo
+WORKERS_SIMULACAO = min(4, os.cpu_count() or 1)
+
+MODO_ALEATORIO = "Aleatório"
+MODO_MELHORES = "Melhores (Top-K)"
+MODO_DIVERSO = "Diversificado (bolão)"
+MODO_MCMC = "Cadeias de trocas (MCMC)"
+
+LAYOUT_GRAFICO = dict(
+    plot_bgcolor="rgba(0,0,0,0.2)",
+    paper_bgcolor="rgba(0,0,0,0)",
+    font=dict(color="#E0E7FF", size=12),
+    showlegend=False,
+    title_font_size=16,
+    margin=dict(l=50, r=50, t=50, b=50),
+)
+
+
+@st.cache_data(show_spinner=False)
+def figura_somas(inicios: tuple, contagens: tuple, largura: int):
+    """
+    Histograma de somas a partir das contagens pré-binadas.
+    O tamanho da figura depende só do número de bins, não do de jogos.
+    """
+    px = carregar("plotly.express")
+    fig = px.bar(
+        x=[inicio + (largura - 1) / 2 for inicio in inicios],
+        y=list(contagens),
+        title="📊 Distribuição de Somas",
+        labels={"x": "Soma", "y": "Frequência"},
+    )
+    fig.update_traces(
+        marker_color="#6366F1",
+        width=largura,
+        customdata=[f"{i}–{i + largura - 1}" for i in inicios],
+        hovertemplate="Soma %{customdata}: %{y}<extra></extra>",
+    )
+    fig.update_layout(
+        **LAYOUT_GRAFICO,
+        hovermode="x unified",
+        bargap=0.05,
+        xaxis_title="Soma dos Números",
+        yaxis_title="Frequência",
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def figura_paridade(media_pares: float, media_impares: float):
+    """Barras com a média de pares e ímpares por jogo."""
+    px = carregar("plotly.express")
+    fig = px.bar(
+        x=["Pares", "Impares"],
+        y=[media_pares, media_impares],
+        title="⚖️ Média de Pares vs Impares",
+        labels={"x": "Tipo", "y": "Média"},
+    )
+    fig.update_traces(
+        marker_color=["#6366F1", "#A855F7"],
+        marker_line_color="rgba(255,255,255,0.2)",
+        marker_line_width=2,
+    )
+    fig.update_layout(**LAYOUT_GRAFICO, xaxis_title="", yaxis_title="Média por Jogo")
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def figura_frequencia(grade: tuple, colunas: int):
+    """Mapa de calor da frequência de cada número, no formato do volante."""
+    px = carregar("plotly.express")
+    rotulos = [
+        [f"{linha * colunas + c + 1:02d}" for c in range(colunas)]
+        for linha in range(len(grade))
+    ]
+    fig = px.imshow(
+        [list(linha) for linha in grade],
+        color_continuous_scale=["#1a1f3a", "#6366F1", "#A855F7"],
+        title="🔥 Frequência por Número",
+        aspect="auto",
+    )
+    fig.update_traces(
+        text=rotulos,
+        texttemplate="%{text}",
+        customdata=rotulos,
+        hovertemplate="Número %{customdata}: %{z}<extra></extra>",
+    )
+    fig.update_layout(**LAYOUT_GRAFICO)
+    fig.update_xaxes(visible=False)
+    fig.update_yaxes(visible=False)
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def figura_janelas(tamanhos: tuple, relativas: tuple):
+    """
+    Frequência relativa de cada número nas janelas do histórico
+    (1,0 = frequência esperada em sorteios uniformes).
+    """
+    px = carregar("plotly.express")
+    numeros = range(1, len(relativas[0]) + 1)
+    fig = px.line(
+        x=[n for _ in tamanhos for n in numeros],
+        y=[valor for serie in relativas for valor in serie],
+        color=[f"Últimos {t}" for t in tamanhos for _ in numeros],
+        title="🕒 Frequência Relativa por Janela",
+        labels={"x": "Número", "y": "Frequência / esperada", "color": "Janela"},
+    )
+    fig.update_layout(**{**LAYOUT_GRAFICO, "showlegend": True}, hovermode="x unified")
+    return fig
+
+
+@st.cache_resource
+def get_ledger() -> TicketLedger:
+    """
+    Retornar conexão compartilhada com o registro de palpites (SQLite).
+    O caminho pode ser trocado pela variável de ambiente LOTOPRO_LEDGER.
+    """
+    return TicketLedger(os.environ.get("LOTOPRO_LEDGER", "lotopro_ledger.db"))
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def get_indice_historico(conteudo: bytes, tipo: str, formato: str) -> IndiceHistorico:
+    """
+    Retornar o índice dos sorteios de um arquivo de histórico enviado.
+    Um índice por conteúdo do arquivo e loteria.
+    """
+    concursos, sorteios = ler_historico(io.BytesIO(conteudo), tipo, formato)
+    return IndiceHistorico(sorteios, concursos)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def get_janelas(conteudo: bytes, tipo: str, formato: str) -> JanelasHistorico:
+    """
+    Retornar as janelas deslizantes (últimos N sorteios) de um histórico enviado.
+    Sorteios com números fora do volante da loteria são recusados na leitura.
+    """
+    _, sorteios = ler_historico(io.BytesIO(conteudo), tipo, formato)
+    janelas = JanelasHistorico(LOTTERY_CONFIG[tipo]["max_numero"])
+    janelas.adicionar_varios(sorteios)
+    return janelas
 
 
-@st.cache_data
-def get_gerador() -> GeradorLoteria:
+@st.cache_resource
+def get_export_queue() -> ExportQueue:
     """
-    Retornar instância cacheada de GeradorLoteria.
-    Evita reinicialização a cada rerun do Streamlit.
+    Retornar a fila de exportação compartilhada (CSV/PDF em segundo plano).
+    Artefatos prontos ficam em cache em disco (LOTOPRO_EXPORT_CACHE).
     """
-    return GeradorLoteria()
+    return ExportQueue(ArtifactCache(diretorio_padrao()))
+
+
+def _painel_exportacao(tipo_jogo: str, exportacoes: dict, aguardando: bool) -> None:
+    """Corpo do painel de exportação (executado como fragmento)."""
+    fila = get_export_queue()
+    nome_base = f'lotopro_{tipo_jogo.lower().replace("-", "_").replace(" ", "_")}'
+    rotulos = {
+        "csv": "📊 Baixar em CSV",
+        "pdf": "📄 Baixar em PDF",
+        "lotobin": "🗜️ Baixar binário (.lotobin)",
+    }
+    pendente = False
+
+    for col, formato in zip(st.columns(len(FORMATOS), gap="large"), FORMATOS):
+        job = fila.obter(exportacoes[formato])
+        with col:
+            # Artefato lido pela fila: o cache pode tê-lo removido (LRU)
+            dados = fila.ler(job.id) if job is not None and job.pronto else None
+            if job is None or (job.pronto and dados is None):
+                st.warning("⚠️ Exportação expirada. Gere os palpites novamente.")
+            elif job.pronto:
+                st.download_button(
+                    label=rotulos[formato],
+                    data=dados,
+                    file_name=f"{nome_base}.{formato}",
+                    mime=FORMATOS[formato],
+                )
+            elif job.status == "erro":
+                st.error(f"❌ Erro ao exportar {formato.upper()}: {job.erro}")
+            else:
+                pendente = True
+                st.progress(
+                    job.progresso,
+                    text=f"Preparando {formato.upper()}... {job.progresso:.0%}",
+                )
+
+    # Tudo pronto: um rerun completo recria o painel sem o polling periódico
+    if aguardando and not pendente:
+        st.rerun()
+
+
+def painel_exportacao(tipo_jogo: str, exportacoes: dict) -> None:
+    """
+    Mostrar progresso das exportações e os botões de download quando prontas.
+    Enquanto houver exportação pendente, só o fragmento do painel é reexecutado.
+    """
+    fila = get_export_queue()
+    jobs = [fila.obter(job_id) for job_id in exportacoes.values()]
+    aguardando = any(
+        j is not None and j.status in ("pendente", "executando") for j in jobs
+    )
+    fragmento = st.fragment(_painel_exportacao, run_every=0.5 if aguardando else None)
+    fragmento(tipo_jogo, exportacoes, aguardando)
+
+
+def aviso_prazo(produzidos: int, quantidade: int) -> str:
+    """Aviso de geração interrompida pelo prazo."""
+    return (
+        f"⚠️ Prazo de {PRAZO_GERACAO:.0f}s atingido: {produzidos} de "
+        f"{quantidade} palpites gerados. Use Continuar para gerar o restante."
+    )
+
+
+def continuar_geracao(geracao: dict) -> None:
+    """
+    Retomar uma geração interrompida pelo prazo (continuação guardada na
+    sessão) e substituir a geração da sessão pela estendida.
+    """
+    tipo_jogo = geracao["tipo"]
+    with tracer.span(
+        "core.gerar_jogos_com_prazo", tipo=tipo_jogo, quantidade=geracao["quantidade"]
+    ):
+        parcial = GeradorLoteria().gerar_jogos_com_prazo(
+            tipo_jogo,
+            geracao["quantidade"],
+            PRAZO_GERACAO,
+            geracao["continuacao"],
+            config=geracao["config"],
+        )
+    lote_id = geracao["lote_id"]
+    if parcial.jogos:
+        try:
+            with tracer.span("ledger.registrar_lote"):
+                lote_id = get_ledger().registrar_lote(
+                    parcial.jogos, tipo_jogo, seed=geracao["seed"]
+                )
+        except sqlite3.Error as e:
+            st.warning(f"⚠️ Não foi possível registrar o lote: {e}")
+
+    # Geração nova na sessão: agregados, exportações e simulação são refeitos
+    st.session_state.pop("resultado_simulacao", None)
+    st.session_state["geracao"] = {
+        **{
+            chave: geracao[chave]
+            for chave in ("tipo", "seed", "candidatos", "quantidade", "config")
+        },
+        "resultados": geracao["resultados"] + parcial.jogos,
+        "lote_id": lote_id,
+        "continuacao": parcial.continuacao,
+        "aviso": (
+            aviso_prazo(parcial.produzidos, geracao["quantidade"])
+            if parcial.continuacao is not None
+            else None
+        ),
+    }
+
+
+@st.fragment
+def painel_faixas(tipo_jogo: str) -> None:
+    """
+    Faixas de soma, pares, primos e Fibonacci ajustáveis, com a contagem das
+    combinações aceitas a cada mudança (ver faixas.py). Só o fragmento é
+    reexecutado; a configuração ajustada fica na sessão para a geração.
+    """
+    config = LOTTERY_CONFIG[tipo_jogo]
+    configuradas = faixas_config(config)
+    faixas = {}
+    for dimensao in dimensoes_disponiveis(tipo_jogo):
+        minimo, maximo = limites(tipo_jogo, dimensao)
+        if minimo == maximo:
+            continue
+        rotulo = DIMENSOES[dimensao]
+        padrao = configuradas[dimensao]
+        chave = f"faixa:{tipo_jogo}:{dimensao}"
+        if st.checkbox(
+            f"Restringir {rotulo.lower()}",
+            value=padrao is not None,
+            key=f"{chave}:ativa",
+        ):
+            inicial = padrao or (minimo, maximo)
+            faixas[dimensao] = st.slider(
+                rotulo,
+                min_value=minimo,
+                max_value=maximo,
+                value=(max(inicial[0], minimo), min(inicial[1], maximo)),
+                key=chave,
+            )
+        else:
+            faixas[dimensao] = None
+    evitar_sequencia = st.checkbox(
+        "Evitar 3 números seguidos",
+        value=config.get("evitar_sequencia", False),
+        key=f"faixa:{tipo_jogo}:sequencia",
+    )
+
+    with st.spinner("Montando tabela de contagem..."):
+        estimativa = estimar(tipo_jogo, faixas, evitar_sequencia)
+    col1, col2 = st.columns(2)
+    col1.metric("Combinações", f"{estimativa.validas:,}".replace(",", "."))
+    col2.metric("Aceitação", f"{estimativa.taxa_aceitacao:.2%}")
+    if not estimativa.validas:
+        st.error("❌ Nenhuma combinação atende a essas faixas.")
+    else:
+        st.caption(
+            f"~{estimativa.tentativas_esperadas:.1f} tentativas por jogo "
+            f"(amostragem {estimativa.estrategia}). Vale para o modo Aleatório."
+        )
+    st.session_state["config_ajustada"] = (
+        tipo_jogo,
+        config_com_faixas(config, faixas, evitar_sequencia),
+    )
 
 
 def apply_custom_style() -> None:
@@ -288,18 +696,21 @@ st.markdown(
 )
 
 # --- SIDEBAR (CONTROLES COM st.form) ---
-gerador = get_gerador()
 
 with st.sidebar:
     st.header("⚙️ Configurações")
 
-    with st.form("lottery_config"):
-        tipo_jogo = st.selectbox(
-            "Selecione a Loteria:",
-            list(LOTTERY_CONFIG.keys()),
-            help="Escolha o tipo de loteria para gerar palpites.",
-        )
+    # Fora do formulário: as faixas abaixo acompanham a loteria escolhida
+    tipo_jogo = st.selectbox(
+        "Selecione a Loteria:",
+        list(LOTTERY_CONFIG.keys()),
+        help="Escolha o tipo de loteria para gerar palpites.",
+    )
+
+    with st.expander("🎚️ Faixas das restrições"):
+        painel_faixas(tipo_jogo)
 
+    with st.form("lottery_config"):
         qtd_jogos = st.slider(
             "Quantidade de Jogos:",
             min_value=1,
@@ -308,6 +719,35 @@ with st.sidebar:
             help="Número de palpites a gerar (máx: 50).",
         )
 
+        modo = st.radio(
+            "Modo de geração:",
+            [MODO_ALEATORIO, MODO_MELHORES, MODO_DIVERSO, MODO_MCMC],
+            help="No modo Top-K, os palpites são os de maior score entre os candidatos avaliados.",
+        )
+        candidatos = st.select_slider(
+            "Candidatos avaliados (Top-K):",
+            options=[10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000],
+            value=100_000,
+            format_func=lambda n: f"{n:,}".replace(",", "."),
+        )
+        max_sobreposicao = st.slider(
+            "Máx. de números em comum (Diversificado):",
+            min_value=0,
+            max_value=14,
+            value=3,
+            help="Dois jogos do conjunto nunca compartilham mais números que isso.",
+        )
+
+        janela_pesos = st.selectbox(
+            "Ponderar pelo histórico (Aleatório):",
+            [None, *TAMANHOS_PADRAO],
+            format_func=lambda n: (
+                "Não ponderar" if n is None else f"Últimos {n} sorteios"
+            ),
+            help="Sorteia cada número com peso proporcional à frequência na janela "
+            "do histórico enviado abaixo.",
+        )
+
         st.markdown("---")
         st.info(
             "✨ Análise otimizada com Fibonacci, números primos e balanceamento de paridades."
@@ -315,281 +755,517 @@ with st.sidebar:
 
         submit_button = st.form_submit_button("🚀 GERAR PALPITES")
 
-# --- ÁREA PRINCIPAL ---
-if submit_button:
-    with st.spinner(f"Processando análise para {tipo_jogo}..."):
-        try:
-            resultados = gerador.gerar_jogos(tipo_jogo, qtd_jogos)
-        except Exception as e:
-            st.error(f"❌ Erro ao gerar palpites: {str(e)}")
-            resultados = []
+    arquivo_historico = st.file_uploader(
+        "📜 Histórico de sorteios (CSV, XLSX ou HTML)",
+        type=TIPOS_HISTORICO,
+        help="Resultados oficiais exportados ou um sorteio por linha: concurso "
+        "(opcional) e os números sorteados. Mostra o sorteio passado mais "
+        "parecido com cada palpite.",
+    )
+    formato_historico = (
+        formato_arquivo(arquivo_historico.name) if arquivo_historico else None
+    )
 
-    if resultados:
-        # 1. MÉTRICAS (KPIs) - Redesenhado
-        st.markdown(
-            """
+    with st.expander("🛠️ Debug"):
+        instrumentar = st.checkbox(
+            "Instrumentação (spans de tempo)",
+            value=os.environ.get("LOTOPRO_DEBUG") == "1",
+            help="Mede geração, score, renderização, gráficos e exportação.",
+        )
+        capturar_perfil = st.checkbox(
+            "Capturar perfil cProfile", value=False, disabled=not instrumentar
+        )
+
+# Perfil cProfile ligado só dentro do try e desligado mesmo se a execução for
+# interrompida (st.rerun, st.stop ou exceção): um perfil ativo prende o perfil
+# do processo e impede o próximo Profile().enable()
+tracer = Tracer()
+try:
+    tracer = Tracer(ativo=instrumentar, perfil=instrumentar and capturar_perfil)
+    if tracer.perfil_ocupado:
+        st.sidebar.warning(
+            "⚠️ Outra sessão está capturando um perfil cProfile; "
+            "esta execução mede só os spans de tempo."
+        )
+
+    # --- ÁREA PRINCIPAL ---
+    if submit_button:
+        # Semente própria por geração: fica registrada no lote para reproduzir os jogos
+        seed = secrets.randbits(63)
+        gerador = GeradorLoteria(seed=seed)
+        ajuste = st.session_state.get("config_ajustada")
+        config_ajustada = (
+            ajuste[1]
+            if ajuste is not None
+            and ajuste[0] == tipo_jogo
+            and ajuste[1] != LOTTERY_CONFIG[tipo_jogo]
+            else None
+        )
+
+        aviso = None
+        continuacao = None
+        with st.spinner(f"Processando análise para {tipo_jogo}..."):
+            try:
+                if modo == MODO_MELHORES:
+                    with tracer.span(
+                        "selecao.selecionar_melhores",
+                        tipo=tipo_jogo,
+                        quantidade=qtd_jogos,
+                        candidatos=candidatos,
+                    ):
+                        resultados = selecionar_melhores(
+                            tipo_jogo,
+                            qtd_jogos,
+                            candidatos,
+                            seed=seed,
+                            config=config_ajustada,
+                        ).jogos
+                elif modo == MODO_DIVERSO:
+                    # Sobreposição acima de k - 1 não restringe nada
+                    max_sobreposicao = min(
+                        max_sobreposicao,
+                        LOTTERY_CONFIG[tipo_jogo]["qtd_selecionados"] - 1,
+                    )
+                    with tracer.span(
+                        "core.gerar_jogos_diversos",
+                        tipo=tipo_jogo,
+                        quantidade=qtd_jogos,
+                        max_sobreposicao=max_sobreposicao,
+                    ):
+                        resultados = gerador.gerar_jogos_diversos(
+                            tipo_jogo, qtd_jogos, max_sobreposicao, config_ajustada
+                        )
+                    if len(resultados) < qtd_jogos:
+                        aviso = (
+                            f"⚠️ Só {len(resultados)} jogos com no máximo "
+                            f"{max_sobreposicao} números em comum foram encontrados."
+                        )
+                elif modo == MODO_MCMC:
+                    with tracer.span(
+                        "core.gerar_jogos_mcmc", tipo=tipo_jogo, quantidade=qtd_jogos
+                    ):
+                        resultados = gerador.gerar_jogos_mcmc(
+                            tipo_jogo, qtd_jogos, config=config_ajustada
+                        )
+                elif janela_pesos is not None and arquivo_historico is not None:
+                    janelas = get_janelas(
+                        arquivo_historico.getvalue(), tipo_jogo, formato_historico
+                    )
+                    with tracer.span(
+                        "core.gerar_jogos_ponderados",
+                        tipo=tipo_jogo,
+                        quantidade=qtd_jogos,
+                        janela=janela_pesos,
+                    ):
+                        resultados = gerador.gerar_jogos_ponderados(
+                            tipo_jogo,
+                            qtd_jogos,
+                            janelas.pesos(janela_pesos),
+                            config_ajustada,
+                        )
+                    if not len(janelas):
+                        aviso = (
+                            "⚠️ Histórico sem sorteios desta loteria: pesos uniformes."
+                        )
+                else:
+                    with tracer.span(
+                        "core.gerar_jogos_com_prazo",
+                        tipo=tipo_jogo,
+                        quantidade=qtd_jogos,
+                        faixas_ajustadas=config_ajustada is not None,
+                    ):
+                        parcial = gerador.gerar_jogos_com_prazo(
+                            tipo_jogo, qtd_jogos, PRAZO_GERACAO, config=config_ajustada
+                        )
+                    resultados = parcial.jogos
+                    continuacao = parcial.continuacao
+                    if continuacao is not None:
+                        aviso = aviso_prazo(parcial.produzidos, qtd_jogos)
+            # Qualquer falha da geração vira mensagem na tela, sem derrubar a página
+            except Exception as e:  # noqa: BLE001
+                st.error(f"❌ Erro ao gerar palpites: {str(e)}")
+                resultados = []
+
+        lote_id = None
+        if resultados:
+            try:
+                with tracer.span("ledger.registrar_lote"):
+                    lote_id = get_ledger().registrar_lote(
+                        resultados, tipo_jogo, seed=seed
+                    )
+            except sqlite3.Error as e:
+                st.warning(f"⚠️ Não foi possível registrar o lote: {e}")
+
+        # Guardar a geração na sessão: botões dos painéis abaixo disparam reruns
+        st.session_state["geracao"] = {
+            "tipo": tipo_jogo,
+            "resultados": resultados,
+            "seed": seed,
+            "lote_id": lote_id,
+            "candidatos": candidatos if modo == MODO_MELHORES else None,
+            "aviso": aviso,
+            "quantidade": qtd_jogos,
+            "config": config_ajustada,
+            "continuacao": continuacao,
+        }
+
+    geracao = st.session_state.get("geracao")
+    if geracao is not None:
+        tipo_jogo = geracao["tipo"]
+        resultados = geracao["resultados"]
+        if geracao["lote_id"] is not None:
+            st.caption(
+                f"Lote #{geracao['lote_id']} registrado · semente {geracao['seed']}"
+            )
+        if geracao.get("aviso"):
+            st.warning(geracao["aviso"])
+        if geracao.get("continuacao") and st.button("⏩ Continuar geração"):
+            with st.spinner("Gerando o restante dos palpites..."):
+                continuar_geracao(geracao)
+            st.rerun()
+        if geracao.get("candidatos"):
+            st.caption(
+                f"Top {len(resultados)} por score entre "
+                f"{geracao['candidatos']:,} candidatos".replace(",", ".")
+            )
+
+        if resultados:
+            components = carregar("streamlit.components.v1")
+
+            # 1. MÉTRICAS (KPIs) - Redesenhado
+            st.markdown(
+                """
             <div style="margin: 30px 0; padding: 24px; background: linear-gradient(135deg, rgba(99, 102, 241, 0.08) 0%, rgba(168, 85, 247, 0.04) 100%); border: 1px solid rgba(99, 102, 241, 0.2); border-radius: 16px;">
                 <h2 style="margin: 0 0 16px 0; border: none; padding: 0;">📊 Resumo da Análise</h2>
             </div>
             """,
-            unsafe_allow_html=True,
-        )
+                unsafe_allow_html=True,
+            )
 
-        # Converter GameResult para dicts
-        resultados_dicts = [r.to_dict() for r in resultados]
-        df = pd.DataFrame(resultados_dicts)
+            # Agregados do lote (uma passada, guardados na sessão): KPIs e gráficos
+            # usam só as contagens, nunca a lista completa de jogos
+            agregado = geracao.get("agregado")
+            if agregado is None:
+                with tracer.span("agregacao.lote", jogos=len(resultados)):
+                    agregado = geracao["agregado"] = agregar(tipo_jogo, resultados)
 
-        kpi1, kpi2, kpi3, kpi4 = st.columns(4, gap="medium")
+            kpi1, kpi2, kpi3, kpi4 = st.columns(4, gap="medium")
 
-        with kpi1:
-            st.markdown(
-                f"""
+            with kpi1:
+                st.markdown(
+                    f"""
                 <div class="metric-container">
                     <div style="font-size: 32px; font-weight: 800; color: #6366F1; margin-bottom: 8px;">{len(resultados)}</div>
                     <div style="color: #94A3B8; font-size: 13px; letter-spacing: 0.5px; text-transform: uppercase;">Jogos Gerados</div>
                 </div>
                 """,
-                unsafe_allow_html=True,
-            )
+                    unsafe_allow_html=True,
+                )
 
-        with kpi2:
-            media_soma = int(df["soma"].mean())
-            st.markdown(
-                f"""
+            with kpi2:
+                media_soma = int(agregado.media_soma)
+                st.markdown(
+                    f"""
                 <div class="metric-container">
                     <div style="font-size: 32px; font-weight: 800; color: #A855F7; margin-bottom: 8px;">{media_soma}</div>
                     <div style="color: #94A3B8; font-size: 13px; letter-spacing: 0.5px; text-transform: uppercase;">Média da Soma</div>
                 </div>
                 """,
-                unsafe_allow_html=True,
-            )
+                    unsafe_allow_html=True,
+                )
 
-        with kpi3:
-            if "primos" in df.columns and df["primos"].notna().any():
-                media_primos = round(df["primos"].mean(), 1)
-                st.markdown(
-                    f"""
+            with kpi3:
+                if any(r.primos is not None for r in resultados):
+                    media_primos = round(agregado.media_primos, 1)
+                    st.markdown(
+                        f"""
                     <div class="metric-container">
                         <div style="font-size: 32px; font-weight: 800; color: #10B981; margin-bottom: 8px;">{media_primos}</div>
                         <div style="color: #94A3B8; font-size: 13px; letter-spacing: 0.5px; text-transform: uppercase;">Primos/Jogo</div>
                     </div>
                     """,
-                    unsafe_allow_html=True,
-                )
-            else:
-                media_pares = round(df["pares"].mean(), 1)
-                st.markdown(
-                    f"""
+                        unsafe_allow_html=True,
+                    )
+                else:
+                    media_pares = round(agregado.media_pares, 1)
+                    st.markdown(
+                        f"""
                     <div class="metric-container">
                         <div style="font-size: 32px; font-weight: 800; color: #10B981; margin-bottom: 8px;">{media_pares}</div>
                         <div style="color: #94A3B8; font-size: 13px; letter-spacing: 0.5px; text-transform: uppercase;">Pares/Jogo</div>
                     </div>
                     """,
-                    unsafe_allow_html=True,
-                )
+                        unsafe_allow_html=True,
+                    )
 
-        with kpi4:
-            st.markdown(
-                f"""
+            with kpi4:
+                st.markdown(
+                    f"""
                 <div class="metric-container" style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.05) 100%); border-color: rgba(16, 185, 129, 0.3);">
                     <div style="font-size: 32px; font-weight: 800; color: #10B981; margin-bottom: 8px;">✓</div>
                     <div style="color: #10B981; font-size: 13px; letter-spacing: 0.5px; text-transform: uppercase; font-weight: 600;">Análise Concluída</div>
                 </div>
                 """,
-                unsafe_allow_html=True,
-            )
+                    unsafe_allow_html=True,
+                )
 
-        # 2. EXIBIÇÃO DOS CARTÕES (VISUAL) - Redesenhado
-        st.markdown(
-            """
+            # 2. EXIBIÇÃO DOS CARTÕES (VISUAL) - Redesenhado
+            st.markdown(
+                """
             <div style="margin: 30px 0; padding: 24px; background: linear-gradient(135deg, rgba(99, 102, 241, 0.08) 0%, rgba(168, 85, 247, 0.04) 100%); border: 1px solid rgba(99, 102, 241, 0.2); border-radius: 16px;">
                 <h2 style="margin: 0 0 16px 0; border: none; padding: 0;">🍀 Seus Palpites Otimizados</h2>
             </div>
             """,
-            unsafe_allow_html=True,
-        )
+                unsafe_allow_html=True,
+            )
 
-        css_class = (
-            "mega"
-            if tipo_jogo == "Mega-Sena"
-            else "loto" if tipo_jogo == "Lotofácil" else "quina"
-        )
+            # Calcular scores e encontrar melhor palpite
+            with tracer.span(
+                "core.calcular_score_probabilidade", jogos=len(resultados)
+            ):
+                scores = [
+                    AnalisadorEstatistico.calcular_score_probabilidade(r)
+                    for r in resultados
+                ]
+            melhor_indice = scores.index(max(scores)) if scores else 0
 
-        # Calcular scores e encontrar melhor palpite
-        from core import AnalisadorEstatistico
-
-        scores = [
-            AnalisadorEstatistico.calcular_score_probabilidade(r) for r in resultados
-        ]
-        melhor_indice = scores.index(max(scores)) if scores else 0
-
-        # Grid responsivo
-        cols = st.columns(2, gap="large")
-
-        for i, resultado in enumerate(resultados):
-            col = cols[i % 2]
-            is_melhor = i == melhor_indice
-            score = scores[i] if i < len(scores) else 0
-
-            with col:
-                # Definir gradiente de cor baseado na loteria
-                if css_class == "mega":
-                    ball_gradient = "linear-gradient(135deg, #10B981 0%, #059669 100%)"
-                elif css_class == "loto":
-                    ball_gradient = "linear-gradient(135deg, #A855F7 0%, #9333EA 100%)"
-                else:  # quina
-                    ball_gradient = "linear-gradient(135deg, #3B82F6 0%, #2563EB 100%)"
-
-                # Bolinhas com estilos inline 100%
-                html_balls = "".join(
-                    f"<span style='display: inline-flex; align-items: center; justify-content: center; width: 48px; height: 48px; border-radius: 50%; font-weight: 800; font-size: 14px; color: white; margin-right: 8px; margin-bottom: 8px; background: {ball_gradient}; box-shadow: 0 8px 20px rgba(0, 0, 0, 0.4); border: 2px solid rgba(255, 255, 255, 0.2);'>{num:02d}</span>"
-                    for num in resultado.numeros
+            # Sorteio passado mais parecido com cada palpite (se houver histórico)
+            proximos = None
+            if arquivo_historico is not None:
+                indice = get_indice_historico(
+                    arquivo_historico.getvalue(), tipo_jogo, formato_historico
                 )
-
-                analise_str = f"<b>Soma:</b> {resultado.soma}"
-                if resultado.primos:
-                    analise_str += f" | <b>Primos:</b> {resultado.primos}"
-                if resultado.fibo:
-                    analise_str += f" | <b>Fibonacci:</b> {resultado.fibo}"
-
-                # Estilos inline para o card
-                # Se for o melhor palpite, aplicamos um destaque estático e sutil (sem animação)
-                if is_melhor:
-                    card_style = (
-                        "background: linear-gradient(135deg, rgba(255, 244, 220, 0.06) 0%, rgba(255, 244, 220, 0.03) 100%);"
-                        "border: 2px solid rgba(255, 215, 0, 0.7); box-shadow: 0 8px 28px rgba(255, 215, 0, 0.12), 0 10px 30px rgba(0,0,0,0.2);"
-                    )
-                    score_badge = (
-                        f"<div style='position:absolute; top:8px; right:8px; background: linear-gradient(135deg, #FFD700 0%, #FFA500 100%); color:#1a1f3a; padding:6px 10px; border-radius:16px; font-size:12px; font-weight:700;'>TOP {int(score)}%</div>"
-                    )
+                if len(indice):
+                    with tracer.span(
+                        "similaridade.mais_proximos",
+                        jogos=len(resultados),
+                        sorteios=len(indice),
+                    ):
+                        proximos = indice.mais_proximos_lote(
+                            (r.numeros for r in resultados), k=1
+                        )
                 else:
-                    score_badge = ""
-                    card_style = (
-                        "background: linear-gradient(135deg, rgba(99, 102, 241, 0.08) 0%, rgba(79, 70, 229, 0.04) 100%);"
-                        "border: 1px solid rgba(99, 102, 241, 0.3); box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);"
+                    st.warning(
+                        f"⚠️ Nenhum sorteio de {tipo_jogo} reconhecido no histórico enviado."
                     )
 
-                html_content = f"""<div style="padding: 24px; border-radius: 16px; margin-bottom: 16px; backdrop-filter: blur(10px); position: relative; overflow: hidden; {card_style}">
-                    {score_badge}
-                    <div style="color: #6366F1; font-weight: 700; font-size: 14px; letter-spacing: 1px; margin-bottom: 12px; text-transform: uppercase;">🎯 Jogo #{i+1}</div>
-                    <div style="margin-bottom: 16px;">
-                        {html_balls}
-                    </div>
-                    <div style="color: #94A3B8; font-size: 13px; margin-top: 12px; font-family: 'SF Mono', 'Monaco', 'Courier New', monospace; line-height: 1.6;">
-                        {analise_str}
-                    </div>
-                </div>"""
-
-                # Use components.html — more reliable full-HTML rendering inside columns
-                # Height is a safe guess; Streamlit will show a vertical scrollbar if content overflows.
-                components.html(html_content, height=180)
+            # Todos os cartões em uma única página HTML (modelos e bolinhas em
+            # cache; lotes idênticos reaproveitam a página já montada)
+            with tracer.span("render.pagina", jogos=len(resultados)):
+                html_cartoes, altura = renderizar_pagina(
+                    tipo_jogo, resultados, scores, melhor_indice, proximos
+                )
+                # Rolagem para telas estreitas, onde a grade vira uma coluna só
+                components.html(html_cartoes, height=altura, scrolling=True)
 
-                # Fallback textual representation (readable) to make sure numbers are
-                # always visible even if the HTML rendering fails in some browsers.
-                readable = " ".join(f"{n:02d}" for n in resultado.numeros)
-                st.markdown(f"**Números:** {readable}")
+            # Representação textual, para os números ficarem visíveis mesmo se o
+            # HTML não for exibido em algum navegador
+            linhas = []
+            for i, resultado in enumerate(resultados):
+                linha = f"**Jogo #{i + 1}:** " + " ".join(
+                    f"{n:02d}" for n in resultado.numeros
+                )
+                if proximos and proximos[i]:
+                    parecido = proximos[i][0]
+                    linha += (
+                        f" · sorteio mais parecido: concurso {parecido.concurso} ("
+                        + " ".join(f"{n:02d}" for n in parecido.numeros)
+                        + f", {parecido.em_comum} em comum)"
+                    )
+                linhas.append(linha)
+            st.markdown("  \n".join(linhas))
 
-        # 3. GRÁFICOS E ANÁLISE - Premium
-        st.markdown(
-            """
+            # 3. GRÁFICOS E ANÁLISE - Premium
+            st.markdown(
+                """
             <div style="margin: 30px 0; padding: 24px; background: linear-gradient(135deg, rgba(99, 102, 241, 0.08) 0%, rgba(168, 85, 247, 0.04) 100%); border: 1px solid rgba(99, 102, 241, 0.2); border-radius: 16px;">
                 <h2 style="margin: 0 0 16px 0; border: none; padding: 0;">📈 Análise Estatística Detalhada</h2>
             </div>
             """,
-            unsafe_allow_html=True,
-        )
+                unsafe_allow_html=True,
+            )
 
-        col_chart1, col_chart2 = st.columns(2, gap="large")
+            dados_graficos = resumo_graficos(agregado)
+            col_chart1, col_chart2 = st.columns(2, gap="large")
 
-        with col_chart1:
-            # Gráfico de distribuição de somas
-            fig_soma = px.histogram(
-                df,
-                x="soma",
-                nbins=15,
-                title="📊 Distribuição de Somas",
-                labels={"soma": "Soma", "count": "Frequência"},
-            )
-            fig_soma.update_traces(marker_color="#6366F1")
-            fig_soma.update_layout(
-                plot_bgcolor="rgba(0,0,0,0.2)",
-                paper_bgcolor="rgba(0,0,0,0)",
-                font=dict(color="#E0E7FF", size=12),
-                hovermode="x unified",
-                title_font_size=16,
-                xaxis_title="Soma dos Números",
-                yaxis_title="Frequência",
-                showlegend=False,
-                margin=dict(l=50, r=50, t=50, b=50),
-            )
-            # Use new width API to avoid deprecation warnings
-            st.plotly_chart(fig_soma, width="stretch")
-
-        with col_chart2:
-            # Gráfico de paridades
-            pares_impares_count = {
-                "Pares": df["pares"].mean(),
-                "Impares": df["impares"].mean(),
-            }
-            fig_parity = px.bar(
-                x=list(pares_impares_count.keys()),
-                y=list(pares_impares_count.values()),
-                title="⚖️ Média de Pares vs Impares",
-                labels={"x": "Tipo", "y": "Média"},
-            )
-            fig_parity.update_traces(
-                marker_color=["#6366F1", "#A855F7"],
-                marker_line_color="rgba(255,255,255,0.2)",
-                marker_line_width=2,
-            )
-            fig_parity.update_layout(
-                plot_bgcolor="rgba(0,0,0,0.2)",
-                paper_bgcolor="rgba(0,0,0,0)",
-                font=dict(color="#E0E7FF", size=12),
-                showlegend=False,
-                title_font_size=16,
-                xaxis_title="",
-                yaxis_title="Média por Jogo",
-                margin=dict(l=50, r=50, t=50, b=50),
+            with col_chart1, tracer.span("graficos.soma"):
+                st.plotly_chart(figura_somas(*dados_graficos["soma"]), width="stretch")
+
+            with col_chart2, tracer.span("graficos.paridade"):
+                st.plotly_chart(
+                    figura_paridade(*dados_graficos["paridade"]), width="stretch"
+                )
+
+            with tracer.span("graficos.frequencia"):
+                st.plotly_chart(
+                    figura_frequencia(
+                        dados_graficos["frequencia"], colunas_volante(tipo_jogo)
+                    ),
+                    width="stretch",
+                )
+
+            # Padrões de posição (dezenas, grade do volante, finais e intervalos)
+            with tracer.span("graficos.padroes", jogos=len(resultados)):
+                pd = carregar("pandas")
+                st.markdown("**Padrões de posição**")
+                st.dataframe(
+                    pd.DataFrame(
+                        {
+                            "Jogo": [f"#{i + 1}" for i in range(len(resultados))],
+                            **colunas_padroes(
+                                tipo_jogo, (r.mascara for r in resultados)
+                            ),
+                        }
+                    ),
+                    hide_index=True,
+                    width="stretch",
+                )
+
+            # Tendências do histórico: janelas atualizadas a cada sorteio do arquivo
+            if arquivo_historico is not None:
+                janelas = get_janelas(
+                    arquivo_historico.getvalue(), tipo_jogo, formato_historico
+                )
+                if len(janelas):
+                    config_jogo = LOTTERY_CONFIG[tipo_jogo]
+                    por_numero = (
+                        config_jogo.get(
+                            "qtd_sorteados", config_jogo["qtd_selecionados"]
+                        )
+                        / config_jogo["max_numero"]
+                    )
+                    with tracer.span("graficos.janelas", sorteios=janelas.total):
+                        resumos = janelas.resumos()
+                        relativas = tuple(
+                            tuple(
+                                f / (r.sorteios * por_numero) for f in r.frequencias[1:]
+                            )
+                            for r in resumos
+                        )
+                        st.plotly_chart(
+                            figura_janelas(
+                                tuple(r.tamanho for r in resumos), relativas
+                            ),
+                            width="stretch",
+                        )
+                        cols_janela = st.columns(len(resumos))
+                        for col, r in zip(cols_janela, resumos):
+                            col.metric(
+                                f"Últimos {r.tamanho}",
+                                f"Soma {r.media_soma:.0f}",
+                                f"{r.media_pares:.1f} pares",
+                                delta_color="off",
+                            )
+
+            # 4. SIMULAÇÃO MONTE CARLO
+            st.markdown(
+                """
+            <div style="margin: 30px 0; padding: 24px; background: linear-gradient(135deg, rgba(99, 102, 241, 0.08) 0%, rgba(168, 85, 247, 0.04) 100%); border: 1px solid rgba(99, 102, 241, 0.2); border-radius: 16px;">
+                <h2 style="margin: 0 0 16px 0; border: none; padding: 0;">🎲 Simulação Monte Carlo</h2>
+            </div>
+            """,
+                unsafe_allow_html=True,
             )
-            # Use new width API to avoid deprecation warnings
-            st.plotly_chart(fig_parity, width="stretch")
 
-        # 4. EXPORTAÇÃO (DOWNLOAD - CSV + PDF) - Premium
-        st.markdown(
-            """
+            faixas_premio = LOTTERY_CONFIG[tipo_jogo]["faixas_premio"]
+            with st.form("simulacao"):
+                sorteios_max = st.select_slider(
+                    "Sorteios simulados (máximo):",
+                    options=[10_000, 50_000, 100_000, 500_000, 1_000_000, 2_000_000],
+                    value=100_000,
+                    help="A simulação para antes se a precisão desejada for atingida.",
+                )
+                precisao = st.slider(
+                    "Precisão relativa (IC 95%):",
+                    min_value=0.01,
+                    max_value=0.20,
+                    value=0.05,
+                    step=0.01,
+                )
+                st.caption("Valor do prêmio por faixa (R$), para o retorno esperado:")
+                cols_premio = st.columns(len(faixas_premio))
+                premios = {
+                    acertos: col.number_input(nome, min_value=0.0, value=0.0, step=1.0)
+                    for col, (acertos, nome) in zip(cols_premio, faixas_premio.items())
+                }
+                simular_button = st.form_submit_button("🎲 SIMULAR SORTEIOS")
+
+            if simular_button:
+                with st.spinner("Simulando sorteios..."):
+                    st.session_state["resultado_simulacao"] = {
+                        "seed_geracao": geracao["seed"],
+                        "resultado": simular(
+                            tipo_jogo,
+                            [r.numeros for r in resultados],
+                            sorteios_max=sorteios_max,
+                            precisao=precisao,
+                            workers=WORKERS_SIMULACAO,
+                            premios={a: v for a, v in premios.items() if v > 0},
+                        ),
+                    }
+
+            simulacao = st.session_state.get("resultado_simulacao")
+            if simulacao is not None and simulacao["seed_geracao"] == geracao["seed"]:
+                pd = carregar("pandas")
+                sim = simulacao["resultado"]
+                inferior, superior = sim.intervalo_algum_premio
+                col_sim1, col_sim2, col_sim3 = st.columns(3)
+                col_sim1.metric(
+                    "Sorteios simulados", f"{sim.sorteios:,}".replace(",", ".")
+                )
+                col_sim2.metric(
+                    "Sorteios com prêmio",
+                    f"{sim.prob_algum_premio:.2%}",
+                    help=f"IC 95%: {inferior:.2%} – {superior:.2%}",
+                )
+                if sim.retorno_esperado is not None:
+                    col_sim3.metric(
+                        "Retorno esperado/sorteio", f"R$ {sim.retorno_esperado:.2f}"
+                    )
+                st.dataframe(
+                    pd.DataFrame([f.to_dict() for f in sim.faixas]),
+                    hide_index=True,
+                    width="stretch",
+                )
+                if not sim.convergiu:
+                    st.caption(
+                        "Precisão não atingida dentro do limite de sorteios; "
+                        "os intervalos mostram a incerteza restante."
+                    )
+
+            # 5. EXPORTAÇÃO (DOWNLOAD - CSV + PDF) - Premium
+            st.markdown(
+                """
             <div style="margin: 30px 0; padding: 24px; background: linear-gradient(135deg, rgba(99, 102, 241, 0.08) 0%, rgba(168, 85, 247, 0.04) 100%); border: 1px solid rgba(99, 102, 241, 0.2); border-radius: 16px;">
                 <h2 style="margin: 0 0 16px 0; border: none; padding: 0;">💾 Exportar Resultados</h2>
             </div>
             """,
-            unsafe_allow_html=True,
-        )
+                unsafe_allow_html=True,
+            )
 
-        col_csv, col_pdf = st.columns(2, gap="large")
+            # Exportações rodam em segundo plano; o painel acompanha o progresso
+            exportacoes = geracao.setdefault("exportacoes", {})
+            if not exportacoes:
+                fila = get_export_queue()
+                for formato in FORMATOS:
+                    with tracer.span(f"exportacao.submeter.{formato}"):
+                        job = fila.submeter(formato, tipo_jogo, resultados)
+                    exportacoes[formato] = job.id
 
-        with col_csv:
-            csv = df.to_csv(index=False).encode("utf-8")
-            st.download_button(
-                label="📊 Baixar em CSV",
-                data=csv,
-                file_name=f'lotopro_{tipo_jogo.lower().replace("-", "_")}.csv',
-                mime="text/csv",
-            )
+            painel_exportacao(tipo_jogo, exportacoes)
 
-        with col_pdf:
-            pdf_generator = PDFGenerator(tipo_jogo)
-            pdf_bytes = pdf_generator.generate_report(resultados)
-            st.download_button(
-                label="📄 Baixar em PDF",
-                data=pdf_bytes,
-                file_name=f'lotopro_{tipo_jogo.lower().replace("-", "_")}.pdf',
-                mime="application/pdf",
-            )
+            # Exportações rodam em threads: registrar a duração das já concluídas
+            for formato, job_id in exportacoes.items():
+                job = get_export_queue().obter(job_id)
+                if job is not None and job.duracao_s is not None:
+                    tracer.registrar(
+                        f"exportacao.{formato}", job.duracao_s, segundo_plano=True
+                    )
 
-else:
-    # TELA INICIAL - Redesenhada
-    st.markdown(
-        """
+    else:
+        # TELA INICIAL - Redesenhada
+        st.markdown(
+            """
         <div style="display: flex; align-items: center; justify-content: center; min-height: 60vh;">
             <div style="text-align: center;">
                 <div style="font-size: 72px; margin-bottom: 20px;">🎯</div>
@@ -603,12 +1279,12 @@ else:
             </div>
         </div>
         """,
-        unsafe_allow_html=True,
-    )
+            unsafe_allow_html=True,
+        )
 
-    # Seção de informações
-    st.markdown(
-        """
+        # Seção de informações
+        st.markdown(
+            """
         <div style="margin-top: 60px; padding: 0;">
             <div style="display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 20px;">
                 <div style="background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(5, 150, 105, 0.05) 100%); padding: 20px; border-radius: 12px; border: 1px solid rgba(16, 185, 129, 0.2);">
@@ -629,5 +1305,47 @@ else:
             </div>
         </div>
         """,
-        unsafe_allow_html=True,
-    )
+            unsafe_allow_html=True,
+        )
+
+    # --- PAINEL DE DEBUG (INSTRUMENTAÇÃO) ---
+    if tracer.ativo:
+        pd = carregar("pandas")
+        tracer.contexto.update(
+            {"tipo": tipo_jogo, "quantidade": qtd_jogos, "gerou": bool(submit_button)}
+        )
+        with st.sidebar:
+            st.markdown("---")
+            st.subheader("⏱️ Tempos desta execução")
+            totais = tracer.totais()
+            if totais:
+                st.dataframe(
+                    pd.DataFrame(
+                        [{"span": nome, **valores} for nome, valores in totais.items()]
+                    ).sort_values("total_ms", ascending=False),
+                    hide_index=True,
+                    width="stretch",
+                )
+            try:
+                caminho_trace = tracer.salvar()
+                st.caption(f"Trace salvo em `{caminho_trace}`")
+            except OSError as e:
+                st.warning(f"⚠️ Não foi possível salvar o trace: {e}")
+            perfil = tracer.resumo_perfil()
+            if perfil:
+                st.markdown("**cProfile (tempo acumulado)**")
+                st.dataframe(pd.DataFrame(perfil), hide_index=True, width="stretch")
+            artefatos = cache_padrao().estatisticas()
+            if artefatos:
+                st.markdown("**Cache de pré-cálculo**")
+                st.dataframe(
+                    pd.DataFrame([a.to_dict() for a in artefatos]),
+                    hide_index=True,
+                    width="stretch",
+                )
+finally:
+    tracer.parar_perfil()
+
+# Primeira tela já enviada: aquecer os módulos pesados para a próxima interação
+if AQUECER:
+    aquecer_modulos()
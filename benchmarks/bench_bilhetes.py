@@ -0,0 +1,59 @@
+"""
+Benchmark do formato .lotobin: gravação, abertura (mmap) e conferência
+contra um sorteio, comparados à leitura do mesmo conjunto em CSV.
+
+Execute com: python -m benchmarks.bench_bilhetes [quantidade]
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+from bilhetes import LeitorBilhetes, gravar_bilhetes
+
+
+def _combinacoes(quantidade: int, seed: int = 42):
+    """Combinações aleatórias da Mega-Sena (sem filtro: o foco é o formato)."""
+    rng = random.Random(seed)
+    populacao = range(1, 61)
+    for _ in range(quantidade):
+        yield sorted(rng.sample(populacao, 6))
+
+
+def run_bench(quantidade: int = 1_000_000) -> None:
+    with tempfile.TemporaryDirectory() as diretorio:
+        binario = os.path.join(diretorio, "jogos.lotobin")
+        texto = os.path.join(diretorio, "jogos.csv")
+
+        inicio = time.perf_counter()
+        gravar_bilhetes(binario, "Mega-Sena", _combinacoes(quantidade))
+        print(f"gravar .lotobin:  {time.perf_counter() - inicio:7.2f}s")
+        with open(texto, "w", newline="") as f:
+            escritor = csv.writer(f)
+            for numeros in _combinacoes(quantidade):
+                escritor.writerow(numeros + [sum(numeros)])
+
+        print(
+            f"tamanho: .lotobin {os.path.getsize(binario) / 1e6:.1f} MB, "
+            f"CSV {os.path.getsize(texto) / 1e6:.1f} MB"
+        )
+
+        inicio = time.perf_counter()
+        leitor = LeitorBilhetes(binario)
+        print(f"abrir .lotobin:   {(time.perf_counter() - inicio) * 1e3:7.2f}ms")
+        inicio = time.perf_counter()
+        contagem = leitor.contar_acertos([4, 15, 23, 35, 44, 58])
+        print(f"conferir sorteio: {time.perf_counter() - inicio:7.2f}s {contagem}")
+        leitor.fechar()
+
+        inicio = time.perf_counter()
+        with open(texto, newline="") as f:
+            linhas = [[int(c) for c in linha] for linha in csv.reader(f)]
+        print(f"ler CSV:          {time.perf_counter() - inicio:7.2f}s ({len(linhas)})")
+
+
+if __name__ == "__main__":
+    run_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
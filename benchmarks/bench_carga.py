@@ -0,0 +1,258 @@
+"""
+Teste de carga do app Streamlit: N sessões simultâneas (AppTest, uma por
+processo) submetendo o formulário `lottery_config` com loterias e
+quantidades variadas.
+
+Mede a latência de cada rerun (p50/p95/p99, no total e por loteria), o
+pico de memória residente (RSS) de cada sessão e a CPU de todas as sessões,
+incluindo os pools de processos que elas abrem (Top-K, simulação, PDF). O
+relatório JSON tem chaves estáveis para comparar versões:
+
+Execute com: python -m benchmarks.bench_carga [--sessoes 8] [--rodadas 5]
+    [--json saida.json] [--comparar anterior.json]
+
+Limitações:
+    - O AppTest não roda em threads simultâneas (o Runtime falso é global e
+      a compilação do script pode falhar com SystemError), então cada
+      sessão tem o próprio processo. Caches do processo (st.cache_resource,
+      pré-cálculo em memória) não são compartilhados entre sessões como no
+      servidor, e a primeira tela de cada sessão inclui as importações a frio.
+    - O RSS de uma sessão inclui o interpretador e o Streamlit; compare o
+      crescimento (pico final - pico após a primeira tela) entre versões.
+    - A CPU dos pools só é contada depois que eles terminam (os.times das
+      sessões encerradas). Memória e CPU exigem Linux ou macOS.
+"""
+
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: sem ru_maxrss
+    resource = None
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "app.py")
+
+# (loteria, quantidade de jogos): cada sessão começa em um ponto da lista
+CENARIOS = [
+    ("Mega-Sena", 5),
+    ("Lotofácil", 20),
+    ("Quina", 50),
+    ("Lotomania", 10),
+    ("Timemania", 30),
+    ("Dia de Sorte", 15),
+    ("Dupla Sena", 40),
+]
+
+
+def _percentis(amostras: List[float]) -> Dict[str, float]:
+    """p50/p95/p99, média e máximo (ms) de uma lista de latências (s)."""
+    if not amostras:
+        return {}
+    ms = sorted(a * 1000 for a in amostras)
+    if len(ms) == 1:
+        p50 = p95 = p99 = ms[0]
+    else:
+        cortes = statistics.quantiles(ms, n=100, method="inclusive")
+        p50, p95, p99 = cortes[49], cortes[94], cortes[98]
+    return {
+        "p50": round(p50, 1),
+        "p95": round(p95, 1),
+        "p99": round(p99, 1),
+        "media": round(statistics.fmean(ms), 1),
+        "max": round(ms[-1], 1),
+        "n": len(ms),
+    }
+
+
+def _rss_pico_kb() -> Optional[float]:
+    """Pico de memória residente do processo atual (KB), se disponível."""
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss vem em KB no Linux e em bytes no macOS
+    return pico / 1024 if sys.platform == "darwin" else float(pico)
+
+
+def _executar_sessao(indice: int, rodadas: int, largada, fila) -> None:
+    """
+    Um usuário, em processo próprio: primeira tela e `rodadas` submissões do
+    formulário. Envia o resultado da sessão para `fila`.
+    """
+    if RAIZ not in sys.path:
+        sys.path.insert(0, RAIZ)
+    resultado = {
+        "primeira": None,
+        "latencias": [],  # (loteria, segundos)
+        "erros": [],
+        "rss_primeira_kb": None,
+        "rss_final_kb": None,
+    }
+    try:
+        from streamlit.testing.v1 import AppTest
+
+        at = AppTest.from_file(APP, default_timeout=600)
+        largada.wait()
+        inicio = time.perf_counter()
+        at.run()
+        resultado["primeira"] = time.perf_counter() - inicio
+        resultado["rss_primeira_kb"] = _rss_pico_kb()
+        for rodada in range(rodadas):
+            tipo, qtd = CENARIOS[(indice + rodada) % len(CENARIOS)]
+            at.selectbox[0].set_value(tipo)
+            at.slider[0].set_value(qtd)
+            botao = next(b for b in at.button if "GERAR" in b.label)
+            inicio = time.perf_counter()
+            botao.click().run()
+            resultado["latencias"].append((tipo, time.perf_counter() - inicio))
+            if at.exception:
+                resultado["erros"].append(f"{tipo}: {at.exception[0].message}")
+        resultado["rss_final_kb"] = _rss_pico_kb()
+    # Qualquer falha da sessão vai para o relatório sem derrubar as outras
+    except Exception as e:  # noqa: BLE001
+        resultado["erros"].append(f"{type(e).__name__}: {e}")
+    fila.put(resultado)
+
+
+def run_bench(sessoes: int = 8, rodadas: int = 5, saida_json: str = "") -> dict:
+    diretorio = tempfile.mkdtemp(prefix="lotopro_carga_")
+    # Registro e exportações em disco, como em produção, mas isolados
+    # (herdados pelos processos das sessões)
+    os.environ.setdefault("LOTOPRO_LEDGER", os.path.join(diretorio, "ledger.db"))
+    os.environ.setdefault("LOTOPRO_EXPORT_CACHE", os.path.join(diretorio, "export"))
+
+    contexto = multiprocessing.get_context("spawn")
+    largada = contexto.Barrier(sessoes + 1)
+    fila = contexto.Queue()
+    processos = [
+        contexto.Process(
+            target=_executar_sessao,
+            args=(i, rodadas, largada, fila),
+            name=f"sessao-{i}",
+        )
+        for i in range(sessoes)
+    ]
+    for p in processos:
+        p.start()
+    # Relógio e CPU a partir da largada, depois das importações das sessões
+    largada.wait()
+    cpu_inicio = os.times()
+    parede_inicio = time.perf_counter()
+    todas = [fila.get() for _ in processos]
+    for p in processos:
+        p.join()
+    parede = time.perf_counter() - parede_inicio
+    cpu_fim = os.times()
+    # Sessões (e os pools que elas esperaram) já encerradas: entram em children_*
+    cpu = (cpu_fim.children_user + cpu_fim.children_system) - (
+        cpu_inicio.children_user + cpu_inicio.children_system
+    )
+
+    latencias = [s for sessao in todas for _, s in sessao["latencias"]]
+    por_loteria: Dict[str, List[float]] = {}
+    for sessao in todas:
+        for tipo, s in sessao["latencias"]:
+            por_loteria.setdefault(tipo, []).append(s)
+    erros = [e for sessao in todas for e in sessao["erros"]]
+    picos = [s["rss_final_kb"] for s in todas if s["rss_final_kb"] is not None]
+    crescimentos = [
+        s["rss_final_kb"] - s["rss_primeira_kb"]
+        for s in todas
+        if s["rss_final_kb"] is not None and s["rss_primeira_kb"] is not None
+    ]
+
+    relatorio = {
+        "parametros": {"sessoes": sessoes, "rodadas": rodadas, "cpus": os.cpu_count()},
+        "rerun_ms": _percentis(latencias),
+        "rerun_por_loteria_ms": {
+            tipo: _percentis(amostras) for tipo, amostras in sorted(por_loteria.items())
+        },
+        "primeira_tela_ms": _percentis(
+            [s["primeira"] for s in todas if s["primeira"] is not None]
+        ),
+        "memoria_kb": {
+            "rss_pico_sessao_p50": round(statistics.median(picos), 1) if picos else 0.0,
+            "rss_pico_sessao_max": round(max(picos), 1) if picos else 0.0,
+            "crescimento_sessao_p50": (
+                round(statistics.median(crescimentos), 1) if crescimentos else 0.0
+            ),
+        },
+        "cpu": {
+            "sessoes_s": round(cpu, 2),
+            "parede_s": round(parede, 2),
+            "nucleos_ocupados": round(cpu / parede, 2) if parede else 0.0,
+        },
+        "vazao_reruns_s": round(len(latencias) / parede, 2) if parede else 0.0,
+        "erros": len(erros),
+    }
+
+    r = relatorio["rerun_ms"]
+    print(
+        f"{sessoes} sessões x {rodadas} rodadas: rerun p50 {r.get('p50')} ms, "
+        f"p95 {r.get('p95')} ms, p99 {r.get('p99')} ms"
+    )
+    for tipo, p in relatorio["rerun_por_loteria_ms"].items():
+        print(f"  {tipo:13} p50 {p['p50']:9.1f} ms  p95 {p['p95']:9.1f} ms  n={p['n']}")
+    memoria = relatorio["memoria_kb"]
+    print(
+        f"RSS por sessão: p50 {memoria['rss_pico_sessao_p50']:.0f} KB "
+        f"(máx {memoria['rss_pico_sessao_max']:.0f} KB, crescimento p50 "
+        f"{memoria['crescimento_sessao_p50']:.0f} KB) · "
+        f"CPU {relatorio['cpu']['sessoes_s']} s em {relatorio['cpu']['parede_s']} s"
+    )
+    for erro in erros[:10]:
+        print(f"  ERRO {erro}")
+
+    if saida_json:
+        with open(saida_json, "w", encoding="utf-8") as f:
+            json.dump(relatorio, f, indent=2, sort_keys=True, ensure_ascii=False)
+        print(f"Relatório salvo em {saida_json}")
+    return relatorio
+
+
+def _folhas(dados: dict, prefixo: str = "") -> Dict[str, float]:
+    """Valores numéricos de um relatório, por caminho (ex.: rerun_ms.p95)."""
+    folhas = {}
+    for chave, valor in dados.items():
+        caminho = f"{prefixo}{chave}"
+        if isinstance(valor, dict):
+            folhas.update(_folhas(valor, f"{caminho}."))
+        elif isinstance(valor, (int, float)):
+            folhas[caminho] = valor
+    return folhas
+
+
+def comparar(anterior: dict, atual: dict) -> None:
+    """Imprimir a variação de cada métrica entre dois relatórios."""
+    antes, depois = _folhas(anterior), _folhas(atual)
+    for caminho in sorted(set(antes) | set(depois)):
+        a, d = antes.get(caminho), depois.get(caminho)
+        if a is None or d is None:
+            print(f"  {caminho:45} {a!s:>10} -> {d!s:>10}")
+        elif a != d:
+            variacao = f"{(d - a) / a:+.1%}" if a else "novo"
+            print(f"  {caminho:45} {a:>10} -> {d:>10} ({variacao})")
+
+
+def _opcao(args: List[str], nome: str, padrao: str = "") -> str:
+    return args[args.index(nome) + 1] if nome in args else padrao
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    relatorio = run_bench(
+        int(_opcao(args, "--sessoes", "8")),
+        int(_opcao(args, "--rodadas", "5")),
+        _opcao(args, "--json"),
+    )
+    if "--comparar" in args:
+        with open(_opcao(args, "--comparar"), encoding="utf-8") as f:
+            print("Comparação com o relatório anterior:")
+            comparar(json.load(f), relatorio)
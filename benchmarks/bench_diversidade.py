@@ -0,0 +1,50 @@
+"""
+Benchmark do modo diversificado: índice de subconjuntos contra a comparação
+de cada candidato com todos os jogos aceitos.
+
+Execute com: python -m benchmarks.bench_diversidade [quantidade]
+"""
+
+import sys
+import time
+
+import diversidade
+from core import GeradorLoteria
+
+CENARIOS = [
+    ("Mega-Sena", 3),
+    ("Quina", 2),
+    ("Lotofácil", 10),
+]
+
+
+def _medir(tipo: str, quantidade: int, max_sobreposicao: int) -> tuple:
+    """Gerar o conjunto e devolver (jogos obtidos, segundos)."""
+    inicio = time.perf_counter()
+    jogos = GeradorLoteria(seed=42).gerar_jogos_diversos(
+        tipo, quantidade, max_sobreposicao
+    )
+    return len(jogos), time.perf_counter() - inicio
+
+
+def run_bench(quantidade: int = 10_000) -> None:
+    limite = diversidade.LIMITE_SUBCONJUNTOS
+    for tipo, t in CENARIOS:
+        obtidos, duracao = _medir(tipo, quantidade, t)
+        print(f"{tipo:10} t={t:<2} índice:    {obtidos:6} jogos em {duracao:7.2f}s")
+        # Varredura linear só no começo da curva (cresce com n²)
+        n = min(quantidade, 2000)
+        diversidade.LIMITE_SUBCONJUNTOS = 0
+        try:
+            obtidos, duracao = _medir(tipo, n, t)
+        finally:
+            diversidade.LIMITE_SUBCONJUNTOS = limite
+        indice_obtidos, indice_duracao = _medir(tipo, n, t)
+        print(
+            f"{'':10} {'':4} varredura: {obtidos:6} jogos em {duracao:7.2f}s "
+            f"(índice: {indice_duracao:.2f}s para os mesmos {indice_obtidos})"
+        )
+
+
+if __name__ == "__main__":
+    run_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
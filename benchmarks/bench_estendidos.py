@@ -0,0 +1,47 @@
+"""
+Benchmark das apostas estendidas: simulação com apostas simples, com
+apostas de 15 números conferidas pelas fórmulas binomiais e com as mesmas
+apostas expandidas em sub-jogos, além da geração com cobertura mínima.
+
+Execute com: python -m benchmarks.bench_estendidos [sorteios]
+"""
+
+import sys
+import time
+from itertools import combinations
+
+from core import GeradorLoteria
+from simulador import simular
+
+
+def _medir(jogos, sorteios: int) -> float:
+    """Microssegundos por sorteio simulado."""
+    inicio = time.perf_counter()
+    simular("Mega-Sena", jogos, sorteios, seed=1, workers=1)
+    return (time.perf_counter() - inicio) / sorteios * 1e6
+
+
+def run_bench(sorteios: int = 20_000) -> None:
+    gerador = GeradorLoteria(seed=1)
+    simples = [j.numeros for j in gerador.gerar_jogos("Mega-Sena", 10)]
+    estendidas = [
+        j.numeros for j in gerador.gerar_jogos_estendidos("Mega-Sena", 10, 15)
+    ]
+    expandidas = [list(c) for j in estendidas[:1] for c in combinations(j, 6)]
+
+    print(f"10 apostas de 6:          {_medir(simples, sorteios):8.2f} µs/sorteio")
+    print(f"10 apostas de 15:         {_medir(estendidas, sorteios):8.2f} µs/sorteio")
+    print(
+        f"1 aposta de 15 expandida: {_medir(expandidas, sorteios // 100):8.2f} µs/sorteio"
+        f" ({len(expandidas)} sub-jogos)"
+    )
+
+    for tamanho in (8, 12, 15):
+        inicio = time.perf_counter()
+        gerador.gerar_jogos_estendidos("Mega-Sena", 20, tamanho)
+        ms = (time.perf_counter() - inicio) / 20 * 1000
+        print(f"Geração, apostas de {tamanho:2d}:  {ms:8.2f} ms/aposta")
+
+
+if __name__ == "__main__":
+    run_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
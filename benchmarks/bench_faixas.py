@@ -0,0 +1,64 @@
+"""
+Benchmark da contagem por faixas da barra lateral: montagem da tabela de
+cada loteria (uma vez) e tempo por ajuste de faixa, comparado à contagem
+exata refeita com poda (viabilidade.ContadorCombinacoes).
+
+Execute com: python -m benchmarks.bench_faixas [ajustes]
+"""
+
+import random
+import sys
+import time
+
+from config import LOTTERY_CONFIG
+from faixas import _construir, dimensoes_disponiveis, limites, tabela_faixas
+from viabilidade import ContadorCombinacoes, Restricoes
+
+
+def run_bench(ajustes: int = 200) -> None:
+    rng = random.Random(1)
+    for tipo, config in LOTTERY_CONFIG.items():
+        dimensoes = tuple(dimensoes_disponiveis(tipo))
+        evitar = config.get("evitar_sequencia", False)
+        tabela = tabela_faixas(tipo, dimensoes, evitar)
+
+        inicio = time.perf_counter()
+        _construir(tabela.restricoes, dimensoes)
+        montagem = time.perf_counter() - inicio
+
+        faixas = {d: limites(tipo, d) for d in dimensoes}
+        sorteadas = []
+        for _ in range(ajustes):
+            # Um ajuste mexe em uma dimensão, como um slider
+            dimensao = rng.choice(dimensoes)
+            minimo, maximo = limites(tipo, dimensao)
+            faixas = {
+                **faixas,
+                dimensao: tuple(sorted(rng.randint(minimo, maximo) for _ in range(2))),
+            }
+            sorteadas.append(faixas)
+        inicio = time.perf_counter()
+        for faixas in sorteadas:
+            tabela.contar(faixas)
+        por_ajuste = (time.perf_counter() - inicio) / ajustes * 1000
+
+        inicio = time.perf_counter()
+        for faixas in sorteadas[:3]:
+            ContadorCombinacoes(
+                Restricoes(
+                    max_numero=config["max_numero"],
+                    qtd=config["qtd_selecionados"],
+                    evitar_sequencia=evitar,
+                    **faixas,
+                )
+            ).preencher()
+        refeita = (time.perf_counter() - inicio) / 3 * 1000
+
+        print(
+            f"{tipo:12} tabela {montagem:6.2f} s ({len(tabela.tabela):5} chaves); "
+            f"ajuste {por_ajuste:6.3f} ms, contagem refeita {refeita:9.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    run_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
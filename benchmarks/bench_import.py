@@ -0,0 +1,133 @@
+"""
+Benchmark de inicialização: custo de importação por módulo e tempo até a
+primeira renderização do app Streamlit.
+
+Cada medição roda em um processo novo (importações a frio).
+
+Execute com: python -m benchmarks.bench_import [--json saida.json]
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULOS = [
+    "config",
+    "core",
+    "ledger",
+    "simulador",
+    "exportacao",
+    "instrumentacao",
+    "streamlit",
+    "pandas",
+    "plotly.express",
+    "streamlit.components.v1",
+    "fpdf",
+    "pdf_generator",
+]
+
+# Módulos que um import headless de `core` não deve puxar
+PESADOS = ["streamlit", "pandas", "plotly", "fpdf", "numpy"]
+
+PRIMEIRA_RENDERIZACAO = """
+import time
+inicio = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+pronto = time.perf_counter()
+at = AppTest.from_file("app.py", default_timeout=120)
+at.run()
+fim = time.perf_counter()
+import sys
+pesados = [m for m in ("pandas", "plotly", "fpdf") if m in sys.modules]
+print(pronto - inicio, fim - pronto, ",".join(pesados) or "-")
+"""
+
+
+def _executar(codigo: str, *flags: str) -> subprocess.CompletedProcess:
+    """Executar código Python em um processo novo."""
+    return subprocess.run(
+        [sys.executable, *flags, "-c", codigo],
+        cwd=RAIZ,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def custo_importacao(modulo: str) -> float:
+    """Tempo cumulativo (ms) de `import modulo` a frio, via -X importtime."""
+    saida = _executar(f"import {modulo}", "-X", "importtime").stderr
+    for linha in reversed(saida.splitlines()):
+        partes = [p.strip() for p in linha.split("|")]
+        if len(partes) == 3 and partes[2] == modulo:
+            return int(partes[1]) / 1000
+    return float("nan")
+
+
+def modulos_pesados_de_core() -> list:
+    """Módulos pesados carregados por um import headless de core."""
+    codigo = (
+        "import sys, core; "
+        f"print(','.join(m for m in {PESADOS!r} if m in sys.modules))"
+    )
+    saida = _executar(codigo).stdout.strip()
+    return saida.split(",") if saida else []
+
+
+def primeira_renderizacao() -> dict:
+    """
+    Tempo da primeira execução do app (tela inicial) em processo novo.
+
+    O aquecimento em segundo plano é desligado para que a lista de módulos
+    pesados reflita só o que a tela inicial importou.
+    """
+    env = {**os.environ, "LOTOPRO_LEDGER": ":memory:", "LOTOPRO_AQUECER": "0"}
+    saida = subprocess.run(
+        [sys.executable, "-c", PRIMEIRA_RENDERIZACAO],
+        cwd=RAIZ,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    harness, render, pesados = saida[-3:]
+    return {
+        "harness_ms": round(float(harness) * 1000, 1),
+        "primeira_renderizacao_ms": round(float(render) * 1000, 1),
+        "pesados_na_tela_inicial": [] if pesados == "-" else pesados.split(","),
+    }
+
+
+def run_bench(saida_json: str = "") -> dict:
+    relatorio = {
+        "importacao_ms": {m: round(custo_importacao(m), 1) for m in MODULOS},
+        "core_puxa_pesados": modulos_pesados_de_core(),
+    }
+    print("Custo de importação a frio (cumulativo):")
+    for modulo, ms in relatorio["importacao_ms"].items():
+        print(f"  {modulo:28} {ms:10.1f} ms")
+    print(f"Pesados carregados por `import core`: {relatorio['core_puxa_pesados']}")
+
+    try:
+        relatorio.update(primeira_renderizacao())
+        print(
+            f"Primeira renderização do app: "
+            f"{relatorio['primeira_renderizacao_ms']:.1f} ms "
+            f"(módulos pesados: {relatorio['pesados_na_tela_inicial']})"
+        )
+    except (subprocess.CalledProcessError, ValueError) as e:
+        print(f"Primeira renderização não medida: {e}")
+
+    if saida_json:
+        with open(saida_json, "w", encoding="utf-8") as f:
+            json.dump(relatorio, f, indent=2)
+        print(f"Relatório salvo em {saida_json}")
+    return relatorio
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    run_bench(args[args.index("--json") + 1] if "--json" in args else "")
@@ -0,0 +1,67 @@
+"""
+Benchmark do importador de históricos: importação inicial de um CSV no
+layout oficial, reimportação sem mudanças (mesmo arquivo e arquivo tocado)
+e acréscimo de concursos novos.
+
+Execute com: python -m benchmarks.bench_importador [concursos]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from importador import importar
+
+
+def _escrever_csv(caminho: str, concursos: int) -> None:
+    """CSV da Mega-Sena com data, bolas e colunas de rateio, como o oficial."""
+    rng = random.Random(42)
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write(
+            "Concurso;Data do Sorteio;Bola1;Bola2;Bola3;Bola4;Bola5;Bola6;"
+            "Ganhadores 6 acertos;Cidade / UF;Rateio 6 acertos;"
+            "Ganhadores 5 acertos;Rateio 5 acertos\n"
+        )
+        for c in range(1, concursos + 1):
+            bolas = ";".join(f"{n:02d}" for n in rng.sample(range(1, 61), 6))
+            f.write(
+                f"{c};01/01/2000;{bolas};0;;R$0,00;{rng.randint(0, 90)};"
+                f"R${rng.randint(10_000, 90_000)},00\n"
+            )
+
+
+def _medir(origem: str, destino: str) -> tuple:
+    inicio = time.perf_counter()
+    resultado = importar(origem, destino, "Mega-Sena")
+    return (time.perf_counter() - inicio) * 1000, resultado
+
+
+def run_bench(concursos: int = 3000) -> None:
+    with tempfile.TemporaryDirectory() as diretorio:
+        origem = os.path.join(diretorio, "mega.csv")
+        destino = os.path.join(diretorio, "mega.lotobin")
+        _escrever_csv(origem, concursos)
+
+        ms, r = _medir(origem, destino)
+        print(f"Importação inicial ({r.novos} sorteios):   {ms:8.2f} ms")
+        ms, r = _medir(origem, destino)
+        print(
+            f"Reimportação, arquivo igual:        {ms:8.2f} ms (inalterado={r.inalterado})"
+        )
+        os.utime(origem)
+        ms, r = _medir(origem, destino)
+        print(
+            f"Reimportação, arquivo tocado:       {ms:8.2f} ms (inalterado={r.inalterado})"
+        )
+        _escrever_csv(origem, concursos + 10)
+        ms, r = _medir(origem, destino)
+        print(f"Acréscimo de {r.novos} concursos:           {ms:8.2f} ms")
+        print(
+            f"Histórico: {os.path.getsize(destino)} bytes, CSV: {os.path.getsize(origem)} bytes"
+        )
+
+
+if __name__ == "__main__":
+    run_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
@@ -0,0 +1,66 @@
+"""
+Benchmark de inserção e consulta do TicketLedger.
+
+Execute com: python -m benchmarks.bench_ledger [quantidade]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from core import GameResult, GeradorLoteria
+from ledger import TicketLedger
+
+
+def _jogos_aleatorios(quantidade: int, seed: int = 42) -> list:
+    """Gerar jogos da Mega-Sena sem filtro (só o custo de inserção importa)."""
+    gerador = GeradorLoteria(seed=seed)
+    jogos = []
+    for _ in range(quantidade):
+        numeros = gerador._gerar_randomico(60, 6)
+        pares, impares = gerador.analisador.contar_pares_impares(numeros)
+        jogos.append(
+            GameResult(
+                numeros=numeros,
+                soma=sum(numeros),
+                pares=pares,
+                impares=impares,
+                tipo="mega_sena",
+            )
+        )
+    return jogos
+
+
+def run_bench(quantidade: int = 200_000) -> None:
+    jogos = _jogos_aleatorios(quantidade)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        caminho = os.path.join(tmp, "bench_ledger.db")
+        with TicketLedger(caminho) as ledger:
+            inicio = time.perf_counter()
+            lote_id = ledger.registrar_lote(jogos, "Mega-Sena", seed=42)
+            duracao = time.perf_counter() - inicio
+            print(
+                f"Inserção: {quantidade} jogos em {duracao:.3f}s "
+                f"({quantidade / duracao:,.0f} jogos/s)"
+            )
+
+            inicio = time.perf_counter()
+            consultas = 10_000
+            for jogo in jogos[:consultas]:
+                ledger.ja_emitido("Mega-Sena", jogo.numeros)
+            duracao = time.perf_counter() - inicio
+            print(
+                f"ja_emitido: {consultas} consultas em {duracao:.3f}s "
+                f"({duracao / consultas * 1e6:.1f} µs/consulta)"
+            )
+
+            inicio = time.perf_counter()
+            lote = ledger.jogos_do_lote(lote_id)
+            duracao = time.perf_counter() - inicio
+            print(f"jogos_do_lote: {len(lote)} jogos em {duracao:.3f}s")
+
+
+if __name__ == "__main__":
+    run_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,56 @@
+"""
+Benchmark da geração por loteria (custo por jogo válido) e da amostragem
+pelo complemento contra sorted(sample) em volantes de 100 números
+(Lotomania: 50 de 100).
+
+Execute com: python -m benchmarks.bench_loterias [quantidade]
+"""
+
+import random
+import sys
+import time
+
+from config import LOTTERY_CONFIG
+from core import GeradorLoteria
+from viabilidade import analisar
+
+
+def _por_jogo(tipo: str, quantidade: int) -> float:
+    """Microssegundos por jogo válido gerado."""
+    analisar(tipo)  # contagem da viabilidade fica fora da medição
+    gerador = GeradorLoteria(seed=42)
+    inicio = time.perf_counter()
+    gerador.gerar_jogos(tipo, quantidade)
+    return (time.perf_counter() - inicio) / quantidade * 1e6
+
+
+def _amostragem(quantidade: int, qtd: int) -> tuple:
+    """Microssegundos por combinação de qtd de 100: (complemento, sorted(sample))."""
+    gerador = GeradorLoteria(seed=42)
+    inicio = time.perf_counter()
+    for _ in range(quantidade):
+        gerador._gerar_randomico(100, qtd)
+    complemento = time.perf_counter() - inicio
+
+    rng = random.Random(42)
+    populacao = range(1, 101)
+    inicio = time.perf_counter()
+    for _ in range(quantidade):
+        sorted(rng.sample(populacao, qtd))
+    ordenado = time.perf_counter() - inicio
+    return complemento / quantidade * 1e6, ordenado / quantidade * 1e6
+
+
+def run_bench(quantidade: int = 2000) -> None:
+    for tipo in LOTTERY_CONFIG:
+        print(f"{tipo:13} {_por_jogo(tipo, quantidade):8.1f} µs/jogo")
+    for qtd in (50, 70, 90):
+        complemento, ordenado = _amostragem(quantidade * 5, qtd)
+        print(
+            f"{qtd} de 100: complemento {complemento:5.1f} µs, "
+            f"sorted(sample) {ordenado:5.1f} µs"
+        )
+
+
+if __name__ == "__main__":
+    run_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
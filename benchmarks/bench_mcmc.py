@@ -0,0 +1,73 @@
+"""
+Benchmark das cadeias de trocas (gerar_jogos_mcmc) contra a geração padrão
+(gerar_jogos) e contra rejeição simples quando há uma restrição extra que a
+contagem exata não cobre (no máximo um número por dezena).
+
+Execute com: python -m benchmarks.bench_mcmc [quantidade]
+"""
+
+import sys
+import time
+
+from config import LOTTERY_CONFIG
+from core import GeradorLoteria, empacotar_numeros
+from viabilidade import analisar
+
+
+def _dezenas(max_numero: int):
+    """Verificação: no máximo um número por dezena (1-10, 11-20, ...)."""
+    mascaras = [
+        sum(1 << n for n in range(d, min(d + 10, max_numero + 1)))
+        for d in range(1, max_numero + 1, 10)
+    ]
+    return lambda m: all((m & d).bit_count() <= 1 for d in mascaras)
+
+
+def _medir(gerar) -> float:
+    """Microssegundos por jogo."""
+    inicio = time.perf_counter()
+    jogos = gerar()
+    return (time.perf_counter() - inicio) / max(1, len(jogos)) * 1e6
+
+
+def _rejeicao(gerador: GeradorLoteria, tipo: str, quantidade: int, verificar):
+    """Jogos da geração padrão filtrados pela verificação extra."""
+    jogos = []
+    for jogo in gerador.gerar_combinacoes(tipo, quantidade * 1000):
+        if verificar(empacotar_numeros(jogo)):
+            jogos.append(jogo)
+            if len(jogos) == quantidade:
+                break
+    return jogos
+
+
+def run_bench(quantidade: int = 2000) -> None:
+    print(f"{'loteria':13} {'padrão':>10} {'mcmc':>10}")
+    for tipo in LOTTERY_CONFIG:
+        analisar(tipo)  # contagem da viabilidade fica fora da medição
+        padrao = _medir(
+            lambda tipo=tipo: GeradorLoteria(seed=1).gerar_jogos(tipo, quantidade)
+        )
+        mcmc = _medir(
+            lambda tipo=tipo: GeradorLoteria(seed=1).gerar_jogos_mcmc(tipo, quantidade)
+        )
+        print(f"{tipo:13} {padrao:8.1f}µs {mcmc:8.1f}µs")
+
+    print("\nCom restrição extra (um número por dezena):")
+    for tipo in ("Mega-Sena", "Quina"):
+        verificar = _dezenas(LOTTERY_CONFIG[tipo]["max_numero"])
+        rejeicao = _medir(
+            lambda tipo=tipo, verificar=verificar: _rejeicao(
+                GeradorLoteria(seed=1), tipo, quantidade // 4, verificar
+            ),
+        )
+        mcmc = _medir(
+            lambda tipo=tipo, verificar=verificar: GeradorLoteria(
+                seed=1
+            ).gerar_jogos_mcmc(tipo, quantidade // 4, verificacoes=[verificar]),
+        )
+        print(f"{tipo:13} rejeição {rejeicao:9.1f}µs  mcmc {mcmc:8.1f}µs")
+
+
+if __name__ == "__main__":
+    run_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
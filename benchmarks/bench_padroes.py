@@ -0,0 +1,46 @@
+"""
+Benchmark dos padrões de posição: medição de lotes inteiros por loteria e
+custo da geração com e sem faixas range_<padrão> configuradas.
+
+Execute com: python -m benchmarks.bench_padroes [jogos]
+"""
+
+import sys
+import time
+
+from config import LOTTERY_CONFIG
+from core import GeradorLoteria
+from padroes import calculadora
+from viabilidade import analisar
+
+
+def _medir_geracao(tipo: str, quantidade: int) -> float:
+    """Microssegundos por jogo de gerar_jogos."""
+    gerador = GeradorLoteria(seed=1)
+    inicio = time.perf_counter()
+    jogos = gerador.gerar_jogos(tipo, quantidade)
+    return (time.perf_counter() - inicio) / max(1, len(jogos)) * 1e6
+
+
+def run_bench(jogos: int = 5000) -> None:
+    print(f"{'loteria':13} {'padrões/jogo':>13} {'geração':>10} {'com faixas':>11}")
+    for tipo, config in LOTTERY_CONFIG.items():
+        analisar(tipo)  # contagem da viabilidade fica fora da medição
+        mascaras = [j.mascara for j in GeradorLoteria(seed=2).gerar_jogos(tipo, jogos)]
+        calc = calculadora(config["max_numero"])
+        inicio = time.perf_counter()
+        calc.medir_lote(mascaras)
+        por_jogo = (time.perf_counter() - inicio) / jogos * 1e6
+
+        padrao = _medir_geracao(tipo, jogos // 5)
+        # Faixa que quase todo jogo atende: mede o custo da verificação
+        config["range_maior_sequencia"] = (0, config["qtd_selecionados"])
+        try:
+            com_faixas = _medir_geracao(tipo, jogos // 5)
+        finally:
+            del config["range_maior_sequencia"]
+        print(f"{tipo:13} {por_jogo:11.2f}µs {padrao:8.1f}µs {com_faixas:9.1f}µs")
+
+
+if __name__ == "__main__":
+    run_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
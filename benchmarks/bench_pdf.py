@@ -0,0 +1,51 @@
+"""
+Benchmark do relatório em PDF: paginação, desenho em um processo e desenho
+em blocos paralelos juntados com pypdf (se instalado).
+
+Execute com: python -m benchmarks.bench_pdf [jogos]
+"""
+
+import os
+import sys
+import time
+
+from core import GeradorLoteria
+from pdf_generator import PDFGenerator, _juntador
+
+
+def _medir(funcao) -> float:
+    inicio = time.perf_counter()
+    funcao()
+    return time.perf_counter() - inicio
+
+
+def run_bench(jogos: int = 20_000) -> None:
+    for tipo in ("Mega-Sena", "Lotomania"):
+        lista = GeradorLoteria(seed=1).gerar_jogos(tipo, jogos)
+        gerador = PDFGenerator(tipo)
+        paginacao = gerador.paginar(lista)
+        print(f"{tipo}: {jogos} jogos, {paginacao.total_paginas} páginas")
+        tempo = _medir(lambda gerador=gerador, lista=lista: gerador.paginar(lista))
+        print(f"  paginação:         {tempo:8.2f} s")
+        serial = _medir(
+            lambda gerador=gerador, lista=lista: gerador.generate_report(
+                lista, workers=1
+            )
+        )
+        print(f"  1 processo:        {serial:8.2f} s")
+        if _juntador() is None:
+            print("  paralelo:          pypdf não instalado")
+            continue
+        workers = os.cpu_count() or 1
+        paralelo = _medir(
+            lambda gerador=gerador, lista=lista, workers=workers: (
+                gerador.generate_report(lista, workers=workers)
+            )
+        )
+        print(
+            f"  {workers} processos:       {paralelo:8.2f} s ({serial / paralelo:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    run_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
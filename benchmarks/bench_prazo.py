@@ -0,0 +1,37 @@
+"""
+Benchmark da geração com prazo: palpites entregues por chamada sob prazos
+curtos e tamanho da continuação (com e sem jogos distintos).
+
+Execute com: python -m benchmarks.bench_prazo [quantidade]
+"""
+
+import sys
+
+from core import GeradorLoteria
+
+
+def run_bench(quantidade: int = 100_000) -> None:
+    for tipo in ("Mega-Sena", "Lotofácil", "Lotomania"):
+        for prazo in (0.01, 0.1):
+            for distintos in (False, True):
+                gerador = GeradorLoteria(seed=1)
+                parcial = gerador.gerar_jogos_com_prazo(
+                    tipo, quantidade, prazo, distintos=distintos
+                )
+                chamadas = 1
+                while not parcial.concluido and chamadas < 5:
+                    parcial = gerador.gerar_jogos_com_prazo(
+                        tipo, quantidade, prazo, parcial.continuacao, distintos
+                    )
+                    chamadas += 1
+                tamanho = len(parcial.continuacao or "") / 1024
+                print(
+                    f"{tipo:10} prazo {prazo * 1000:4.0f} ms "
+                    f"{'distintos' if distintos else 'livres   '}: "
+                    f"{parcial.produzidos / chamadas:8.0f} jogos/chamada, "
+                    f"continuação {tamanho:7.1f} KiB após {parcial.produzidos} jogos"
+                )
+
+
+if __name__ == "__main__":
+    run_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
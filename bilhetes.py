@@ -0,0 +1,636 @@
+"""
+Formato binário compacto para conjuntos grandes de jogos (.lotobin) e
+leitor via mmap com visões sem cópia.
+
+Layout (inteiros little-endian, seções alinhadas em 8 bytes):
+
+    preâmbulo  "LOTOBIN\\0", versão (u16), palavras por jogo (u16),
+               tamanho do cabeçalho (u32), quantidade de jogos (u64)
+    cabeçalho  JSON: loteria, seed, criado_em, colunas de estatísticas e
+               metadados livres (ex.: origem de um histórico importado)
+    máscaras   quantidade * palavras inteiros u64 (bit n = número n)
+    colunas    uma seção por coluna (soma: u16; pares, primos, fibo: u8;
+               concurso: u32, em históricos de sorteios)
+    extras     uma seção u8 por sorteio fora do volante da loteria (índice
+               da opção; SEM_EXTRA em jogos gravados sem os extras)
+
+Os jogos são guardados como máscaras e não como rank: a máscara da
+Lotomania (101 bits) cabe em duas palavras, enquanto o rank passa de 64
+bits, e a conferência contra um sorteio é um AND + popcount direto.
+"""
+
+import csv
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+import uuid
+from array import array
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from config import LOTTERY_CONFIG
+from core import (
+    GameResult,
+    GeradorLoteria,
+    codificar_extras,
+    decodificar_extras,
+    desempacotar_numeros,
+)
+from precomputo import tabelas_numeros
+
+MAGICO = b"LOTOBIN\x00"
+VERSAO = 1
+PREAMBULO = struct.Struct("<8sHHIQ")
+# Offset do campo quantidade no preâmbulo (reescrito ao fechar o escritor)
+OFFSET_QUANTIDADE = 16
+
+TIPOS_COLUNAS = {
+    "soma": "H",
+    "pares": "B",
+    "primos": "B",
+    "fibo": "B",
+    "concurso": "I",
+}
+TAMANHO_BLOCO = 65536
+# Índice gravado nas seções de extras de um jogo sem sorteios extras
+SEM_EXTRA = 0xFF
+
+
+def _alinhar(tamanho: int) -> int:
+    """Arredondar para o próximo múltiplo de 8."""
+    return -(-tamanho // 8) * 8
+
+
+def _palavras(loteria: str) -> int:
+    """Palavras de 64 bits por máscara (bit 0 não é usado)."""
+    return LOTTERY_CONFIG[loteria]["max_numero"] // 64 + 1
+
+
+def colunas_padrao(loteria: str) -> List[str]:
+    """Colunas de estatísticas gravadas por padrão (as do GameResult)."""
+    config = LOTTERY_CONFIG[loteria]
+    colunas = ["soma", "pares"]
+    if "range_primos" in config:
+        colunas.append("primos")
+    if "range_fibo" in config:
+        colunas.append("fibo")
+    return colunas
+
+
+class EscritorBilhetes:
+    """
+    Gravação em fluxo de um arquivo .lotobin.
+
+    As máscaras vão para o arquivo em blocos conforme chegam; as colunas de
+    estatísticas e os sorteios extras (1 a 2 bytes por jogo) ficam em
+    memória até o fechamento, quando são gravados depois das máscaras e a
+    quantidade é escrita no preâmbulo.
+    """
+
+    def __init__(
+        self,
+        arquivo: BinaryIO,
+        loteria: str,
+        seed: Optional[int] = None,
+        colunas: Optional[Sequence[str]] = None,
+        criado_em: Optional[float] = None,
+        metadados: Optional[dict] = None,
+        reserva_cabecalho: int = 0,
+    ):
+        """
+        Gravar o cabeçalho e preparar a escrita.
+
+        Args:
+            arquivo: Arquivo binário aberto para escrita (com seek).
+            loteria: Tipo de loteria (chave de LOTTERY_CONFIG).
+            seed: Semente da geração, se conhecida.
+            colunas: Estatísticas gravadas por jogo (padrão: colunas_padrao).
+            criado_em: Timestamp do conjunto (padrão: agora).
+            metadados: Dados livres (serializáveis em JSON) do cabeçalho.
+            reserva_cabecalho: Bytes livres no fim do cabeçalho, para que
+                metadados maiores caibam no lugar (ver acrescentar_bilhetes).
+
+        Raises:
+            ValueError: Se a loteria ou alguma coluna não for reconhecida.
+        """
+        if loteria not in LOTTERY_CONFIG:
+            raise ValueError(f"Tipo de loteria desconhecido: {loteria}")
+        colunas = colunas_padrao(loteria) if colunas is None else list(colunas)
+        desconhecidas = [c for c in colunas if c not in TIPOS_COLUNAS]
+        if desconhecidas:
+            raise ValueError(f"Colunas desconhecidas: {desconhecidas}")
+
+        self._preparar(
+            arquivo,
+            loteria,
+            {c: array(TIPOS_COLUNAS[c]) for c in colunas},
+            [array("B") for _ in LOTTERY_CONFIG[loteria].get("sorteios_extras") or {}],
+        )
+        self._inicio = arquivo.tell()
+
+        cabecalho = json.dumps(
+            {
+                "loteria": loteria,
+                "seed": seed,
+                "criado_em": time.time() if criado_em is None else criado_em,
+                "colunas": [{"nome": c, "tipo": TIPOS_COLUNAS[c]} for c in colunas],
+                "extras": list(self._config.get("sorteios_extras") or {}),
+                "metadados": metadados or {},
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        tamanho = _alinhar(len(cabecalho) + reserva_cabecalho)
+        cabecalho += b" " * (tamanho - len(cabecalho))
+        arquivo.write(PREAMBULO.pack(MAGICO, VERSAO, self.palavras, len(cabecalho), 0))
+        arquivo.write(cabecalho)
+
+    def _preparar(
+        self,
+        arquivo: BinaryIO,
+        loteria: str,
+        colunas: Dict[str, array],
+        extras: List[array],
+    ) -> None:
+        """Estado da escrita: colunas e extras já gravados e tabelas por número."""
+        self.arquivo = arquivo
+        self.loteria = loteria
+        self.palavras = _palavras(loteria)
+        self.quantidade = 0
+        self._colunas = colunas
+        self._config = LOTTERY_CONFIG[loteria]
+        self._extras = extras
+        self._mascaras = array("Q")
+        self._inicio = 0
+
+        tabelas = tabelas_numeros(loteria)
+        self._bits = tabelas["bits"]
+        self._tabelas = {
+            "pares": tabelas["par"],
+            "primos": tabelas["primo"],
+            "fibo": tabelas["fibo"],
+        }
+
+    @classmethod
+    def _continuar(
+        cls, arquivo: BinaryIO, leitor: "LeitorBilhetes"
+    ) -> "EscritorBilhetes":
+        """
+        Escritor que continua os jogos de `leitor` em `arquivo` (o mesmo
+        arquivo, aberto para leitura e escrita e posicionado no fim das
+        máscaras). As colunas e os extras gravados são copiados para a memória.
+        """
+        escritor = cls.__new__(cls)
+        escritor._preparar(
+            arquivo,
+            leitor.loteria,
+            {
+                nome: array(leitor._secoes[nome][2], leitor._secao(nome))
+                for nome in leitor.colunas
+            },
+            [
+                array("B", leitor._secao(f"extra:{nome}"))
+                for nome in leitor.extras_gravados
+            ],
+        )
+        escritor.quantidade = len(leitor)
+        return escritor
+
+    def __enter__(self) -> "EscritorBilhetes":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fechar()
+
+    def adicionar(
+        self,
+        numeros: List[int],
+        concurso: int = 0,
+        extras: Optional[Dict[str, object]] = None,
+    ) -> None:
+        """
+        Gravar um jogo.
+
+        Args:
+            numeros: Números do jogo.
+            concurso: Número do concurso (só na coluna "concurso").
+            extras: Sorteios fora do volante do jogo (GameResult.extras).
+
+        Raises:
+            ValueError: Se os extras não forem opções da loteria.
+        """
+        if self._extras:
+            indices = (
+                [SEM_EXTRA] * len(self._extras)
+                if extras is None
+                else codificar_extras(self._config, extras)
+            )
+            for coluna, indice in zip(self._extras, indices):
+                coluna.append(indice)
+        bits = self._bits
+        mascara = 0
+        for x in numeros:
+            mascara |= bits[x]
+        if self.palavras == 1:
+            self._mascaras.append(mascara)
+        else:
+            for _ in range(self.palavras):
+                self._mascaras.append(mascara & 0xFFFFFFFFFFFFFFFF)
+                mascara >>= 64
+        for nome, coluna in self._colunas.items():
+            if nome == "soma":
+                coluna.append(sum(numeros))
+            elif nome == "concurso":
+                coluna.append(concurso)
+            else:
+                tabela = self._tabelas[nome]
+                coluna.append(sum([tabela[x] for x in numeros]))
+        self.quantidade += 1
+        if len(self._mascaras) >= TAMANHO_BLOCO:
+            self._descarregar()
+
+    def adicionar_varios(self, combinacoes: Iterable[List[int]]) -> None:
+        """
+        Gravar vários jogos (ex.: direto de GeradorLoteria.gerar_combinacoes).
+
+        Args:
+            combinacoes: Números de cada jogo.
+        """
+        for numeros in combinacoes:
+            self.adicionar(numeros)
+
+    def _descarregar(self) -> None:
+        """Gravar o bloco de máscaras pendente."""
+        if sys.byteorder != "little":
+            self._mascaras.byteswap()
+        self._mascaras.tofile(self.arquivo)
+        self._mascaras = array("Q")
+
+    def fechar(self) -> None:
+        """Gravar as colunas, os extras e a quantidade final de jogos."""
+        self._descarregar()
+        for coluna in [*self._colunas.values(), *self._extras]:
+            if sys.byteorder != "little":
+                coluna.byteswap()
+            dados = coluna.tobytes()
+            self.arquivo.write(dados + b"\x00" * (_alinhar(len(dados)) - len(dados)))
+        fim = self.arquivo.tell()
+        self.arquivo.seek(self._inicio + OFFSET_QUANTIDADE)
+        self.arquivo.write(struct.pack("<Q", self.quantidade))
+        self.arquivo.seek(fim)
+        self.arquivo.flush()
+
+
+def gravar_bilhetes(
+    caminho: str,
+    loteria: str,
+    combinacoes: Iterable[List[int]],
+    seed: Optional[int] = None,
+    colunas: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    Gravar um arquivo .lotobin completo (escrita atômica).
+
+    Args:
+        caminho: Arquivo de destino.
+        loteria: Tipo de loteria (chave de LOTTERY_CONFIG).
+        combinacoes: Números de cada jogo.
+        seed: Semente da geração, se conhecida.
+        colunas: Estatísticas gravadas por jogo (padrão: colunas_padrao).
+
+    Returns:
+        Quantidade de jogos gravados.
+
+    Raises:
+        ValueError: Se a loteria ou alguma coluna não for reconhecida.
+    """
+    temporario = f"{caminho}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(temporario, "wb") as f, EscritorBilhetes(
+            f, loteria, seed=seed, colunas=colunas
+        ) as escritor:
+            escritor.adicionar_varios(combinacoes)
+        os.replace(temporario, caminho)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+    return escritor.quantidade
+
+
+def acrescentar_bilhetes(
+    caminho: str,
+    jogos: Iterable[Tuple[List[int], int]],
+    metadados: Optional[dict] = None,
+) -> Optional[int]:
+    """
+    Acrescentar jogos a um arquivo .lotobin sem regravar os já gravados.
+
+    As novas máscaras entram depois das antigas; só as colunas e os extras
+    (1 a 6 bytes por jogo) são regravados, e o preâmbulo e o cabeçalho são
+    corrigidos no lugar. Se a gravação falhar, o trecho alterado é
+    restaurado; ao contrário de gravar_bilhetes, uma queda do processo no
+    meio da gravação pode deixar o arquivo inconsistente.
+
+    Args:
+        caminho: Arquivo .lotobin existente.
+        jogos: Pares (números, concurso) dos jogos acrescentados, gravados
+            sem sorteios extras.
+        metadados: Novos metadados do cabeçalho (padrão: os atuais).
+
+    Returns:
+        Quantidade total de jogos, ou None (sem alterar o arquivo) se o novo
+        cabeçalho não couber no espaço do atual; nesse caso, regrave o
+        arquivo inteiro.
+
+    Raises:
+        ValueError: Se o arquivo não for um .lotobin válido.
+    """
+    with open(caminho, "r+b") as f:
+        with LeitorBilhetes(caminho) as leitor:
+            cabecalho = dict(leitor._cabecalho)
+            if metadados is not None:
+                cabecalho["metadados"] = metadados
+            dados = json.dumps(cabecalho, ensure_ascii=False).encode("utf-8")
+            tamanho = leitor._tamanho_cabecalho
+            if len(dados) > tamanho:
+                return None
+            dados += b" " * (tamanho - len(dados))
+            fim_mascaras = leitor._secoes["mascaras"][1]
+            escritor = EscritorBilhetes._continuar(f, leitor)
+
+        original = f.read(PREAMBULO.size + tamanho)
+        f.seek(fim_mascaras)
+        cauda = f.read()
+        f.seek(fim_mascaras)
+        try:
+            for numeros, concurso in jogos:
+                escritor.adicionar(numeros, concurso)
+            escritor.fechar()
+            f.truncate()
+            f.seek(PREAMBULO.size)
+            f.write(dados)
+            f.flush()
+        except BaseException:
+            f.seek(0)
+            f.write(original)
+            f.seek(fim_mascaras)
+            f.write(cauda)
+            f.truncate()
+            raise
+    return escritor.quantidade
+
+
+class LeitorBilhetes:
+    """
+    Leitura de um arquivo .lotobin via mmap.
+
+    Abrir o arquivo só lê o preâmbulo e o cabeçalho; máscaras e colunas são
+    memoryviews sobre o mapeamento (sem cópia), paginadas pelo sistema
+    operacional conforme são acessadas. As visões devem ser descartadas
+    antes de fechar o leitor.
+    """
+
+    def __init__(self, caminho: str):
+        """
+        Mapear o arquivo e validar o cabeçalho.
+
+        Args:
+            caminho: Arquivo .lotobin.
+
+        Raises:
+            ValueError: Se o arquivo não for um .lotobin válido, for de uma
+                versão não suportada ou estiver truncado.
+        """
+        with open(caminho, "rb") as f:
+            tamanho = os.fstat(f.fileno()).st_size
+            if tamanho < PREAMBULO.size:
+                raise ValueError(f"Arquivo .lotobin truncado: {caminho}")
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magico, versao, palavras, tamanho_cabecalho, quantidade = (
+                PREAMBULO.unpack_from(self._mapa)
+            )
+            if magico != MAGICO:
+                raise ValueError(f"Arquivo não é .lotobin: {caminho}")
+            if versao != VERSAO:
+                raise ValueError(f"Versão .lotobin não suportada: {versao}")
+            inicio = PREAMBULO.size
+            cabecalho = json.loads(
+                bytes(self._mapa[inicio : inicio + tamanho_cabecalho]).decode("utf-8")
+            )
+        except Exception:
+            self._mapa.close()
+            raise
+
+        self.loteria: str = cabecalho["loteria"]
+        self.seed: Optional[int] = cabecalho["seed"]
+        self.criado_em: float = cabecalho["criado_em"]
+        self.palavras = palavras
+        self.quantidade = quantidade
+        self.colunas = [c["nome"] for c in cabecalho["colunas"]]
+        # Arquivos gravados antes da seção de extras não têm a chave
+        self.extras_gravados: List[str] = cabecalho.get("extras", [])
+        self.metadados: dict = cabecalho.get("metadados", {})
+        self._cabecalho = cabecalho
+        self._tamanho_cabecalho = tamanho_cabecalho
+
+        # Offsets das seções
+        self._visao = memoryview(self._mapa)
+        self._secoes: Dict[str, tuple] = {}
+        offset = inicio + tamanho_cabecalho
+        fim = offset + quantidade * palavras * 8
+        self._secoes["mascaras"] = (offset, fim, "Q")
+        for coluna in cabecalho["colunas"]:
+            offset = _alinhar(fim)
+            fim = offset + quantidade * struct.calcsize(coluna["tipo"])
+            self._secoes[coluna["nome"]] = (offset, fim, coluna["tipo"])
+        for nome in self.extras_gravados:
+            offset = _alinhar(fim)
+            fim = offset + quantidade
+            self._secoes[f"extra:{nome}"] = (offset, fim, "B")
+        if fim > tamanho:
+            self.fechar()
+            raise ValueError(f"Arquivo .lotobin truncado: {caminho}")
+        self.mascaras = self._secao("mascaras")
+
+    def _secao(self, nome: str) -> memoryview:
+        """Visão tipada de uma seção do arquivo."""
+        inicio, fim, tipo = self._secoes[nome]
+        if sys.byteorder != "little":
+            # Sem cópia só na ordem de bytes do arquivo
+            dados = array(tipo, bytes(self._visao[inicio:fim]))
+            dados.byteswap()
+            return memoryview(dados)
+        return self._visao[inicio:fim].cast(tipo)
+
+    def __len__(self) -> int:
+        return self.quantidade
+
+    def __enter__(self) -> "LeitorBilhetes":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fechar()
+
+    def fechar(self) -> None:
+        """Liberar as visões e o mapeamento."""
+        if hasattr(self, "mascaras"):
+            self.mascaras.release()
+        self._visao.release()
+        self._mapa.close()
+
+    def coluna(self, nome: str) -> memoryview:
+        """
+        Visão sem cópia de uma coluna de estatísticas.
+
+        Args:
+            nome: Nome da coluna (ver `colunas`).
+
+        Returns:
+            memoryview com um valor por jogo.
+
+        Raises:
+            KeyError: Se a coluna não estiver no arquivo.
+        """
+        if nome not in self.colunas:
+            raise KeyError(f"Coluna ausente no arquivo: {nome} ({self.colunas})")
+        return self._secao(nome)
+
+    def mascara(self, indice: int) -> int:
+        """Máscara de bits do jogo `indice`."""
+        if self.palavras == 1:
+            return self.mascaras[indice]
+        base = indice * self.palavras
+        mascara = 0
+        for j in range(self.palavras - 1, -1, -1):
+            mascara = (mascara << 64) | self.mascaras[base + j]
+        return mascara
+
+    def numeros(self, indice: int) -> List[int]:
+        """Números do jogo `indice`."""
+        return desempacotar_numeros(self.mascara(indice))
+
+    def iter_mascaras(self) -> Iterator[int]:
+        """Máscaras de todos os jogos, em ordem."""
+        if self.palavras == 1:
+            return iter(self.mascaras)
+        return (self.mascara(i) for i in range(self.quantidade))
+
+    def __iter__(self) -> Iterator[List[int]]:
+        return map(desempacotar_numeros, self.iter_mascaras())
+
+    def contar_acertos(self, sorteio: List[int]) -> List[int]:
+        """
+        Conferir todos os jogos contra um sorteio.
+
+        Args:
+            sorteio: Números sorteados.
+
+        Returns:
+            Lista indexada pela quantidade de acertos com o número de jogos.
+        """
+        contagem = [0] * (len(sorteio) + 1)
+        alvo = 0
+        for n in sorteio:
+            alvo |= 1 << n
+        if self.palavras == 1:
+            for mascara in self.mascaras:
+                contagem[(mascara & alvo).bit_count()] += 1
+            return contagem
+        # Uma passada por palavra, somando os acertos de cada jogo
+        acertos = [0] * self.quantidade
+        for j in range(self.palavras):
+            parte = (alvo >> (64 * j)) & 0xFFFFFFFFFFFFFFFF
+            if not parte:
+                continue
+            palavras = self.mascaras[j :: self.palavras]
+            for i, mascara in enumerate(palavras):
+                acertos[i] += (mascara & parte).bit_count()
+        for a in acertos:
+            contagem[a] += 1
+        return contagem
+
+    def extras(self, indice: int) -> Optional[Dict[str, object]]:
+        """
+        Sorteios fora do volante gravados para o jogo `indice`.
+
+        Returns:
+            Dicionário nome -> opção, ou None se a loteria não tiver extras
+            ou o jogo tiver sido gravado sem eles.
+        """
+        if not self.extras_gravados:
+            return None
+        indices = []
+        for nome in self.extras_gravados:
+            inicio, _, _ = self._secoes[f"extra:{nome}"]
+            indices.append(self._mapa[inicio + indice])
+        if SEM_EXTRA in indices:
+            return None
+        return decodificar_extras(LOTTERY_CONFIG[self.loteria], indices)
+
+    def jogos(self) -> Iterator[GameResult]:
+        """
+        Jogos como GameResult (estatísticas recalculadas dos números e
+        sorteios extras lidos do arquivo).
+
+        Returns:
+            Iterador de GameResult, em ordem.
+        """
+        # Os extras vêm do arquivo: a configuração sem sorteios_extras evita
+        # que criar_resultado sorteie outros
+        config = {
+            chave: valor
+            for chave, valor in LOTTERY_CONFIG[self.loteria].items()
+            if chave != "sorteios_extras"
+        }
+        gerador = GeradorLoteria(seed=self.seed)
+        for i, numeros in enumerate(self):
+            resultado = gerador.criar_resultado(self.loteria, numeros, config)
+            resultado.extras = self.extras(i)
+            yield resultado
+
+    def para_csv(self, destino: TextIO) -> int:
+        """
+        Converter para CSV (números, colunas de estatísticas e sorteios
+        extras do arquivo).
+
+        Jogos com menos números que o maior do arquivo (apostas estendidas,
+        históricos de sorteios) têm as colunas de números restantes vazias.
+
+        Args:
+            destino: Arquivo texto aberto para escrita.
+
+        Returns:
+            Quantidade de linhas gravadas.
+        """
+        qtd = max((m.bit_count() for m in self.iter_mascaras()), default=0)
+        writer = csv.writer(destino, lineterminator="\n")
+        writer.writerow(
+            [f"n{i}" for i in range(1, qtd + 1)] + self.colunas + self.extras_gravados
+        )
+        colunas = [self.coluna(nome) for nome in self.colunas]
+        try:
+            for i, numeros in enumerate(self):
+                extras = self.extras(i) or {}
+                writer.writerow(
+                    numeros
+                    + [""] * (qtd - len(numeros))
+                    + [c[i] for c in colunas]
+                    + [extras.get(nome, "") for nome in self.extras_gravados]
+                )
+        finally:
+            for coluna in colunas:
+                coluna.release()
+        return self.quantidade
@@ -0,0 +1,232 @@
+"""
+Amostragem por cadeias de Markov (trocas de um número) para restrições que
+a contagem exata não cobre ou cobre a custo alto.
+"""
+
+import random
+from typing import Callable, Iterator, List, Optional, Sequence
+
+from precomputo import tabelas_volante
+from viabilidade import Restricoes
+
+# Verificação adicional sobre a máscara de bits do jogo (bit n = número n)
+Verificacao = Callable[[int], bool]
+
+INFINITO = float("inf")
+
+
+class _Cadeia:
+    """Estado de uma cadeia: números dentro/fora do jogo e acumuladores."""
+
+    __slots__ = ("dentro", "fora", "mascara", "soma", "pares", "primos", "fibo")
+
+    def __init__(self, numeros: Sequence[int], max_numero: int, tabelas: dict):
+        escolhidos = set(numeros)
+        self.dentro = list(numeros)
+        self.fora = [n for n in range(1, max_numero + 1) if n not in escolhidos]
+        self.mascara = sum(tabelas["bits"][n] for n in numeros)
+        self.soma = sum(numeros)
+        self.pares = sum(tabelas["par"][n] for n in numeros)
+        self.primos = sum(tabelas["primo"][n] for n in numeros)
+        self.fibo = sum(tabelas["fibo"][n] for n in numeros)
+
+
+class AmostradorTrocas:
+    """
+    Várias cadeias de Markov independentes sobre os jogos válidos.
+
+    Cada passo propõe trocar um número do jogo por um de fora (proposta
+    simétrica) e aceita se o jogo novo continuar válido, então a
+    distribuição estacionária é uniforme entre os jogos válidos alcançáveis.
+    Soma, pares, primos e Fibonacci são atualizados pela diferença entre o
+    número que sai e o que entra, e a sequência proibida só pode surgir em
+    volta do número que entra: cada restrição custa O(1) por passo, seja
+    qual for o tamanho do volante. Verificações extras recebem a máscara de
+    bits do jogo proposto e só rodam se as restrições básicas passarem.
+
+    As cadeias avançam em rodízio e cada uma entrega um jogo a cada
+    `desbaste` passos, depois de `aquecimento` passos iniciais: jogos
+    consecutivos de uma cadeia são correlacionados, e intercalar cadeias e
+    aumentar o desbaste reduz essa correlação.
+    """
+
+    def __init__(
+        self,
+        restricoes: Restricoes,
+        iniciais: Sequence[Sequence[int]],
+        rng: Optional[random.Random] = None,
+        cadeias: int = 8,
+        desbaste: Optional[int] = None,
+        aquecimento: Optional[int] = None,
+        verificacoes: Sequence[Verificacao] = (),
+    ):
+        """
+        Criar as cadeias.
+
+        Args:
+            restricoes: Restrições da loteria.
+            iniciais: Jogos válidos para iniciar as cadeias (reaproveitados
+                em rodízio se houver menos jogos que cadeias).
+            rng: Gerador aleatório (padrão: um novo, sem semente).
+            cadeias: Quantidade de cadeias independentes.
+            desbaste: Passos entre dois jogos entregues por uma cadeia
+                (padrão: 3 vezes a quantidade de números do jogo, o menor
+                múltiplo aprovado pelos testes de qualidade.py).
+            aquecimento: Passos de cada cadeia antes do primeiro jogo
+                (padrão: 10 vezes o desbaste).
+            verificacoes: Restrições adicionais sobre a máscara do jogo.
+
+        Raises:
+            ValueError: Se não houver jogo inicial, cadeias ou desbaste não
+                forem positivos, ou um jogo inicial for inválido.
+        """
+        if not iniciais:
+            raise ValueError("Nenhum jogo inicial para as cadeias")
+        if cadeias <= 0:
+            raise ValueError(f"Quantidade de cadeias deve ser positiva: {cadeias}")
+        r = restricoes
+        self.restricoes = r
+        self.rng = rng or random.Random()
+        self.desbaste = desbaste if desbaste is not None else 3 * r.qtd
+        self.aquecimento = (
+            aquecimento if aquecimento is not None else 10 * self.desbaste
+        )
+        if self.desbaste <= 0:
+            raise ValueError(f"Desbaste deve ser positivo: {self.desbaste}")
+        self.verificacoes = tuple(verificacoes)
+        self.propostas = 0
+        self.aceitas = 0
+
+        self._tabelas = tabelas_volante(r.max_numero)
+        self._soma = r.soma or (-INFINITO, INFINITO)
+        self._pares = r.pares or (0, r.qtd)
+        self._primos = r.primos or (0, r.qtd)
+        self._fibo = r.fibo or (0, r.qtd)
+
+        for jogo in iniciais:
+            if not self.valido(jogo):
+                raise ValueError(f"Jogo inicial não atende às restrições: {jogo}")
+        self.cadeias = [
+            _Cadeia(iniciais[i % len(iniciais)], r.max_numero, self._tabelas)
+            for i in range(cadeias)
+        ]
+        self._aquecidas = False
+
+    def valido(self, numeros: Sequence[int]) -> bool:
+        """Verificar um jogo completo contra todas as restrições."""
+        r = self.restricoes
+        tabelas = self._tabelas
+        numeros = sorted(numeros)
+        if len(set(numeros)) != r.qtd or not 1 <= numeros[0] <= r.max_numero:
+            return False
+        if numeros[-1] > r.max_numero:
+            return False
+        medidas = (
+            (self._soma, sum(numeros)),
+            (self._pares, sum(tabelas["par"][n] for n in numeros)),
+            (self._primos, sum(tabelas["primo"][n] for n in numeros)),
+            (self._fibo, sum(tabelas["fibo"][n] for n in numeros)),
+        )
+        if any(not faixa[0] <= valor <= faixa[1] for faixa, valor in medidas):
+            return False
+        if r.evitar_sequencia and any(
+            numeros[i] + 2 == numeros[i + 2] for i in range(len(numeros) - 2)
+        ):
+            return False
+        mascara = sum(tabelas["bits"][n] for n in numeros)
+        return all(verificar(mascara) for verificar in self.verificacoes)
+
+    def _passos(self, cadeia: _Cadeia, passos: int) -> None:
+        """Avançar uma cadeia (propostas recusadas mantêm o estado)."""
+        r = self.restricoes
+        tabelas = self._tabelas
+        bits, par, primo, fibo = (
+            tabelas["bits"],
+            tabelas["par"],
+            tabelas["primo"],
+            tabelas["fibo"],
+        )
+        soma_min, soma_max = self._soma
+        pares_min, pares_max = self._pares
+        primos_min, primos_max = self._primos
+        fibo_min, fibo_max = self._fibo
+        evitar_sequencia = r.evitar_sequencia
+        verificacoes = self.verificacoes
+        dentro, fora = cadeia.dentro, cadeia.fora
+        qtd, livres = len(dentro), len(fora)
+        sortear = self.rng.randrange
+        aceitas = 0
+        if not livres:  # volante inteiro marcado: não há troca possível
+            self.propostas += passos
+            return
+
+        for _ in range(passos):
+            i = sortear(qtd)
+            j = sortear(livres)
+            sai, entra = dentro[i], fora[j]
+
+            soma = cadeia.soma + entra - sai
+            if not soma_min <= soma <= soma_max:
+                continue
+            pares = cadeia.pares + par[entra] - par[sai]
+            if not pares_min <= pares <= pares_max:
+                continue
+            primos = cadeia.primos + primo[entra] - primo[sai]
+            if not primos_min <= primos <= primos_max:
+                continue
+            fibos = cadeia.fibo + fibo[entra] - fibo[sai]
+            if not fibo_min <= fibos <= fibo_max:
+                continue
+
+            mascara = cadeia.mascara ^ bits[sai]
+            if evitar_sequencia:
+                # Três consecutivos só podem surgir em volta do número novo:
+                # bits 0..4 de `vizinhos` = entra-2 .. entra+2
+                vizinhos = mascara >> (entra - 2) if entra > 1 else mascara << 1
+                if (
+                    vizinhos & 0b00011 == 0b00011
+                    or vizinhos & 0b01010 == 0b01010
+                    or vizinhos & 0b11000 == 0b11000
+                ):
+                    continue
+            mascara |= bits[entra]
+            if verificacoes and not all(v(mascara) for v in verificacoes):
+                continue
+
+            dentro[i], fora[j] = entra, sai
+            cadeia.mascara = mascara
+            cadeia.soma, cadeia.pares, cadeia.primos, cadeia.fibo = (
+                soma,
+                pares,
+                primos,
+                fibos,
+            )
+            aceitas += 1
+
+        self.propostas += passos
+        self.aceitas += aceitas
+
+    @property
+    def taxa_aceitacao(self) -> float:
+        """Fração das trocas propostas que foram aceitas."""
+        return self.aceitas / self.propostas if self.propostas else 0.0
+
+    def amostras(self, quantidade: int) -> Iterator[List[int]]:
+        """
+        Gerar jogos alternando entre as cadeias.
+
+        Args:
+            quantidade: Quantidade de jogos.
+
+        Returns:
+            Iterador de listas de números ordenadas.
+        """
+        if not self._aquecidas:
+            for cadeia in self.cadeias:
+                self._passos(cadeia, self.aquecimento)
+            self._aquecidas = True
+        cadeias = self.cadeias
+        for k in range(quantidade):
+            cadeia = cadeias[k % len(cadeias)]
+            self._passos(cadeia, self.desbaste)
+            yield sorted(cadeia.dentro)
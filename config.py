@@ -32,29 +32,123 @@ PRIMOS = {
 FIBONACCI = {1, 2, 3, 5, 8, 13, 21, 34, 55}
 
 # Configuração por tipo de loteria: (max_numero, qtd_selecionados, ranges de soma, ranges de pares, etc)
+# Todas as restrições (range_soma, range_pares, range_primos, range_fibo,
+# evitar_sequencia) são opcionais; uma loteria nova só precisa de uma entrada aqui.
+# Faixas de padrão também opcionais (ver padroes.py): range_max_dezena,
+#   range_max_linha, range_max_coluna, range_max_quadrante,
+#   range_finais_iguais, range_maior_intervalo e range_maior_sequencia
+# faixas_premio: acertos -> nome da faixa de premiação
+# qtd_sorteados: números sorteados por concurso (padrão: qtd_selecionados)
+# max_selecionados: maior aposta estendida aceita (ver estendidos.py)
+# sorteios_por_concurso: sorteios independentes por concurso (Dupla Sena: 2)
+# sorteios_extras: sorteios fora do volante, por nome -> opções (lista de
+#   rótulos ou quantidade de opções numeradas a partir de 1)
 LOTTERY_CONFIG = {
     "Mega-Sena": {
         "max_numero": 60,
         "qtd_selecionados": 6,
+        "max_selecionados": 15,
         "range_soma": (140, 225),
         "range_pares": (2, 4),
         "max_tentativas": 10000,
+        "faixas_premio": {6: "Sena", 5: "Quina", 4: "Quadra"},
     },
     "Lotofácil": {
         "max_numero": 25,
         "qtd_selecionados": 15,
+        "max_selecionados": 20,
         "range_soma": (180, 230),
         "range_pares": (6, 9),
         "range_primos": (4, 6),
         "range_fibo": (3, 6),
         "max_tentativas": 10000,
+        "faixas_premio": {
+            15: "15 acertos",
+            14: "14 acertos",
+            13: "13 acertos",
+            12: "12 acertos",
+            11: "11 acertos",
+        },
     },
     "Quina": {
         "max_numero": 80,
         "qtd_selecionados": 5,
+        "max_selecionados": 15,
         "range_soma": (160, 240),
         "range_pares": (1, 4),
         "max_tentativas": 10000,
         "evitar_sequencia": True,
+        "faixas_premio": {5: "Quina", 4: "Quadra", 3: "Terno", 2: "Duque"},
+    },
+    "Lotomania": {
+        # O "00" do volante é representado como 100
+        "max_numero": 100,
+        "qtd_selecionados": 50,
+        "qtd_sorteados": 20,
+        "range_pares": (22, 28),
+        "max_tentativas": 10000,
+        "faixas_premio": {
+            20: "20 acertos",
+            19: "19 acertos",
+            18: "18 acertos",
+            17: "17 acertos",
+            16: "16 acertos",
+            15: "15 acertos",
+            0: "0 acertos",
+        },
+    },
+    "Timemania": {
+        "max_numero": 80,
+        "qtd_selecionados": 10,
+        "qtd_sorteados": 7,
+        "range_soma": (320, 490),
+        "range_pares": (3, 7),
+        "max_tentativas": 10000,
+        "sorteios_extras": {"Time do Coração": 80},
+        "faixas_premio": {
+            7: "7 acertos",
+            6: "6 acertos",
+            5: "5 acertos",
+            4: "4 acertos",
+            3: "3 acertos",
+        },
+    },
+    "Dia de Sorte": {
+        "max_numero": 31,
+        "qtd_selecionados": 7,
+        "range_soma": (80, 145),
+        "range_pares": (2, 5),
+        "max_tentativas": 10000,
+        "sorteios_extras": {
+            "Mês da Sorte": [
+                "Janeiro",
+                "Fevereiro",
+                "Março",
+                "Abril",
+                "Maio",
+                "Junho",
+                "Julho",
+                "Agosto",
+                "Setembro",
+                "Outubro",
+                "Novembro",
+                "Dezembro",
+            ]
+        },
+        "faixas_premio": {
+            7: "7 acertos",
+            6: "6 acertos",
+            5: "5 acertos",
+            4: "4 acertos",
+        },
+    },
+    "Dupla Sena": {
+        "max_numero": 50,
+        "qtd_selecionados": 6,
+        "sorteios_por_concurso": 2,
+        "range_soma": (110, 200),
+        "range_pares": (2, 4),
+        "max_tentativas": 10000,
+        "faixas_premio": {6: "Sena", 5: "Quina", 4: "Quadra", 3: "Terno"},
     },
 }
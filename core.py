@@ -2,10 +2,138 @@
 Núcleo de lógica matemática e geração de palpites.
 """
 
+import hashlib
+import heapq
+import json
 import random
+import time
 from dataclasses import dataclass
-from typing import List, Optional
-from config import PRIMOS, FIBONACCI, LOTTERY_CONFIG
+from math import ceil, comb, log
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from cadeias import AmostradorTrocas, Verificacao
+from config import FIBONACCI, LOTTERY_CONFIG, PRIMOS
+from diversidade import IndiceSobreposicao
+from estendidos import contar_subjogos_validos, tamanhos_aposta
+from faixas import estimar_config
+from padroes import verificacao_config
+from viabilidade import Restricoes, Viabilidade, analisar
+
+
+def empacotar_numeros(numeros: List[int]) -> int:
+    """
+    Empacotar uma combinação em máscara de bits (bit n ligado = número n).
+
+    Args:
+        numeros: Lista de números (1 a max_numero).
+
+    Returns:
+        Inteiro com um bit por número selecionado.
+    """
+    mascara = 0
+    for n in numeros:
+        mascara |= 1 << n
+    return mascara
+
+
+def desempacotar_numeros(mascara: int) -> List[int]:
+    """
+    Converter uma máscara de bits de volta em lista ordenada de números.
+
+    Args:
+        mascara: Máscara gerada por empacotar_numeros.
+
+    Returns:
+        Lista de números, ordenada.
+    """
+    numeros = []
+    while mascara:
+        bit = mascara & -mascara
+        numeros.append(bit.bit_length() - 1)
+        mascara ^= bit
+    return numeros
+
+
+def rank_combinacao(numeros: List[int]) -> int:
+    """
+    Calcular o rank colexicográfico de uma combinação (0 a C(n, k) - 1).
+
+    Args:
+        numeros: Lista de números ordenada (1 a max_numero).
+
+    Returns:
+        Posição da combinação na ordem colexicográfica.
+    """
+    return sum(comb(n - 1, i) for i, n in enumerate(numeros, 1))
+
+
+def unrank_combinacao(rank: int, qtd: int) -> List[int]:
+    """
+    Reconstruir a combinação de uma posição colexicográfica.
+
+    Args:
+        rank: Posição retornada por rank_combinacao.
+        qtd: Quantidade de números da combinação.
+
+    Returns:
+        Lista de números ordenada (1 a max_numero).
+    """
+    numeros = []
+    for i in range(qtd, 0, -1):
+        # Maior c tal que C(c, i) <= rank
+        c = i - 1
+        while comb(c + 1, i) <= rank:
+            c += 1
+        rank -= comb(c, i)
+        numeros.append(c + 1)
+    return numeros[::-1]
+
+
+def codificar_extras(config: dict, extras: Dict[str, object]) -> List[int]:
+    """
+    Converter os sorteios extras de um jogo em índices (0 a opções - 1).
+
+    Args:
+        config: Configuração da loteria (com sorteios_extras).
+        extras: Dicionário nome -> opção, como em GameResult.extras.
+
+    Returns:
+        Índice de cada sorteio extra, na ordem de sorteios_extras.
+
+    Raises:
+        ValueError: Se faltar um sorteio ou a opção não existir.
+    """
+    indices = []
+    for nome, opcoes in config["sorteios_extras"].items():
+        if nome not in extras:
+            raise ValueError(f"Sorteio extra ausente: {nome}")
+        valor = extras[nome]
+        if isinstance(opcoes, int):
+            if not (isinstance(valor, int) and 1 <= valor <= opcoes):
+                raise ValueError(f"Opção inválida para {nome}: {valor}")
+            indices.append(valor - 1)
+        else:
+            if valor not in opcoes:
+                raise ValueError(f"Opção inválida para {nome}: {valor}")
+            indices.append(opcoes.index(valor))
+    return indices
+
+
+def decodificar_extras(config: dict, indices: List[int]) -> Dict[str, object]:
+    """
+    Reconstruir os sorteios extras a partir de codificar_extras.
+
+    Args:
+        config: Configuração da loteria (com sorteios_extras).
+        indices: Índice de cada sorteio extra.
+
+    Returns:
+        Dicionário nome -> opção.
+    """
+    return {
+        nome: indice + 1 if isinstance(opcoes, int) else opcoes[indice]
+        for (nome, opcoes), indice in zip(config["sorteios_extras"].items(), indices)
+    }
 
 
 @dataclass
@@ -19,6 +147,17 @@ class GameResult:
     tipo: str
     primos: Optional[int] = None
     fibo: Optional[int] = None
+    extras: Optional[Dict[str, object]] = None
+
+    @property
+    def mascara(self) -> int:
+        """Números do jogo empacotados em máscara de bits."""
+        return empacotar_numeros(self.numeros)
+
+    @property
+    def rank(self) -> int:
+        """Rank colexicográfico da combinação."""
+        return rank_combinacao(self.numeros)
 
     def to_dict(self) -> dict:
         """Converter para dicionário (compatível com pandas.DataFrame)."""
@@ -30,9 +169,47 @@ class GameResult:
             "tipo": self.tipo,
             "primos": self.primos,
             "fibo": self.fibo,
+            # Sorteios fora do volante viram colunas próprias (ex.: "Mês da Sorte")
+            **(self.extras or {}),
         }
 
 
+@dataclass
+class ResultadoParcial:
+    """Jogos gerados dentro de um prazo e como continuar a geração."""
+
+    jogos: List[GameResult]
+    produzidos: int  # jogos entregues até aqui, somando as chamadas anteriores
+    quantidade: int
+    continuacao: Optional[str]  # None quando a geração terminou
+
+    @property
+    def concluido(self) -> bool:
+        """Indica se não há mais nada a gerar."""
+        return self.continuacao is None
+
+
+def _chave_config(config: dict) -> str:
+    """Hash do conteúdo de uma configuração (amarra a continuação a ela)."""
+    conteudo = json.dumps(config, sort_keys=True, ensure_ascii=False, default=list)
+    return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()[:16]
+
+
+def _analisar_geracao(tipo: str, config: dict) -> Viabilidade:
+    """
+    Viabilidade da configuração de uma geração.
+
+    Ajustes de faixas (ex.: controles da barra lateral) tomam contagem e
+    estratégia das tabelas de faixas, sem a contagem exata podada de cada
+    ajuste; o contador só é montado se a estratégia for construtiva.
+    """
+    if config != LOTTERY_CONFIG[tipo]:
+        estimativa = estimar_config(tipo, config)
+        if estimativa is not None:
+            return analisar(tipo, config, validas=estimativa.validas)
+    return analisar(tipo, config)
+
+
 class AnalisadorEstatistico:
     """Análise estatística de sequências de números."""
 
@@ -146,14 +323,25 @@ class AnalisadorEstatistico:
 class GeradorLoteria:
     """Gerador de palpites otimizados para loterias."""
 
-    def __init__(self):
-        """Inicializar com o analisador estatístico."""
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Inicializar com o analisador estatístico.
+
+        Args:
+            seed: Semente do gerador aleatório (None para semente do sistema).
+        """
         self.analisador = AnalisadorEstatistico()
+        self.seed = seed
+        self.rng = random.Random(seed)
 
     def _gerar_randomico(self, total: int, qtd: int) -> List[int]:
         """
         Gerar uma combinação aleatória de números únicos, ordenados.
 
+        Quando metade ou mais do volante é marcada (ex.: Lotomania, 50 de
+        100), sorteia os números que ficam de fora e percorre o volante uma
+        vez: O(total) sem ordenação, com total - qtd sorteios em vez de qtd.
+
         Args:
             total: Número máximo do intervalo (1 a total).
             qtd: Quantidade de números a selecionar.
@@ -161,101 +349,593 @@ class GeradorLoteria:
         Returns:
             Lista de números únicos, ordenada.
         """
-        return sorted(random.sample(range(1, total + 1), qtd))
+        if 2 * qtd >= total:
+            fora = set(self.rng.sample(range(1, total + 1), total - qtd))
+            return [n for n in range(1, total + 1) if n not in fora]
+        return sorted(self.rng.sample(range(1, total + 1), qtd))
 
-    def _validar_jogo_mega_sena(self, jogo: List[int]) -> bool:
-        """Validar critérios específicos da Mega-Sena."""
-        config = LOTTERY_CONFIG["Mega-Sena"]
-        soma = self.analisador.obter_soma(jogo)
-        pares, _ = self.analisador.contar_pares_impares(jogo)
+    def _validar_jogo(self, config: dict, jogo: List[int]) -> bool:
+        """
+        Validar um jogo contra as restrições configuradas da loteria.
 
-        soma_ok = config["range_soma"][0] <= soma <= config["range_soma"][1]
-        pares_ok = config["range_pares"][0] <= pares <= config["range_pares"][1]
+        Todas as restrições são opcionais: range_soma, range_pares,
+        range_primos, range_fibo, evitar_sequencia e as faixas de padrão
+        range_<padrão> (ver padroes.py).
 
-        return soma_ok and pares_ok
+        Args:
+            config: Configuração da loteria (entrada de LOTTERY_CONFIG).
+            jogo: Números do jogo, ordenados.
 
-    def _validar_jogo_lotofacil(self, jogo: List[int]) -> bool:
-        """Validar critérios específicos da Lotofácil."""
-        config = LOTTERY_CONFIG["Lotofácil"]
-        soma = self.analisador.obter_soma(jogo)
-        primos = self.analisador.contar_primos(jogo)
-        fibo = self.analisador.contar_fibonacci(jogo)
-        pares, _ = self.analisador.contar_pares_impares(jogo)
+        Returns:
+            True se o jogo atende a todas as restrições configuradas.
+        """
+        medidas = (
+            ("range_soma", self.analisador.obter_soma),
+            ("range_pares", lambda j: self.analisador.contar_pares_impares(j)[0]),
+            ("range_primos", self.analisador.contar_primos),
+            ("range_fibo", self.analisador.contar_fibonacci),
+        )
+        for chave, medir in medidas:
+            faixa = config.get(chave)
+            if faixa is not None and not faixa[0] <= medir(jogo) <= faixa[1]:
+                return False
+
+        tem_seq = config.get(
+            "evitar_sequencia", False
+        ) and self.analisador.tem_sequencia_consecutiva(jogo, 3)
+        if tem_seq:
+            return False
+
+        verificar_padroes = verificacao_config(config)
+        return verificar_padroes is None or verificar_padroes(empacotar_numeros(jogo))
+
+    def _sortear_extras(self, config: dict) -> Optional[Dict[str, object]]:
+        """
+        Sortear os palpites fora do volante (ex.: time do coração, mês da sorte).
+
+        Args:
+            config: Configuração da loteria.
+
+        Returns:
+            Dicionário nome -> opção escolhida, ou None se a loteria não tiver
+            sorteios extras.
+        """
+        extras = config.get("sorteios_extras")
+        if not extras:
+            return None
+        return {
+            nome: (
+                self.rng.randint(1, opcoes)
+                if isinstance(opcoes, int)
+                else self.rng.choice(opcoes)
+            )
+            for nome, opcoes in extras.items()
+        }
 
-        soma_ok = config["range_soma"][0] <= soma <= config["range_soma"][1]
-        primos_ok = config["range_primos"][0] <= primos <= config["range_primos"][1]
-        fibo_ok = config["range_fibo"][0] <= fibo <= config["range_fibo"][1]
-        pares_ok = config["range_pares"][0] <= pares <= config["range_pares"][1]
+    def _amostrar_por_rejeicao(self, config: dict) -> Optional[List[int]]:
+        """
+        Sortear combinações até uma atender às restrições da loteria.
 
-        return soma_ok and primos_ok and fibo_ok and pares_ok
+        Args:
+            config: Configuração da loteria.
+
+        Returns:
+            Combinação aceita, ou None após max_tentativas.
+        """
+        for _ in range(config["max_tentativas"]):
+            jogo = self._gerar_randomico(
+                config["max_numero"], config["qtd_selecionados"]
+            )
+            if self._validar_jogo(config, jogo):
+                return jogo
+        return None
+
+    def _amostrar_ponderado(self, pesos: Sequence[float], qtd: int) -> List[int]:
+        """
+        Sortear qtd números distintos com probabilidade proporcional ao peso.
 
-    def _validar_jogo_quina(self, jogo: List[int]) -> bool:
-        """Validar critérios específicos da Quina."""
-        config = LOTTERY_CONFIG["Quina"]
+        Amostragem ponderada sem reposição de Efraimidis-Spirakis: cada
+        número recebe a chave log(u) / peso e os qtd de maior chave são
+        escolhidos (equivale a u ** (1 / peso), sem exponenciação).
+
+        Args:
+            pesos: Peso de cada número (índice = número; peso 0 exclui).
+            qtd: Quantidade de números a selecionar.
+
+        Returns:
+            Lista de números únicos, ordenada.
+        """
+        aleatorio = self.rng.random
+        chaves = [
+            (log(1.0 - aleatorio()) / peso, n)
+            for n, peso in enumerate(pesos)
+            if peso > 0
+        ]
+        return sorted(n for _, n in heapq.nlargest(qtd, chaves))
+
+    def criar_resultado(
+        self, tipo: str, jogo: List[int], config: Optional[dict] = None
+    ) -> GameResult:
+        """
+        Montar o GameResult (com estatísticas e sorteios extras) de uma combinação.
+
+        Args:
+            tipo: Tipo de loteria.
+            jogo: Números do jogo, ordenados.
+            config: Configuração usada na geração (padrão: LOTTERY_CONFIG[tipo]).
+
+        Returns:
+            GameResult do jogo.
+        """
         soma = self.analisador.obter_soma(jogo)
-        pares, _ = self.analisador.contar_pares_impares(jogo)
-        tem_seq = self.analisador.tem_sequencia_consecutiva(jogo, 3)
+        pares, impares = self.analisador.contar_pares_impares(jogo)
+
+        result = GameResult(
+            numeros=jogo,
+            soma=soma,
+            pares=pares,
+            impares=impares,
+            tipo=tipo.lower().replace("-", "_"),
+        )
+
+        # Adicionar atributos opcionais (loterias que restringem primos/Fibonacci)
+        config = LOTTERY_CONFIG[tipo] if config is None else config
+        if "range_primos" in config:
+            result.primos = self.analisador.contar_primos(jogo)
+        if "range_fibo" in config:
+            result.fibo = self.analisador.contar_fibonacci(jogo)
+        result.extras = self._sortear_extras(config)
+
+        return result
+
+    def gerar_combinacoes(
+        self, tipo: str, quantidade: int, config: Optional[dict] = None
+    ) -> Iterator[List[int]]:
+        """
+        Gerar combinações válidas sem montar GameResult (fluxo de candidatos).
+
+        A estratégia de amostragem vem da contagem exata das combinações
+        válidas (viabilidade.analisar): rejeição quando a taxa de aceitação
+        é alta, sorteio construtivo direto entre as válidas caso contrário.
+        As duas produzem jogos uniformes entre as combinações aceitas. As
+        faixas de padrão (range_<padrão>, fora da contagem exata) recusam
+        as amostras construtivas que não as atendem.
+
+        Args:
+            tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+            quantidade: Quantidade de combinações a gerar.
+            config: Configuração com outras restrições (ex.: faixas
+                ajustadas no app, ver faixas.config_com_faixas); padrão:
+                LOTTERY_CONFIG[tipo].
+
+        Returns:
+            Iterador de listas de números ordenadas.
+
+        Raises:
+            ValueError: Se tipo de loteria não for reconhecido ou se a
+                configuração não aceitar nenhuma combinação.
+        """
+        if tipo not in LOTTERY_CONFIG:
+            raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+
+        config = LOTTERY_CONFIG[tipo] if config is None else config
+        amostrar = self._amostrador(tipo, config)
+
+        def combinacoes() -> Iterator[List[int]]:
+            for _ in range(quantidade):
+                jogo = amostrar()
+                if jogo is not None:
+                    yield jogo
+
+        return combinacoes()
 
-        soma_ok = config["range_soma"][0] <= soma <= config["range_soma"][1]
-        pares_ok = config["range_pares"][0] <= pares <= config["range_pares"][1]
-        seq_ok = not (config.get("evitar_sequencia", False) and tem_seq)
+    def _amostrador(self, tipo: str, config: dict) -> Callable[[], Optional[List[int]]]:
+        """
+        Função que sorteia um jogo (uma posição de gerar_combinacoes).
 
-        return soma_ok and pares_ok and seq_ok
+        Args:
+            tipo: Tipo de loteria.
+            config: Configuração da loteria.
 
-    def gerar_jogos(self, tipo: str, quantidade: int) -> List[GameResult]:
+        Returns:
+            Função sem argumentos que devolve uma combinação aceita, ou None
+            se as tentativas se esgotarem.
+
+        Raises:
+            ValueError: Se a configuração não aceitar nenhuma combinação.
+        """
+        viabilidade = _analisar_geracao(tipo, config)
+        verificar_padroes = verificacao_config(config)
+
+        if viabilidade.estrategia != "construtiva":
+            return lambda: self._amostrar_por_rejeicao(config)
+        contador = viabilidade.contador
+        if verificar_padroes is None:
+            return lambda: contador.amostrar(self.rng)
+
+        def amostrar_construtivo() -> Optional[List[int]]:
+            for _ in range(config["max_tentativas"]):
+                jogo = contador.amostrar(self.rng)
+                if verificar_padroes(empacotar_numeros(jogo)):
+                    return jogo
+            return None
+
+        return amostrar_construtivo
+
+    def gerar_jogos(
+        self, tipo: str, quantidade: int, config: Optional[dict] = None
+    ) -> List[GameResult]:
         """
         Gerar palpites otimizados para uma loteria.
 
         Args:
-            tipo: Tipo de loteria ("Mega-Sena", "Lotofácil", "Quina").
+            tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+            quantidade: Quantidade de palpites a gerar.
+            config: Configuração com outras restrições (padrão:
+                LOTTERY_CONFIG[tipo]).
+
+        Returns:
+            Lista de GameResult com os palpites gerados.
+
+        Raises:
+            ValueError: Se tipo de loteria não for reconhecido ou se a
+                configuração não aceitar nenhuma combinação.
+        """
+        return [
+            self.criar_resultado(tipo, jogo, config)
+            for jogo in self.gerar_combinacoes(tipo, quantidade, config)
+        ]
+
+    def gerar_jogos_com_prazo(
+        self,
+        tipo: str,
+        quantidade: int,
+        prazo: float,
+        continuacao: Optional[str] = None,
+        distintos: bool = False,
+        config: Optional[dict] = None,
+    ) -> ResultadoParcial:
+        """
+        Gerar palpites até um prazo, devolvendo o que ficou pronto e uma
+        continuação para o restante.
+
+        A continuação é um JSON com o estado do gerador aleatório, o
+        progresso e (com distintos) as máscaras já entregues: pode ser
+        retomada depois, por outro GeradorLoteria ou em outro processo. Sem
+        distintos, a concatenação das partes é igual a gerar_jogos com o
+        mesmo estado inicial do gerador.
+
+        Args:
+            tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+            quantidade: Quantidade total de palpites.
+            prazo: Tempo máximo desta chamada, em segundos (ao menos uma
+                tentativa é feita, para a geração sempre avançar).
+            continuacao: Continuação devolvida pela chamada anterior.
+            distintos: Não repetir jogos; desiste após max_tentativas
+                repetições ou recusas seguidas.
+            config: Configuração com outras restrições (padrão:
+                LOTTERY_CONFIG[tipo]); a mesma em todas as partes.
+
+        Returns:
+            ResultadoParcial com os jogos desta chamada e a continuação
+            (None quando a geração terminou).
+
+        Raises:
+            ValueError: Se tipo de loteria não for reconhecido, se a
+                configuração não aceitar combinações suficientes ou se a
+                continuação for de outra geração.
+        """
+        if tipo not in LOTTERY_CONFIG:
+            raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+        fim = time.perf_counter() + prazo
+        config = LOTTERY_CONFIG[tipo] if config is None else config
+        chave = _chave_config(config)
+
+        if continuacao is None:
+            estado = {
+                "tipo": tipo,
+                "quantidade": quantidade,
+                "distintos": distintos,
+                "chave_config": chave,
+                "tentativas": 0,
+                "produzidos": 0,
+                "falhas": 0,
+                "emitidos": [],
+            }
+            validas = _analisar_geracao(tipo, config).combinacoes_validas
+            if distintos and quantidade > validas:
+                raise ValueError(
+                    f"Só há {validas} combinações válidas para {quantidade} "
+                    "jogos distintos"
+                )
+        else:
+            estado = json.loads(continuacao)
+            esperado = (tipo, quantidade, distintos, chave)
+            recebido = tuple(
+                estado[c] for c in ("tipo", "quantidade", "distintos", "chave_config")
+            )
+            if recebido != esperado:
+                raise ValueError(
+                    "Continuação de outra geração (loteria, quantidade, "
+                    "distintos ou configuração diferentes)"
+                )
+            versao, interno, gauss = estado["rng"]
+            self.rng.setstate((versao, tuple(interno), gauss))
+
+        amostrar = self._amostrador(tipo, config)
+        emitidos = set(estado["emitidos"])
+        limite = config["max_tentativas"]
+
+        def terminou() -> bool:
+            if estado["produzidos"] == quantidade:
+                return True
+            if distintos:
+                return estado["falhas"] >= limite
+            return estado["tentativas"] == quantidade
+
+        jogos: List[GameResult] = []
+        while not terminou():
+            estado["tentativas"] += 1
+            jogo = amostrar()
+            if jogo is not None and distintos:
+                mascara = empacotar_numeros(jogo)
+                if mascara in emitidos:
+                    jogo = None
+                else:
+                    emitidos.add(mascara)
+            if jogo is None:
+                estado["falhas"] += 1
+            else:
+                estado["falhas"] = 0
+                estado["produzidos"] += 1
+                jogos.append(self.criar_resultado(tipo, jogo, config))
+            if time.perf_counter() >= fim:
+                break
+
+        if terminou():
+            return ResultadoParcial(jogos, estado["produzidos"], quantidade, None)
+        versao, interno, gauss = self.rng.getstate()
+        estado["rng"] = [versao, list(interno), gauss]
+        estado["emitidos"] = sorted(emitidos)
+        return ResultadoParcial(
+            jogos,
+            estado["produzidos"],
+            quantidade,
+            json.dumps(estado, separators=(",", ":")),
+        )
+
+    def gerar_jogos_ponderados(
+        self,
+        tipo: str,
+        quantidade: int,
+        pesos: Sequence[float],
+        config: Optional[dict] = None,
+    ) -> List[GameResult]:
+        """
+        Gerar palpites sorteando os números com probabilidade proporcional a
+        um peso (ex.: frequência em uma janela do histórico, ver janelas.py).
+
+        Cada jogo é sorteado por amostragem ponderada e recusado se não
+        atender às restrições da loteria; após max_tentativas recusas o jogo
+        é descartado, então restrições apertadas podem devolver menos jogos.
+
+        Args:
+            tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
             quantidade: Quantidade de palpites a gerar.
+            pesos: Peso de cada número (índice = número, posição 0 ignorada).
+            config: Configuração com outras restrições (padrão:
+                LOTTERY_CONFIG[tipo]).
 
         Returns:
             Lista de GameResult com os palpites gerados.
 
         Raises:
-            ValueError: Se tipo de loteria não for reconhecido.
+            ValueError: Se tipo de loteria não for reconhecido, se os pesos
+                não cobrirem o volante ou tiverem menos números com peso
+                positivo que o necessário para um jogo.
         """
         if tipo not in LOTTERY_CONFIG:
             raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
 
-        config = LOTTERY_CONFIG[tipo]
+        config = LOTTERY_CONFIG[tipo] if config is None else config
+        qtd = config["qtd_selecionados"]
+        if len(pesos) != config["max_numero"] + 1:
+            raise ValueError(
+                f"Esperados {config['max_numero'] + 1} pesos (índice = número): "
+                f"{len(pesos)}"
+            )
+        pesos = [0.0, *pesos[1:]]
+        if sum(1 for peso in pesos if peso > 0) < qtd:
+            raise ValueError(f"Menos de {qtd} números com peso positivo")
+
         jogos: List[GameResult] = []
-        validadores = {
-            "Mega-Sena": self._validar_jogo_mega_sena,
-            "Lotofácil": self._validar_jogo_lotofacil,
-            "Quina": self._validar_jogo_quina,
-        }
-        validador = validadores[tipo]
+        for _ in range(quantidade):
+            for _ in range(config["max_tentativas"]):
+                jogo = self._amostrar_ponderado(pesos, qtd)
+                if self._validar_jogo(config, jogo):
+                    jogos.append(self.criar_resultado(tipo, jogo, config))
+                    break
+        return jogos
+
+    def gerar_jogos_estendidos(
+        self,
+        tipo: str,
+        quantidade: int,
+        tamanho: int,
+        cobertura_minima: float = 0.5,
+        config: Optional[dict] = None,
+    ) -> List[GameResult]:
+        """
+        Gerar apostas estendidas (mais números que o mínimo, ver estendidos.py).
 
+        Uma aposta de `tamanho` números cobre todos os sub-jogos de
+        qtd_selecionados números que contém; ela é aceita se ao menos
+        `cobertura_minima` desses sub-jogos atenderem às restrições da
+        loteria, contados sem expandi-los. As faixas de padrão
+        (range_<padrão>) não entram na contagem. Após max_tentativas
+        recusas o jogo é descartado, então coberturas altas podem devolver
+        menos jogos.
+
+        Args:
+            tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+            quantidade: Quantidade de apostas a gerar.
+            tamanho: Números por aposta (ver tamanhos_aposta).
+            cobertura_minima: Fração mínima de sub-jogos válidos (0 a 1).
+            config: Configuração com outras restrições (padrão:
+                LOTTERY_CONFIG[tipo]).
+
+        Returns:
+            Lista de GameResult com as apostas geradas.
+
+        Raises:
+            ValueError: Se tipo de loteria não for reconhecido, se o tamanho
+                não for aceito pela loteria ou se a cobertura estiver fora
+                de 0..1.
+        """
+        tamanhos = tamanhos_aposta(tipo)
+        if tamanho not in tamanhos:
+            raise ValueError(
+                f"{tipo} aceita apostas de {tamanhos.start} a {tamanhos.stop - 1} "
+                f"números: {tamanho}"
+            )
+        if not 0 <= cobertura_minima <= 1:
+            raise ValueError(f"Cobertura mínima fora de 0..1: {cobertura_minima}")
+
+        config = LOTTERY_CONFIG[tipo] if config is None else config
+        restricoes = Restricoes.de_config(config)
+        minimo = max(1, ceil(cobertura_minima * comb(tamanho, restricoes.qtd)))
+        jogos: List[GameResult] = []
         for _ in range(quantidade):
-            tentativas = 0
-            max_tentativas = config["max_tentativas"]
+            for _ in range(config["max_tentativas"]):
+                jogo = self._gerar_randomico(config["max_numero"], tamanho)
+                if contar_subjogos_validos(restricoes, jogo) >= minimo:
+                    jogos.append(self.criar_resultado(tipo, jogo, config))
+                    break
+        return jogos
 
-            while tentativas < max_tentativas:
-                tentativas += 1
-                jogo = self._gerar_randomico(
-                    config["max_numero"], config["qtd_selecionados"]
-                )
+    def gerar_jogos_diversos(
+        self,
+        tipo: str,
+        quantidade: int,
+        max_sobreposicao: int,
+        config: Optional[dict] = None,
+    ) -> List[GameResult]:
+        """
+        Gerar palpites em que dois jogos quaisquer compartilham no máximo
+        `max_sobreposicao` números (cobertura espalhada para bolões).
+
+        Os candidatos vêm de gerar_combinacoes e são aceitos gulosamente; a
+        verificação de sobreposição usa IndiceSobreposicao e não cresce com a
+        quantidade de jogos aceitos. A geração para depois de max_tentativas
+        candidatos recusados seguidos, então restrições muito apertadas podem
+        devolver menos jogos que o pedido.
 
-                if validador(jogo):
-                    soma = self.analisador.obter_soma(jogo)
-                    pares, impares = self.analisador.contar_pares_impares(jogo)
+        Args:
+            tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+            quantidade: Quantidade de palpites a gerar.
+            max_sobreposicao: Máximo de números em comum entre dois jogos.
+            config: Configuração com outras restrições (padrão:
+                LOTTERY_CONFIG[tipo]).
+
+        Returns:
+            Lista de GameResult com os palpites gerados.
 
-                    result = GameResult(
-                        numeros=jogo,
-                        soma=soma,
-                        pares=pares,
-                        impares=impares,
-                        tipo=tipo.lower().replace("-", "_"),
-                    )
+        Raises:
+            ValueError: Se tipo de loteria não for reconhecido, se a
+                configuração for inviável ou se max_sobreposicao não estiver
+                entre 0 e qtd_selecionados - 1.
+        """
+        if tipo not in LOTTERY_CONFIG:
+            raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
 
-                    # Adicionar atributos opcionais
-                    if tipo == "Lotofácil":
-                        result.primos = self.analisador.contar_primos(jogo)
-                        result.fibo = self.analisador.contar_fibonacci(jogo)
+        config = LOTTERY_CONFIG[tipo] if config is None else config
+        indice = IndiceSobreposicao(max_sobreposicao, config["qtd_selecionados"])
+        max_tentativas = config["max_tentativas"]
+        jogos: List[GameResult] = []
+        recusados = 0
 
-                    jogos.append(result)
+        for jogo in self.gerar_combinacoes(tipo, quantidade * max_tentativas, config):
+            if indice.tentar_adicionar(jogo):
+                jogos.append(self.criar_resultado(tipo, jogo, config))
+                recusados = 0
+                if len(jogos) == quantidade:
+                    break
+            else:
+                recusados += 1
+                if recusados >= max_tentativas:
                     break
 
         return jogos
+
+    def gerar_jogos_mcmc(
+        self,
+        tipo: str,
+        quantidade: int,
+        cadeias: int = 8,
+        desbaste: Optional[int] = None,
+        aquecimento: Optional[int] = None,
+        verificacoes: Sequence[Verificacao] = (),
+        config: Optional[dict] = None,
+    ) -> List[GameResult]:
+        """
+        Gerar palpites por cadeias de Markov de trocas (ver cadeias.py).
+
+        Indicado quando há restrições além das de LOTTERY_CONFIG
+        (`verificacoes`), que a contagem exata não cobre: cada troca é
+        verificada de forma incremental e o custo por jogo não depende de
+        quão rara é a combinação válida. Os jogos iniciais das cadeias vêm
+        de gerar_combinacoes, filtrados pelas verificações. As faixas de
+        padrão configuradas (range_<padrão>) entram como verificação.
+
+        Args:
+            tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+            quantidade: Quantidade de palpites a gerar.
+            cadeias: Quantidade de cadeias independentes.
+            desbaste: Passos entre dois jogos de uma mesma cadeia.
+            aquecimento: Passos de cada cadeia antes do primeiro jogo.
+            verificacoes: Restrições adicionais sobre a máscara de bits do
+                jogo (bit n ligado = número n marcado).
+            config: Configuração com outras restrições (padrão:
+                LOTTERY_CONFIG[tipo]).
+
+        Returns:
+            Lista de GameResult com os palpites gerados.
+
+        Raises:
+            ValueError: Se tipo de loteria não for reconhecido, se a
+                configuração for inviável ou se nenhum jogo inicial atender
+                às verificações em max_tentativas candidatos.
+        """
+        if tipo not in LOTTERY_CONFIG:
+            raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+
+        config = LOTTERY_CONFIG[tipo] if config is None else config
+        verificar_padroes = verificacao_config(config)
+        if verificar_padroes is not None:
+            verificacoes = [*verificacoes, verificar_padroes]
+        iniciais: List[List[int]] = []
+        for jogo in self.gerar_combinacoes(tipo, config["max_tentativas"], config):
+            mascara = empacotar_numeros(jogo)
+            if all(verificar(mascara) for verificar in verificacoes):
+                iniciais.append(jogo)
+                if len(iniciais) == cadeias:
+                    break
+        if not iniciais:
+            raise ValueError(
+                f"Nenhum jogo inicial de {tipo} atende às verificações em "
+                f"{config['max_tentativas']} candidatos"
+            )
+
+        amostrador = AmostradorTrocas(
+            Restricoes.de_config(config),
+            iniciais,
+            rng=self.rng,
+            cadeias=cadeias,
+            desbaste=desbaste,
+            aquecimento=aquecimento,
+            verificacoes=verificacoes,
+        )
+        return [
+            self.criar_resultado(tipo, jogo, config)
+            for jogo in amostrador.amostras(quantidade)
+        ]
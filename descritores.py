@@ -0,0 +1,235 @@
+"""
+Lotes endereçáveis por semente: o jogo i de um lote (loteria, hash da
+configuração, semente) é recalculado diretamente, sem gerar os jogos 0..i-1.
+
+Cada jogo sai de um hash com chave (blake2b sobre semente, loteria, hash da
+configuração e índice), reduzido a uma posição entre as combinações válidas
+e decodificado pela tabela de completamentos da contagem exata
+(viabilidade.ContadorCombinacoes.decodificar). Como em gerar_jogos, os jogos
+são uniformes entre os válidos e independentes entre si (podem se repetir).
+
+Um lote de milhões de jogos é guardado como um descritor de poucos bytes
+(DescritorLote.to_dict, JSON); conferência, exportação e PDF percorrem os
+jogos sob demanda (DescritorLote.jogos).
+"""
+
+import hashlib
+import struct
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Union
+
+from config import LOTTERY_CONFIG
+from core import GameResult, GeradorLoteria, desempacotar_numeros, empacotar_numeros
+from padroes import verificacao_config
+from precomputo import hash_config
+from viabilidade import analisar
+
+# Fluxos do hash de um jogo: tentativas dos números e sorteios extras
+FLUXO_EXTRAS = 0xFFFFFFFF
+
+
+@dataclass(frozen=True)
+class DescritorLote:
+    """Lote de jogos definido só por loteria, semente, quantidade e configuração."""
+
+    tipo: str
+    seed: int
+    quantidade: int
+    chave_config: str = field(default_factory=hash_config)
+
+    def __post_init__(self):
+        if self.tipo not in LOTTERY_CONFIG:
+            raise ValueError(f"Tipo de loteria desconhecido: {self.tipo}")
+        if self.quantidade < 0:
+            raise ValueError(f"Quantidade negativa: {self.quantidade}")
+        if self.chave_config != hash_config():
+            raise ValueError(
+                f"Lote gerado com outra configuração ({self.chave_config}); "
+                f"a atual é {hash_config()}"
+            )
+        config = LOTTERY_CONFIG[self.tipo]
+        base = hashlib.blake2b(
+            f"{self.chave_config}|{self.tipo}|{self.seed}|".encode("utf-8"),
+            digest_size=32,
+        )
+        # Estado derivado, fora da igualdade e da serialização
+        object.__setattr__(self, "_base", base)
+        object.__setattr__(self, "_config", config)
+        object.__setattr__(self, "_contador", analisar(self.tipo).contador)
+        object.__setattr__(self, "_padroes", verificacao_config(config))
+
+    def __reduce__(self):
+        # O hash base e o contador são refeitos no processo de destino
+        return (
+            DescritorLote,
+            (self.tipo, self.seed, self.quantidade, self.chave_config),
+        )
+
+    def _palavra(self, indice: int, fluxo: int) -> int:
+        """Inteiro de 256 bits do jogo `indice` no fluxo dado."""
+        h = self._base.copy()
+        h.update(struct.pack("<QI", indice, fluxo))
+        return int.from_bytes(h.digest(), "little")
+
+    def __len__(self) -> int:
+        return self.quantidade
+
+    def numeros(self, indice: int) -> Optional[List[int]]:
+        """
+        Números do jogo `indice`, calculados diretamente.
+
+        A posição sorteada (hash módulo total de válidas; o viés fica abaixo
+        de 2^-150) é decodificada em O(max_numero) passos. Faixas de padrão
+        (range_<padrão>, fora da contagem exata) recusam a decodificação e
+        passam à tentativa seguinte do mesmo índice, até max_tentativas.
+
+        Args:
+            indice: Posição do jogo no lote (0..quantidade-1).
+
+        Returns:
+            Lista de números ordenada, ou None se nenhuma tentativa atender
+            às faixas de padrão.
+
+        Raises:
+            IndexError: Se o índice estiver fora do lote.
+        """
+        if not 0 <= indice < self.quantidade:
+            raise IndexError(f"Jogo fora do lote: {indice}")
+        total = self._contador.total
+        for tentativa in range(self._config["max_tentativas"]):
+            jogo = self._contador.decodificar(self._palavra(indice, tentativa) % total)
+            if self._padroes is None or self._padroes(empacotar_numeros(jogo)):
+                return jogo
+        return None
+
+    def extras(self, indice: int) -> Optional[Dict[str, object]]:
+        """
+        Sorteios fora do volante do jogo `indice` (ex.: mês da sorte).
+
+        Args:
+            indice: Posição do jogo no lote.
+
+        Returns:
+            Dicionário nome -> opção, ou None se a loteria não tiver extras.
+        """
+        sorteios = self._config.get("sorteios_extras")
+        if not sorteios:
+            return None
+        palavra = self._palavra(indice, FLUXO_EXTRAS)
+        extras = {}
+        for nome, opcoes in sorteios.items():
+            tamanho = opcoes if isinstance(opcoes, int) else len(opcoes)
+            palavra, escolha = divmod(palavra, tamanho)
+            extras[nome] = escolha + 1 if isinstance(opcoes, int) else opcoes[escolha]
+        return extras
+
+    def iter_mascaras(self) -> Iterator[int]:
+        """Máscaras dos jogos, em ordem (jogos recusados pelos padrões omitidos)."""
+        for i in range(self.quantidade):
+            jogo = self.numeros(i)
+            if jogo is not None:
+                yield empacotar_numeros(jogo)
+
+    def __iter__(self) -> Iterator[List[int]]:
+        return map(desempacotar_numeros, self.iter_mascaras())
+
+    def contar_acertos(self, sorteio: List[int]) -> List[int]:
+        """
+        Conferir todos os jogos contra um sorteio, recalculando-os em sequência.
+
+        Args:
+            sorteio: Números sorteados.
+
+        Returns:
+            Lista indexada pela quantidade de acertos com o número de jogos.
+        """
+        contagem = [0] * (len(sorteio) + 1)
+        alvo = empacotar_numeros(sorteio)
+        for mascara in self.iter_mascaras():
+            contagem[(mascara & alvo).bit_count()] += 1
+        return contagem
+
+    def jogos(self) -> "JogosDescritor":
+        """Sequência preguiçosa de GameResult do lote (ver JogosDescritor)."""
+        return JogosDescritor(self)
+
+    def to_dict(self) -> dict:
+        """Converter para dicionário (serializável em JSON)."""
+        return {
+            "tipo": self.tipo,
+            "seed": self.seed,
+            "quantidade": self.quantidade,
+            "chave_config": self.chave_config,
+        }
+
+    @classmethod
+    def de_dict(cls, dados: dict) -> "DescritorLote":
+        """
+        Reconstruir um descritor salvo com to_dict.
+
+        Raises:
+            ValueError: Se a configuração atual não for a do lote.
+        """
+        return cls(
+            tipo=dados["tipo"],
+            seed=dados["seed"],
+            quantidade=dados["quantidade"],
+            chave_config=dados["chave_config"],
+        )
+
+
+class JogosDescritor(Sequence):
+    """
+    Jogos de um descritor (ou de um trecho dele) como sequência de GameResult.
+
+    Nada é guardado: cada acesso recalcula o jogo, e fatias são novas
+    visões sobre o mesmo descritor. Serve onde se espera uma lista de
+    jogos (gerar_csv, gerar_lotobin, PDFGenerator), e no PDF em paralelo
+    cada processo recebe só o descritor e o trecho das suas páginas.
+    Jogos recusados pelas faixas de padrão (ver DescritorLote.numeros)
+    levantam LookupError; lotes de configurações com faixas de padrão
+    devem ser percorridos com DescritorLote.iter_mascaras.
+    """
+
+    def __init__(
+        self, descritor: DescritorLote, inicio: int = 0, fim: Optional[int] = None
+    ):
+        """
+        Args:
+            descritor: Lote de origem.
+            inicio: Primeiro índice do trecho.
+            fim: Índice após o último (padrão: fim do lote).
+        """
+        self.descritor = descritor
+        self.inicio = inicio
+        self.fim = descritor.quantidade if fim is None else fim
+        self._gerador = GeradorLoteria(seed=descritor.seed)
+
+    def __len__(self) -> int:
+        return max(0, self.fim - self.inicio)
+
+    def __getitem__(
+        self, indice: Union[int, slice]
+    ) -> Union[GameResult, "JogosDescritor"]:
+        if isinstance(indice, slice):
+            inicio, fim, passo = indice.indices(len(self))
+            if passo != 1:
+                raise ValueError("Fatias de jogos só com passo 1")
+            return JogosDescritor(
+                self.descritor, self.inicio + inicio, self.inicio + max(inicio, fim)
+            )
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError(f"Jogo fora do trecho: {indice}")
+        posicao = self.inicio + indice
+        jogo = self.descritor.numeros(posicao)
+        if jogo is None:
+            raise LookupError(f"Jogo {posicao} recusado pelas faixas de padrão")
+        resultado = self._gerador.criar_resultado(self.descritor.tipo, jogo)
+        resultado.extras = self.descritor.extras(posicao)
+        return resultado
+
+    def __iter__(self) -> Iterator[GameResult]:
+        return (self[i] for i in range(len(self)))
@@ -0,0 +1,119 @@
+"""
+Índice de sobreposição para conjuntos de jogos diversificados (dois jogos
+quaisquer compartilham no máximo t números).
+"""
+
+from itertools import combinations
+from math import comb
+from typing import List, Set
+
+# Acima desta quantidade de subconjuntos de t+1 números por jogo, o índice
+# ocuparia memória demais e a verificação passa a comparar as máscaras
+LIMITE_SUBCONJUNTOS = 5000
+
+
+class IndiceSobreposicao:
+    """
+    Jogos aceitos indexados pelos seus subconjuntos de t+1 números.
+
+    Dois jogos compartilham mais de t números exatamente quando têm um
+    subconjunto de t+1 números em comum. Cada jogo aceito registra as
+    máscaras de todos os seus subconjuntos de t+1 números em um set, e um
+    candidato é verificado com C(k, t+1) consultas, independentemente de
+    quantos jogos já foram aceitos.
+
+    Enquanto há menos de C(k, t+1) jogos aceitos, comparar o candidato com
+    cada máscara aceita via popcount é mais barato, então o set só é montado
+    ao passar desse ponto. Com C(k, t+1) acima de LIMITE_SUBCONJUNTOS o
+    índice ocuparia memória demais e a comparação direta é mantida.
+    """
+
+    def __init__(self, max_sobreposicao: int, qtd: int):
+        """
+        Criar um índice vazio.
+
+        Args:
+            max_sobreposicao: Máximo de números em comum entre dois jogos (t).
+            qtd: Quantidade de números por jogo (k).
+
+        Raises:
+            ValueError: Se t não estiver entre 0 e k - 1.
+        """
+        if not 0 <= max_sobreposicao < qtd:
+            raise ValueError(
+                f"max_sobreposicao deve estar entre 0 e {qtd - 1}: {max_sobreposicao}"
+            )
+        self.max_sobreposicao = max_sobreposicao
+        self.qtd = qtd
+        self.mascaras: List[int] = []
+        self.por_subconjuntos = False
+        self._chaves_por_jogo = comb(qtd, max_sobreposicao + 1)
+        self._subconjuntos: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self.mascaras)
+
+    def _chaves(self, bits: List[int]):
+        """Máscaras dos subconjuntos de t+1 números (bits distintos: soma = OR)."""
+        return map(sum, combinations(bits, self.max_sobreposicao + 1))
+
+    def _montar_subconjuntos(self) -> None:
+        """Indexar os jogos já aceitos e passar a consultar o set."""
+        for mascara in self.mascaras:
+            bits = []
+            while mascara:
+                bit = mascara & -mascara
+                bits.append(bit)
+                mascara ^= bit
+            self._subconjuntos.update(self._chaves(bits))
+        self.por_subconjuntos = True
+
+    def compativel(self, numeros: List[int]) -> bool:
+        """
+        Verificar se um jogo respeita a sobreposição máxima com os aceitos.
+
+        Args:
+            numeros: Números do jogo candidato.
+
+        Returns:
+            True se nenhum jogo aceito compartilhar mais de t números com ele.
+        """
+        if self.por_subconjuntos:
+            return self._subconjuntos.isdisjoint(
+                self._chaves([1 << n for n in numeros])
+            )
+        mascara = sum(1 << n for n in numeros)
+        t = self.max_sobreposicao
+        return not any((mascara & m).bit_count() > t for m in self.mascaras)
+
+    def adicionar(self, numeros: List[int]) -> None:
+        """
+        Registrar um jogo aceito (sem verificar compatibilidade).
+
+        Args:
+            numeros: Números do jogo.
+        """
+        bits = [1 << n for n in numeros]
+        self.mascaras.append(sum(bits))
+        if self.por_subconjuntos:
+            self._subconjuntos.update(self._chaves(bits))
+        elif (
+            self._chaves_por_jogo <= LIMITE_SUBCONJUNTOS
+            and len(self.mascaras) >= self._chaves_por_jogo
+        ):
+            self._montar_subconjuntos()
+
+    def tentar_adicionar(self, numeros: List[int]) -> bool:
+        """
+        Registrar o jogo se ele for compatível com os aceitos.
+
+        Args:
+            numeros: Números do jogo candidato.
+
+        Returns:
+            True se o jogo foi aceito.
+        """
+        if not self.compativel(numeros):
+            return False
+        self.adicionar(numeros)
+        return True
@@ -0,0 +1,180 @@
+"""
+Apostas estendidas: jogos com mais números que o mínimo da loteria (ex.:
+7 a 15 na Mega-Sena), que equivalem a todos os sub-jogos de tamanho mínimo
+que contêm.
+
+Nada é expandido: as restrições são contadas sobre os sub-jogos por
+programação dinâmica nos números da aposta, e as faixas de premiação saem
+de fórmulas binomiais sobre a quantidade de acertos.
+"""
+
+from functools import lru_cache
+from math import comb
+from typing import Dict, Sequence, Tuple
+
+from config import LOTTERY_CONFIG
+from precomputo import tabelas_volante
+from viabilidade import Restricoes
+
+
+def tamanhos_aposta(tipo: str) -> range:
+    """
+    Tamanhos de aposta aceitos pela loteria (qtd_selecionados até
+    max_selecionados).
+
+    Args:
+        tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+
+    Returns:
+        Intervalo de tamanhos (só o mínimo se a loteria não tiver apostas
+        estendidas).
+
+    Raises:
+        ValueError: Se tipo de loteria não for reconhecido.
+    """
+    if tipo not in LOTTERY_CONFIG:
+        raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+    config = LOTTERY_CONFIG[tipo]
+    minimo = config["qtd_selecionados"]
+    return range(minimo, config.get("max_selecionados", minimo) + 1)
+
+
+def contar_subjogos_validos(restricoes: Restricoes, numeros: Sequence[int]) -> int:
+    """
+    Quantos sub-jogos de tamanho restricoes.qtd da aposta atendem às
+    restrições.
+
+    Programação dinâmica sobre os números da aposta, em ordem: o estado
+    guarda quantos números já foram escolhidos e os acumuladores restritos
+    (como em viabilidade.ContadorCombinacoes), então o custo depende dos
+    estados alcançados e não de C(len(numeros), qtd).
+
+    Args:
+        restricoes: Restrições da loteria.
+        numeros: Números da aposta, ordenados.
+
+    Returns:
+        Quantidade de sub-jogos válidos.
+    """
+    r = restricoes
+    tabelas = tabelas_volante(r.max_numero)
+    d_par = tabelas["par"] if r.pares is not None else [0] * (r.max_numero + 1)
+    d_primo = tabelas["primo"] if r.primos is not None else [0] * (r.max_numero + 1)
+    d_fibo = tabelas["fibo"] if r.fibo is not None else [0] * (r.max_numero + 1)
+    soma_max = r.soma[1] if r.soma is not None else None
+    pares_max = r.pares[1] if r.pares is not None else r.qtd
+    primos_max = r.primos[1] if r.primos is not None else r.qtd
+    fibo_max = r.fibo[1] if r.fibo is not None else r.qtd
+
+    # (k, soma, pares, primos, fibo, sequência em curso) -> sub-jogos parciais
+    estados: Dict[Tuple[int, ...], int] = {(0, 0, 0, 0, 0, 0): 1}
+    anterior = -1
+    for restantes, x in zip(range(len(numeros) - 1, -1, -1), numeros):
+        vizinho = x == anterior + 1
+        proximos: Dict[Tuple[int, ...], int] = {}
+        for (k, soma, pares, primos, fibo, seq), parciais in estados.items():
+            if k + restantes >= r.qtd:
+                chave = (k, soma, pares, primos, fibo, 0)
+                proximos[chave] = proximos.get(chave, 0) + parciais
+            if k == r.qtd:
+                continue
+            proxima = seq + 1 if r.evitar_sequencia and vizinho else 1
+            s = soma + x if soma_max is not None else 0
+            p, q, f = pares + d_par[x], primos + d_primo[x], fibo + d_fibo[x]
+            if (
+                (r.evitar_sequencia and proxima >= 3)
+                or (soma_max is not None and s > soma_max)
+                or p > pares_max
+                or q > primos_max
+                or f > fibo_max
+            ):
+                continue
+            chave = (k + 1, s, p, q, f, proxima if r.evitar_sequencia else 0)
+            proximos[chave] = proximos.get(chave, 0) + parciais
+        estados = proximos
+        anterior = x
+
+    faixas = (
+        (1, r.soma),
+        (2, r.pares),
+        (3, r.primos),
+        (4, r.fibo),
+    )
+    validos = 0
+    for estado, parciais in estados.items():
+        if estado[0] == r.qtd and all(
+            faixa is None or faixa[0] <= estado[i] <= faixa[1] for i, faixa in faixas
+        ):
+            validos += parciais
+    return validos
+
+
+def cobertura(restricoes: Restricoes, numeros: Sequence[int]) -> float:
+    """
+    Fração dos sub-jogos da aposta que atendem às restrições.
+
+    Args:
+        restricoes: Restrições da loteria.
+        numeros: Números da aposta, ordenados.
+
+    Returns:
+        Fração entre 0 e 1.
+    """
+    total = comb(len(numeros), restricoes.qtd)
+    return contar_subjogos_validos(restricoes, numeros) / total if total else 0.0
+
+
+@lru_cache(maxsize=None)
+def tabela_premios(tipo: str, tamanho: int) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """
+    Sub-jogos premiados por faixa para cada quantidade de acertos da aposta.
+
+    Com h acertos em uma aposta de t números, os sub-jogos de k números
+    com exatamente j acertos são C(h, j) · C(t - h, k - j).
+
+    Args:
+        tipo: Tipo de loteria.
+        tamanho: Quantidade de números da aposta.
+
+    Returns:
+        Tupla indexada pelos acertos da aposta, com pares (acertos da
+        faixa, sub-jogos premiados) só das faixas com algum sub-jogo.
+
+    Raises:
+        ValueError: Se o tamanho não for aceito pela loteria.
+    """
+    if tamanho not in tamanhos_aposta(tipo):
+        raise ValueError(f"Tamanho de aposta inválido para {tipo}: {tamanho}")
+    config = LOTTERY_CONFIG[tipo]
+    k = config["qtd_selecionados"]
+    sorteados = config.get("qtd_sorteados", k)
+    return tuple(
+        tuple(
+            (j, comb(h, j) * comb(tamanho - h, k - j))
+            for j in sorted(config["faixas_premio"], reverse=True)
+            if comb(h, j) * comb(tamanho - h, k - j)
+        )
+        for h in range(min(tamanho, sorteados) + 1)
+    )
+
+
+def conferir(
+    tipo: str, numeros: Sequence[int], sorteio: Sequence[int]
+) -> Dict[int, int]:
+    """
+    Conferir uma aposta (simples ou estendida) contra um sorteio.
+
+    Args:
+        tipo: Tipo de loteria.
+        numeros: Números da aposta.
+        sorteio: Números sorteados.
+
+    Returns:
+        Dicionário acertos da faixa -> sub-jogos premiados (só faixas com
+        prêmio).
+
+    Raises:
+        ValueError: Se o tamanho da aposta não for aceito pela loteria.
+    """
+    acertos = len(set(numeros) & set(sorteio))
+    return dict(tabela_premios(tipo, len(numeros))[acertos])
@@ -0,0 +1,457 @@
+"""
+Fila de exportação em segundo plano (CSV/PDF/.lotobin) com cache de
+artefatos em disco.
+"""
+
+import csv
+import hashlib
+import io
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from core import GameResult
+from padroes import colunas_padroes
+
+FORMATOS = {
+    "csv": "text/csv",
+    "pdf": "application/pdf",
+    "lotobin": "application/octet-stream",
+}
+
+# Mudanças no layout dos artefatos (ex.: colunas de padrões no CSV)
+# invalidam o cache antigo
+VERSAO_ARTEFATOS = 2
+
+
+class ArtifactCache:
+    """Cache de arquivos em disco, limitado em bytes, com remoção LRU."""
+
+    def __init__(self, diretorio: str, max_bytes: int = 200 * 1024 * 1024):
+        """
+        Abrir (ou criar) o diretório de cache.
+
+        Args:
+            diretorio: Diretório onde os artefatos são gravados.
+            max_bytes: Tamanho máximo somado dos artefatos.
+        """
+        self.diretorio = diretorio
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entradas: "OrderedDict[str, int]" = OrderedDict()
+        os.makedirs(diretorio, exist_ok=True)
+
+        # Reconstituir a ordem LRU a partir do mtime (atualizado a cada acesso)
+        arquivos = []
+        for nome in os.listdir(diretorio):
+            caminho = os.path.join(diretorio, nome)
+            if nome.endswith(".tmp") or not os.path.isfile(caminho):
+                continue
+            info = os.stat(caminho)
+            arquivos.append((info.st_mtime_ns, nome, info.st_size))
+        for _, nome, tamanho in sorted(arquivos):
+            self._entradas[nome] = tamanho
+
+    @property
+    def total_bytes(self) -> int:
+        """Tamanho somado dos artefatos em cache."""
+        return sum(self._entradas.values())
+
+    def __contains__(self, chave: str) -> bool:
+        """Indica se a chave está em cache (sem alterar a ordem LRU)."""
+        return chave in self._entradas
+
+    def caminho(self, chave: str) -> str:
+        """Caminho do arquivo de uma chave."""
+        return os.path.join(self.diretorio, chave)
+
+    def obter(self, chave: str) -> Optional[str]:
+        """
+        Buscar um artefato, marcando-o como usado recentemente.
+
+        Args:
+            chave: Nome do artefato.
+
+        Returns:
+            Caminho do arquivo, ou None se não estiver em cache.
+        """
+        with self._lock:
+            if chave not in self._entradas:
+                return None
+            caminho = self.caminho(chave)
+            if not os.path.exists(caminho):
+                del self._entradas[chave]
+                return None
+            self._entradas.move_to_end(chave)
+            os.utime(caminho)
+            return caminho
+
+    def gravar(self, chave: str, dados: bytes) -> str:
+        """
+        Gravar um artefato (escrita atômica) e remover os menos usados.
+
+        Args:
+            chave: Nome do artefato.
+            dados: Conteúdo do arquivo.
+
+        Returns:
+            Caminho do arquivo gravado.
+        """
+        caminho = self.caminho(chave)
+        temporario = f"{caminho}.{uuid.uuid4().hex}.tmp"
+        with open(temporario, "wb") as f:
+            f.write(dados)
+        os.replace(temporario, caminho)
+
+        with self._lock:
+            self._entradas[chave] = len(dados)
+            self._entradas.move_to_end(chave)
+            total = self.total_bytes
+            while total > self.max_bytes and len(self._entradas) > 1:
+                antiga, tamanho = self._entradas.popitem(last=False)
+                total -= tamanho
+                try:
+                    os.remove(self.caminho(antiga))
+                except FileNotFoundError:
+                    pass
+        return caminho
+
+
+@dataclass
+class ExportJob:
+    """Estado de uma exportação submetida à fila."""
+
+    id: str
+    formato: str
+    chave: str
+    status: str = "pendente"  # pendente, executando, concluido, erro
+    progresso: float = 0.0
+    caminho: Optional[str] = None
+    erro: Optional[str] = None
+    duracao_s: Optional[float] = None
+    criado_em: float = field(default_factory=time.monotonic)
+    finalizado_em: Optional[float] = None  # time.monotonic ao concluir ou falhar
+
+    @property
+    def terminado(self) -> bool:
+        """Indica se o job já concluiu ou falhou."""
+        return self.status in ("concluido", "erro")
+
+    @property
+    def pronto(self) -> bool:
+        """Indica se o artefato está disponível para download."""
+        return self.status == "concluido"
+
+    def ler(self) -> bytes:
+        """
+        Ler o conteúdo do artefato concluído.
+
+        Raises:
+            RuntimeError: Se a exportação não estiver concluída.
+            FileNotFoundError: Se o artefato já tiver saído do cache (ver
+                ExportQueue.ler).
+        """
+        if self.caminho is None:
+            raise RuntimeError(f"Exportação {self.id} ainda não concluída")
+        with open(self.caminho, "rb") as f:
+            return f.read()
+
+
+def chave_exportacao(formato: str, tipo: str, jogos: List[GameResult]) -> str:
+    """
+    Calcular a chave de cache de uma exportação (conteúdo dos jogos).
+
+    Args:
+        formato: Chave de FORMATOS.
+        tipo: Tipo de loteria.
+        jogos: Jogos exportados.
+
+    Returns:
+        Nome do artefato (hash + extensão).
+    """
+    h = hashlib.sha256(f"{VERSAO_ARTEFATOS}|{formato}|{tipo}".encode())
+    for jogo in jogos:
+        h.update(repr(sorted(jogo.to_dict().items())).encode())
+    return f"{h.hexdigest()[:32]}.{formato}"
+
+
+def gerar_csv(
+    jogos: List[GameResult],
+    progresso: Optional[Callable[[int, int], None]] = None,
+    tipo: Optional[str] = None,
+) -> bytes:
+    """
+    Gerar CSV dos jogos (mesmas colunas de GameResult.to_dict).
+
+    Args:
+        jogos: Jogos a exportar.
+        progresso: Callback (concluídos, total) chamado periodicamente.
+        tipo: Tipo de loteria; se informado, acrescenta as colunas de
+            padrões do lote (ver padroes.py).
+
+    Returns:
+        Bytes do CSV em UTF-8.
+    """
+    buffer = io.StringIO()
+    colunas = list(jogos[0].to_dict()) if jogos else []
+    padroes = {}
+    if tipo is not None:
+        padroes = colunas_padroes(tipo, (jogo.mascara for jogo in jogos))
+        colunas += list(padroes)
+    writer = csv.DictWriter(buffer, fieldnames=colunas, lineterminator="\n")
+    writer.writeheader()
+    total = len(jogos)
+    for i, jogo in enumerate(jogos, 1):
+        linha = jogo.to_dict()
+        for nome, valores in padroes.items():
+            linha[nome] = valores[i - 1]
+        writer.writerow(linha)
+        if progresso is not None and i % 1000 == 0:
+            progresso(i, total)
+    return buffer.getvalue().encode("utf-8")
+
+
+def gerar_pdf(
+    tipo: str,
+    jogos: List[GameResult],
+    progresso: Optional[Callable[[int, int], None]] = None,
+) -> bytes:
+    """
+    Gerar o relatório PDF dos jogos.
+
+    Args:
+        tipo: Tipo de loteria.
+        jogos: Jogos a exportar.
+        progresso: Callback (concluídos, total) chamado periodicamente.
+
+    Returns:
+        Bytes do PDF.
+    """
+    from pdf_generator import PDFGenerator
+
+    return PDFGenerator(tipo).generate_report(jogos, progresso=progresso)
+
+
+def gerar_lotobin(
+    tipo: str,
+    jogos: List[GameResult],
+    progresso: Optional[Callable[[int, int], None]] = None,
+) -> bytes:
+    """
+    Gerar o arquivo binário compacto dos jogos (ver bilhetes.py).
+
+    Args:
+        tipo: Tipo de loteria.
+        jogos: Jogos a exportar.
+        progresso: Callback (concluídos, total) chamado periodicamente.
+
+    Returns:
+        Bytes do arquivo .lotobin.
+    """
+    from bilhetes import EscritorBilhetes
+
+    buffer = io.BytesIO()
+    total = len(jogos)
+    with EscritorBilhetes(buffer, tipo) as escritor:
+        for i, jogo in enumerate(jogos, 1):
+            escritor.adicionar(jogo.numeros, extras=jogo.extras)
+            if progresso is not None and i % 10000 == 0:
+                progresso(i, total)
+    return buffer.getvalue()
+
+
+class ExportQueue:
+    """Fila de exportações executadas em threads, com progresso e cache."""
+
+    def __init__(
+        self,
+        cache: ArtifactCache,
+        workers: int = 2,
+        max_jobs: int = 64,
+        validade_s: float = 3600.0,
+        prazo_s: float = 900.0,
+    ):
+        """
+        Inicializar a fila.
+
+        Args:
+            cache: Cache onde os artefatos concluídos são guardados.
+            workers: Quantidade de threads de exportação.
+            max_jobs: Jobs terminados (concluídos ou com erro) lembrados; os
+                mais antigos são esquecidos primeiro.
+            validade_s: Segundos que um job terminado é lembrado.
+            prazo_s: Segundos que um job pode ficar pendente ou executando
+                antes de ser dado como falho.
+        """
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="lotopro-export"
+        )
+        self._lock = threading.Lock()
+        self.max_jobs = max_jobs
+        self.validade_s = validade_s
+        self.prazo_s = prazo_s
+        self._jobs: Dict[str, ExportJob] = {}
+        self._por_chave: Dict[str, ExportJob] = {}
+        self._futuros: Dict[str, Future] = {}
+
+    def submeter(self, formato: str, tipo: str, jogos: List[GameResult]) -> ExportJob:
+        """
+        Submeter uma exportação (ou reaproveitar uma idêntica).
+
+        Args:
+            formato: Chave de FORMATOS.
+            tipo: Tipo de loteria.
+            jogos: Jogos a exportar.
+
+        Returns:
+            ExportJob, já concluído se o artefato estava em cache.
+
+        Raises:
+            ValueError: Se o formato não for suportado.
+        """
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato de exportação desconhecido: {formato}")
+
+        chave = chave_exportacao(formato, tipo, jogos)
+        with self._lock:
+            self._podar()
+            existente = self._por_chave.get(chave)
+            if existente is not None and existente.status in ("pendente", "executando"):
+                return existente
+            if existente is not None:
+                # Job anterior da mesma chave (concluído ou com erro) é substituído
+                del self._jobs[existente.id]
+
+            job = ExportJob(id=uuid.uuid4().hex, formato=formato, chave=chave)
+            self._jobs[job.id] = job
+            self._por_chave[chave] = job
+
+        caminho = self.cache.obter(chave)
+        if caminho is not None:
+            job.status, job.progresso, job.caminho = "concluido", 1.0, caminho
+            job.finalizado_em = time.monotonic()
+            return job
+
+        futuro = self._executor.submit(self._executar, job, tipo, list(jogos))
+        with self._lock:
+            if job.id in self._jobs and not futuro.done():
+                self._futuros[job.id] = futuro
+        return job
+
+    def obter(self, job_id: str) -> Optional[ExportJob]:
+        """
+        Buscar um job pelo id.
+
+        Returns:
+            ExportJob, ou None se o id for desconhecido ou o artefato do job
+            concluído já tiver saído do cache.
+        """
+        with self._lock:
+            self._podar()
+            return self._jobs.get(job_id)
+
+    def ler(self, job_id: str) -> Optional[bytes]:
+        """
+        Ler o artefato de um job concluído, passando pelo cache (o acesso
+        renova a posição LRU).
+
+        Args:
+            job_id: Identificador do job.
+
+        Returns:
+            Conteúdo do artefato, ou None se o job não existir, não estiver
+            concluído ou o artefato já tiver saído do cache.
+        """
+        job = self.obter(job_id)
+        if job is None or not job.pronto:
+            return None
+        caminho = self.cache.obter(job.chave)
+        if caminho is not None:
+            try:
+                with open(caminho, "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                # Removido por outra gravação entre obter e open
+                pass
+        with self._lock:
+            self._remover(job)
+        return None
+
+    def _remover(self, job: ExportJob) -> None:
+        """Esquecer um job (chamado com o lock da fila)."""
+        self._jobs.pop(job.id, None)
+        self._futuros.pop(job.id, None)
+        if self._por_chave.get(job.chave) is job:
+            del self._por_chave[job.chave]
+
+    def _podar(self) -> None:
+        """
+        Esquecer jobs antigos (chamado com o lock da fila): concluídos cujo
+        artefato saiu do cache, terminados há mais de validade_s e os
+        terminados além dos max_jobs mais recentes. Jobs pendentes ou em
+        execução há mais de prazo_s são dados como falhos (os pendentes são
+        cancelados; uma thread travada não pode ser interrompida).
+        """
+        agora = time.monotonic()
+        for job in list(self._jobs.values()):
+            if not job.terminado and agora - job.criado_em > self.prazo_s:
+                futuro = self._futuros.pop(job.id, None)
+                if futuro is not None:
+                    futuro.cancel()
+                job.erro = f"Exportação sem resposta após {self.prazo_s:.0f} s"
+                job.status, job.finalizado_em = "erro", agora
+        terminados = sorted(
+            (j for j in self._jobs.values() if j.terminado),
+            key=lambda j: j.finalizado_em or j.criado_em,
+            reverse=True,
+        )
+        for posicao, job in enumerate(terminados):
+            if (
+                posicao >= self.max_jobs
+                or agora - (job.finalizado_em or job.criado_em) > self.validade_s
+                or (job.pronto and job.chave not in self.cache)
+            ):
+                self._remover(job)
+
+    def _executar(self, job: ExportJob, tipo: str, jogos: List[GameResult]) -> None:
+        """Executar uma exportação (thread da fila)."""
+        job.status = "executando"
+        inicio = time.perf_counter()
+
+        def progresso(concluidos: int, total: int) -> None:
+            job.progresso = concluidos / total if total else 1.0
+
+        try:
+            if job.formato == "csv":
+                dados = gerar_csv(jogos, progresso, tipo)
+            elif job.formato == "lotobin":
+                dados = gerar_lotobin(tipo, jogos, progresso)
+            else:
+                dados = gerar_pdf(tipo, jogos, progresso)
+            job.caminho = self.cache.gravar(job.chave, dados)
+            job.progresso = 1.0
+            job.status = "concluido"
+        # Qualquer falha vira status "erro"; uma exceção escapando da thread
+        # deixaria o job em "executando" e só apareceria no Future descartado
+        except Exception as e:  # noqa: BLE001
+            job.erro = str(e)
+            job.status = "erro"
+        finally:
+            job.duracao_s = time.perf_counter() - inicio
+            job.finalizado_em = time.monotonic()
+            with self._lock:
+                self._futuros.pop(job.id, None)
+
+
+def diretorio_padrao() -> str:
+    """Diretório padrão do cache (variável de ambiente LOTOPRO_EXPORT_CACHE)."""
+    return os.environ.get(
+        "LOTOPRO_EXPORT_CACHE", os.path.join(tempfile.gettempdir(), "lotopro_exports")
+    )
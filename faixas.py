@@ -0,0 +1,385 @@
+"""
+Contagem interativa das combinações aceitas por faixas de soma, pares,
+primos e Fibonacci (controles da barra lateral do app).
+
+A contagem exata de viabilidade.py poda pelas faixas, então cada ajuste
+refaria a programação dinâmica. Aqui a tabela é montada uma vez sem faixas:
+a distribuição conjunta das combinações por (pares, primos, Fibonacci),
+com somas prefixadas ao longo da soma. Uma faixa qualquer vira uma soma em
+caixa: uma passada pelas chaves (pares, primos, Fibonacci) com duas
+consultas às somas prefixadas cada, sem refazer nada nas outras dimensões.
+Só ligar uma dimensão ainda não acompanhada (ou mudar evitar_sequencia)
+monta outra tabela; desligar usa a que já existe.
+"""
+
+from dataclasses import dataclass
+from math import comb, inf
+from typing import Dict, List, Optional, Tuple
+
+from config import FIBONACCI, LOTTERY_CONFIG, PRIMOS
+from precomputo import cache_padrao, tabelas_volante
+from viabilidade import Restricoes, escolher_estrategia
+
+# Dimensão -> rótulo (ordem dos controles e das chaves da tabela)
+DIMENSOES = {
+    "soma": "Soma",
+    "pares": "Pares",
+    "primos": "Primos",
+    "fibo": "Fibonacci",
+}
+
+# A soma só entra na tabela se qtd * max_numero não passar disso (a Lotomania,
+# 50 de 100, teria milhares de somas por chave)
+LIMITE_SOMA = 2000
+
+Faixas = Dict[str, Optional[Tuple[int, int]]]
+
+
+@dataclass
+class Estimativa:
+    """Combinações aceitas por um conjunto de faixas."""
+
+    validas: int
+    total: int
+    taxa_aceitacao: float
+    tentativas_esperadas: float  # inf se nenhuma combinação for aceita
+    estrategia: Optional[str]  # None se nenhuma combinação for aceita
+
+    def to_dict(self) -> dict:
+        """Converter para dicionário (compatível com pandas.DataFrame)."""
+        return {
+            "validas": self.validas,
+            "total": self.total,
+            "taxa_aceitacao": self.taxa_aceitacao,
+            "tentativas_esperadas": self.tentativas_esperadas,
+            "estrategia": self.estrategia,
+        }
+
+
+def dimensoes_disponiveis(tipo: str) -> List[str]:
+    """
+    Dimensões que podem ser ajustadas para uma loteria.
+
+    Args:
+        tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+
+    Returns:
+        Chaves de DIMENSOES (sem "soma" acima de LIMITE_SOMA).
+
+    Raises:
+        ValueError: Se tipo de loteria não for reconhecido.
+    """
+    if tipo not in LOTTERY_CONFIG:
+        raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+    config = LOTTERY_CONFIG[tipo]
+    soma = config["qtd_selecionados"] * config["max_numero"] <= LIMITE_SOMA
+    return [d for d in DIMENSOES if d != "soma" or soma]
+
+
+def limites(tipo: str, dimensao: str) -> Tuple[int, int]:
+    """
+    Menor e maior valor possíveis de uma dimensão em um jogo.
+
+    Args:
+        tipo: Tipo de loteria.
+        dimensao: Chave de DIMENSOES.
+
+    Returns:
+        Tupla (mínimo, máximo).
+
+    Raises:
+        ValueError: Se a dimensão não existir.
+    """
+    config = LOTTERY_CONFIG[tipo]
+    n, k = config["max_numero"], config["qtd_selecionados"]
+    volante = range(1, n + 1)
+    if dimensao == "soma":
+        return k * (k + 1) // 2, k * n - k * (k - 1) // 2
+    marcados = {
+        "pares": sum(1 for x in volante if x % 2 == 0),
+        "primos": sum(1 for x in volante if x in PRIMOS),
+        "fibo": sum(1 for x in volante if x in FIBONACCI),
+    }
+    if dimensao not in marcados:
+        raise ValueError(f"Dimensão desconhecida: {dimensao}")
+    # Mínimo: os números fora da categoria não bastam para completar o jogo
+    return max(0, k - (n - marcados[dimensao])), min(k, marcados[dimensao])
+
+
+def faixas_config(config: dict) -> Faixas:
+    """
+    Faixas configuradas (range_<dimensão>) de uma entrada de LOTTERY_CONFIG.
+
+    Args:
+        config: Configuração da loteria.
+
+    Returns:
+        Dicionário dimensão -> faixa (None se não restrita).
+    """
+    return {d: config.get(f"range_{d}") for d in DIMENSOES}
+
+
+def config_com_faixas(config: dict, faixas: Faixas, evitar_sequencia: bool) -> dict:
+    """
+    Cópia de uma configuração com outras faixas e evitar_sequencia.
+
+    Args:
+        config: Configuração da loteria.
+        faixas: Dimensão -> faixa (None remove a restrição).
+        evitar_sequencia: Recusar três números seguidos.
+
+    Returns:
+        Nova configuração (a original não é alterada).
+    """
+    nova = dict(config)
+    if evitar_sequencia or "evitar_sequencia" in config:
+        nova["evitar_sequencia"] = evitar_sequencia
+    for dimensao, faixa in faixas.items():
+        if faixa is None:
+            nova.pop(f"range_{dimensao}", None)
+        else:
+            nova[f"range_{dimensao}"] = tuple(faixa)
+    return nova
+
+
+class TabelaFaixas:
+    """Distribuição conjunta das combinações de um volante, sem faixas."""
+
+    def __init__(
+        self,
+        restricoes: Restricoes,
+        dimensoes: Tuple[str, ...],
+        tabela: Dict[Tuple[int, ...], Tuple[int, List[int]]],
+    ):
+        """
+        Args:
+            restricoes: Volante, tamanho do jogo e evitar_sequencia (as
+                faixas são ignoradas).
+            dimensoes: Dimensões acompanhadas, na ordem de DIMENSOES.
+            tabela: Chave (valores das dimensões acompanhadas, exceto a
+                soma) -> (menor soma, somas prefixadas das contagens por
+                soma); sem a soma, (0, [0, contagem]).
+        """
+        self.restricoes = restricoes
+        self.dimensoes = dimensoes
+        self.tabela = tabela
+        self._chaves = [d for d in dimensoes if d != "soma"]
+
+    @property
+    def total(self) -> int:
+        """Combinações do volante (com evitar_sequencia, se ligado)."""
+        return sum(prefixo[-1] for _, prefixo in self.tabela.values())
+
+    def contar(self, faixas: Faixas) -> int:
+        """
+        Combinações cujas dimensões ficam dentro das faixas.
+
+        Args:
+            faixas: Dimensão -> (mínimo, máximo); None ou ausente não restringe.
+
+        Returns:
+            Quantidade de combinações.
+
+        Raises:
+            ValueError: Se uma faixa for de dimensão fora da tabela.
+        """
+        fora = [
+            d for d, f in faixas.items() if f is not None and d not in self.dimensoes
+        ]
+        if fora:
+            raise ValueError(f"Dimensões fora da tabela: {', '.join(fora)}")
+        caixa = [faixas.get(d) for d in self._chaves]
+        soma = faixas.get("soma")
+        total = 0
+        for chave, (menor, prefixo) in self.tabela.items():
+            if any(
+                f is not None and not f[0] <= v <= f[1] for f, v in zip(caixa, chave)
+            ):
+                continue
+            if soma is None:
+                total += prefixo[-1]
+                continue
+            inicio = max(soma[0] - menor, 0)
+            fim = min(soma[1] - menor + 1, len(prefixo) - 1)
+            if inicio < fim:
+                total += prefixo[fim] - prefixo[inicio]
+        return total
+
+    def estimar(self, faixas: Faixas) -> Estimativa:
+        """
+        Combinações aceitas, taxa de aceitação e amostragem escolhida.
+
+        Args:
+            faixas: Dimensão -> (mínimo, máximo) ou None.
+
+        Returns:
+            Estimativa (a taxa é sobre todas as combinações do volante).
+        """
+        r = self.restricoes
+        validas = self.contar(faixas)
+        total = comb(r.max_numero, r.qtd)
+        taxa = validas / total
+        return Estimativa(
+            validas=validas,
+            total=total,
+            taxa_aceitacao=taxa,
+            tentativas_esperadas=1 / taxa if validas else inf,
+            estrategia=escolher_estrategia(r, taxa) if validas else None,
+        )
+
+
+def _construir(
+    restricoes: Restricoes, dimensoes: Tuple[str, ...]
+) -> Dict[Tuple[int, ...], Tuple[int, List[int]]]:
+    """Programação dinâmica sobre os números do volante, sem podar por faixas."""
+    r = restricoes
+    n = r.max_numero
+    tabelas = tabelas_volante(n)
+    zeros = [0] * (n + 1)
+    d_par = tabelas["par"] if "pares" in dimensoes else zeros
+    d_primo = tabelas["primo"] if "primos" in dimensoes else zeros
+    d_fibo = tabelas["fibo"] if "fibo" in dimensoes else zeros
+    usa_soma = "soma" in dimensoes
+
+    # (k, soma, pares, primos, fibo, sequência em curso) -> combinações parciais
+    estados: Dict[Tuple[int, ...], int] = {(0, 0, 0, 0, 0, 0): 1}
+    for x in range(1, n + 1):
+        restantes = n - x
+        proximos: Dict[Tuple[int, ...], int] = {}
+        obter = proximos.get
+        for (k, soma, pares, primos, fibo, seq), parciais in estados.items():
+            if k + restantes >= r.qtd:
+                chave = (k, soma, pares, primos, fibo, 0)
+                proximos[chave] = obter(chave, 0) + parciais
+            if k == r.qtd or (r.evitar_sequencia and seq == 2):
+                continue
+            chave = (
+                k + 1,
+                soma + x if usa_soma else 0,
+                pares + d_par[x],
+                primos + d_primo[x],
+                fibo + d_fibo[x],
+                seq + 1 if r.evitar_sequencia else 0,
+            )
+            proximos[chave] = obter(chave, 0) + parciais
+        estados = proximos
+
+    # Agrupar por chave e prefixar ao longo da soma
+    por_soma: Dict[Tuple[int, ...], Dict[int, int]] = {}
+    indices = [
+        i for i, d in enumerate(("pares", "primos", "fibo"), 2) if d in dimensoes
+    ]
+    for estado, parciais in estados.items():
+        chave = tuple(estado[i] for i in indices)
+        contagens = por_soma.setdefault(chave, {})
+        contagens[estado[1]] = contagens.get(estado[1], 0) + parciais
+    tabela = {}
+    for chave, contagens in por_soma.items():
+        menor = min(contagens)
+        prefixo = [0]
+        for soma in range(menor, max(contagens) + 1):
+            prefixo.append(prefixo[-1] + contagens.get(soma, 0))
+        tabela[chave] = (menor, prefixo)
+    return tabela
+
+
+# Tabelas montadas no processo: (restrições, dimensões) -> TabelaFaixas
+_TABELAS: Dict[Tuple[Restricoes, Tuple[str, ...]], TabelaFaixas] = {}
+
+
+def tabela_faixas(
+    tipo: str, dimensoes: Tuple[str, ...], evitar_sequencia: bool
+) -> TabelaFaixas:
+    """
+    Tabela que responde faixas nas dimensões pedidas.
+
+    Uma tabela já montada com mais dimensões (e o mesmo evitar_sequencia)
+    serve sem montar outra; as novas são gravadas no cache de pré-cálculo.
+
+    Args:
+        tipo: Tipo de loteria.
+        dimensoes: Dimensões que terão faixas.
+        evitar_sequencia: Recusar três números seguidos.
+
+    Returns:
+        TabelaFaixas.
+
+    Raises:
+        ValueError: Se tipo de loteria ou dimensão não forem reconhecidos
+            ou a dimensão não estiver disponível (ver dimensoes_disponiveis).
+    """
+    disponiveis = dimensoes_disponiveis(tipo)
+    fora = [d for d in dimensoes if d not in disponiveis]
+    if fora:
+        raise ValueError(f"Dimensões indisponíveis para {tipo}: {', '.join(fora)}")
+    config = LOTTERY_CONFIG[tipo]
+    restricoes = Restricoes(
+        max_numero=config["max_numero"],
+        qtd=config["qtd_selecionados"],
+        evitar_sequencia=evitar_sequencia,
+    )
+    pedidas = set(dimensoes)
+    # A menor tabela montada que cobre as dimensões pedidas
+    candidatas = [
+        tabela
+        for (r, dims), tabela in list(_TABELAS.items())
+        if r == restricoes and pedidas <= set(dims)
+    ]
+    if candidatas:
+        return min(candidatas, key=lambda t: len(t.dimensoes))
+
+    ordenadas = tuple(d for d in DIMENSOES if d in pedidas)
+    nome = (
+        f"faixas:{restricoes.max_numero}:{restricoes.qtd}:"
+        f"{int(evitar_sequencia)}:{','.join(ordenadas)}"
+    )
+    tabela = cache_padrao().obter(nome, lambda: _construir(restricoes, ordenadas))
+    return _TABELAS.setdefault(
+        (restricoes, ordenadas), TabelaFaixas(restricoes, ordenadas, tabela)
+    )
+
+
+def estimar(tipo: str, faixas: Faixas, evitar_sequencia: bool) -> Estimativa:
+    """
+    Combinações aceitas por faixas ajustadas de uma loteria.
+
+    As faixas de padrão (range_<padrão>, ver padroes.py) ficam de fora,
+    como na contagem de viabilidade.py.
+
+    Args:
+        tipo: Tipo de loteria.
+        faixas: Dimensão -> (mínimo, máximo) ou None.
+        evitar_sequencia: Recusar três números seguidos.
+
+    Returns:
+        Estimativa.
+
+    Raises:
+        ValueError: Se tipo de loteria ou dimensão não forem reconhecidos.
+    """
+    dimensoes = tuple(d for d, f in faixas.items() if f is not None)
+    return tabela_faixas(tipo, dimensoes, evitar_sequencia).estimar(faixas)
+
+
+def estimar_config(tipo: str, config: dict) -> Optional[Estimativa]:
+    """
+    Estimativa de uma configuração ajustada a partir das tabelas de faixas.
+
+    Args:
+        tipo: Tipo de loteria.
+        config: Configuração com as faixas (ex.: config_com_faixas).
+
+    Returns:
+        Estimativa, ou None se a configuração mudar o volante ou restringir
+        uma dimensão fora das tabelas (ver dimensoes_disponiveis).
+
+    Raises:
+        ValueError: Se tipo de loteria não for reconhecido.
+    """
+    base = LOTTERY_CONFIG[tipo]
+    if any(config[c] != base[c] for c in ("max_numero", "qtd_selecionados")):
+        return None
+    faixas = {d: f for d, f in faixas_config(config).items() if f is not None}
+    if not set(faixas) <= set(dimensoes_disponiveis(tipo)):
+        return None
+    return estimar(tipo, faixas, config.get("evitar_sequencia", False))
@@ -0,0 +1,532 @@
+"""
+Importação em fluxo dos históricos oficiais de resultados (CSV, XLSX ou
+tabela HTML salvos localmente) para um histórico .lotobin com a coluna de
+concurso, acrescentando só os concursos novos.
+
+Importe com: python -m importador <loteria> <arquivo> <historico.lotobin>
+"""
+
+import codecs
+import csv
+import hashlib
+import io
+import os
+import re
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from itertools import chain
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+from bilhetes import EscritorBilhetes, LeitorBilhetes, acrescentar_bilhetes
+from config import LOTTERY_CONFIG
+
+TAMANHO_LEITURA = 1 << 16
+# Mensagens de linhas recusadas guardadas no resultado (as demais só contam)
+MAX_ERROS = 20
+# Folga do cabeçalho do histórico: os metadados da origem mudam de tamanho a
+# cada importação e são regravados no lugar (ver bilhetes.acrescentar_bilhetes)
+RESERVA_CABECALHO = 256
+
+EXTENSOES = {
+    ".csv": "csv",
+    ".txt": "csv",
+    ".xlsx": "xlsx",
+    ".htm": "html",
+    ".html": "html",
+}
+
+_INTEIRO = re.compile(r"^\d+$")
+_COLUNA_BOLA = re.compile(r"bola|dezena", re.IGNORECASE)
+
+
+@dataclass
+class ResultadoImportacao:
+    """Resumo de uma importação."""
+
+    loteria: str
+    lidos: int  # sorteios válidos encontrados no arquivo
+    novos: int  # sorteios acrescentados ao histórico
+    rejeitados: int  # linhas com concurso mas sorteio inválido
+    total: int  # sorteios no histórico depois da importação
+    ultimo_concurso: int
+    inalterado: bool  # arquivo já importado: nada foi lido nem gravado
+    duracao_s: float
+    erros: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """Converter para dicionário (compatível com pandas.DataFrame)."""
+        return {
+            "loteria": self.loteria,
+            "lidos": self.lidos,
+            "novos": self.novos,
+            "rejeitados": self.rejeitados,
+            "total": self.total,
+            "ultimo_concurso": self.ultimo_concurso,
+            "inalterado": self.inalterado,
+            "duracao_s": self.duracao_s,
+        }
+
+
+def formato_arquivo(nome: str) -> str:
+    """
+    Formato de um arquivo de resultados pela extensão.
+
+    Args:
+        nome: Nome ou caminho do arquivo.
+
+    Returns:
+        "csv", "xlsx" ou "html".
+
+    Raises:
+        ValueError: Se a extensão não for suportada.
+    """
+    extensao = os.path.splitext(nome)[1].lower()
+    if extensao not in EXTENSOES:
+        raise ValueError(f"Formato de arquivo não suportado: {extensao or nome}")
+    return EXTENSOES[extensao]
+
+
+def linhas_csv(arquivo: BinaryIO) -> Iterator[List[str]]:
+    """
+    Linhas de um CSV, em fluxo.
+
+    O separador (ponto e vírgula, vírgula ou tabulação) é detectado na
+    primeira linha; sem nenhum deles, as células são separadas por espaço.
+    """
+    texto = io.TextIOWrapper(arquivo, encoding="utf-8-sig", errors="replace")
+    primeira = texto.readline()
+    separador = max(";,\t", key=primeira.count)
+    if primeira.count(separador):
+        return csv.reader(chain([primeira], texto), delimiter=separador)
+    return (linha.split() for linha in chain([primeira], texto))
+
+
+def linhas_xlsx(arquivo: BinaryIO) -> Iterator[List[str]]:
+    """
+    Linhas da primeira planilha de um XLSX, em fluxo (openpyxl em modo
+    somente leitura).
+
+    Raises:
+        ImportError: Se o pacote openpyxl não estiver instalado.
+    """
+    try:
+        from openpyxl import load_workbook
+    except ImportError as erro:
+        raise ImportError(
+            "Importar XLSX requer o pacote openpyxl (pip install openpyxl)"
+        ) from erro
+
+    livro = load_workbook(arquivo, read_only=True, data_only=True)
+    try:
+        for valores in livro.worksheets[0].iter_rows(values_only=True):
+            yield [
+                (
+                    str(int(v))
+                    if isinstance(v, float) and v.is_integer()
+                    else "" if v is None else str(v)
+                )
+                for v in valores
+            ]
+    finally:
+        livro.close()
+
+
+class _TabelaHTML(HTMLParser):
+    """Linhas (<tr>) de tabelas HTML; tabelas dentro de células viram texto."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.linhas: List[List[str]] = []
+        self._linha: Optional[List[str]] = None
+        self._celula: Optional[List[str]] = None
+        self._aninhadas = 0
+
+    def _fechar_celula(self) -> None:
+        if self._celula is not None and self._linha is not None:
+            self._linha.append("".join(self._celula).strip())
+        self._celula = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._aninhadas:
+            self._aninhadas += tag == "table"
+        elif tag == "table" and self._celula is not None:
+            self._aninhadas = 1
+        elif tag == "tr":
+            self._linha = []
+        elif tag in ("td", "th") and self._linha is not None:
+            self._fechar_celula()
+            self._celula = []
+
+    def handle_endtag(self, tag):
+        if self._aninhadas:
+            self._aninhadas -= tag == "table"
+        elif tag in ("td", "th"):
+            self._fechar_celula()
+        elif tag == "tr" and self._linha is not None:
+            self._fechar_celula()
+            self.linhas.append(self._linha)
+            self._linha = None
+
+    def handle_data(self, data):
+        if self._celula is not None:
+            self._celula.append(data)
+
+
+def linhas_html(arquivo: BinaryIO) -> Iterator[List[str]]:
+    """Linhas das tabelas de um HTML, em fluxo (lido em blocos)."""
+    tabela = _TabelaHTML()
+    decodificador = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        bloco = arquivo.read(TAMANHO_LEITURA)
+        tabela.feed(decodificador.decode(bloco, final=not bloco))
+        yield from tabela.linhas
+        tabela.linhas = []
+        if not bloco:
+            break
+    tabela.close()
+    yield from tabela.linhas
+
+
+LEITORES = {"csv": linhas_csv, "xlsx": linhas_xlsx, "html": linhas_html}
+
+
+def _inteiro(texto: str) -> Optional[int]:
+    """Inteiro de uma célula ("04", " 4 "), ou None."""
+    texto = texto.strip()
+    return int(texto) if _INTEIRO.match(texto) else None
+
+
+def extrair_sorteios(
+    linhas: Iterable[List[str]], tipo: str
+) -> Iterator[Tuple[int, List[List[int]], Optional[str]]]:
+    """
+    Sorteios de linhas de uma planilha de resultados.
+
+    Com cabeçalho (uma célula "Concurso" e colunas "Bola"/"Dezena"), os
+    números vêm dessas colunas e as demais (data, rateio, cidades...) são
+    ignoradas. Sem cabeçalho, a primeira célula é o concurso e os números
+    são os inteiros seguintes, pulando células de texto como a data; uma
+    linha só com os números recebe concursos sequenciais. Linhas sem
+    concurso (títulos, totais) são ignoradas.
+
+    Args:
+        linhas: Células de cada linha.
+        tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+
+    Returns:
+        Iterador de (concurso, sorteios do concurso, erro): erro é None ou
+        o motivo da recusa (e a lista de sorteios fica vazia).
+
+    Raises:
+        ValueError: Se o tipo de loteria não for reconhecido.
+    """
+    if tipo not in LOTTERY_CONFIG:
+        raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+    config = LOTTERY_CONFIG[tipo]
+    max_numero = config["max_numero"]
+    qtd = config.get("qtd_sorteados", config["qtd_selecionados"])
+    por_concurso = config.get("sorteios_por_concurso", 1)
+    esperados = qtd * por_concurso
+
+    colunas: Optional[List[int]] = None  # [concurso, bolas...] do cabeçalho
+    cabecalho_visto = False
+    sequencial = 0
+    for celulas in linhas:
+        if not cabecalho_visto and any(
+            c.strip().lower().startswith("concurso") for c in celulas
+        ):
+            cabecalho_visto = True
+            bolas = [i for i, c in enumerate(celulas) if _COLUNA_BOLA.search(c)]
+            if len(bolas) >= esperados:
+                concurso = next(
+                    i
+                    for i, c in enumerate(celulas)
+                    if c.strip().lower().startswith("concurso")
+                )
+                colunas = [concurso, *bolas[:esperados]]
+            continue
+
+        if colunas is not None:
+            valores = [
+                _inteiro(celulas[i]) if i < len(celulas) else None for i in colunas
+            ]
+            concurso, numeros = valores[0], valores[1:]
+            if concurso is None:
+                continue
+            if None in numeros:
+                yield concurso, [], f"concurso {concurso}: número ausente ou inválido"
+                continue
+        else:
+            valores = [_inteiro(c) for c in celulas if c.strip()]
+            if not valores or valores[0] is None:
+                continue
+            if len(valores) == esperados and None not in valores:
+                sequencial += 1
+                concurso, numeros = sequencial, valores
+            else:
+                concurso = valores[0]
+                resto = valores[1:]
+                # Pular texto (data) antes dos números e parar no primeiro
+                # texto depois deles
+                while resto and resto[0] is None:
+                    resto.pop(0)
+                numeros = []
+                for v in resto:
+                    if v is None or len(numeros) == esperados:
+                        break
+                    numeros.append(v)
+                if len(numeros) < esperados:
+                    yield (
+                        concurso,
+                        [],
+                        f"concurso {concurso}: {len(numeros)} números, "
+                        f"esperados {esperados}",
+                    )
+                    continue
+            sequencial = concurso
+
+        if max_numero == 100:
+            # Lotomania: o "00" do volante é o número 100
+            numeros = [n or 100 for n in numeros]
+        sorteios = [
+            sorted(numeros[i * qtd : (i + 1) * qtd]) for i in range(por_concurso)
+        ]
+        erro = None
+        if concurso <= 0:
+            erro = f"concurso inválido: {concurso}"
+        elif any(not 1 <= n <= max_numero for n in numeros):
+            erro = f"concurso {concurso}: número fora de 1..{max_numero}"
+        elif any(len(set(s)) != qtd for s in sorteios):
+            erro = f"concurso {concurso}: número repetido"
+        yield (concurso, [], erro) if erro else (concurso, sorteios, None)
+
+
+def ler_historico(
+    arquivo: BinaryIO, tipo: str, formato: str = "csv"
+) -> Tuple[List[int], List[List[int]]]:
+    """
+    Ler todos os sorteios válidos de um arquivo de resultados (ex.: enviado
+    pelo usuário, sem gravar histórico).
+
+    Args:
+        arquivo: Arquivo binário aberto.
+        tipo: Tipo de loteria.
+        formato: "csv", "xlsx" ou "html" (ver formato_arquivo).
+
+    Returns:
+        Tupla (concursos, sorteios), um item por sorteio.
+
+    Raises:
+        ValueError: Se o tipo de loteria ou o formato não forem reconhecidos.
+        ImportError: Se o formato exigir um pacote não instalado.
+    """
+    if formato not in LEITORES:
+        raise ValueError(f"Formato de arquivo não suportado: {formato}")
+    concursos: List[int] = []
+    sorteios: List[List[int]] = []
+    for concurso, do_concurso, erro in extrair_sorteios(
+        LEITORES[formato](arquivo), tipo
+    ):
+        for sorteio in do_concurso:
+            concursos.append(concurso)
+            sorteios.append(sorteio)
+    return concursos, sorteios
+
+
+def impressao_digital(caminho: str) -> str:
+    """Hash do conteúdo de um arquivo (lido em blocos)."""
+    resumo = hashlib.blake2b(digest_size=16)
+    with open(caminho, "rb") as f:
+        for bloco in iter(lambda: f.read(1 << 20), b""):
+            resumo.update(bloco)
+    return resumo.hexdigest()
+
+
+def carregar_historico(caminho: str) -> Tuple[List[int], List[List[int]]]:
+    """
+    Ler um histórico gravado por importar.
+
+    Args:
+        caminho: Arquivo .lotobin do histórico.
+
+    Returns:
+        Tupla (concursos, sorteios), em ordem de concurso.
+
+    Raises:
+        ValueError: Se o arquivo não for um histórico .lotobin válido.
+    """
+    with LeitorBilhetes(caminho) as leitor:
+        if "concurso" not in leitor.colunas:
+            raise ValueError(f"Arquivo .lotobin sem coluna de concurso: {caminho}")
+        coluna = leitor.coluna("concurso")
+        concursos = list(coluna)
+        coluna.release()
+        sorteios = list(leitor)
+    return concursos, sorteios
+
+
+def importar(
+    origem: str, destino: str, tipo: str, formato: Optional[str] = None
+) -> ResultadoImportacao:
+    """
+    Importar um arquivo de resultados para o histórico .lotobin.
+
+    Só os concursos posteriores ao último já importado são acrescentados,
+    no fim do histórico existente (os sorteios já gravados não são
+    regravados; ver bilhetes.acrescentar_bilhetes). O hash do arquivo de origem fica no cabeçalho do histórico: reimportar
+    o mesmo arquivo (mesmo tamanho e data de modificação, ou mesmo
+    conteúdo) não lê nem grava nada.
+
+    Args:
+        origem: Arquivo de resultados (CSV, XLSX ou HTML).
+        destino: Histórico .lotobin (criado se não existir).
+        tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+        formato: Formato da origem (padrão: pela extensão).
+
+    Returns:
+        ResultadoImportacao.
+
+    Raises:
+        ValueError: Se a loteria ou o formato não forem reconhecidos, ou se
+            o histórico existente for de outra loteria.
+        ImportError: Se o formato exigir um pacote não instalado.
+    """
+    inicio = time.perf_counter()
+    if tipo not in LOTTERY_CONFIG:
+        raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+    formato = formato or formato_arquivo(origem)
+    if formato not in LEITORES:
+        raise ValueError(f"Formato de arquivo não suportado: {formato}")
+
+    metadados: dict = {}
+    total = 0
+    if os.path.exists(destino):
+        with LeitorBilhetes(destino) as leitor:
+            if leitor.loteria != tipo:
+                raise ValueError(
+                    f"Histórico {destino} é de {leitor.loteria}, não de {tipo}"
+                )
+            metadados, total = leitor.metadados, len(leitor)
+    ultimo = metadados.get("ultimo_concurso", 0)
+
+    def resultado(**campos) -> ResultadoImportacao:
+        valores = dict(
+            loteria=tipo,
+            lidos=0,
+            novos=0,
+            rejeitados=0,
+            total=total,
+            ultimo_concurso=ultimo,
+            inalterado=False,
+        )
+        valores.update(campos)
+        return ResultadoImportacao(duracao_s=time.perf_counter() - inicio, **valores)
+
+    estado = os.stat(origem)
+    anterior = metadados.get("origem", {})
+    if (anterior.get("tamanho"), anterior.get("modificado_ns")) == (
+        estado.st_size,
+        estado.st_mtime_ns,
+    ):
+        return resultado(inalterado=True)
+    digital = impressao_digital(origem)
+    if anterior.get("hash") == digital:
+        return resultado(inalterado=True)
+
+    lidos = rejeitados = 0
+    erros: List[str] = []
+    novos = {}
+    with open(origem, "rb") as f:
+        for concurso, sorteios, erro in extrair_sorteios(LEITORES[formato](f), tipo):
+            if erro is not None:
+                rejeitados += 1
+                if len(erros) < MAX_ERROS:
+                    erros.append(erro)
+                continue
+            lidos += len(sorteios)
+            if concurso > ultimo:
+                novos[concurso] = sorteios
+
+    acrescentados = [
+        (concurso, sorteio) for concurso in sorted(novos) for sorteio in novos[concurso]
+    ]
+    metadados = {
+        "ultimo_concurso": max([ultimo, *novos]),
+        "origem": {
+            "arquivo": os.path.basename(origem),
+            "tamanho": estado.st_size,
+            "modificado_ns": estado.st_mtime_ns,
+            "hash": digital,
+        },
+    }
+    # Histórico existente: só os sorteios novos são gravados, depois dos atuais
+    quantidade = None
+    if os.path.exists(destino):
+        quantidade = acrescentar_bilhetes(
+            destino,
+            ((sorteio, concurso) for concurso, sorteio in acrescentados),
+            metadados,
+        )
+    if quantidade is None:
+        # Histórico novo, ou cabeçalho sem folga: regravar (escrita atômica)
+        anteriores: List[Tuple[int, List[int]]] = []
+        if os.path.exists(destino):
+            concursos, sorteios = carregar_historico(destino)
+            anteriores = list(zip(concursos, sorteios))
+        temporario = f"{destino}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temporario, "wb") as f, EscritorBilhetes(
+                f,
+                tipo,
+                colunas=["concurso"],
+                metadados=metadados,
+                reserva_cabecalho=RESERVA_CABECALHO,
+            ) as escritor:
+                for concurso, sorteio in chain(anteriores, acrescentados):
+                    escritor.adicionar(sorteio, concurso)
+            os.replace(temporario, destino)
+        finally:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+        quantidade = escritor.quantidade
+
+    return resultado(
+        lidos=lidos,
+        novos=len(acrescentados),
+        rejeitados=rejeitados,
+        total=quantidade,
+        ultimo_concurso=metadados["ultimo_concurso"],
+        erros=erros,
+    )
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) != 3:
+        print("Uso: python -m importador <loteria> <arquivo> <historico.lotobin>")
+        return 2
+    tipo, origem, destino = argv
+    try:
+        r = importar(origem, destino, tipo)
+    except (ValueError, ImportError, OSError) as e:
+        print(f"ERRO: {e}")
+        return 1
+    if r.inalterado:
+        print(
+            f"{origem} já importado ({r.total} sorteios, {r.duracao_s * 1000:.1f} ms)"
+        )
+    else:
+        print(
+            f"{r.lidos} sorteios lidos, {r.novos} novos, {r.rejeitados} recusados; "
+            f"histórico com {r.total} sorteios até o concurso {r.ultimo_concurso} "
+            f"({r.duracao_s * 1000:.1f} ms)"
+        )
+    for erro in r.erros:
+        print(f"  {erro}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
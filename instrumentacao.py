@@ -0,0 +1,249 @@
+"""
+Instrumentação opcional: spans de tempo, perfil cProfile e traces em JSON.
+
+Compare dois traces com: python -m instrumentacao trace_a.json trace_b.json
+"""
+
+import cProfile
+import json
+import os
+import platform
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+VERSAO_TRACE = 1
+
+# Um perfil cProfile por processo: sessões do Streamlit rodam em threads do
+# mesmo processo e, a partir do Python 3.12, um segundo Profile().enable()
+# falha com "Another profiling tool is already active"
+_PERFIL_LOCK = threading.Lock()
+
+
+class Tracer:
+    """Coletor de spans de tempo (no-op quando inativo)."""
+
+    def __init__(self, ativo: bool = False, perfil: bool = False):
+        """
+        Inicializar o coletor.
+
+        Args:
+            ativo: Se False, span() não mede nada (custo desprezível).
+            perfil: Capturar também um perfil cProfile enquanto ativo. Se outra
+                sessão do processo já estiver capturando, o perfil é pulado e
+                perfil_ocupado fica True.
+        """
+        self.ativo = ativo
+        self.spans: List[dict] = []
+        self.contexto: Dict[str, object] = {}
+        self._inicio = time.perf_counter()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._perfil: Optional[cProfile.Profile] = None
+        self._perfil_ligado = False
+        self.perfil_ocupado = False
+        if ativo and perfil:
+            if _PERFIL_LOCK.acquire(blocking=False):
+                try:
+                    self._perfil = cProfile.Profile()
+                    self._perfil.enable()
+                except BaseException:
+                    _PERFIL_LOCK.release()
+                    raise
+                self._perfil_ligado = True
+            else:
+                self.perfil_ocupado = True
+
+    @contextmanager
+    def span(self, nome: str, **atributos) -> Iterator[None]:
+        """
+        Medir o tempo de um trecho de código.
+
+        Args:
+            nome: Nome do span (ex.: "core.gerar_jogos").
+            **atributos: Dados extras gravados no span (ex.: quantidade).
+        """
+        if not self.ativo:
+            yield
+            return
+
+        pilha = getattr(self._local, "pilha", None)
+        if pilha is None:
+            pilha = self._local.pilha = []
+        pai = pilha[-1] if pilha else None
+        pilha.append(nome)
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            fim = time.perf_counter()
+            pilha.pop()
+            self._adicionar(nome, inicio, fim, pai, atributos)
+
+    def registrar(self, nome: str, duracao_s: float, **atributos) -> None:
+        """
+        Registrar um span medido fora do coletor (ex.: em outra thread).
+
+        Args:
+            nome: Nome do span.
+            duracao_s: Duração em segundos.
+            **atributos: Dados extras gravados no span.
+        """
+        if self.ativo:
+            agora = time.perf_counter()
+            self._adicionar(nome, agora - duracao_s, agora, None, atributos)
+
+    def _adicionar(
+        self, nome: str, inicio: float, fim: float, pai: Optional[str], atributos: dict
+    ) -> None:
+        span = {
+            "nome": nome,
+            "inicio_ms": round((inicio - self._inicio) * 1000, 3),
+            "duracao_ms": round((fim - inicio) * 1000, 3),
+            "pai": pai,
+        }
+        if atributos:
+            span["atributos"] = atributos
+        with self._lock:
+            self.spans.append(span)
+
+    def totais(self) -> Dict[str, dict]:
+        """
+        Agregar os spans por nome.
+
+        Returns:
+            Dicionário nome -> {"chamadas", "total_ms", "max_ms"}.
+        """
+        totais: Dict[str, dict] = {}
+        for span in self.spans:
+            t = totais.setdefault(
+                span["nome"], {"chamadas": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            t["chamadas"] += 1
+            t["total_ms"] = round(t["total_ms"] + span["duracao_ms"], 3)
+            t["max_ms"] = max(t["max_ms"], span["duracao_ms"])
+        return totais
+
+    def parar_perfil(self) -> None:
+        """Encerrar a captura do cProfile (se ativa) e liberar o perfil do processo."""
+        if self._perfil_ligado:
+            self._perfil.disable()
+            self._perfil_ligado = False
+            _PERFIL_LOCK.release()
+
+    def resumo_perfil(self, limite: int = 25) -> List[dict]:
+        """
+        Funções com maior tempo acumulado no perfil cProfile.
+
+        Args:
+            limite: Quantidade de funções retornadas.
+
+        Returns:
+            Lista de dicionários (funcao, chamadas, proprio_ms, acumulado_ms).
+        """
+        if self._perfil is None:
+            return []
+        self.parar_perfil()
+        stats = pstats.Stats(self._perfil)
+        linhas = []
+        for (arquivo, linha, funcao), (_, chamadas, proprio, acumulado, _) in sorted(
+            stats.stats.items(), key=lambda item: item[1][3], reverse=True
+        )[:limite]:
+            linhas.append(
+                {
+                    "funcao": f"{os.path.basename(arquivo)}:{linha}({funcao})",
+                    "chamadas": chamadas,
+                    "proprio_ms": round(proprio * 1000, 3),
+                    "acumulado_ms": round(acumulado * 1000, 3),
+                }
+            )
+        return linhas
+
+    def to_dict(self) -> dict:
+        """Converter o trace para dicionário serializável em JSON."""
+        return {
+            "versao": VERSAO_TRACE,
+            "criado_em": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "contexto": self.contexto,
+            "spans": self.spans,
+            "totais": self.totais(),
+            "perfil": self.resumo_perfil(),
+        }
+
+    def salvar(self, diretorio: Optional[str] = None) -> str:
+        """
+        Gravar o trace em JSON.
+
+        Args:
+            diretorio: Diretório de destino (padrão: LOTOPRO_TRACE_DIR ou
+                "traces").
+
+        Returns:
+            Caminho do arquivo gravado.
+        """
+        diretorio = diretorio or os.environ.get("LOTOPRO_TRACE_DIR", "traces")
+        os.makedirs(diretorio, exist_ok=True)
+        nome = f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.json"
+        caminho = os.path.join(diretorio, nome)
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return caminho
+
+
+def comparar_traces(base: dict, novo: dict) -> List[dict]:
+    """
+    Comparar os totais de dois traces (ex.: entre versões).
+
+    Args:
+        base: Trace de referência (dicionário lido do JSON).
+        novo: Trace comparado.
+
+    Returns:
+        Lista por span com total_ms de cada trace e a variação percentual.
+    """
+    linhas = []
+    totais_base, totais_novo = base["totais"], novo["totais"]
+    for nome in sorted(set(totais_base) | set(totais_novo)):
+        antes = totais_base.get(nome, {}).get("total_ms")
+        depois = totais_novo.get(nome, {}).get("total_ms")
+        variacao = None
+        if antes and depois is not None:
+            variacao = round((depois - antes) / antes * 100, 1)
+        linhas.append(
+            {
+                "span": nome,
+                "base_ms": antes,
+                "novo_ms": depois,
+                "variacao_pct": variacao,
+            }
+        )
+    return linhas
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) != 2:
+        print("Uso: python -m instrumentacao trace_base.json trace_novo.json")
+        return 2
+    with open(argv[0], encoding="utf-8") as f:
+        base = json.load(f)
+    with open(argv[1], encoding="utf-8") as f:
+        novo = json.load(f)
+    print(f"{'span':40} {'base (ms)':>12} {'novo (ms)':>12} {'variação':>10}")
+    for linha in comparar_traces(base, novo):
+        variacao = linha["variacao_pct"]
+        print(
+            f"{linha['span']:40} {linha['base_ms'] or '-':>12} "
+            f"{linha['novo_ms'] or '-':>12} "
+            f"{'-' if variacao is None else f'{variacao:+.1f}%':>10}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,183 @@
+"""
+Estatísticas dos últimos N sorteios (janelas deslizantes) com atualização
+incremental a cada sorteio novo.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+TAMANHOS_PADRAO = (10, 50, 100, 500)
+
+
+@dataclass
+class ResumoJanela:
+    """Estatísticas de uma janela em um instante."""
+
+    tamanho: int
+    sorteios: int  # menor que tamanho enquanto o histórico não enche a janela
+    frequencias: List[int]  # índice = número (posição 0 não é usada)
+    media_soma: float
+    media_pares: float
+
+    def to_dict(self) -> dict:
+        """Converter para dicionário (compatível com pandas.DataFrame)."""
+        return {
+            "janela": self.tamanho,
+            "sorteios": self.sorteios,
+            "media_soma": self.media_soma,
+            "media_pares": self.media_pares,
+        }
+
+
+class JanelasHistorico:
+    """
+    Frequência, soma e paridade sobre os últimos N sorteios, para vários N.
+
+    Os sorteios ficam em um buffer circular do tamanho da maior janela, e
+    cada janela mantém contadores acumulados. Um sorteio novo entra em todas
+    as janelas e o sorteio que acaba de sair de cada uma (o N-ésimo mais
+    recente, lido direto do buffer) é descontado: O(números por sorteio) por
+    janela, sem varrer o histórico.
+    """
+
+    def __init__(self, max_numero: int, tamanhos: Sequence[int] = TAMANHOS_PADRAO):
+        """
+        Criar as janelas vazias.
+
+        Args:
+            max_numero: Maior número do volante.
+            tamanhos: Tamanhos das janelas (quantidade de sorteios).
+
+        Raises:
+            ValueError: Se não houver tamanhos ou algum não for positivo.
+        """
+        if not tamanhos or min(tamanhos) <= 0:
+            raise ValueError(f"Tamanhos de janela devem ser positivos: {tamanhos}")
+        self.max_numero = max_numero
+        self.tamanhos = tuple(sorted(set(tamanhos)))
+        self._capacidade = self.tamanhos[-1]
+        self._anel: List[Optional[Tuple[List[int], int, int]]] = [
+            None
+        ] * self._capacidade
+        self._proximo = 0
+        self.total = 0
+        self._frequencias: Dict[int, List[int]] = {
+            n: [0] * (max_numero + 1) for n in self.tamanhos
+        }
+        self._somas = dict.fromkeys(self.tamanhos, 0)
+        self._pares = dict.fromkeys(self.tamanhos, 0)
+
+    def __len__(self) -> int:
+        return min(self.total, self._capacidade)
+
+    def adicionar(self, numeros: List[int]) -> None:
+        """
+        Registrar o sorteio mais recente em todas as janelas.
+
+        Args:
+            numeros: Números sorteados.
+
+        Raises:
+            ValueError: Se algum número estiver fora do volante.
+        """
+        if any(not 1 <= n <= self.max_numero for n in numeros):
+            raise ValueError(f"Número fora de 1..{self.max_numero}: {numeros}")
+        sorteio = (list(numeros), sum(numeros), sum(1 for n in numeros if n % 2 == 0))
+        for tamanho in self.tamanhos:
+            frequencias = self._frequencias[tamanho]
+            if self.total >= tamanho:
+                saindo, soma, pares = self._anel[
+                    (self._proximo - tamanho) % self._capacidade
+                ]
+                for n in saindo:
+                    frequencias[n] -= 1
+                self._somas[tamanho] -= soma
+                self._pares[tamanho] -= pares
+            for n in sorteio[0]:
+                frequencias[n] += 1
+            self._somas[tamanho] += sorteio[1]
+            self._pares[tamanho] += sorteio[2]
+        self._anel[self._proximo] = sorteio
+        self._proximo = (self._proximo + 1) % self._capacidade
+        self.total += 1
+
+    def adicionar_varios(self, sorteios: Iterable[List[int]]) -> None:
+        """
+        Registrar vários sorteios, do mais antigo para o mais recente.
+
+        Args:
+            sorteios: Números de cada sorteio, em ordem cronológica.
+        """
+        for numeros in sorteios:
+            self.adicionar(numeros)
+
+    def _verificar(self, tamanho: int) -> None:
+        if tamanho not in self._frequencias:
+            raise ValueError(f"Janela não configurada: {tamanho} ({self.tamanhos})")
+
+    def frequencias(self, tamanho: int) -> List[int]:
+        """
+        Quantas vezes cada número saiu nos últimos `tamanho` sorteios.
+
+        Args:
+            tamanho: Tamanho da janela.
+
+        Returns:
+            Lista indexada pelo número (posição 0 não é usada).
+
+        Raises:
+            ValueError: Se a janela não estiver configurada.
+        """
+        self._verificar(tamanho)
+        return list(self._frequencias[tamanho])
+
+    def pesos(self, tamanho: int, suavizacao: float = 1.0) -> List[float]:
+        """
+        Pesos por número para geração ponderada pela janela.
+
+        A suavização (pseudo-contagem somada a todos os números) garante
+        peso positivo para quem não saiu na janela.
+
+        Args:
+            tamanho: Tamanho da janela.
+            suavizacao: Pseudo-contagem somada a cada número.
+
+        Returns:
+            Lista indexada pelo número (posição 0 com peso 0).
+
+        Raises:
+            ValueError: Se a janela não estiver configurada ou a suavização
+                não for positiva.
+        """
+        if suavizacao <= 0:
+            raise ValueError(f"suavizacao deve ser positiva: {suavizacao}")
+        self._verificar(tamanho)
+        frequencias = self._frequencias[tamanho]
+        return [0.0] + [f + suavizacao for f in frequencias[1:]]
+
+    def resumo(self, tamanho: int) -> ResumoJanela:
+        """
+        Estatísticas atuais de uma janela.
+
+        Args:
+            tamanho: Tamanho da janela.
+
+        Returns:
+            ResumoJanela com frequências e médias de soma e pares.
+
+        Raises:
+            ValueError: Se a janela não estiver configurada.
+        """
+        self._verificar(tamanho)
+        sorteios = min(self.total, tamanho)
+        return ResumoJanela(
+            tamanho=tamanho,
+            sorteios=sorteios,
+            frequencias=list(self._frequencias[tamanho]),
+            media_soma=self._somas[tamanho] / sorteios if sorteios else 0.0,
+            media_pares=self._pares[tamanho] / sorteios if sorteios else 0.0,
+        )
+
+    def resumos(self) -> List[ResumoJanela]:
+        """Resumo de todas as janelas, da menor para a maior."""
+        return [self.resumo(tamanho) for tamanho in self.tamanhos]
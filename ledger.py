@@ -0,0 +1,312 @@
+"""
+Registro persistente (SQLite) dos palpites gerados.
+"""
+
+import sqlite3
+import threading
+import time
+from math import comb
+from typing import Iterable, List, Optional
+
+from config import LOTTERY_CONFIG
+from core import (
+    GameResult,
+    codificar_extras,
+    decodificar_extras,
+    desempacotar_numeros,
+    empacotar_numeros,
+    rank_combinacao,
+)
+from estendidos import tamanhos_aposta
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lotes (
+    id INTEGER PRIMARY KEY,
+    loteria TEXT NOT NULL,
+    seed INTEGER,
+    criado_em REAL NOT NULL,
+    quantidade INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS jogos (
+    id INTEGER PRIMARY KEY,
+    lote_id INTEGER NOT NULL REFERENCES lotes(id),
+    mascara BLOB NOT NULL,
+    rank INTEGER NOT NULL,
+    soma INTEGER NOT NULL,
+    pares INTEGER NOT NULL,
+    impares INTEGER NOT NULL,
+    primos INTEGER,
+    fibo INTEGER,
+    extras BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_jogos_lote ON jogos (lote_id);
+CREATE INDEX IF NOT EXISTS idx_jogos_rank ON jogos (rank);
+CREATE INDEX IF NOT EXISTS idx_jogos_stats ON jogos (soma, pares);
+CREATE INDEX IF NOT EXISTS idx_lotes_loteria ON lotes (loteria);
+"""
+
+# Ranks que não cabem no INTEGER de 64 bits do SQLite (Lotomania: C(100, 50)
+# ~ 1e29) são reduzidos módulo um primo de Mersenne. A coluna rank vira uma
+# chave de busca com colisões possíveis, e ja_emitido confirma pela máscara.
+LIMITE_RANK = 2**63
+PRIMO_RANK = 2**61 - 1
+
+# Sorteios extras (time do coração, mês da sorte) ficam na coluna extras como
+# um byte por sorteio com o índice da opção (core.codificar_extras); NULL em
+# loterias sem extras.
+
+# Uma conexão é compartilhada entre as sessões do app (threads): o lock de
+# escrita do SQLite é por conexão, então as operações são serializadas por um
+# lock próprio para que transações de threads diferentes não se misturem.
+
+
+def _tamanho_mascara(loteria: str) -> int:
+    """Quantidade de bytes da máscara de uma loteria (bit 0 não é usado)."""
+    return LOTTERY_CONFIG[loteria]["max_numero"] // 8 + 1
+
+
+def _chave_rank(rank: int) -> int:
+    """Rank como chave INTEGER do SQLite (reduzido se passar de 64 bits)."""
+    return rank if rank < LIMITE_RANK else rank % PRIMO_RANK
+
+
+def _tabela_binomiais(max_numero: int, qtd: int) -> List[List[int]]:
+    """Tabela C(n - 1, i) para calcular o rank sem chamar comb por número."""
+    return [
+        [comb(n - 1, i) if n else 0 for i in range(qtd + 1)]
+        for n in range(max_numero + 1)
+    ]
+
+
+class TicketLedger:
+    """
+    Histórico de palpites em SQLite (modo WAL, inserções em lote).
+
+    Seguro para uso por várias threads: cada operação segura o lock da
+    instância enquanto usa a conexão.
+    """
+
+    def __init__(self, caminho: str = "lotopro_ledger.db", tamanho_lote: int = 5000):
+        """
+        Abrir (ou criar) o banco de registro.
+
+        Args:
+            caminho: Caminho do arquivo SQLite (":memory:" para testes).
+            tamanho_lote: Quantidade de linhas por chamada a executemany.
+        """
+        self.tamanho_lote = tamanho_lote
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(caminho, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self.conn.executescript(SCHEMA)
+        colunas = {row[1] for row in self.conn.execute("PRAGMA table_info(jogos)")}
+        if "extras" not in colunas:
+            # Bancos criados antes da coluna de extras
+            self.conn.execute("ALTER TABLE jogos ADD COLUMN extras BLOB")
+
+    def close(self) -> None:
+        """Fechar a conexão."""
+        with self._lock:
+            self.conn.close()
+
+    def __enter__(self) -> "TicketLedger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def registrar_lote(
+        self,
+        jogos: Iterable[GameResult],
+        loteria: str,
+        seed: Optional[int] = None,
+        criado_em: Optional[float] = None,
+    ) -> int:
+        """
+        Registrar um lote de jogos em uma única transação.
+
+        Args:
+            jogos: Jogos gerados (qualquer iterável, consumido em blocos).
+            loteria: Tipo de loteria (chave de LOTTERY_CONFIG).
+            seed: Semente usada na geração, se conhecida.
+            criado_em: Timestamp do lote (padrão: agora).
+
+        Returns:
+            Identificador do lote criado.
+
+        Raises:
+            ValueError: Se tipo de loteria não for reconhecido, se um jogo
+                não tiver um tamanho de aposta da loteria ou trouxer extras
+                que não são opções dela (nada é gravado).
+        """
+        if loteria not in LOTTERY_CONFIG:
+            raise ValueError(f"Tipo de loteria desconhecido: {loteria}")
+
+        config = LOTTERY_CONFIG[loteria]
+        tamanho = _tamanho_mascara(loteria)
+        # Apostas estendidas entram com o rank da própria combinação
+        tamanhos = tamanhos_aposta(loteria)
+        binomiais = _tabela_binomiais(config["max_numero"], tamanhos[-1])
+        sql = (
+            "INSERT INTO jogos (lote_id, mascara, rank, soma, pares, impares,"
+            " primos, fibo, extras) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        )
+
+        with self._lock, self.conn:
+            cur = self.conn.execute(
+                "INSERT INTO lotes (loteria, seed, criado_em, quantidade)"
+                " VALUES (?, ?, ?, 0)",
+                (loteria, seed, time.time() if criado_em is None else criado_em),
+            )
+            lote_id = cur.lastrowid
+
+            total = 0
+            bloco = []
+            for jogo in jogos:
+                if len(jogo.numeros) not in tamanhos:
+                    raise ValueError(
+                        f"Jogo de {len(jogo.numeros)} números fora dos tamanhos "
+                        f"de aposta da {loteria} ({tamanhos[0]} a {tamanhos[-1]})"
+                    )
+                mascara = 0
+                rank = 0
+                for i, n in enumerate(jogo.numeros, 1):
+                    mascara |= 1 << n
+                    rank += binomiais[n][i]
+                bloco.append(
+                    (
+                        lote_id,
+                        mascara.to_bytes(tamanho, "little"),
+                        _chave_rank(rank),
+                        jogo.soma,
+                        jogo.pares,
+                        jogo.impares,
+                        jogo.primos,
+                        jogo.fibo,
+                        (
+                            None
+                            if jogo.extras is None
+                            else bytes(codificar_extras(config, jogo.extras))
+                        ),
+                    )
+                )
+                if len(bloco) >= self.tamanho_lote:
+                    self.conn.executemany(sql, bloco)
+                    total += len(bloco)
+                    bloco = []
+            if bloco:
+                self.conn.executemany(sql, bloco)
+                total += len(bloco)
+
+            self.conn.execute(
+                "UPDATE lotes SET quantidade = ? WHERE id = ?", (total, lote_id)
+            )
+        return lote_id
+
+    def ja_emitido(self, loteria: str, numeros: List[int]) -> bool:
+        """
+        Verificar se uma combinação já foi registrada para a loteria.
+
+        Args:
+            loteria: Tipo de loteria.
+            numeros: Números da combinação.
+
+        Returns:
+            True se a combinação já consta no registro (False para uma
+            loteria desconhecida).
+        """
+        if loteria not in LOTTERY_CONFIG:
+            return False
+        numeros = sorted(numeros)
+        mascara = empacotar_numeros(numeros).to_bytes(
+            _tamanho_mascara(loteria), "little"
+        )
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM jogos JOIN lotes ON lotes.id = jogos.lote_id"
+                " WHERE jogos.rank = ? AND jogos.mascara = ? AND lotes.loteria = ?"
+                " LIMIT 1",
+                (_chave_rank(rank_combinacao(numeros)), mascara, loteria),
+            ).fetchone()
+        return row is not None
+
+    def jogos_do_lote(self, lote_id: int) -> List[GameResult]:
+        """
+        Recuperar todos os jogos de um lote, na ordem de inserção.
+
+        Args:
+            lote_id: Identificador retornado por registrar_lote.
+
+        Returns:
+            Lista de GameResult do lote (vazia se o lote não existir).
+        """
+        with self._lock:
+            lote = self.conn.execute(
+                "SELECT loteria FROM lotes WHERE id = ?", (lote_id,)
+            ).fetchone()
+            if lote is None:
+                return []
+            rows = self.conn.execute(
+                "SELECT mascara, soma, pares, impares, primos, fibo, extras FROM jogos"
+                " WHERE lote_id = ? ORDER BY id",
+                (lote_id,),
+            ).fetchall()
+
+        loteria = lote[0]
+        tipo = loteria.lower().replace("-", "_")
+        config = LOTTERY_CONFIG[loteria]
+        return [
+            GameResult(
+                numeros=desempacotar_numeros(int.from_bytes(mascara, "little")),
+                soma=soma,
+                pares=pares,
+                impares=impares,
+                tipo=tipo,
+                primos=primos,
+                fibo=fibo,
+                extras=None if extras is None else decodificar_extras(config, extras),
+            )
+            for mascara, soma, pares, impares, primos, fibo, extras in rows
+        ]
+
+    def lotes(self, loteria: Optional[str] = None) -> List[dict]:
+        """
+        Listar os lotes registrados (mais recentes primeiro).
+
+        Args:
+            loteria: Filtrar por tipo de loteria (opcional).
+
+        Returns:
+            Lista de dicionários com id, loteria, seed, criado_em e quantidade.
+        """
+        sql = "SELECT id, loteria, seed, criado_em, quantidade FROM lotes"
+        params: tuple = ()
+        if loteria is not None:
+            sql += " WHERE loteria = ?"
+            params = (loteria,)
+        sql += " ORDER BY id DESC"
+        colunas = ("id", "loteria", "seed", "criado_em", "quantidade")
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [dict(zip(colunas, row)) for row in rows]
+
+    def contar(self, loteria: Optional[str] = None) -> int:
+        """
+        Contar jogos registrados.
+
+        Args:
+            loteria: Filtrar por tipo de loteria (opcional).
+
+        Returns:
+            Quantidade de jogos.
+        """
+        with self._lock:
+            if loteria is None:
+                return self.conn.execute("SELECT COUNT(*) FROM jogos").fetchone()[0]
+            return self.conn.execute(
+                "SELECT COALESCE(SUM(quantidade), 0) FROM lotes WHERE loteria = ?",
+                (loteria,),
+            ).fetchone()[0]
@@ -0,0 +1,325 @@
+"""
+Padrões de posição dos jogos: dezenas, linhas, colunas e quadrantes do
+volante, finais repetidos, maior intervalo e maior sequência.
+
+Cada padrão é medido sobre a máscara de bits do jogo (bit n ligado =
+número n marcado) com máscaras de grupo pré-calculadas por volante: uma
+contagem de bits por grupo, sem percorrer os números. Os padrões servem
+como restrições opcionais em LOTTERY_CONFIG (chaves range_<padrão>) e
+como colunas de análise no app e nas exportações.
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import LOTTERY_CONFIG
+from precomputo import cache_padrao
+
+# Nome do padrão -> descrição (ordem das colunas nas análises)
+PADROES = {
+    "max_dezena": "Máx. por dezena",
+    "max_linha": "Máx. por linha",
+    "max_coluna": "Máx. por coluna",
+    "max_quadrante": "Máx. por quadrante",
+    "finais_iguais": "Finais iguais",
+    "maior_intervalo": "Maior intervalo",
+    "maior_sequencia": "Maior sequência",
+}
+
+# Padrão -> chave da restrição em LOTTERY_CONFIG
+CHAVES = {padrao: f"range_{padrao}" for padrao in PADROES}
+
+
+def colunas_por_linha(max_numero: int) -> int:
+    """Números por linha no volante (5 na Lotofácil, 10 nas demais)."""
+    return 5 if max_numero <= 25 else 10
+
+
+def grupos_volante(max_numero: int) -> Dict[str, List[int]]:
+    """
+    Máscaras de bits dos grupos de números de um volante 1..max_numero.
+
+    Dezenas e finais seguem o algarismo (01-09, 10-19, ...; o 100 da
+    Lotomania é o "00"); linhas e colunas seguem a grade do volante
+    (colunas_por_linha) e os quadrantes dividem a grade ao meio nos dois
+    sentidos.
+
+    Args:
+        max_numero: Maior número do volante.
+
+    Returns:
+        Dicionário com as listas "dezena", "linha", "coluna", "quadrante"
+        e "final" (uma máscara por grupo, sem grupos vazios).
+    """
+    n = max_numero
+
+    def construir() -> Dict[str, List[int]]:
+        colunas = colunas_por_linha(n)
+        linhas = (n + colunas - 1) // colunas
+        indices: Dict[str, Callable[[int], int]] = {
+            "dezena": lambda x: x % 100 // 10,
+            "linha": lambda x: (x - 1) // colunas,
+            "coluna": lambda x: (x - 1) % colunas,
+            "quadrante": lambda x: 2 * ((x - 1) // colunas >= (linhas + 1) // 2)
+            + ((x - 1) % colunas >= colunas // 2),
+            "final": lambda x: x % 10,
+        }
+        grupos = {}
+        for nome, indice in indices.items():
+            mascaras: Dict[int, int] = {}
+            for x in range(1, n + 1):
+                mascaras[indice(x)] = mascaras.get(indice(x), 0) | 1 << x
+            grupos[nome] = [mascaras[i] for i in sorted(mascaras)]
+        return grupos
+
+    # Montar custa menos que ler do disco: só memória
+    return cache_padrao().obter(f"padroes:{n}", construir, persistir=False)
+
+
+def maior_corrida(mascara: int) -> int:
+    """
+    Tamanho da maior corrida de bits ligados consecutivos.
+
+    Dobra o deslocamento enquanto houver corrida (m & m >> k deixa ligados
+    os inícios de corridas de tamanho 2k) e refina por busca binária:
+    O(log corrida) operações sobre o inteiro, não uma por bit.
+
+    Args:
+        mascara: Máscara de bits.
+
+    Returns:
+        Comprimento da maior corrida (0 se a máscara for vazia).
+    """
+    if not mascara:
+        return 0
+    atual, tamanho = mascara, 1
+    while True:
+        proxima = atual & (atual >> tamanho)
+        if not proxima:
+            break
+        atual, tamanho = proxima, 2 * tamanho
+    passo = tamanho // 2
+    while passo:
+        proxima = atual & (atual >> passo)
+        if proxima:
+            atual, tamanho = proxima, tamanho + passo
+        passo //= 2
+    return tamanho
+
+
+def maior_intervalo(mascara: int) -> int:
+    """
+    Maior diferença entre dois números consecutivos do jogo.
+
+    Args:
+        mascara: Máscara de bits do jogo.
+
+    Returns:
+        Maior diferença (0 se o jogo tiver menos de dois números).
+    """
+    menor = (mascara & -mascara).bit_length() - 1
+    maior = mascara.bit_length() - 1
+    if maior <= menor:
+        return 0
+    # Bits desligados entre o menor e o maior número marcados
+    vazios = ~mascara & ((1 << maior) - (1 << menor))
+    return maior_corrida(vazios) + 1
+
+
+class CalculadoraPadroes:
+    """Medição dos padrões de posição para um volante."""
+
+    def __init__(self, max_numero: int):
+        """
+        Montar as máscaras de grupo do volante.
+
+        Args:
+            max_numero: Maior número do volante.
+        """
+        self.max_numero = max_numero
+        grupos = grupos_volante(max_numero)
+        self.dezenas = grupos["dezena"]
+        self.linhas = grupos["linha"]
+        self.colunas = grupos["coluna"]
+        self.quadrantes = grupos["quadrante"]
+        self.finais = grupos["final"]
+        maximo = self._maximo
+        self._medidores: Dict[str, Callable[[int], int]] = {
+            "max_dezena": lambda m: maximo(m, self.dezenas),
+            "max_linha": lambda m: maximo(m, self.linhas),
+            "max_coluna": lambda m: maximo(m, self.colunas),
+            "max_quadrante": lambda m: maximo(m, self.quadrantes),
+            "finais_iguais": lambda m: maximo(m, self.finais),
+            "maior_intervalo": maior_intervalo,
+            "maior_sequencia": maior_corrida,
+        }
+
+    @staticmethod
+    def _maximo(mascara: int, grupos: List[int]) -> int:
+        """Maior quantidade de números marcados em um mesmo grupo."""
+        return max([(mascara & g).bit_count() for g in grupos])
+
+    def medidor(self, padrao: str) -> Callable[[int], int]:
+        """
+        Função que mede um padrão na máscara de bits de um jogo.
+
+        Args:
+            padrao: Chave de PADROES.
+
+        Returns:
+            Função máscara -> valor do padrão.
+
+        Raises:
+            ValueError: Se o padrão não existir.
+        """
+        if padrao not in self._medidores:
+            raise ValueError(f"Padrão desconhecido: {padrao}")
+        return self._medidores[padrao]
+
+    def medir(self, mascara: int) -> Dict[str, int]:
+        """
+        Medir todos os padrões de um jogo.
+
+        Args:
+            mascara: Máscara de bits do jogo.
+
+        Returns:
+            Dicionário padrão -> valor, na ordem de PADROES.
+        """
+        return {padrao: medir(mascara) for padrao, medir in self._medidores.items()}
+
+    def medir_lote(self, mascaras: Iterable[int]) -> Dict[str, List[int]]:
+        """
+        Medir todos os padrões de um lote de jogos, em colunas.
+
+        Os máximos por grupo são calculados grupo a grupo sobre o lote
+        inteiro (uma contagem de bits por jogo e grupo, máximo elemento a
+        elemento entre as colunas), sem chamada de função por jogo.
+
+        Args:
+            mascaras: Máscaras de bits dos jogos.
+
+        Returns:
+            Dicionário padrão -> lista de valores (um por jogo).
+        """
+        mascaras = list(mascaras)
+        grupos = {
+            "max_dezena": self.dezenas,
+            "max_linha": self.linhas,
+            "max_coluna": self.colunas,
+            "max_quadrante": self.quadrantes,
+            "finais_iguais": self.finais,
+        }
+        colunas = {}
+        for padrao, medir in self._medidores.items():
+            if padrao in grupos:
+                contagens = [
+                    [(m & g).bit_count() for m in mascaras] for g in grupos[padrao]
+                ]
+                colunas[padrao] = list(map(max, zip(*contagens)))
+            else:
+                colunas[padrao] = list(map(medir, mascaras))
+        return colunas
+
+    def distribuicao(self, mascaras: Iterable[int], grupo: str) -> List[int]:
+        """
+        Quantos números do lote caem em cada grupo (ex.: por dezena).
+
+        Args:
+            mascaras: Máscaras de bits dos jogos.
+            grupo: "dezena", "linha", "coluna", "quadrante" ou "final".
+
+        Returns:
+            Contagem por grupo, na ordem de grupos_volante.
+
+        Raises:
+            ValueError: Se o grupo não existir.
+        """
+        grupos = grupos_volante(self.max_numero)
+        if grupo not in grupos:
+            raise ValueError(f"Grupo desconhecido: {grupo}")
+        contagens = [0] * len(grupos[grupo])
+        for mascara in mascaras:
+            for i, g in enumerate(grupos[grupo]):
+                contagens[i] += (mascara & g).bit_count()
+        return contagens
+
+
+@lru_cache(maxsize=None)
+def calculadora(max_numero: int) -> CalculadoraPadroes:
+    """
+    Calculadora de padrões compartilhada de um volante.
+
+    Args:
+        max_numero: Maior número do volante.
+
+    Returns:
+        CalculadoraPadroes (a mesma instância a cada chamada).
+    """
+    return CalculadoraPadroes(max_numero)
+
+
+def faixas_configuradas(config: dict) -> Tuple[Tuple[str, int, int], ...]:
+    """
+    Restrições de padrão presentes na configuração de uma loteria.
+
+    Args:
+        config: Configuração da loteria (entrada de LOTTERY_CONFIG).
+
+    Returns:
+        Tuplas (padrão, mínimo, máximo), vazia se nenhuma estiver configurada.
+    """
+    return tuple(
+        (padrao, *config[chave]) for padrao, chave in CHAVES.items() if chave in config
+    )
+
+
+@lru_cache(maxsize=None)
+def _verificacao(
+    max_numero: int, faixas: Tuple[Tuple[str, int, int], ...]
+) -> Callable[[int], bool]:
+    """Verificação (memoizada) de um conjunto de faixas de padrão."""
+    calc = calculadora(max_numero)
+    checagens = [(calc.medidor(p), minimo, maximo) for p, minimo, maximo in faixas]
+    return lambda m: all(
+        minimo <= medir(m) <= maximo for medir, minimo, maximo in checagens
+    )
+
+
+def verificacao_config(config: dict) -> Optional[Callable[[int], bool]]:
+    """
+    Verificação das restrições de padrão configuradas (range_<padrão>).
+
+    Só os padrões configurados são medidos; sem nenhum, não há custo extra
+    por jogo além de procurar as chaves.
+
+    Args:
+        config: Configuração da loteria (entrada de LOTTERY_CONFIG).
+
+    Returns:
+        Função máscara -> bool, ou None se nenhum padrão estiver configurado.
+    """
+    faixas = faixas_configuradas(config)
+    if not faixas:
+        return None
+    return _verificacao(config["max_numero"], faixas)
+
+
+def colunas_padroes(tipo: str, mascaras: Iterable[int]) -> Dict[str, List[int]]:
+    """
+    Colunas de padrões de um lote, com a descrição de cada padrão como nome.
+
+    Args:
+        tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+        mascaras: Máscaras de bits dos jogos.
+
+    Returns:
+        Dicionário descrição -> lista de valores (um por jogo).
+
+    Raises:
+        ValueError: Se tipo de loteria não for reconhecido.
+    """
+    if tipo not in LOTTERY_CONFIG:
+        raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+    colunas = calculadora(LOTTERY_CONFIG[tipo]["max_numero"]).medir_lote(mascaras)
+    return {PADROES[padrao]: valores for padrao, valores in colunas.items()}
@@ -1,14 +1,150 @@
 """
 Módulo para exportação de resultados em PDF com layout profissional.
+
+A paginação é calculada antes de desenhar (altura fixa por linha de
+cartão), então relatórios grandes podem ser divididos em blocos de páginas
+desenhados em um pool de processos e juntados depois (pypdf, opcional),
+com o mesmo cabeçalho, numeração e resumo do relatório desenhado de uma
+vez. As páginas guardam só intervalos de índices: os jogos podem vir de
+qualquer sequência, inclusive preguiçosa (descritores.JogosDescritor).
 """
 
+import io
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from fpdf import FPDF
 
 from core import GameResult
 
+logger = logging.getLogger(__name__)
+
+# Altura (mm) de uma linha de texto dos cartões e espaço entre cartões
+ALTURA_LINHA = 6
+ESPACO_CARTAO = 2
+# Limite inferior do conteúdo (mm); abaixo dele fica o rodapé da página
+LIMITE_CONTEUDO = 297 - 18
+# Páginas por bloco na renderização paralela
+PAGINAS_POR_BLOCO = 40
+# Abaixo disso o relatório é desenhado em um processo só
+MINIMO_PARALELO = 5000
+
+RODAPE_FINAL = "Gerado por LotoPro AI - Análise Estatística de Loterias"
+
+
+@dataclass
+class Pagina:
+    """Intervalo de jogos de uma página do relatório."""
+
+    numero: int  # numeração global, a partir de 1
+    inicio: int  # índice (base 0) do primeiro jogo da página
+    fim: int  # índice após o último jogo da página
+
+
+@dataclass
+class Paginacao:
+    """Páginas e resumo de um relatório, calculados antes do desenho."""
+
+    paginas: List[Pagina]
+    assinatura_propria: bool  # assinatura final em uma página própria
+    total_jogos: int
+    media_soma: float
+    media_pares: float
+
+    @property
+    def total_paginas(self) -> int:
+        """Páginas do relatório completo."""
+        return len(self.paginas) + self.assinatura_propria
+
+
+class _DocumentoPDF(FPDF):
+    """FPDF com cabeçalho e rodapé em todas as páginas."""
+
+    def __init__(self, lottery_type: str, total_paginas: int, primeira_pagina: int):
+        super().__init__(orientation="P", unit="mm", format="A4")
+        self.lottery_type = lottery_type
+        self.total_paginas = total_paginas
+        self.primeira_pagina = primeira_pagina
+        # Quebras de página vêm da paginação calculada antes
+        self.set_auto_page_break(auto=False)
+
+    @property
+    def pagina_global(self) -> int:
+        """Número da página atual no relatório completo."""
+        return self.primeira_pagina + self.page_no() - 1
+
+    def header(self) -> None:
+        """Cabeçalho curto das páginas seguintes à primeira."""
+        if self.pagina_global == 1:
+            return
+        self.set_font("Helvetica", "", 8)
+        self.set_text_color(150, 150, 150)
+        self.cell(
+            0, 5, f"LotoPro AI - Relatório de Palpites - {self.lottery_type}", ln=True
+        )
+        self.ln(3)
+
+    def footer(self) -> None:
+        """Numeração global da página."""
+        self.set_y(-15)
+        self.set_font("Helvetica", "", 8)
+        self.set_text_color(150, 150, 150)
+        self.cell(
+            0, 5, f"Página {self.pagina_global} de {self.total_paginas}", align="C"
+        )
+
+
+@lru_cache(maxsize=None)
+def _larguras() -> Tuple[Dict[int, float], float, float, float]:
+    """Larguras (mm) de cada número, do separador e do prefixo na fonte dos cartões."""
+    medidor = FPDF()
+    medidor.add_page()
+    medidor.set_font("Helvetica", "", 10)
+    numeros = {n: medidor.get_string_width(f"{n:02d}") for n in range(101)}
+    util = medidor.epw - 2 * medidor.c_margin
+    return (
+        numeros,
+        medidor.get_string_width(" - "),
+        medidor.get_string_width("Números: "),
+        util,
+    )
+
+
+def _linhas_numeros(numeros: Sequence[int]) -> List[str]:
+    """
+    Quebrar "Números: 01 - 02 - ..." em linhas que cabem no cartão (a
+    Lotomania tem 50 números por jogo), sem medir o texto a cada jogo.
+    """
+    largura, separador, prefixo, util = _larguras()
+    linhas: List[str] = []
+    atual: List[str] = []
+    x = prefixo
+    for n in numeros:
+        texto = f"{n:02d}"
+        # O separador fica no fim da linha, como na quebra por palavras
+        if atual and x + separador + largura[n] > util:
+            linhas.append(" - ".join(atual) + " -")
+            atual, x = [], 0.0
+        elif atual:
+            x += separador
+        atual.append(texto)
+        x += largura[n]
+    linhas.append(" - ".join(atual))
+    linhas[0] = "Números: " + linhas[0]
+    return linhas
+
+
+def _altura_cartao(game: GameResult) -> float:
+    """Altura (mm) do cartão de um jogo."""
+    linhas = 2 + len(_linhas_numeros(game.numeros)) + bool(game.extras)
+    return linhas * ALTURA_LINHA + ESPACO_CARTAO
+
 
 class PDFGenerator:
     """Gerador de relatórios em PDF para palpites de loterias."""
@@ -18,64 +154,75 @@ class PDFGenerator:
         Inicializar gerador de PDF.
 
         Args:
-            lottery_type: Tipo de loteria (Mega-Sena, Lotofácil, Quina).
+            lottery_type: Tipo de loteria (chave de LOTTERY_CONFIG).
         """
         self.lottery_type = lottery_type
-        self.pdf = FPDF(orientation="P", unit="mm", format="A4")
-        self.pdf.add_page()
-        self.pdf.set_auto_page_break(auto=True, margin=10)
-        self._setup_fonts()
+        self.gerado_em = datetime.now().strftime("%d/%m/%Y às %H:%M:%S")
 
-    def _setup_fonts(self) -> None:
-        """Configurar fontes padrão."""
-        # Usar fonte padrão do FPDF sem add_font
-        pass
+    def _novo_documento(self, total_paginas: int, primeira_pagina: int) -> FPDF:
+        """Documento com cabeçalho e rodapé numerado."""
+        pdf = _DocumentoPDF(self.lottery_type, total_paginas, primeira_pagina)
+        pdf.add_page()
+        return pdf
 
-    def _add_header(self) -> None:
+    def _add_header(self, pdf: FPDF) -> None:
         """Adicionar cabeçalho do documento."""
-        self.pdf.set_font("Helvetica", "B", 24)
-        self.pdf.set_text_color(0, 200, 83)  # Verde
-        self.pdf.cell(0, 15, "LotoPro AI", ln=True, align="C")
+        pdf.set_font("Helvetica", "B", 24)
+        pdf.set_text_color(0, 200, 83)  # Verde
+        pdf.cell(0, 15, "LotoPro AI", ln=True, align="C")
 
-        self.pdf.set_font("Helvetica", "", 10)
-        self.pdf.set_text_color(100, 100, 100)
-        self.pdf.cell(
+        pdf.set_font("Helvetica", "", 10)
+        pdf.set_text_color(100, 100, 100)
+        pdf.cell(
             0, 5, f"Relatório de Palpites - {self.lottery_type}", ln=True, align="C"
         )
-        self.pdf.cell(
-            0,
-            5,
-            f"Gerado em: {datetime.now().strftime('%d/%m/%Y às %H:%M:%S')}",
-            ln=True,
-            align="C",
-        )
-        self.pdf.ln(5)
+        pdf.cell(0, 5, f"Gerado em: {self.gerado_em}", ln=True, align="C")
+        pdf.ln(5)
 
-    def _add_section_title(self, title: str) -> None:
+    def _add_section_title(self, pdf: FPDF, title: str) -> None:
         """Adicionar título de seção."""
-        self.pdf.set_font("Helvetica", "B", 14)
-        self.pdf.set_text_color(0, 200, 83)
-        self.pdf.cell(0, 8, title, ln=True)
-        self.pdf.ln(2)
+        pdf.set_font("Helvetica", "B", 14)
+        pdf.set_text_color(0, 200, 83)
+        pdf.cell(0, 8, title, ln=True)
+        pdf.ln(2)
 
-    def _add_game_card(self, game: GameResult, index: int) -> None:
+    def _add_summary(self, pdf: FPDF, resumo: Paginacao) -> None:
+        """Adicionar cabeçalho, resumo do relatório e título dos palpites."""
+        self._add_header(pdf)
+        self._add_section_title(pdf, "Resumo Estatistico")
+        pdf.set_font("Helvetica", "", 10)
+        pdf.set_text_color(50, 50, 50)
+        pdf.cell(0, 6, f"Total de Palpites: {resumo.total_jogos}", ln=True)
+
+        if resumo.total_jogos:
+            pdf.cell(0, 6, f"Média de Soma: {resumo.media_soma:.1f}", ln=True)
+            pdf.cell(0, 6, f"Média de Pares: {resumo.media_pares:.1f}", ln=True)
+
+        pdf.ln(5)
+        self._add_section_title(pdf, "Palpites Gerados")
+
+    def _add_game_card(self, pdf: FPDF, game: GameResult, index: int) -> None:
         """
         Adicionar cartão com um jogo ao PDF.
 
         Args:
+            pdf: Documento.
             game: Resultado do jogo.
             index: Número do jogo.
         """
         # Cabeçalho do cartão
-        self.pdf.set_font("Helvetica", "B", 11)
-        self.pdf.set_text_color(0, 200, 83)
-        self.pdf.cell(0, 6, f"JOGO #{index}", ln=True)
+        pdf.set_font("Helvetica", "B", 11)
+        pdf.set_text_color(0, 200, 83)
+        pdf.cell(0, ALTURA_LINHA, f"JOGO #{index}", ln=True)
 
-        # Números
-        self.pdf.set_font("Helvetica", "", 10)
-        self.pdf.set_text_color(50, 50, 50)
-        numeros_str = " - ".join(f"{n:02d}" for n in game.numeros)
-        self.pdf.cell(0, 6, f"Números: {numeros_str}", ln=True)
+        # Números, já quebrados em linhas (ver _linhas_numeros)
+        pdf.set_font("Helvetica", "", 10)
+        pdf.set_text_color(50, 50, 50)
+        for linha in _linhas_numeros(game.numeros):
+            pdf.cell(0, ALTURA_LINHA, linha, ln=True)
+        if game.extras:
+            extras_str = " | ".join(f"{k}: {v}" for k, v in game.extras.items())
+            pdf.cell(0, ALTURA_LINHA, extras_str, ln=True)
 
         # Análise
         analise = f"Soma: {game.soma} | Pares: {game.pares} | Impares: {game.impares}"
@@ -83,53 +230,192 @@ class PDFGenerator:
             analise += f" | Primos: {game.primos}"
         if game.fibo is not None:
             analise += f" | Fibonacci: {game.fibo}"
-        self.pdf.cell(0, 6, analise, ln=True)
-        self.pdf.ln(2)
+        pdf.cell(0, ALTURA_LINHA, analise, ln=True)
+        pdf.ln(ESPACO_CARTAO)
+
+    def _add_final_footer(self, pdf: FPDF) -> None:
+        """Adicionar a assinatura do fim do relatório."""
+        pdf.ln(10)
+        pdf.set_font("Helvetica", "", 8)
+        pdf.set_text_color(150, 150, 150)
+        pdf.cell(0, 5, RODAPE_FINAL, ln=True, align="C")
+
+    def paginar(self, games: Sequence[GameResult]) -> Paginacao:
+        """
+        Distribuir os cartões em páginas sem desenhá-los (uma passada pelos
+        jogos, que também calcula o resumo).
+
+        Args:
+            games: Jogos do relatório.
 
-    def generate_report(self, games: List[GameResult]) -> bytes:
+        Returns:
+            Paginacao com as páginas e o resumo.
+        """
+        total = len(games)
+        # Posição depois do resumo (primeira página) e do cabeçalho curto
+        rascunho = self._novo_documento(2, 1)
+        self._add_summary(rascunho, Paginacao([], False, total, 0.0, 0.0))
+        y = rascunho.get_y()
+        rascunho.add_page()
+        topo = rascunho.get_y()
+
+        paginas = [Pagina(1, 0, 0)]
+        soma = pares = 0
+        for i, game in enumerate(games):
+            altura = _altura_cartao(game)
+            if y + altura > LIMITE_CONTEUDO and paginas[-1].fim > paginas[-1].inicio:
+                paginas.append(Pagina(len(paginas) + 1, i, i))
+                y = topo
+            paginas[-1].fim = i + 1
+            y += altura
+            soma += game.soma
+            pares += game.pares
+        return Paginacao(
+            paginas,
+            y + 15 > LIMITE_CONTEUDO,
+            total,
+            soma / total if total else 0.0,
+            pares / total if total else 0.0,
+        )
+
+    def render_pages(
+        self,
+        paginas: List[Pagina],
+        total_paginas: int,
+        jogos: Sequence[GameResult],
+        resumo: Optional[Paginacao] = None,
+        rodape_final: Optional[bool] = None,
+        progresso: Optional[Callable[[int, int], None]] = None,
+    ) -> bytes:
+        """
+        Desenhar um bloco de páginas consecutivas.
+
+        Args:
+            paginas: Páginas do bloco (de paginar).
+            total_paginas: Páginas do relatório completo (numeração).
+            jogos: Jogos do bloco (jogos[0] é o jogo paginas[0].inicio).
+            resumo: Paginação do relatório, se o bloco começa o relatório
+                (desenha o resumo).
+            rodape_final: Se o bloco termina o relatório: None não desenha
+                a assinatura, False desenha na última página e True em uma
+                página própria.
+            progresso: Callback (cartões concluídos no bloco, total do
+                bloco) a cada 500.
+
+        Returns:
+            Bytes do PDF do bloco.
+        """
+        pdf = self._novo_documento(total_paginas, paginas[0].numero)
+        if resumo is not None:
+            self._add_summary(pdf, resumo)
+        deslocamento = paginas[0].inicio
+        proxima = iter(paginas)
+        pagina = next(proxima)
+        for i, game in enumerate(jogos, deslocamento):
+            while i >= pagina.fim:
+                pagina = next(proxima)
+                pdf.add_page()
+            self._add_game_card(pdf, game, i + 1)
+            if progresso is not None and (i + 1) % 500 == 0:
+                progresso(i + 1 - deslocamento, len(jogos))
+        if rodape_final is not None:
+            if rodape_final:
+                pdf.add_page()
+            self._add_final_footer(pdf)
+        return bytes(pdf.output())
+
+    def generate_report(
+        self,
+        games: Sequence[GameResult],
+        progresso: Optional[Callable[[int, int], None]] = None,
+        workers: Optional[int] = None,
+    ) -> bytes:
         """
         Gerar relatório em PDF.
 
+        Relatórios com MINIMO_PARALELO jogos ou mais são divididos em blocos
+        de PAGINAS_POR_BLOCO páginas desenhados em um pool de processos e
+        juntados com pypdf; sem pypdf (ou com um só worker) o relatório é
+        desenhado de uma vez, com as mesmas páginas. Cada processo recebe só
+        os jogos do seu bloco (games[inicio:fim]; em um JogosDescritor, uma
+        visão que recalcula os jogos no processo).
+
         Args:
-            games: Lista de GameResult para incluir no relatório.
+            games: Jogos do relatório (lista de GameResult ou sequência
+                preguiçosa com len e fatias).
+            progresso: Callback (cartões concluídos, total) chamado a cada
+                500 cartões (a cada bloco, no modo paralelo), para
+                exportações em segundo plano.
+            workers: Processos do pool (padrão: núcleos disponíveis; 1
+                desenha no processo atual).
 
         Returns:
             Bytes do PDF gerado.
         """
-        self._add_header()
-
-        # Resumo
-        self._add_section_title("Resumo Estatistico")
-        self.pdf.set_font("Helvetica", "", 10)
-        self.pdf.set_text_color(50, 50, 50)
-        self.pdf.cell(0, 6, f"Total de Palpites: {len(games)}", ln=True)
-
-        if games:
-            somas = [g.soma for g in games]
-            media_soma = sum(somas) / len(somas)
-            self.pdf.cell(0, 6, f"Média de Soma: {media_soma:.1f}", ln=True)
-
-            pares = [g.pares for g in games]
-            media_pares = sum(pares) / len(pares)
-            self.pdf.cell(0, 6, f"Média de Pares: {media_pares:.1f}", ln=True)
-
-        self.pdf.ln(5)
-
-        # Palpites
-        self._add_section_title("Palpites Gerados")
-        for i, game in enumerate(games, 1):
-            self._add_game_card(game, i)
-
-        # Footer
-        self.pdf.ln(10)
-        self.pdf.set_font("Helvetica", "", 8)
-        self.pdf.set_text_color(150, 150, 150)
-        self.pdf.cell(
-            0,
-            5,
-            "Gerado por LotoPro AI - Análise Estatística de Loterias",
-            ln=True,
-            align="C",
-        )
+        paginacao = self.paginar(games)
+        paginas = paginacao.paginas
+        total = paginacao.total_jogos
+        workers = workers or os.cpu_count() or 1
+        blocos = [
+            paginas[i : i + PAGINAS_POR_BLOCO]
+            for i in range(0, len(paginas), PAGINAS_POR_BLOCO)
+        ]
+
+        juntar = _juntador() if total >= MINIMO_PARALELO else None
+        if total >= MINIMO_PARALELO and juntar is None and workers != 1:
+            logger.warning(
+                "pypdf não instalado: relatório de %d jogos desenhado em um "
+                "processo só",
+                total,
+            )
+        if workers == 1 or len(blocos) == 1 or juntar is None:
+            return self.render_pages(
+                paginas,
+                paginacao.total_paginas,
+                games,
+                paginacao,
+                paginacao.assinatura_propria,
+                progresso,
+            )
+
+        argumentos = [
+            (
+                bloco,
+                paginacao.total_paginas,
+                games[bloco[0].inicio : bloco[-1].fim],
+                paginacao if i == 0 else None,
+                paginacao.assinatura_propria if i == len(blocos) - 1 else None,
+            )
+            for i, bloco in enumerate(blocos)
+        ]
+        partes: List[bytes] = []
+        contexto = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(blocos)), mp_context=contexto
+        ) as pool:
+            # map devolve na ordem dos blocos: páginas na ordem do relatório
+            for bloco, parte in zip(
+                blocos, pool.map(self.render_pages, *zip(*argumentos))
+            ):
+                partes.append(parte)
+                if progresso is not None:
+                    progresso(bloco[-1].fim, total)
+        return juntar(partes)
+
+
+def _juntador() -> Optional[Callable[[List[bytes]], bytes]]:
+    """Função que junta PDFs em ordem, ou None se pypdf não estiver instalado."""
+    try:
+        from pypdf import PdfReader, PdfWriter
+    except ImportError:
+        return None
+
+    def juntar(partes: List[bytes]) -> bytes:
+        escritor = PdfWriter()
+        for parte in partes:
+            escritor.append(PdfReader(io.BytesIO(parte)))
+        saida = io.BytesIO()
+        escritor.write(saida)
+        return saida.getvalue()
 
-        return bytes(self.pdf.output())
+    return juntar
@@ -0,0 +1,279 @@
+"""
+Cache de estruturas pré-calculadas (tabelas da contagem de combinações,
+tabelas por número) por conteúdo de LOTTERY_CONFIG, em memória e em disco.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, TypeVar
+
+from config import FIBONACCI, LOTTERY_CONFIG, PRIMOS
+
+# Mudanças no formato ou no algoritmo dos artefatos invalidam o cache antigo
+VERSAO_ARTEFATOS = 1
+EXTENSAO = ".marshal"
+
+T = TypeVar("T")
+
+
+def hash_config() -> str:
+    """
+    Hash do conteúdo de LOTTERY_CONFIG, PRIMOS e FIBONACCI.
+
+    Qualquer edição em config.py muda o hash e, com ele, as chaves de todos
+    os artefatos: o cache antigo deixa de ser usado sem invalidação manual.
+    """
+    conteudo = json.dumps(
+        {
+            "versao": VERSAO_ARTEFATOS,
+            "loterias": LOTTERY_CONFIG,
+            "primos": sorted(PRIMOS),
+            "fibonacci": sorted(FIBONACCI),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(conteudo.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class EstatisticaArtefato:
+    """Uso de um artefato do cache."""
+
+    nome: str
+    acertos_memoria: int = 0
+    acertos_disco: int = 0
+    faltas: int = 0
+    construcao_s: float = 0.0
+    carga_s: float = 0.0
+    bytes_disco: int = 0
+
+    def to_dict(self) -> dict:
+        """Converter para dicionário (compatível com pandas.DataFrame)."""
+        return {
+            "artefato": self.nome,
+            "acertos_memoria": self.acertos_memoria,
+            "acertos_disco": self.acertos_disco,
+            "faltas": self.faltas,
+            "construcao_s": self.construcao_s,
+            "carga_s": self.carga_s,
+            "bytes_disco": self.bytes_disco,
+        }
+
+
+class CachePrecomputo:
+    """
+    Artefatos pré-calculados por hash de configuração, em memória e em disco.
+
+    Cada artefato é construído uma vez por processo (chamadas concorrentes
+    esperam a mesma construção) e gravado com marshal, que carrega
+    dicionários e listas de tipos nativos várias vezes mais rápido que
+    reconstruí-los e, ao contrário do pickle, não executa código ao ler.
+    Ao abrir o diretório, arquivos de outros hashes de configuração são
+    removidos.
+    """
+
+    def __init__(
+        self, diretorio: Optional[str] = None, chave_config: Optional[str] = None
+    ):
+        """
+        Abrir o cache.
+
+        Args:
+            diretorio: Diretório dos artefatos em disco (None: só memória).
+            chave_config: Hash da configuração (padrão: hash_config()).
+        """
+        self.diretorio = diretorio
+        self.chave_config = chave_config or hash_config()
+        self._memoria: Dict[str, object] = {}
+        self._estatisticas: Dict[str, EstatisticaArtefato] = {}
+        self._lock = threading.Lock()
+        self._locks: Dict[str, threading.Lock] = {}
+        if diretorio is not None:
+            os.makedirs(diretorio, mode=0o700, exist_ok=True)
+            self._remover_obsoletos()
+
+    def _remover_obsoletos(self) -> None:
+        """Apagar artefatos gravados com outro hash de configuração."""
+        prefixo = f"{self.chave_config}-"
+        for nome in os.listdir(self.diretorio):
+            if nome.endswith(EXTENSAO) and not nome.startswith(prefixo):
+                try:
+                    os.remove(os.path.join(self.diretorio, nome))
+                except OSError:
+                    pass
+
+    def _caminho(self, nome: str) -> str:
+        """Arquivo de um artefato (nome saneado + hash da configuração)."""
+        seguro = "".join(c if c.isalnum() or c in "-_." else "_" for c in nome)
+        resumo = hashlib.sha256(nome.encode("utf-8")).hexdigest()[:8]
+        return os.path.join(
+            self.diretorio, f"{self.chave_config}-{seguro[:60]}-{resumo}{EXTENSAO}"
+        )
+
+    def _estatistica(self, nome: str) -> EstatisticaArtefato:
+        estatistica = self._estatisticas.get(nome)
+        if estatistica is None:
+            estatistica = self._estatisticas[nome] = EstatisticaArtefato(nome)
+        return estatistica
+
+    def obter(self, nome: str, construir: Callable[[], T], persistir: bool = True) -> T:
+        """
+        Buscar um artefato, construindo-o na primeira vez.
+
+        Args:
+            nome: Identificador do artefato, incluindo os parâmetros de que
+                ele depende (o hash da configuração cobre edições em
+                config.py entre execuções, não alterações em memória).
+            construir: Função que monta o artefato. Para persistir, deve
+                devolver só tipos nativos (dict, list, tuple, int, str...).
+            persistir: Gravar em disco (False para artefatos mais baratos de
+                construir do que de ler).
+
+        Returns:
+            O artefato (o mesmo objeto para todas as chamadas do processo).
+        """
+        with self._lock:
+            if nome in self._memoria:
+                self._estatistica(nome).acertos_memoria += 1
+                return self._memoria[nome]
+            lock = self._locks.setdefault(nome, threading.Lock())
+
+        with lock:
+            with self._lock:
+                if nome in self._memoria:
+                    self._estatistica(nome).acertos_memoria += 1
+                    return self._memoria[nome]
+
+            caminho = None
+            if persistir and self.diretorio is not None:
+                caminho = self._caminho(nome)
+                inicio = time.perf_counter()
+                valor = self._ler(caminho)
+                if valor is not None:
+                    with self._lock:
+                        estatistica = self._estatistica(nome)
+                        estatistica.acertos_disco += 1
+                        estatistica.carga_s += time.perf_counter() - inicio
+                        estatistica.bytes_disco = valor[1]
+                        self._memoria[nome] = valor[0]
+                    return valor[0]
+
+            inicio = time.perf_counter()
+            artefato = construir()
+            duracao = time.perf_counter() - inicio
+            tamanho = self._gravar(caminho, artefato) if caminho is not None else 0
+            with self._lock:
+                estatistica = self._estatistica(nome)
+                estatistica.faltas += 1
+                estatistica.construcao_s += duracao
+                estatistica.bytes_disco = tamanho
+                self._memoria[nome] = artefato
+            return artefato
+
+    @staticmethod
+    def _ler(caminho: str) -> Optional[tuple]:
+        """Carregar um artefato ((valor, bytes) ou None se ausente/corrompido)."""
+        try:
+            with open(caminho, "rb") as f:
+                dados = f.read()
+            # loads sobre o arquivo inteiro: marshal.load(f) lê em pedaços pequenos
+            return marshal.loads(dados), len(dados)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    @staticmethod
+    def _gravar(caminho: str, artefato: object) -> int:
+        """Gravar um artefato (escrita atômica); 0 se não for serializável."""
+        try:
+            dados = marshal.dumps(artefato)
+        except ValueError:
+            return 0
+        temporario = f"{caminho}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temporario, "wb") as f:
+                f.write(dados)
+            os.replace(temporario, caminho)
+        except OSError:
+            # Disco cheio ou sem permissão: o artefato continua em memória
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            return 0
+        return len(dados)
+
+    def estatisticas(self) -> List[EstatisticaArtefato]:
+        """Uso de cada artefato, em ordem de nome."""
+        with self._lock:
+            return [
+                EstatisticaArtefato(**vars(e))
+                for _, e in sorted(self._estatisticas.items())
+            ]
+
+    def limpar_memoria(self) -> None:
+        """Descartar os artefatos em memória (os arquivos em disco ficam)."""
+        with self._lock:
+            self._memoria.clear()
+
+
+def diretorio_padrao() -> Optional[str]:
+    """
+    Diretório padrão do cache (variável de ambiente LOTOPRO_PRECOMPUTO;
+    "0" desliga a gravação em disco).
+    """
+    diretorio = os.environ.get(
+        "LOTOPRO_PRECOMPUTO",
+        os.path.join(tempfile.gettempdir(), "lotopro_precomputo"),
+    )
+    return None if diretorio == "0" else diretorio
+
+
+@lru_cache(maxsize=1)
+def cache_padrao() -> CachePrecomputo:
+    """Cache compartilhado pelo processo."""
+    return CachePrecomputo(diretorio_padrao())
+
+
+def tabelas_volante(max_numero: int) -> Dict[str, List[int]]:
+    """
+    Tabelas por número de um volante 1..max_numero (índice = número): bit
+    da máscara, par, primo e Fibonacci.
+
+    Args:
+        max_numero: Maior número do volante.
+
+    Returns:
+        Dicionário com as listas "bits", "par", "primo" e "fibo".
+    """
+    n = max_numero
+
+    def construir() -> Dict[str, List[int]]:
+        return {
+            "bits": [1 << x for x in range(n + 1)],
+            "par": [1 - x % 2 for x in range(n + 1)],
+            "primo": [int(x in PRIMOS) for x in range(n + 1)],
+            "fibo": [int(x in FIBONACCI) for x in range(n + 1)],
+        }
+
+    # Montar custa menos que ler do disco: só memória
+    return cache_padrao().obter(f"tabelas:{n}", construir, persistir=False)
+
+
+def tabelas_numeros(tipo: str) -> Dict[str, List[int]]:
+    """
+    Tabelas por número de uma loteria (ver tabelas_volante).
+
+    Args:
+        tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+
+    Returns:
+        Dicionário com as listas "bits", "par", "primo" e "fibo".
+    """
+    return tabelas_volante(LOTTERY_CONFIG[tipo]["max_numero"])
@@ -0,0 +1,522 @@
+"""
+Testes estatísticos de qualidade dos amostradores: aderência às
+distribuições exatas das combinações válidas e independência entre jogos
+consecutivos e entre fluxos de blocos diferentes.
+
+Execute com: python -m qualidade [loteria ...] [--amostras N] [--workers N]
+"""
+
+import multiprocessing
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
+from math import exp, lgamma, log
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config import LOTTERY_CONFIG
+from precomputo import cache_padrao, tabelas_numeros
+from selecao import gerador_bloco
+from viabilidade import Restricoes, analisar, contador
+
+# Amostradores avaliados (ver amostrar)
+AMOSTRADORES = ("padrao", "ponderado", "mcmc")
+
+# Nível de significância padrão: com sementes fixas o resultado é
+# reprodutível, então um limiar baixo evita alarmes falsos sem esconder viés
+ALFA = 1e-3
+
+# Acima desse tamanho (qtd × max_numero) a soma sem restrição fica fora do
+# estado da contagem exata (ex.: Lotomania, 50 × 100)
+LIMITE_SOMA_LIVRE = 2000
+
+
+def _gama_superior(a: float, x: float) -> float:
+    """Função gama incompleta superior regularizada Q(a, x)."""
+    if x <= 0:
+        return 1.0
+    prefixo = exp(-x + a * log(x) - lgamma(a))
+    if x < a + 1:
+        # Série de P(a, x)
+        termo = soma = 1.0 / a
+        n = a
+        for _ in range(10_000):
+            n += 1
+            termo *= x / n
+            soma += termo
+            if abs(termo) < abs(soma) * 1e-15:
+                break
+        return max(0.0, 1.0 - soma * prefixo)
+    # Fração contínua de Q(a, x) (método de Lentz)
+    minimo = 1e-300
+    b = x + 1 - a
+    c = 1 / minimo
+    d = 1 / b
+    h = d
+    for i in range(1, 10_000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = minimo if abs(d) < minimo else d
+        c = b + an / c
+        c = minimo if abs(c) < minimo else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return prefixo * h
+
+
+def p_valor_qui_quadrado(estatistica: float, graus: int) -> float:
+    """
+    Probabilidade de uma qui-quadrado com `graus` graus de liberdade
+    superar a estatística.
+
+    Args:
+        estatistica: Valor observado da estatística.
+        graus: Graus de liberdade.
+
+    Returns:
+        p-valor (1.0 se não houver graus de liberdade).
+    """
+    if graus <= 0:
+        return 1.0
+    if estatistica == float("inf"):
+        return 0.0
+    return _gama_superior(graus / 2, estatistica / 2)
+
+
+@dataclass
+class ResultadoTeste:
+    """Resultado de um teste qui-quadrado."""
+
+    nome: str
+    estatistica: float
+    graus: int
+    p_valor: float
+
+    def aprovado(self, alfa: float = ALFA) -> bool:
+        """Indica se o teste não rejeita a hipótese ao nível alfa."""
+        return self.p_valor >= alfa
+
+    def to_dict(self) -> dict:
+        """Converter para dicionário (compatível com pandas.DataFrame)."""
+        return {
+            "teste": self.nome,
+            "estatistica": self.estatistica,
+            "graus": self.graus,
+            "p_valor": self.p_valor,
+        }
+
+
+def qui_quadrado_aderencia(
+    nome: str,
+    observados: Sequence[int],
+    esperados: Sequence[float],
+    minimo: float = 5.0,
+) -> ResultadoTeste:
+    """
+    Teste qui-quadrado de aderência, juntando classes vizinhas até cada uma
+    ter ao menos `minimo` ocorrências esperadas.
+
+    Args:
+        nome: Nome do teste.
+        observados: Contagem observada por classe (em ordem).
+        esperados: Contagem esperada por classe (mesma ordem).
+        minimo: Menor contagem esperada por classe após juntar.
+
+    Returns:
+        ResultadoTeste (p-valor 0 se houver ocorrência em classe impossível).
+    """
+    classes: List[Tuple[float, float]] = []
+    obs = esp = 0.0
+    for o, e in zip(observados, esperados):
+        if e == 0 and o > 0:
+            return ResultadoTeste(nome, float("inf"), len(classes), 0.0)
+        obs, esp = obs + o, esp + e
+        if esp >= minimo:
+            classes.append((obs, esp))
+            obs = esp = 0.0
+    if esp > 0 and classes:
+        o, e = classes.pop()
+        classes.append((o + obs, e + esp))
+    estatistica = sum((o - e) ** 2 / e for o, e in classes)
+    graus = len(classes) - 1
+    return ResultadoTeste(
+        nome, estatistica, graus, p_valor_qui_quadrado(estatistica, graus)
+    )
+
+
+def _classes(valores: Sequence[int], quantidade: int) -> Dict[int, int]:
+    """Agrupar valores em até `quantidade` classes de frequência parecida."""
+    contagem = Counter(valores)
+    total = len(valores)
+    classes: Dict[int, int] = {}
+    acumulado = 0
+    classe = 0
+    for valor in sorted(contagem):
+        classes[valor] = classe
+        acumulado += contagem[valor]
+        if acumulado >= total * (classe + 1) / quantidade:
+            classe += 1
+    return classes
+
+
+def qui_quadrado_independencia(
+    nome: str, x: Sequence[int], y: Sequence[int], classes: int = 6
+) -> ResultadoTeste:
+    """
+    Teste qui-quadrado de independência entre duas medidas pareadas.
+
+    Os valores de cada medida são agrupados em até `classes` classes de
+    frequência parecida, para a tabela de contingência não ter células
+    quase vazias.
+
+    Args:
+        nome: Nome do teste.
+        x: Primeira medida (ex.: pares do jogo i).
+        y: Segunda medida, pareada com x (ex.: pares do jogo i + 1).
+        classes: Máximo de classes por medida.
+
+    Returns:
+        ResultadoTeste.
+    """
+    cx, cy = _classes(x, classes), _classes(y, classes)
+    linhas, colunas = max(cx.values()) + 1, max(cy.values()) + 1
+    tabela = Counter((cx[a], cy[b]) for a, b in zip(x, y))
+    total = sum(tabela.values())
+    por_linha = [sum(tabela[i, j] for j in range(colunas)) for i in range(linhas)]
+    por_coluna = [sum(tabela[i, j] for i in range(linhas)) for j in range(colunas)]
+    estatistica = 0.0
+    for i in range(linhas):
+        for j in range(colunas):
+            esperado = por_linha[i] * por_coluna[j] / total
+            if esperado > 0:
+                estatistica += (tabela[i, j] - esperado) ** 2 / esperado
+    graus = (linhas - 1) * (colunas - 1)
+    return ResultadoTeste(
+        nome, estatistica, graus, p_valor_qui_quadrado(estatistica, graus)
+    )
+
+
+@dataclass
+class DistribuicoesExatas:
+    """Distribuições exatas sobre as combinações válidas de uma loteria."""
+
+    total: int
+    marginais: List[int]  # índice = número: combinações válidas que o contêm
+    pares: Dict[int, int]  # pares -> combinações válidas
+    soma: Optional[Dict[int, int]] = None  # soma -> combinações válidas
+
+
+def distribuicoes_exatas(restricoes: Restricoes) -> DistribuicoesExatas:
+    """
+    Distribuições exatas por número, de pares e de soma entre as
+    combinações válidas.
+
+    Percorre o volante para frente contando os prefixos que chegam a cada
+    estado, podados pela tabela de completamentos da contagem exata
+    (viabilidade.contador); combinações com x = prefixos × completamentos.
+    A soma só é acompanhada quando é restrita ou o volante é pequeno
+    (LIMITE_SOMA_LIVRE). O resultado fica no cache de pré-cálculo.
+
+    Args:
+        restricoes: Restrições da loteria.
+
+    Returns:
+        DistribuicoesExatas.
+    """
+    r = restricoes
+    com_soma = r.soma is not None or r.qtd * r.max_numero <= LIMITE_SOMA_LIVRE
+
+    def construir() -> dict:
+        cont = contador(r)
+        completar = cont._completar
+        d_par, d_primo, d_fibo = cont._d_par, cont._d_primo, cont._d_fibo
+        max_pares, max_primos, max_fibo = (
+            cont._pares[1],
+            cont._primos[1],
+            cont._fibo[1],
+        )
+        soma_restrita = r.soma is not None
+        pares_restritos = r.pares is not None
+        # (k, soma, pares, primos, fibo, seq) -> prefixos; soma e pares
+        # completos, reduzidos só na consulta aos completamentos
+        estados = {(0, 0, 0, 0, 0, 0): 1}
+        marginais = [0] * (r.max_numero + 1)
+        for x in range(1, r.max_numero + 1):
+            proximos: Dict[tuple, int] = {}
+            par = 1 - x % 2
+            for (k, soma, pares, primos, fibo, seq), prefixos in estados.items():
+                s_red = soma if soma_restrita else 0
+                p_red = pares if pares_restritos else 0
+                if completar(x + 1, k, s_red, p_red, primos, fibo, 0):
+                    chave = (k, soma, pares, primos, fibo, 0)
+                    proximos[chave] = proximos.get(chave, 0) + prefixos
+                if k == r.qtd or (r.evitar_sequencia and seq == 2):
+                    continue
+                p, q, f = p_red + d_par[x], primos + d_primo[x], fibo + d_fibo[x]
+                if p > max_pares or q > max_primos or f > max_fibo:
+                    continue
+                proxima = seq + 1 if r.evitar_sequencia else 0
+                completos = completar(
+                    x + 1, k + 1, s_red + x if soma_restrita else 0, p, q, f, proxima
+                )
+                if completos:
+                    marginais[x] += prefixos * completos
+                    chave = (
+                        k + 1,
+                        soma + x if com_soma else 0,
+                        pares + par,
+                        q,
+                        f,
+                        proxima,
+                    )
+                    proximos[chave] = proximos.get(chave, 0) + prefixos
+            estados = proximos
+
+        somas: Dict[int, int] = {}
+        por_pares: Dict[int, int] = {}
+        for (k, soma, pares, _, _, _), quantidade in estados.items():
+            if k == r.qtd:
+                somas[soma] = somas.get(soma, 0) + quantidade
+                por_pares[pares] = por_pares.get(pares, 0) + quantidade
+        return {
+            "total": cont.total,
+            "marginais": marginais,
+            "pares": por_pares,
+            "soma": somas if com_soma else None,
+        }
+
+    dados = cache_padrao().obter(f"distribuicoes:{r!r}", construir)
+    return DistribuicoesExatas(**dados)
+
+
+def avaliar_amostra(
+    tipo: str, jogos: List[List[int]], exatas: DistribuicoesExatas
+) -> List[ResultadoTeste]:
+    """
+    Aderência de um lote às distribuições exatas e independência entre
+    jogos consecutivos.
+
+    Marginais: a contagem de cada número tem variância N·p·(1 - p) (um
+    número por jogo no máximo), então cada termo é dividido por E·(1 - p).
+    Independência: pares e soma do jogo 2i contra os do jogo 2i + 1.
+
+    Args:
+        tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+        jogos: Lote gerado, na ordem de geração.
+        exatas: Distribuições exatas da loteria.
+
+    Returns:
+        Lista de ResultadoTeste.
+    """
+    n = len(jogos)
+    par = tabelas_numeros(tipo)["par"]
+    contagem = Counter(chain.from_iterable(jogos))
+    estatistica, graus = 0.0, -1
+    for numero, validas in enumerate(exatas.marginais[1:], 1):
+        p = validas / exatas.total
+        if p == 0 or p == 1:
+            if contagem[numero] != (n if p == 1 else 0):
+                estatistica = float("inf")
+            continue
+        esperado = n * p
+        estatistica += (contagem[numero] - esperado) ** 2 / (esperado * (1 - p))
+        graus += 1
+    resultados = [
+        ResultadoTeste(
+            "marginais", estatistica, graus, p_valor_qui_quadrado(estatistica, graus)
+        )
+    ]
+
+    pares = [sum(par[x] for x in jogo) for jogo in jogos]
+    somas = list(map(sum, jogos))
+    medidas = [("pares", pares, exatas.pares)]
+    if exatas.soma is not None:
+        medidas.append(("soma", somas, exatas.soma))
+    for nome, valores, exata in medidas:
+        observada = Counter(valores)
+        classes = range(min(exata), max(exata) + 1)
+        resultados.append(
+            qui_quadrado_aderencia(
+                nome,
+                [observada[c] for c in classes],
+                [n * exata.get(c, 0) / exatas.total for c in classes],
+            )
+        )
+
+    for nome, valores in (("pares consecutivos", pares), ("soma consecutiva", somas)):
+        resultados.append(
+            qui_quadrado_independencia(nome, valores[0::2], valores[1::2])
+        )
+    return resultados
+
+
+def avaliar_fluxos(
+    tipo: str, jogos_a: List[List[int]], jogos_b: List[List[int]]
+) -> List[ResultadoTeste]:
+    """
+    Independência entre dois fluxos (ex.: blocos de processos diferentes):
+    pares e soma do i-ésimo jogo de um contra os do i-ésimo do outro.
+
+    Args:
+        tipo: Tipo de loteria.
+        jogos_a: Lote do primeiro fluxo.
+        jogos_b: Lote do segundo fluxo.
+
+    Returns:
+        Lista de ResultadoTeste.
+    """
+    par = tabelas_numeros(tipo)["par"]
+    medidas = {
+        "pares entre fluxos": lambda jogo: sum(par[x] for x in jogo),
+        "soma entre fluxos": sum,
+    }
+    return [
+        qui_quadrado_independencia(
+            nome, list(map(medir, jogos_a)), list(map(medir, jogos_b))
+        )
+        for nome, medir in medidas.items()
+    ]
+
+
+def amostrar(
+    tipo: str, amostrador: str, quantidade: int, seed: int, indice: int = 0
+) -> List[List[int]]:
+    """
+    Gerar um lote com um dos amostradores de GeradorLoteria.
+
+    Args:
+        tipo: Tipo de loteria.
+        amostrador: Chave de AMOSTRADORES ("padrao": gerar_combinacoes;
+            "ponderado": gerar_jogos_ponderados com pesos iguais; "mcmc":
+            gerar_jogos_mcmc).
+        quantidade: Quantidade de jogos.
+        seed: Semente.
+        indice: Índice do fluxo (bloco), como na seleção Top-K.
+
+    Returns:
+        Lista de jogos (listas de números).
+
+    Raises:
+        ValueError: Se o amostrador não existir.
+    """
+    gerador = gerador_bloco(seed, indice)
+    if amostrador == "padrao":
+        return list(gerador.gerar_combinacoes(tipo, quantidade))
+    if amostrador == "ponderado":
+        pesos = [1.0] * (LOTTERY_CONFIG[tipo]["max_numero"] + 1)
+        jogos = gerador.gerar_jogos_ponderados(tipo, quantidade, pesos)
+    elif amostrador == "mcmc":
+        jogos = gerador.gerar_jogos_mcmc(tipo, quantidade)
+    else:
+        raise ValueError(f"Amostrador desconhecido: {amostrador}")
+    return [jogo.numeros for jogo in jogos]
+
+
+def avaliar(
+    tipo: str, amostrador: str, quantidade: int, seed: int = 0
+) -> List[ResultadoTeste]:
+    """
+    Bateria completa de um amostrador: aderência e independência no fluxo 0
+    e independência entre os fluxos 0 e 1.
+
+    Args:
+        tipo: Tipo de loteria.
+        amostrador: Chave de AMOSTRADORES.
+        quantidade: Jogos por fluxo.
+        seed: Semente.
+
+    Returns:
+        Lista de ResultadoTeste.
+    """
+    exatas = distribuicoes_exatas(Restricoes.de_config(LOTTERY_CONFIG[tipo]))
+    a = amostrar(tipo, amostrador, quantidade, seed, 0)
+    b = amostrar(tipo, amostrador, quantidade, seed, 1)
+    return avaliar_amostra(tipo, a, exatas) + avaliar_fluxos(tipo, a, b)
+
+
+def bateria(
+    tipos: Optional[Sequence[str]] = None,
+    amostradores: Sequence[str] = AMOSTRADORES,
+    quantidade: int = 20_000,
+    seed: int = 0,
+    workers: Optional[int] = None,
+) -> Dict[Tuple[str, str], List[ResultadoTeste]]:
+    """
+    Avaliar vários amostradores e loterias em um pool de processos.
+
+    Args:
+        tipos: Loterias avaliadas (padrão: todas).
+        amostradores: Amostradores avaliados.
+        quantidade: Jogos por fluxo.
+        seed: Semente.
+        workers: Processos do pool (1 executa no processo atual).
+
+    Returns:
+        Dicionário (tipo, amostrador) -> resultados, na ordem dos pedidos.
+
+    Raises:
+        ValueError: Se tipo de loteria não for reconhecido.
+    """
+    tipos = list(LOTTERY_CONFIG) if tipos is None else list(tipos)
+    for tipo in tipos:
+        if tipo not in LOTTERY_CONFIG:
+            raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+        # Contagem e distribuições exatas no cache antes de abrir o pool
+        analisar(tipo)
+        distribuicoes_exatas(Restricoes.de_config(LOTTERY_CONFIG[tipo]))
+
+    pedidos = [(tipo, a) for tipo in tipos for a in amostradores]
+    argumentos = [(tipo, a, quantidade, seed) for tipo, a in pedidos]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pedidos) == 1:
+        resultados = [avaliar(*args) for args in argumentos]
+    else:
+        contexto = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(pedidos)), mp_context=contexto
+        ) as pool:
+            resultados = list(pool.map(avaliar, *zip(*argumentos)))
+    return dict(zip(pedidos, resultados))
+
+
+def _opcao(argv: List[str], nome: str, padrao: int) -> int:
+    """Ler (e remover de argv) uma opção inteira --nome N."""
+    if nome not in argv:
+        return padrao
+    i = argv.index(nome)
+    valor = int(argv[i + 1])
+    del argv[i : i + 2]
+    return valor
+
+
+def main(argv: List[str]) -> int:
+    argv = list(argv)
+    quantidade = _opcao(argv, "--amostras", 20_000)
+    workers = _opcao(argv, "--workers", 0) or None
+    seed = _opcao(argv, "--seed", 0)
+    resultados = bateria(
+        argv or None, quantidade=quantidade, seed=seed, workers=workers
+    )
+    print(
+        f"{'loteria':13} {'amostrador':10} {'teste':20} {'qui²':>10} {'gl':>4} {'p':>8}"
+    )
+    falhas = 0
+    for (tipo, amostrador), testes in resultados.items():
+        for t in testes:
+            marca = "" if t.aprovado() else "  <- FALHOU"
+            falhas += not t.aprovado()
+            print(
+                f"{tipo:13} {amostrador:10} {t.nome:20} {t.estatistica:10.1f} "
+                f"{t.graus:4d} {t.p_valor:8.4f}{marca}"
+            )
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,277 @@
+"""
+HTML dos cartões de palpites: modelos pré-montados por loteria, fragmentos
+das bolinhas em cache e páginas inteiras em cache pelo conteúdo.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from config import LOTTERY_CONFIG
+
+# Gradiente das bolinhas por loteria (as demais usam o da Quina)
+GRADIENTES = {
+    "Mega-Sena": "linear-gradient(135deg, #10B981 0%, #059669 100%)",
+    "Lotofácil": "linear-gradient(135deg, #A855F7 0%, #9333EA 100%)",
+    "Lotomania": "linear-gradient(135deg, #F97316 0%, #EA580C 100%)",
+    "Timemania": "linear-gradient(135deg, #84CC16 0%, #65A30D 100%)",
+    "Dia de Sorte": "linear-gradient(135deg, #F59E0B 0%, #D97706 100%)",
+    "Dupla Sena": "linear-gradient(135deg, #EF4444 0%, #DC2626 100%)",
+}
+GRADIENTE_PADRAO = "linear-gradient(135deg, #3B82F6 0%, #2563EB 100%)"
+
+# Estilos compartilhados: uma vez por página, em vez de repetidos em cada
+# bolinha e cartão
+ESTILO_PAGINA = """<style>
+body { margin: 0; font-family: sans-serif; }
+.grade { display: grid; grid-template-columns: 1fr 1fr; column-gap: 32px; }
+.cartao { padding: 24px; border-radius: 16px; margin-bottom: 16px; backdrop-filter: blur(10px); position: relative; overflow: hidden; box-sizing: border-box;
+  background: linear-gradient(135deg, rgba(99, 102, 241, 0.08) 0%, rgba(79, 70, 229, 0.04) 100%);
+  border: 1px solid rgba(99, 102, 241, 0.3); box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3); }
+.cartao.melhor { background: linear-gradient(135deg, rgba(255, 244, 220, 0.06) 0%, rgba(255, 244, 220, 0.03) 100%);
+  border: 2px solid rgba(255, 215, 0, 0.7); box-shadow: 0 8px 28px rgba(255, 215, 0, 0.12), 0 10px 30px rgba(0,0,0,0.2); }
+.selo { position: absolute; top: 8px; right: 8px; background: linear-gradient(135deg, #FFD700 0%, #FFA500 100%); color: #1a1f3a; padding: 6px 10px; border-radius: 16px; font-size: 12px; font-weight: 700; }
+.titulo { color: #6366F1; font-weight: 700; font-size: 14px; letter-spacing: 1px; margin-bottom: 12px; text-transform: uppercase; }
+.bolas { margin-bottom: 16px; }
+.bola { display: inline-flex; align-items: center; justify-content: center; width: 48px; height: 48px; border-radius: 50%; font-weight: 800; font-size: 14px; color: white; margin-right: 8px; margin-bottom: 8px; background: GRADIENTE; box-shadow: 0 8px 20px rgba(0, 0, 0, 0.4); border: 2px solid rgba(255, 255, 255, 0.2); }
+.analise { color: #94A3B8; font-size: 13px; margin-top: 12px; font-family: 'SF Mono', 'Monaco', 'Courier New', monospace; line-height: 1.6; }
+@media (max-width: 640px) { .grade { grid-template-columns: 1fr; } }
+</style>"""
+
+
+@lru_cache(maxsize=None)
+def fragmentos_bolas(max_numero: int) -> Tuple[str, ...]:
+    """
+    HTML de cada bolinha de 0 a max_numero (índice = número).
+
+    Args:
+        max_numero: Maior número do volante.
+
+    Returns:
+        Tupla com o <span> de cada número, formatado com dois dígitos.
+    """
+    return tuple(f'<span class="bola">{n:02d}</span>' for n in range(max_numero + 1))
+
+
+class ModeloCartao:
+    """
+    Modelo de cartão de uma loteria, montado uma vez.
+
+    As partes fixas do cartão ficam prontas e o HTML de um jogo é só a
+    junção delas com as bolinhas em cache e a linha de análise.
+    """
+
+    def __init__(self, tipo: str):
+        """
+        Montar o modelo.
+
+        Args:
+            tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+
+        Raises:
+            ValueError: Se a loteria não existir.
+        """
+        if tipo not in LOTTERY_CONFIG:
+            raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+        config = LOTTERY_CONFIG[tipo]
+        self.tipo = tipo
+        self.bolas = fragmentos_bolas(config["max_numero"])
+        self.estilo = ESTILO_PAGINA.replace(
+            "GRADIENTE", GRADIENTES.get(tipo, GRADIENTE_PADRAO)
+        )
+        self.altura_cartao = self.altura(config["qtd_selecionados"])
+        self._abertura = (
+            f'<div class="cartao" style="min-height: {self.altura_cartao - 16}px">'
+        )
+        self._abertura_melhor = self._abertura.replace('"cartao"', '"cartao melhor"')
+
+    @staticmethod
+    def altura(qtd_numeros: int) -> int:
+        """
+        Altura (px) de um cartão com `qtd_numeros` bolinhas, 6 por linha.
+
+        Args:
+            qtd_numeros: Números do jogo (apostas estendidas têm mais que o
+                volante simples).
+
+        Returns:
+            Altura do cartão, com a margem inferior.
+        """
+        # Cartão com 3 linhas de bolinhas cabe em 180px; Lotomania tem 9
+        linhas_bolas = -(-qtd_numeros // 6)
+        return 180 + 56 * max(0, linhas_bolas - 3)
+
+    def renderizar(
+        self,
+        indice: int,
+        numeros: Sequence[int],
+        analise: str,
+        score: Optional[float] = None,
+    ) -> str:
+        """
+        HTML de um cartão.
+
+        Args:
+            indice: Posição do jogo no lote (começa em 0).
+            numeros: Números do jogo.
+            analise: Linha de análise (HTML) exibida abaixo das bolinhas.
+            score: Score do melhor palpite (None nos demais cartões).
+
+        Returns:
+            O <div> do cartão.
+        """
+        bolas = self.bolas
+        return "".join(
+            (
+                self._abertura if score is None else self._abertura_melhor,
+                "" if score is None else f'<div class="selo">TOP {int(score)}%</div>',
+                f'<div class="titulo">🎯 Jogo #{indice + 1}</div><div class="bolas">',
+                "".join([bolas[n] for n in numeros]),
+                '</div><div class="analise">',
+                analise,
+                "</div></div>",
+            )
+        )
+
+
+@lru_cache(maxsize=None)
+def modelo_cartao(tipo: str) -> ModeloCartao:
+    """Modelo de cartão de uma loteria (montado na primeira chamada)."""
+    return ModeloCartao(tipo)
+
+
+def analise_jogo(resultado, parecido=None) -> str:
+    """
+    Linha de análise de um cartão: soma, primos, Fibonacci, extras e o
+    sorteio histórico mais parecido.
+
+    Args:
+        resultado: GameResult do jogo.
+        parecido: SorteioSemelhante mais próximo (opcional).
+
+    Returns:
+        HTML da linha de análise.
+    """
+    partes = [f"<b>Soma:</b> {resultado.soma}"]
+    if resultado.primos:
+        partes.append(f"<b>Primos:</b> {resultado.primos}")
+    if resultado.fibo:
+        partes.append(f"<b>Fibonacci:</b> {resultado.fibo}")
+    for nome, valor in (resultado.extras or {}).items():
+        partes.append(f"<b>{nome}:</b> {valor}")
+    analise = " | ".join(partes)
+    if parecido is not None:
+        analise += (
+            f"<br><b>Mais parecido:</b> concurso {parecido.concurso} "
+            f"({parecido.em_comum} em comum)"
+        )
+    return analise
+
+
+class CachePaginas:
+    """Páginas renderizadas, indexadas pelo conteúdo (LRU, seguro entre threads)."""
+
+    def __init__(self, capacidade: int = 64):
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.faltas = 0
+        self._paginas: "OrderedDict[tuple, Tuple[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obter(self, chave: tuple) -> Optional[Tuple[str, int]]:
+        """Página em cache (None se ausente)."""
+        with self._lock:
+            pagina = self._paginas.get(chave)
+            if pagina is None:
+                self.faltas += 1
+                return None
+            self._paginas.move_to_end(chave)
+            self.acertos += 1
+            return pagina
+
+    def guardar(self, chave: tuple, pagina: Tuple[str, int]) -> None:
+        """Guardar uma página, descartando a usada há mais tempo se cheio."""
+        with self._lock:
+            self._paginas[chave] = pagina
+            self._paginas.move_to_end(chave)
+            while len(self._paginas) > self.capacidade:
+                self._paginas.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._paginas)
+
+
+_PAGINAS = CachePaginas()
+
+
+def renderizar_pagina(
+    tipo: str,
+    resultados: Sequence,
+    scores: Sequence[float],
+    melhor_indice: int,
+    proximos: Optional[List[list]] = None,
+    cache: Optional[CachePaginas] = _PAGINAS,
+) -> Tuple[str, int]:
+    """
+    HTML de todos os cartões de um lote, para uma única chamada de
+    components.html.
+
+    Args:
+        tipo: Tipo de loteria.
+        resultados: GameResults do lote.
+        scores: Score de cada jogo.
+        melhor_indice: Posição do jogo destacado.
+        proximos: Sorteios mais parecidos por jogo (listas, possivelmente
+            vazias), como devolvido por IndiceHistorico.mais_proximos_lote.
+        cache: Cache de páginas (None para sempre renderizar).
+
+    Returns:
+        Tupla (html, altura em pixels da grade em duas colunas).
+
+    Raises:
+        ValueError: Se a loteria não existir.
+    """
+    modelo = modelo_cartao(tipo)
+    if proximos:
+        parecidos = [p[0] if p else None for p in proximos]
+    else:
+        parecidos = [None] * len(resultados)
+
+    chave = None
+    if cache is not None:
+        # A chave é o próprio conteúdo em tuplas: o dicionário compara por
+        # hash e igualdade (em C), mais barato que serializar e aplicar um
+        # hash criptográfico. Números e extras determinam o resto do cartão.
+        chave = (
+            tipo,
+            melhor_indice,
+            int(scores[melhor_indice]) if scores else 0,
+            tuple(
+                (tuple(r.numeros), tuple((r.extras or {}).items())) for r in resultados
+            ),
+            tuple(p and (p.concurso, p.em_comum) for p in parecidos),
+        )
+        pagina = cache.obter(chave)
+        if pagina is not None:
+            return pagina
+
+    cartoes = [
+        modelo.renderizar(
+            i,
+            resultado.numeros,
+            analise_jogo(resultado, parecidos[i]),
+            scores[i] if i == melhor_indice and i < len(scores) else None,
+        )
+        for i, resultado in enumerate(resultados)
+    ]
+    html = "".join((modelo.estilo, '<div class="grade">', "".join(cartoes), "</div>"))
+    # Duas colunas, com a linha da grade tão alta quanto o maior jogo da
+    # página; abaixo de 640px a grade vira uma coluna e o iframe precisa de
+    # rolagem (components.html(..., scrolling=True))
+    maior = max((len(r.numeros) for r in resultados), default=0)
+    altura = max(modelo.altura_cartao, modelo.altura(maior)) * -(-len(resultados) // 2)
+    pagina = (html, altura)
+    if cache is not None:
+        cache.guardar(chave, pagina)
+    return pagina
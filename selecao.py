@@ -0,0 +1,208 @@
+"""
+Seleção dos K jogos de maior score em um fluxo grande de candidatos.
+"""
+
+import heapq
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from config import LOTTERY_CONFIG
+from core import GameResult, GeradorLoteria
+from precomputo import tabelas_numeros
+
+# Item do heap: (score, desempate aleatório, números)
+Item = Tuple[float, float, List[int]]
+
+
+class PontuadorPadrao:
+    """
+    Score de AnalisadorEstatistico.calcular_score_probabilidade calculado
+    direto dos números, com tabelas por número e sem montar GameResult.
+    """
+
+    def __init__(self, tipo: str, config: Optional[dict] = None):
+        """
+        Montar as tabelas da loteria.
+
+        Args:
+            tipo: Tipo de loteria.
+            config: Configuração usada na geração (padrão: LOTTERY_CONFIG[tipo]).
+        """
+        config = LOTTERY_CONFIG[tipo] if config is None else config
+        tabelas = tabelas_numeros(tipo)
+        self._par = tabelas["par"]
+        # Primos e Fibonacci só vão para o GameResult quando a loteria os restringe
+        self._com_primos = "range_primos" in config
+        self._com_fibo = "range_fibo" in config
+        self._primo = tabelas["primo"]
+        self._fibo = tabelas["fibo"]
+
+    def __call__(self, numeros: List[int]) -> float:
+        """Score (0 a 100) de uma combinação ordenada."""
+        score = 50.0
+        if 2 <= sum([self._par[x] for x in numeros]) <= 4:
+            score += 15
+        if 100 <= sum(numeros) <= 250:
+            score += 10
+        if self._com_primos and sum([self._primo[x] for x in numeros]) >= 2:
+            score += 5
+        if self._com_fibo and any([self._fibo[x] for x in numeros]):
+            score += 5
+        # Números distintos e ordenados: três consecutivos <=> n[i+2] - n[i] == 2
+        if any(b - a == 2 for a, b in zip(numeros, numeros[2:])):
+            score -= 10
+        return min(100.0, max(0.0, score))
+
+
+@dataclass
+class ResultadoSelecao:
+    """Melhores jogos encontrados em uma seleção Top-K."""
+
+    tipo: str
+    jogos: List[GameResult]
+    scores: List[float]
+    candidatos: int
+    seed: Optional[int] = None
+    blocos: int = 0
+
+
+def gerador_bloco(seed: int, indice: int) -> GeradorLoteria:
+    """
+    Gerador de um bloco de candidatos, derivado de (seed, indice).
+
+    Args:
+        seed: Semente da seleção.
+        indice: Índice do bloco.
+
+    Returns:
+        GeradorLoteria com fluxo próprio do bloco.
+    """
+    return GeradorLoteria(seed=random.Random(f"{seed}:{indice}").getrandbits(63))
+
+
+def _selecionar_bloco(
+    tipo: str,
+    k: int,
+    candidatos: int,
+    seed: int,
+    indice: int,
+    pontuador: Optional[Callable[[GameResult], float]],
+    config: Optional[dict] = None,
+) -> List[Item]:
+    """
+    Gerar um bloco de candidatos e manter os K melhores em um heap mínimo.
+
+    Cada bloco tem seu próprio gerador derivado de (seed, indice), então o
+    resultado independe de quantos processos participam.
+
+    Returns:
+        Até K itens (score, desempate, números), sem ordem definida.
+    """
+    gerador = gerador_bloco(seed, indice)
+    desempate = random.Random(f"{seed}:{indice}:desempate").random
+    pontuar_numeros = PontuadorPadrao(tipo, config) if pontuador is None else None
+
+    heap: List[Item] = []
+    for numeros in gerador.gerar_combinacoes(tipo, candidatos, config):
+        if pontuar_numeros is not None:
+            score = pontuar_numeros(numeros)
+        else:
+            score = pontuador(gerador.criar_resultado(tipo, numeros, config))
+        if len(heap) < k:
+            heapq.heappush(heap, (score, desempate(), numeros))
+        elif score >= heap[0][0]:
+            item = (score, desempate(), numeros)
+            if item > heap[0]:
+                heapq.heapreplace(heap, item)
+    return heap
+
+
+def selecionar_melhores(
+    tipo: str,
+    k: int,
+    candidatos: int,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    tamanho_bloco: int = 50_000,
+    pontuador: Optional[Callable[[GameResult], float]] = None,
+    config: Optional[dict] = None,
+) -> ResultadoSelecao:
+    """
+    Avaliar `candidatos` jogos válidos e devolver os K de maior score.
+
+    Os candidatos são gerados e pontuados em blocos (um gerador por bloco,
+    derivado da seed) distribuídos em um pool de processos; cada bloco
+    mantém só um heap de tamanho K, e os heaps são mesclados em ordem de
+    bloco. Memória O(K) por bloco em andamento. Empates de score são
+    desfeitos por um sorteio reprodutível.
+
+    Args:
+        tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+        k: Quantidade de jogos retornados.
+        candidatos: Quantidade de jogos válidos avaliados.
+        seed: Semente da seleção (None para sorteá-la).
+        workers: Processos do pool (1 executa no processo atual; padrão:
+            um por CPU).
+        tamanho_bloco: Candidatos por bloco.
+        pontuador: Função GameResult -> score (padrão: o score de
+            calcular_score_probabilidade, calculado sem montar GameResult).
+            Com mais de um processo deve ser uma função de nível de módulo.
+        config: Configuração com outras restrições (padrão:
+            LOTTERY_CONFIG[tipo]).
+
+    Returns:
+        ResultadoSelecao com os jogos em ordem decrescente de score.
+
+    Raises:
+        ValueError: Se tipo de loteria não for reconhecido, se a configuração
+            for inviável ou se k/candidatos não forem positivos.
+    """
+    if tipo not in LOTTERY_CONFIG:
+        raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+    if k <= 0 or candidatos <= 0:
+        raise ValueError("k e candidatos devem ser positivos")
+
+    seed = random.randrange(2**63) if seed is None else seed
+    total_blocos = -(-candidatos // tamanho_bloco)
+    tamanhos = [
+        min(tamanho_bloco, candidatos - i * tamanho_bloco) for i in range(total_blocos)
+    ]
+    argumentos = [
+        (tipo, k, qtd, seed, i, pontuador, config) for i, qtd in enumerate(tamanhos)
+    ]
+
+    melhores: List[Item] = []
+
+    def mesclar(parcial: List[Item]) -> None:
+        nonlocal melhores
+        melhores = heapq.nlargest(k, melhores + parcial)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or total_blocos == 1:
+        for args in argumentos:
+            mesclar(_selecionar_bloco(*args))
+    else:
+        contexto = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=min(workers, total_blocos), mp_context=contexto
+        ) as pool:
+            # map devolve na ordem dos blocos: resultado reprodutível
+            for parcial in pool.map(_selecionar_bloco, *zip(*argumentos)):
+                mesclar(parcial)
+
+    melhores.sort(reverse=True)
+    gerador = GeradorLoteria(seed=seed)
+    return ResultadoSelecao(
+        tipo=tipo,
+        jogos=[
+            gerador.criar_resultado(tipo, numeros, config) for _, _, numeros in melhores
+        ],
+        scores=[score for score, _, _ in melhores],
+        candidatos=candidatos,
+        seed=seed,
+        blocos=total_blocos,
+    )
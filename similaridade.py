@@ -0,0 +1,157 @@
+"""
+Busca dos sorteios históricos mais parecidos com um jogo (mais números em
+comum, ou seja, menor distância de Hamming entre as máscaras de bits).
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence
+
+
+@dataclass
+class SorteioSemelhante:
+    """Sorteio histórico próximo de um jogo."""
+
+    concurso: int
+    numeros: List[int]
+    em_comum: int
+    distancia: int  # Hamming entre as máscaras: |a| + |b| - 2 * em_comum
+
+    def to_dict(self) -> dict:
+        """Converter para dicionário (compatível com pandas.DataFrame)."""
+        return {
+            "concurso": self.concurso,
+            "numeros": self.numeros,
+            "em_comum": self.em_comum,
+            "distancia": self.distancia,
+        }
+
+
+class IndiceHistorico:
+    """
+    Índice transposto dos sorteios para contar números em comum com todos
+    os sorteios de uma vez.
+
+    Para cada número n guarda um inteiro com o bit i ligado se o sorteio i
+    contém n. A quantidade de números em comum entre um jogo e cada sorteio
+    é a soma das colunas dos números do jogo, feita com um somador
+    bit-sliced sobre esses inteiros: cada operação processa todos os
+    sorteios de uma vez (SWAR), e o jogo custa O(k * log k) operações de
+    inteiros longos em vez de um laço Python por sorteio.
+    """
+
+    def __init__(
+        self,
+        sorteios: Sequence[List[int]],
+        concursos: Optional[Sequence[int]] = None,
+    ):
+        """
+        Montar o índice.
+
+        Args:
+            sorteios: Números de cada sorteio, em ordem cronológica.
+            concursos: Número de cada concurso (padrão: 1, 2, 3...).
+
+        Raises:
+            ValueError: Se concursos e sorteios tiverem tamanhos diferentes.
+        """
+        if concursos is None:
+            concursos = range(1, len(sorteios) + 1)
+        if len(concursos) != len(sorteios):
+            raise ValueError("concursos e sorteios devem ter o mesmo tamanho")
+        self.sorteios = [sorted(s) for s in sorteios]
+        self.concursos = list(concursos)
+        self._todos = (1 << len(self.sorteios)) - 1
+        maior = max((s[-1] for s in self.sorteios if s), default=0)
+        self._colunas = [0] * (maior + 1)
+        for i, sorteio in enumerate(self.sorteios):
+            bit = 1 << i
+            for n in sorteio:
+                self._colunas[n] |= bit
+
+    def __len__(self) -> int:
+        return len(self.sorteios)
+
+    def _fatias(self, numeros: List[int]) -> List[int]:
+        """Contagem de números em comum por sorteio, em fatias de bits."""
+        fatias: List[int] = []
+        colunas = self._colunas
+        for n in numeros:
+            if n >= len(colunas):
+                continue
+            vai = colunas[n]
+            for j, fatia in enumerate(fatias):
+                if not vai:
+                    break
+                fatias[j], vai = fatia ^ vai, fatia & vai
+            if vai:
+                fatias.append(vai)
+        return fatias
+
+    def contagens(self, numeros: List[int]) -> List[int]:
+        """
+        Números em comum entre um jogo e cada sorteio.
+
+        Args:
+            numeros: Números do jogo.
+
+        Returns:
+            Lista alinhada com os sorteios do índice.
+        """
+        fatias = self._fatias(numeros)
+        return [
+            sum(((fatia >> i) & 1) << j for j, fatia in enumerate(fatias))
+            for i in range(len(self.sorteios))
+        ]
+
+    def mais_proximos(self, numeros: List[int], k: int = 3) -> List[SorteioSemelhante]:
+        """
+        Sorteios com mais números em comum com um jogo.
+
+        Percorre as contagens possíveis da maior para a menor e só extrai os
+        sorteios do nível em que o top-k se completa. Empates ficam com os
+        sorteios mais recentes.
+
+        Args:
+            numeros: Números do jogo.
+            k: Quantidade de sorteios retornados.
+
+        Returns:
+            Até k sorteios, do mais parecido para o menos parecido.
+        """
+        fatias = self._fatias(numeros)
+        resultado: List[SorteioSemelhante] = []
+        for contagem in range((1 << len(fatias)) - 1, -1, -1):
+            if len(resultado) >= k:
+                break
+            # Sorteios cuja contagem tem exatamente estes bits
+            mascara = self._todos
+            for j, fatia in enumerate(fatias):
+                mascara &= fatia if contagem >> j & 1 else ~fatia
+            while mascara and len(resultado) < k:
+                i = mascara.bit_length() - 1
+                mascara ^= 1 << i
+                sorteio = self.sorteios[i]
+                resultado.append(
+                    SorteioSemelhante(
+                        concurso=self.concursos[i],
+                        numeros=sorteio,
+                        em_comum=contagem,
+                        distancia=len(numeros) + len(sorteio) - 2 * contagem,
+                    )
+                )
+        return resultado
+
+    def mais_proximos_lote(
+        self, jogos: Iterable[List[int]], k: int = 3
+    ) -> List[List[SorteioSemelhante]]:
+        """
+        Aplicar mais_proximos a vários jogos.
+
+        Args:
+            jogos: Números de cada jogo.
+            k: Quantidade de sorteios por jogo.
+
+        Returns:
+            Lista com os sorteios mais parecidos de cada jogo.
+        """
+        return [self.mais_proximos(numeros, k) for numeros in jogos]
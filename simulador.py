@@ -0,0 +1,378 @@
+"""
+Simulação Monte Carlo de sorteios contra um conjunto de palpites.
+"""
+
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from math import comb, sqrt
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple
+
+from config import LOTTERY_CONFIG
+from core import empacotar_numeros
+from estendidos import tabela_premios
+
+# Tamanho padrão dos blocos: sorteios_max dividido em BLOCOS_PADRAO partes
+# (ao menos BLOCO_MINIMO sorteios), para a parada antecipada cortar trabalho
+# de verdade. Não depende de workers: o resultado de uma seed é o mesmo com
+# qualquer pool.
+BLOCOS_PADRAO = 64
+BLOCO_MINIMO = 1_000
+
+
+@dataclass
+class FaixaSimulada:
+    """Estimativa de uma faixa de premiação (quantidade de acertos)."""
+
+    acertos: int
+    nome: str
+    ocorrencias: int
+    media_por_sorteio: float
+    intervalo: Tuple[float, float]
+    media_exata: float
+
+    def to_dict(self) -> dict:
+        """Converter para dicionário (compatível com pandas.DataFrame)."""
+        return {
+            "faixa": self.nome,
+            "acertos": self.acertos,
+            "ocorrencias": self.ocorrencias,
+            "media_por_sorteio": self.media_por_sorteio,
+            "ic_inferior": self.intervalo[0],
+            "ic_superior": self.intervalo[1],
+            "media_exata": self.media_exata,
+        }
+
+
+@dataclass
+class ResultadoSimulacao:
+    """Resultado consolidado de uma simulação Monte Carlo."""
+
+    tipo: str
+    sorteios: int
+    faixas: List[FaixaSimulada]
+    prob_algum_premio: float
+    intervalo_algum_premio: Tuple[float, float]
+    convergiu: bool
+    retorno_esperado: Optional[float] = None
+    intervalo_retorno: Optional[Tuple[float, float]] = None
+    seed: Optional[int] = None
+    blocos: int = 0
+
+
+def _qtd_sorteados(config: dict) -> int:
+    """Quantidade de números sorteados por concurso."""
+    return config.get("qtd_sorteados", config["qtd_selecionados"])
+
+
+def _sorteios_por_concurso(config: dict) -> int:
+    """Quantidade de sorteios independentes por concurso (Dupla Sena: 2)."""
+    return config.get("sorteios_por_concurso", 1)
+
+
+def media_exata_acertos(tipo: str, tamanho: int, acertos: int) -> float:
+    """
+    Quantidade esperada, por sorteio, de jogos de um palpite com `acertos`
+    acertos (hipergeométrica).
+
+    Um palpite estendido (mais números que qtd_selecionados, ver
+    estendidos.py) conta cada sub-jogo de qtd_selecionados números: a média
+    é C(tamanho, qtd_selecionados) vezes a de um jogo simples.
+
+    Args:
+        tipo: Tipo de loteria.
+        tamanho: Quantidade de números do palpite.
+        acertos: Quantidade de acertos.
+
+    Returns:
+        Média por sorteio (probabilidade, para palpites simples).
+    """
+    config = LOTTERY_CONFIG[tipo]
+    total = config["max_numero"]
+    sorteados = _qtd_sorteados(config)
+    k = config["qtd_selecionados"]
+    subjogos = comb(tamanho, k) if tamanho > k else 1
+    k = min(tamanho, k)
+    return (
+        subjogos
+        * comb(k, acertos)
+        * comb(total - k, sorteados - acertos)
+        / comb(total, sorteados)
+    )
+
+
+def _simular_bloco(
+    tipo: str,
+    mascaras: List[int],
+    faixas: List[int],
+    valores: List[float],
+    sorteios: int,
+    seed: int,
+    indice: int,
+) -> Tuple[int, List[int], List[int], int, float, float]:
+    """
+    Simular um bloco de sorteios (executado em um processo do pool).
+
+    Cada bloco tem seu próprio gerador derivado de (seed, indice), então o
+    resultado independe de quantos processos participam. Palpites
+    estendidos são conferidos como os simples (uma contagem de bits) e
+    agrupados por tamanho; os acertos viram sub-jogos premiados por faixa
+    uma vez por sorteio, pela tabela de estendidos.tabela_premios.
+
+    Returns:
+        Tupla (sorteios, soma por faixa, soma dos quadrados por faixa,
+        sorteios com algum prêmio, soma do retorno, soma dos quadrados
+        do retorno).
+    """
+    config = LOTTERY_CONFIG[tipo]
+    rng = random.Random(f"{seed}:{indice}")
+    populacao = range(1, config["max_numero"] + 1)
+    sorteados = _qtd_sorteados(config)
+    por_concurso = range(_sorteios_por_concurso(config))
+    bits = [1 << n for n in range(config["max_numero"] + 1)]
+    amostrar = rng.sample
+    posicoes = list(enumerate(faixas))
+
+    # Palpites estendidos por tamanho: (máscaras, acertos por palpite, tabela)
+    k = config["qtd_selecionados"]
+    por_tamanho: Dict[int, List[int]] = {}
+    for mascara in mascaras:
+        tamanho = mascara.bit_count()
+        if tamanho > k:
+            por_tamanho.setdefault(tamanho, []).append(mascara)
+    simples = [m for m in mascaras if m.bit_count() <= k]
+    estendidos = [
+        (grupo, [0] * (min(tamanho, sorteados) + 1), tabela_premios(tipo, tamanho))
+        for tamanho, grupo in por_tamanho.items()
+    ]
+
+    somas = [0] * len(faixas)
+    quadrados = [0] * len(faixas)
+    premiados = 0
+    retorno = 0.0
+    retorno2 = 0.0
+    contagem = [0] * (sorteados + 1)
+
+    for _ in range(sorteios):
+        for i in range(len(contagem)):
+            contagem[i] = 0
+        # Concursos com vários sorteios premiam cada sorteio separadamente
+        for _ in por_concurso:
+            sorteio = 0
+            for n in amostrar(populacao, sorteados):
+                sorteio |= bits[n]
+            for mascara in simples:
+                contagem[(sorteio & mascara).bit_count()] += 1
+            for grupo, por_acertos, tabela in estendidos:
+                for mascara in grupo:
+                    por_acertos[(sorteio & mascara).bit_count()] += 1
+                for acertos, palpites in enumerate(por_acertos):
+                    if palpites:
+                        for faixa, subjogos in tabela[acertos]:
+                            contagem[faixa] += palpites * subjogos
+                        por_acertos[acertos] = 0
+
+        valor = 0.0
+        algum = False
+        for i, acertos in posicoes:
+            c = contagem[acertos]
+            if c:
+                somas[i] += c
+                quadrados[i] += c * c
+                valor += c * valores[i]
+                algum = True
+        premiados += algum
+        retorno += valor
+        retorno2 += valor * valor
+
+    return sorteios, somas, quadrados, premiados, retorno, retorno2
+
+
+def _intervalo_media(
+    soma: float, quadrados: float, n: int, z: float
+) -> Tuple[float, float, float]:
+    """Média e intervalo de confiança normal a partir de somas acumuladas."""
+    media = soma / n
+    variancia = max(0.0, quadrados / n - media * media)
+    meia = z * sqrt(variancia / n) if n > 1 else float("inf")
+    return media, max(0.0, media - meia), media + meia
+
+
+def _intervalo_wilson(sucessos: int, n: int, z: float) -> Tuple[float, float]:
+    """Intervalo de Wilson para uma proporção."""
+    if n == 0:
+        return 0.0, 1.0
+    p = sucessos / n
+    denominador = 1 + z * z / n
+    centro = (p + z * z / (2 * n)) / denominador
+    meia = z * sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominador
+    return max(0.0, centro - meia), min(1.0, centro + meia)
+
+
+def simular(
+    tipo: str,
+    jogos: List[List[int]],
+    sorteios_max: int = 1_000_000,
+    precisao: float = 0.02,
+    confianca: float = 0.95,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    tamanho_bloco: Optional[int] = None,
+    premios: Optional[Dict[int, float]] = None,
+) -> ResultadoSimulacao:
+    """
+    Estimar a distribuição de prêmios de um conjunto de palpites.
+
+    Sorteios são simulados em blocos (um gerador por bloco, derivado da
+    seed) e distribuídos em um pool de processos, que recebe poucos blocos
+    além dos que está executando. Os blocos são consolidados em ordem e a
+    simulação para assim que a meia-largura relativa do
+    intervalo de confiança fica abaixo de `precisao` em todas as faixas
+    estimáveis — aquelas com pelo menos 30 ocorrências esperadas dentro de
+    `sorteios_max`. Faixas raras demais (ex.: a sena) não seguram a parada.
+
+    Cada "sorteio" simulado é um concurso: em loterias com
+    sorteios_por_concurso (Dupla Sena) os prêmios dos sorteios do concurso
+    são somados.
+
+    Args:
+        tipo: Tipo de loteria (chave de LOTTERY_CONFIG).
+        jogos: Palpites a avaliar (listas de números).
+        sorteios_max: Limite de sorteios simulados.
+        precisao: Meia-largura relativa desejada para o intervalo.
+        confianca: Nível de confiança dos intervalos.
+        seed: Semente da simulação (None para sorteá-la).
+        workers: Processos do pool (1 executa no processo atual; padrão:
+            um por CPU).
+        tamanho_bloco: Sorteios por bloco (padrão: sorteios_max /
+            BLOCOS_PADRAO, com ao menos BLOCO_MINIMO).
+        premios: Valor do prêmio por faixa (acertos -> valor), para o
+            retorno esperado por sorteio.
+
+    Returns:
+        ResultadoSimulacao com frequências, intervalos e retorno esperado.
+
+    Raises:
+        ValueError: Se tipo de loteria não for reconhecido ou não houver jogos.
+    """
+    if tipo not in LOTTERY_CONFIG:
+        raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+    if not jogos:
+        raise ValueError("Nenhum jogo para simular")
+
+    config = LOTTERY_CONFIG[tipo]
+    nomes = config["faixas_premio"]
+    faixas = sorted(nomes, reverse=True)
+    mascaras = [empacotar_numeros(j) for j in jogos]
+    seed = random.randrange(2**63) if seed is None else seed
+    z = NormalDist().inv_cdf(0.5 + confianca / 2)
+
+    por_concurso = _sorteios_por_concurso(config)
+    medias_exatas = [
+        por_concurso * sum(media_exata_acertos(tipo, len(j), acertos) for j in jogos)
+        for acertos in faixas
+    ]
+    estimaveis = [i for i, m in enumerate(medias_exatas) if m * sorteios_max >= 30]
+
+    if tamanho_bloco is None:
+        tamanho_bloco = max(BLOCO_MINIMO, sorteios_max // BLOCOS_PADRAO)
+    total_blocos = -(-sorteios_max // tamanho_bloco)
+    tamanhos = [
+        min(tamanho_bloco, sorteios_max - i * tamanho_bloco)
+        for i in range(total_blocos)
+    ]
+
+    valores = [float((premios or {}).get(a, 0.0)) for a in faixas]
+
+    n = 0
+    retorno = 0.0
+    retorno2 = 0.0
+    somas = [0] * len(faixas)
+    quadrados = [0] * len(faixas)
+    premiados = 0
+    blocos = 0
+    convergiu = False
+
+    def consolidar(parcial: tuple) -> bool:
+        nonlocal n, premiados, blocos, retorno, retorno2
+        qtd, s, q, p, r, r2 = parcial
+        n += qtd
+        premiados += p
+        retorno += r
+        retorno2 += r2
+        blocos += 1
+        for i in range(len(faixas)):
+            somas[i] += s[i]
+            quadrados[i] += q[i]
+        if not estimaveis:
+            return False
+        for i in estimaveis:
+            media, _, superior = _intervalo_media(somas[i], quadrados[i], n, z)
+            if media == 0 or (superior - media) / media > precisao:
+                return False
+        return True
+
+    args = (tipo, mascaras, faixas, valores)
+    if workers == 1:
+        for indice, qtd in enumerate(tamanhos):
+            if consolidar(_simular_bloco(*args, qtd, seed, indice)):
+                convergiu = True
+                break
+    else:
+        contexto = multiprocessing.get_context("spawn")
+        workers = min(workers or os.cpu_count() or 1, total_blocos)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=contexto) as pool:
+            # Um bloco na fila além dos em execução: nenhum processo fica
+            # parado e, na convergência, sobra pouco trabalho a descartar
+            janela = workers + 1
+            pendentes = []
+            proximo = 0
+            while proximo < total_blocos or pendentes:
+                while proximo < total_blocos and len(pendentes) < janela:
+                    pendentes.append(
+                        pool.submit(
+                            _simular_bloco, *args, tamanhos[proximo], seed, proximo
+                        )
+                    )
+                    proximo += 1
+                # Consolidar sempre em ordem de bloco: resultado reprodutível
+                if consolidar(pendentes.pop(0).result()):
+                    convergiu = True
+                    for futuro in pendentes:
+                        futuro.cancel()
+                    break
+
+    resultado_faixas = []
+    for i, acertos in enumerate(faixas):
+        media, inferior, superior = _intervalo_media(somas[i], quadrados[i], n, z)
+        resultado_faixas.append(
+            FaixaSimulada(
+                acertos=acertos,
+                nome=nomes[acertos],
+                ocorrencias=somas[i],
+                media_por_sorteio=media,
+                intervalo=(inferior, superior),
+                media_exata=medias_exatas[i],
+            )
+        )
+
+    resultado = ResultadoSimulacao(
+        tipo=tipo,
+        sorteios=n,
+        faixas=resultado_faixas,
+        prob_algum_premio=premiados / n,
+        intervalo_algum_premio=_intervalo_wilson(premiados, n, z),
+        convergiu=convergiu,
+        seed=seed,
+        blocos=blocos,
+    )
+
+    if premios:
+        media, inferior, superior = _intervalo_media(retorno, retorno2, n, z)
+        resultado.retorno_esperado = media
+        resultado.intervalo_retorno = (inferior, superior)
+
+    return resultado
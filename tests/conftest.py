@@ -0,0 +1,30 @@
+"""
+Configuração compartilhada dos testes.
+"""
+
+import pytest
+
+import faixas
+import viabilidade
+from precomputo import cache_padrao
+
+
+def _limpar_caches() -> None:
+    """Descartar os caches em memória ligados ao cache de pré-cálculo."""
+    cache_padrao.cache_clear()
+    viabilidade._contador_configurado.cache_clear()
+    viabilidade._contador_avulso.cache_clear()
+    faixas._TABELAS.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def precomputo_temporario(tmp_path_factory):
+    """
+    Gravar as tabelas pré-calculadas num diretório temporário da sessão de
+    testes, e não no cache real (LOTOPRO_PRECOMPUTO).
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("LOTOPRO_PRECOMPUTO", str(tmp_path_factory.mktemp("precomputo")))
+        _limpar_caches()
+        yield
+        _limpar_caches()
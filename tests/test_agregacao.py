@@ -0,0 +1,101 @@
+"""
+Testes unitários para o módulo agregacao.py
+"""
+
+import pytest
+
+from agregacao import agregar, faixa_soma, resumo_graficos
+from config import FIBONACCI, PRIMOS
+from core import GeradorLoteria
+
+
+class TestAgregadoLote:
+    """Testes para AgregadoLote."""
+
+    def test_contagens_conferem_com_jogos(self):
+        """Testar que os agregados batem com as estatísticas de cada jogo."""
+        jogos = GeradorLoteria(seed=5).gerar_jogos("Mega-Sena", 200)
+        agregado = agregar("Mega-Sena", jogos)
+
+        assert agregado.total == 200
+        assert sum(agregado.histograma_soma) == 200
+        assert agregado.media_soma == pytest.approx(sum(j.soma for j in jogos) / 200)
+        assert agregado.media_pares == pytest.approx(sum(j.pares for j in jogos) / 200)
+        assert agregado.media_pares + agregado.media_impares == pytest.approx(6)
+        assert sum(i * c for i, c in enumerate(agregado.primos)) == sum(
+            sum(1 for x in j.numeros if x in PRIMOS) for j in jogos
+        )
+        assert sum(i * c for i, c in enumerate(agregado.fibo)) == sum(
+            sum(1 for x in j.numeros if x in FIBONACCI) for j in jogos
+        )
+        assert sum(agregado.frequencia) == 200 * 6
+
+    def test_mesclar_equivale_a_lote_unico(self):
+        """Testar que mesclar dois agregados equivale a agregar tudo junto."""
+        jogos = GeradorLoteria(seed=6).gerar_jogos("Quina", 60)
+        parcial = agregar("Quina", jogos[:25]).mesclar(agregar("Quina", jogos[25:]))
+        assert parcial == agregar("Quina", jogos)
+
+    def test_mesclar_loterias_diferentes(self):
+        """Testar erro ao mesclar agregados de loterias diferentes."""
+        with pytest.raises(ValueError):
+            agregar("Quina", []).mesclar(agregar("Mega-Sena", []))
+
+    def test_apostas_estendidas(self):
+        """Testar agregados de um lote com apostas simples e estendidas."""
+        gerador = GeradorLoteria(seed=9)
+        simples = gerador.gerar_jogos("Mega-Sena", 20)
+        estendidas = gerador.gerar_jogos_estendidos("Mega-Sena", 10, 15)
+        jogos = simples + estendidas
+        agregado = agregar("Mega-Sena", jogos)
+        assert agregado.largura_bin == agregar("Mega-Sena", simples).largura_bin
+        assert sum(agregado.histograma_soma) == 30
+        assert agregado.media_soma == pytest.approx(sum(j.soma for j in jogos) / 30)
+        assert agregado.media_pares + agregado.media_impares == pytest.approx(
+            (20 * 6 + 10 * 15) / 30
+        )
+        assert len(agregado.pares) == 16
+        parcial = agregar("Mega-Sena", simples).mesclar(
+            agregar("Mega-Sena", estendidas)
+        )
+        assert parcial == agregado
+        with pytest.raises(ValueError, match="tamanhos de aposta"):
+            agregar("Mega-Sena", [*simples, gerador.gerar_jogos("Quina", 1)[0]])
+
+    def test_bins_soma(self):
+        """Testar que os bins cobrem todas as somas do lote."""
+        jogos = GeradorLoteria(seed=7).gerar_jogos("Lotofácil", 100)
+        agregado = agregar("Lotofácil", jogos)
+        inicios, contagens = agregado.bins_soma()
+        assert sum(contagens) == 100
+        assert inicios[0] <= min(j.soma for j in jogos)
+        assert inicios[-1] + agregado.largura_bin > max(j.soma for j in jogos)
+        minima, maxima = faixa_soma("Lotofácil")
+        assert minima <= inicios[0] and inicios[-1] <= maxima
+
+    def test_grade_frequencia(self):
+        """Testar o formato da grade de frequência (volante)."""
+        jogos = GeradorLoteria(seed=8).gerar_jogos("Lotofácil", 10)
+        grade = agregar("Lotofácil", jogos).grade_frequencia(colunas=5)
+        assert len(grade) == 5 and all(len(linha) == 5 for linha in grade)
+        assert sum(map(sum, grade)) == 10 * 15
+
+    def test_resumo_graficos_hasheavel(self):
+        """Testar que o resumo dos gráficos é hasheável (chave de cache)."""
+        jogos = GeradorLoteria(seed=9).gerar_jogos("Mega-Sena", 30)
+        resumo = resumo_graficos(agregar("Mega-Sena", jogos))
+        assert {"soma", "paridade", "frequencia"} <= set(resumo)
+        hash(tuple(resumo.values()))
+        assert len(resumo["frequencia"]) == 6
+
+    def test_lote_vazio(self):
+        """Testar agregados de um lote vazio."""
+        agregado = agregar("Quina", [])
+        assert agregado.total == 0
+        assert agregado.media_soma == 0.0
+        assert agregado.bins_soma() == ([], [])
+
+    def test_loteria_invalida(self):
+        """Testar erro para loteria desconhecida."""
+        with pytest.raises(ValueError):
+            agregar("Loteria Inexistente", [])
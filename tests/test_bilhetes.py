@@ -0,0 +1,189 @@
+"""
+Testes unitários para o módulo bilhetes.py
+"""
+
+import io
+
+import pytest
+
+from bilhetes import (
+    EscritorBilhetes,
+    LeitorBilhetes,
+    acrescentar_bilhetes,
+    gravar_bilhetes,
+)
+from core import GeradorLoteria
+from exportacao import gerar_lotobin
+
+
+def _conferir(jogos, sorteio):
+    """Contagem de acertos por jogo, calculada direto dos números."""
+    contagem = [0] * (len(sorteio) + 1)
+    for jogo in jogos:
+        contagem[len(set(jogo) & set(sorteio))] += 1
+    return contagem
+
+
+class TestBilhetes:
+    """Testes para o formato .lotobin."""
+
+    @pytest.mark.parametrize("tipo", ["Mega-Sena", "Lotofácil", "Lotomania"])
+    def test_ida_e_volta(self, tmp_path, tipo):
+        """Testar gravação e leitura (máscaras de uma e de duas palavras)."""
+        jogos = list(GeradorLoteria(seed=1).gerar_combinacoes(tipo, 50))
+        caminho = str(tmp_path / "jogos.lotobin")
+        assert gravar_bilhetes(caminho, tipo, jogos, seed=1) == 50
+
+        with LeitorBilhetes(caminho) as leitor:
+            assert leitor.loteria == tipo
+            assert leitor.seed == 1
+            assert len(leitor) == 50
+            assert list(leitor) == jogos
+            assert leitor.numeros(7) == jogos[7]
+            soma = leitor.coluna("soma")
+            assert list(soma) == [sum(j) for j in jogos]
+            soma.release()
+
+    @pytest.mark.parametrize("tipo", ["Quina", "Lotomania"])
+    def test_contar_acertos(self, tmp_path, tipo):
+        """Testar a conferência contra um sorteio."""
+        jogos = list(GeradorLoteria(seed=2).gerar_combinacoes(tipo, 200))
+        sorteio = list(range(1, 101, 5))[:20] if tipo == "Lotomania" else jogos[0]
+        caminho = str(tmp_path / "jogos.lotobin")
+        gravar_bilhetes(caminho, tipo, jogos)
+        with LeitorBilhetes(caminho) as leitor:
+            assert leitor.contar_acertos(sorteio) == _conferir(jogos, sorteio)
+
+    def test_colunas_e_csv(self, tmp_path):
+        """Testar colunas padrão da Lotofácil e a conversão para CSV."""
+        jogos = GeradorLoteria(seed=3).gerar_jogos("Lotofácil", 10)
+        caminho = str(tmp_path / "jogos.lotobin")
+        gravar_bilhetes(caminho, "Lotofácil", (j.numeros for j in jogos))
+        with LeitorBilhetes(caminho) as leitor:
+            assert leitor.colunas == ["soma", "pares", "primos", "fibo"]
+            primos = leitor.coluna("primos")
+            assert list(primos) == [j.primos for j in jogos]
+            primos.release()
+            with pytest.raises(KeyError):
+                leitor.coluna("inexistente")
+            destino = io.StringIO()
+            assert leitor.para_csv(destino) == 10
+            recuperados = [j.numeros for j in leitor.jogos()]
+        linhas = destino.getvalue().splitlines()
+        assert linhas[0].startswith("n1,n2,")
+        assert linhas[1].split(",")[:15] == [str(n) for n in jogos[0].numeros]
+        assert recuperados == [j.numeros for j in jogos]
+
+    @pytest.mark.parametrize("tipo", ["Timemania", "Dia de Sorte"])
+    def test_extras_ida_e_volta(self, tmp_path, tipo):
+        """Testar que os sorteios extras voltam do arquivo, sem novo sorteio."""
+        jogos = GeradorLoteria(seed=4).gerar_jogos(tipo, 30)
+        caminho = tmp_path / "jogos.lotobin"
+        caminho.write_bytes(gerar_lotobin(tipo, jogos))
+        with LeitorBilhetes(str(caminho)) as leitor:
+            assert list(leitor.jogos()) == jogos
+            destino = io.StringIO()
+            leitor.para_csv(destino)
+        cabecalho, primeira = destino.getvalue().splitlines()[:2]
+        nome = next(iter(jogos[0].extras))
+        assert cabecalho.endswith(nome)
+        assert primeira.endswith(str(jogos[0].extras[nome]))
+
+    def test_extras_ausentes(self, tmp_path):
+        """Testar jogos gravados sem extras numa loteria que os tem."""
+        caminho = str(tmp_path / "jogos.lotobin")
+        jogos = list(GeradorLoteria(seed=4).gerar_combinacoes("Timemania", 5))
+        gravar_bilhetes(caminho, "Timemania", jogos)
+        with LeitorBilhetes(caminho) as leitor:
+            assert leitor.extras(0) is None
+            assert all(j.extras is None for j in leitor.jogos())
+        with pytest.raises(ValueError):
+            EscritorBilhetes(io.BytesIO(), "Timemania").adicionar(
+                jogos[0], extras={"Time do Coração": 81}
+            )
+
+    def test_csv_apostas_estendidas(self, tmp_path):
+        """Testar o CSV de jogos com mais números que o volante simples."""
+        jogos = [
+            j.numeros
+            for j in GeradorLoteria(seed=1).gerar_jogos_estendidos("Mega-Sena", 3, 8)
+        ] + [[1, 2, 3, 4, 5, 6]]
+        caminho = str(tmp_path / "jogos.lotobin")
+        gravar_bilhetes(caminho, "Mega-Sena", jogos)
+        with LeitorBilhetes(caminho) as leitor:
+            destino = io.StringIO()
+            leitor.para_csv(destino)
+        linhas = [linha.split(",") for linha in destino.getvalue().splitlines()]
+        assert linhas[0][:9] == [f"n{i}" for i in range(1, 9)] + ["soma"]
+        assert linhas[1][:8] == [str(n) for n in jogos[0]]
+        assert linhas[4][:9] == ["1", "2", "3", "4", "5", "6", "", "", "21"]
+
+    @pytest.mark.parametrize("tipo", ["Timemania", "Lotomania"])
+    def test_acrescentar(self, tmp_path, tipo):
+        """Testar que acrescentar dá o mesmo arquivo que gravar tudo de uma vez."""
+        jogos = list(GeradorLoteria(seed=6).gerar_combinacoes(tipo, 30))
+        registros = [(numeros, 100 + i) for i, numeros in enumerate(jogos)]
+
+        def gravar(caminho, parte, metadados):
+            with open(caminho, "wb") as f, EscritorBilhetes(
+                f,
+                tipo,
+                colunas=["concurso", "soma"],
+                criado_em=1.0,
+                metadados=metadados,
+                reserva_cabecalho=64,
+            ) as escritor:
+                for numeros, concurso in parte:
+                    escritor.adicionar(numeros, concurso)
+
+        caminho, inteiro = tmp_path / "parcial.lotobin", tmp_path / "inteiro.lotobin"
+        gravar(caminho, registros[:20], {"ultimo": 119})
+        gravar(inteiro, registros, {"ultimo": 129})
+        total = acrescentar_bilhetes(str(caminho), registros[20:], {"ultimo": 129})
+        assert total == 30
+        assert caminho.read_bytes() == inteiro.read_bytes()
+        with LeitorBilhetes(str(caminho)) as leitor:
+            assert list(leitor) == jogos
+            assert leitor.metadados == {"ultimo": 129}
+
+    def test_acrescentar_sem_folga_ou_com_falha(self, tmp_path):
+        """Testar cabeçalho sem espaço e restauração do arquivo após erro."""
+        caminho = tmp_path / "jogos.lotobin"
+        gravar_bilhetes(str(caminho), "Quina", [[1, 2, 3, 4, 5]] * 10)
+        original = caminho.read_bytes()
+        assert acrescentar_bilhetes(str(caminho), [], {"x": "y" * 100}) is None
+        assert caminho.read_bytes() == original
+
+        def registros():
+            yield [6, 7, 8, 9, 10], 0
+            raise OSError("origem interrompida")
+
+        with pytest.raises(OSError):
+            acrescentar_bilhetes(str(caminho), registros())
+        assert caminho.read_bytes() == original
+
+    def test_escritor_em_memoria(self):
+        """Testar o escritor com um arquivo em memória e conjunto vazio."""
+        buffer = io.BytesIO()
+        with EscritorBilhetes(buffer, "Quina", colunas=[]) as escritor:
+            pass
+        assert escritor.quantidade == 0
+        assert buffer.getvalue().startswith(b"LOTOBIN\x00")
+
+    def test_erros(self, tmp_path):
+        """Testar loteria, coluna e arquivo inválidos."""
+        with pytest.raises(ValueError):
+            EscritorBilhetes(io.BytesIO(), "LoteriaBogus")
+        with pytest.raises(ValueError):
+            EscritorBilhetes(io.BytesIO(), "Quina", colunas=["media"])
+
+        invalido = tmp_path / "invalido.lotobin"
+        invalido.write_bytes(b"nao e lotobin" * 4)
+        with pytest.raises(ValueError):
+            LeitorBilhetes(str(invalido))
+
+        caminho = tmp_path / "truncado.lotobin"
+        gravar_bilhetes(str(caminho), "Quina", [[1, 2, 3, 4, 5]] * 10)
+        caminho.write_bytes(caminho.read_bytes()[:-40])
+        with pytest.raises(ValueError):
+            LeitorBilhetes(str(caminho))
@@ -0,0 +1,106 @@
+"""
+Testes unitários para o módulo cadeias.py
+"""
+
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from cadeias import AmostradorTrocas
+from config import LOTTERY_CONFIG
+from core import GeradorLoteria
+from viabilidade import Restricoes
+
+
+def _validos(restricoes, inicial):
+    """Todos os jogos válidos de um volante pequeno, por força bruta."""
+    amostrador = AmostradorTrocas(restricoes, [inicial], cadeias=1)
+    return [
+        list(jogo)
+        for jogo in combinations(range(1, restricoes.max_numero + 1), restricoes.qtd)
+        if amostrador.valido(jogo)
+    ]
+
+
+class TestAmostradorTrocas:
+    """Testes para AmostradorTrocas."""
+
+    def test_cobre_validos_uniformemente(self):
+        """Testar que as cadeias visitam todos os jogos válidos por igual."""
+        restricoes = Restricoes(
+            max_numero=10, qtd=3, soma=(12, 18), pares=(1, 2), evitar_sequencia=True
+        )
+        validos = _validos(restricoes, [2, 5, 9])
+        amostrador = AmostradorTrocas(
+            restricoes, [[2, 5, 9]], rng=random.Random(1), cadeias=4, desbaste=6
+        )
+        contagem = Counter(tuple(j) for j in amostrador.amostras(200 * len(validos)))
+        assert set(contagem) == {tuple(j) for j in validos}
+        assert min(contagem.values()) > 140 and max(contagem.values()) < 260
+        assert 0 < amostrador.taxa_aceitacao < 1
+
+    def test_sequencia_nas_bordas(self):
+        """Testar a sequência proibida perto do 1 e do último número."""
+        restricoes = Restricoes(max_numero=8, qtd=4, evitar_sequencia=True)
+        validos = {tuple(j) for j in _validos(restricoes, [1, 2, 4, 5])}
+        amostrador = AmostradorTrocas(
+            restricoes, [[1, 2, 4, 5]], rng=random.Random(2), desbaste=3
+        )
+        assert {tuple(j) for j in amostrador.amostras(3000)} == validos
+
+    def test_verificacoes(self):
+        """Testar restrições extras sobre a máscara de bits."""
+        restricoes = Restricoes.de_config(LOTTERY_CONFIG["Mega-Sena"])
+        # No máximo um número por dezena 1-10, 11-20, ...
+        dezenas = [sum(1 << n for n in range(d, d + 10)) for d in range(1, 61, 10)]
+        uma_por_dezena = lambda m: all((m & d).bit_count() <= 1 for d in dezenas)
+        amostrador = AmostradorTrocas(
+            restricoes,
+            [[3, 14, 25, 36, 47, 58]],
+            rng=random.Random(3),
+            verificacoes=[uma_por_dezena],
+        )
+        for jogo in amostrador.amostras(200):
+            assert len({(n - 1) // 10 for n in jogo}) == 6
+
+    def test_erros(self):
+        """Testar jogo inicial inválido e parâmetros inválidos."""
+        restricoes = Restricoes(max_numero=10, qtd=3, soma=(12, 18))
+        with pytest.raises(ValueError):
+            AmostradorTrocas(restricoes, [])
+        with pytest.raises(ValueError):
+            AmostradorTrocas(restricoes, [[1, 2, 3]])
+        with pytest.raises(ValueError):
+            AmostradorTrocas(restricoes, [[1, 5, 9]], cadeias=0)
+        with pytest.raises(ValueError):
+            AmostradorTrocas(restricoes, [[1, 5, 9]], desbaste=0)
+
+
+class TestGerarJogosMcmc:
+    """Testes para GeradorLoteria.gerar_jogos_mcmc."""
+
+    @pytest.mark.parametrize("tipo", list(LOTTERY_CONFIG))
+    def test_jogos_validos(self, tipo):
+        """Testar que todos os jogos atendem às restrições da loteria."""
+        gerador = GeradorLoteria(seed=4)
+        jogos = gerador.gerar_jogos_mcmc(tipo, 30)
+        config = LOTTERY_CONFIG[tipo]
+        assert len(jogos) == 30
+        for jogo in jogos:
+            assert len(jogo.numeros) == config["qtd_selecionados"]
+            assert gerador._validar_jogo(config, jogo.numeros)
+
+    def test_reproduzivel(self):
+        """Testar que a mesma semente gera os mesmos jogos."""
+        a = GeradorLoteria(seed=5).gerar_jogos_mcmc("Lotofácil", 10, cadeias=3)
+        b = GeradorLoteria(seed=5).gerar_jogos_mcmc("Lotofácil", 10, cadeias=3)
+        assert [j.numeros for j in a] == [j.numeros for j in b]
+
+    def test_sem_jogo_inicial(self):
+        """Testar erro quando nenhum candidato atende às verificações."""
+        with pytest.raises(ValueError):
+            GeradorLoteria(seed=6).gerar_jogos_mcmc(
+                "Quina", 5, verificacoes=[lambda m: False]
+            )
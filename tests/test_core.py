@@ -3,7 +3,42 @@ Testes unitários para o módulo core.py
 """
 
 import pytest
-from core import AnalisadorEstatistico, GeradorLoteria, GameResult
+
+from config import LOTTERY_CONFIG
+from core import (
+    AnalisadorEstatistico,
+    GameResult,
+    GeradorLoteria,
+    desempacotar_numeros,
+    empacotar_numeros,
+    rank_combinacao,
+    unrank_combinacao,
+)
+
+
+class TestCombinacoes:
+    """Testes para máscaras de bits e rank de combinações."""
+
+    def test_empacotar_desempacotar(self):
+        """Testar ida e volta da máscara de bits."""
+        mascara = empacotar_numeros([1, 5, 60])
+        assert mascara == (1 << 1) | (1 << 5) | (1 << 60)
+        assert desempacotar_numeros(mascara) == [1, 5, 60]
+
+    def test_rank_extremos(self):
+        """Testar rank da primeira e da última combinação."""
+        assert rank_combinacao([1, 2, 3, 4, 5, 6]) == 0
+        assert rank_combinacao([55, 56, 57, 58, 59, 60]) == 50063860 - 1
+
+    def test_unrank_inverte_rank(self):
+        """Testar que unrank reconstrói todas as combinações de C(7, 3)."""
+        from itertools import combinations
+
+        for esperado, combo in enumerate(
+            sorted(combinations(range(1, 8), 3), key=lambda c: c[::-1])
+        ):
+            assert rank_combinacao(list(combo)) == esperado
+            assert unrank_combinacao(esperado, 3) == list(combo)
 
 
 class TestAnalisadorEstatistico:
@@ -65,6 +100,12 @@ class TestGeradorLoteria:
         assert all(1 <= n <= 60 for n in numeros)
         assert numeros == sorted(numeros)  # Deve estar ordenado
 
+    def test_seed_reproduz_jogos(self):
+        """Testar que a mesma semente gera os mesmos jogos."""
+        jogos_a = GeradorLoteria(seed=7).gerar_jogos("Quina", 5)
+        jogos_b = GeradorLoteria(seed=7).gerar_jogos("Quina", 5)
+        assert [j.numeros for j in jogos_a] == [j.numeros for j in jogos_b]
+
     def test_gerar_jogos_mega_sena(self):
         """Testar geração de jogos da Mega-Sena."""
         gerador = GeradorLoteria()
@@ -96,6 +137,82 @@ class TestGeradorLoteria:
             assert len(jogo.numeros) == 5
             assert 160 <= jogo.soma <= 240
 
+    def test_gerar_randomico_complemento(self):
+        """Testar a amostragem pelo complemento (metade ou mais do volante)."""
+        gerador = GeradorLoteria(seed=5)
+        numeros = gerador._gerar_randomico(100, 50)
+        assert len(numeros) == 50
+        assert len(set(numeros)) == 50
+        assert all(1 <= n <= 100 for n in numeros)
+        assert numeros == sorted(numeros)
+
+    def test_gerar_jogos_lotomania(self):
+        """Testar jogos da Lotomania (50 de 100, só restrição de pares)."""
+        jogos = GeradorLoteria(seed=6).gerar_jogos("Lotomania", 5)
+        for jogo in jogos:
+            assert len(set(jogo.numeros)) == 50
+            assert 22 <= jogo.pares <= 28
+            assert jogo.primos is None
+            assert jogo.extras is None
+
+    def test_sorteios_extras(self):
+        """Testar time do coração e mês da sorte no resultado e no to_dict."""
+        gerador = GeradorLoteria(seed=8)
+        for jogo in gerador.gerar_jogos("Timemania", 5):
+            assert 1 <= jogo.extras["Time do Coração"] <= 80
+            assert jogo.to_dict()["Time do Coração"] == jogo.extras["Time do Coração"]
+        meses = LOTTERY_CONFIG["Dia de Sorte"]["sorteios_extras"]["Mês da Sorte"]
+        for jogo in gerador.gerar_jogos("Dia de Sorte", 5):
+            assert jogo.extras["Mês da Sorte"] in meses
+
+    def test_validador_generico(self, monkeypatch):
+        """Testar que uma loteria nova só precisa de uma entrada na configuração."""
+        monkeypatch.setitem(
+            LOTTERY_CONFIG,
+            "Teste",
+            {
+                "max_numero": 20,
+                "qtd_selecionados": 4,
+                "range_soma": (30, 50),
+                "evitar_sequencia": True,
+                "max_tentativas": 10000,
+                "faixas_premio": {4: "Quadra"},
+            },
+        )
+        gerador = GeradorLoteria(seed=9)
+        config = LOTTERY_CONFIG["Teste"]
+        assert gerador._validar_jogo(config, [5, 8, 12, 15])
+        assert not gerador._validar_jogo(config, [1, 2, 3, 4])
+        assert not gerador._validar_jogo(config, [9, 10, 11, 20])
+        for jogo in gerador.gerar_jogos("Teste", 5):
+            assert 30 <= jogo.soma <= 50
+
+    def test_gerar_jogos_ponderados(self):
+        """Testar que números de peso 0 nunca saem e as restrições valem."""
+        pesos = [0.0] + [1.0 if n <= 40 else 0.0 for n in range(1, 61)]
+        jogos = GeradorLoteria(seed=10).gerar_jogos_ponderados("Mega-Sena", 20, pesos)
+        assert len(jogos) == 20
+        for jogo in jogos:
+            assert all(n <= 40 for n in jogo.numeros)
+            assert 140 <= jogo.soma <= 225
+            assert 2 <= jogo.pares <= 4
+
+    def test_amostragem_ponderada_favorece_peso(self):
+        """Testar que um número de peso maior sai com mais frequência."""
+        gerador = GeradorLoteria(seed=11)
+        pesos = [0.0, 10.0] + [1.0] * 9
+        saidas = sum(1 in gerador._amostrar_ponderado(pesos, 2) for _ in range(2000))
+        # P(1 entre 2 de 10 com peso 10 contra 9 de peso 1) ~ 0,8
+        assert saidas > 1400
+
+    def test_gerar_jogos_ponderados_erros(self):
+        """Testar pesos com tamanho errado ou poucos números positivos."""
+        gerador = GeradorLoteria()
+        with pytest.raises(ValueError):
+            gerador.gerar_jogos_ponderados("Quina", 1, [1.0] * 80)
+        with pytest.raises(ValueError):
+            gerador.gerar_jogos_ponderados("Quina", 1, [0.0] * 77 + [1.0] * 4)
+
     def test_gerar_jogos_tipo_invalido(self):
         """Testar erro com tipo de loteria inválido."""
         gerador = GeradorLoteria()
@@ -103,6 +220,68 @@ class TestGeradorLoteria:
             gerador.gerar_jogos("LoteriaBogus", 1)
 
 
+class TestGerarJogosComPrazo:
+    """Testes para a geração com prazo e continuação."""
+
+    @staticmethod
+    def _ate_concluir(tipo, quantidade, **kwargs):
+        """Gerar em partes com prazo zero, retomando em novos geradores."""
+        parcial = GeradorLoteria(seed=7).gerar_jogos_com_prazo(
+            tipo, quantidade, 0, **kwargs
+        )
+        partes = [parcial]
+        while not parcial.concluido:
+            parcial = GeradorLoteria().gerar_jogos_com_prazo(
+                tipo, quantidade, 0, parcial.continuacao, **kwargs
+            )
+            partes.append(parcial)
+        return partes
+
+    @pytest.mark.parametrize("tipo", ["Mega-Sena", "Lotofácil", "Dia de Sorte"])
+    def test_partes_iguais_a_gerar_jogos(self, tipo):
+        """Testar que as partes retomadas somam os mesmos jogos de gerar_jogos."""
+        partes = self._ate_concluir(tipo, 5)
+        assert len(partes) == 5
+        assert partes[-1].produzidos == 5
+        jogos = [j for p in partes for j in p.jogos]
+        assert jogos == GeradorLoteria(seed=7).gerar_jogos(tipo, 5)
+
+    def test_prazo_folgado_conclui(self):
+        """Testar que um prazo folgado gera tudo numa chamada só."""
+        parcial = GeradorLoteria(seed=1).gerar_jogos_com_prazo("Quina", 50, 60)
+        assert parcial.concluido
+        assert len(parcial.jogos) == parcial.produzidos == 50
+
+    def test_continuacao_de_outra_geracao(self):
+        """Testar recusa de continuação com loteria ou quantidade diferentes."""
+        gerador = GeradorLoteria(seed=1)
+        parcial = gerador.gerar_jogos_com_prazo("Quina", 10, 0)
+        with pytest.raises(ValueError, match="outra geração"):
+            gerador.gerar_jogos_com_prazo("Quina", 11, 0, parcial.continuacao)
+        with pytest.raises(ValueError, match="outra geração"):
+            gerador.gerar_jogos_com_prazo("Mega-Sena", 10, 0, parcial.continuacao)
+        config = {**LOTTERY_CONFIG["Quina"], "range_soma": (100, 250)}
+        with pytest.raises(ValueError, match="outra geração"):
+            gerador.gerar_jogos_com_prazo(
+                "Quina", 10, 0, parcial.continuacao, config=config
+            )
+
+    def test_distintos(self):
+        """Testar jogos distintos entre partes retomadas."""
+        partes = self._ate_concluir("Mega-Sena", 8, distintos=True)
+        mascaras = [j.mascara for p in partes for j in p.jogos]
+        assert len(mascaras) == len(set(mascaras)) == 8
+        assert str(mascaras[0]) in partes[0].continuacao
+
+    def test_distintos_acima_das_validas(self):
+        """Testar recusa de mais jogos distintos que combinações válidas."""
+        config = {**LOTTERY_CONFIG["Mega-Sena"], "range_soma": (21, 22)}
+        with pytest.raises(ValueError, match="combinações válidas"):
+            GeradorLoteria(seed=1).gerar_jogos_com_prazo(
+                "Mega-Sena", 3, 1, distintos=True, config=config
+            )
+
+
 class TestGameResult:
     """Testes para GameResult."""
 
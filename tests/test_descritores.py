@@ -0,0 +1,113 @@
+"""
+Testes unitários para o módulo descritores.py
+"""
+
+import json
+import pickle
+
+import pytest
+
+from config import LOTTERY_CONFIG
+from core import GeradorLoteria, empacotar_numeros
+from descritores import DescritorLote
+from exportacao import gerar_csv
+from padroes import calculadora
+
+
+class TestDescritorLote:
+    """Testes para o cálculo direto dos jogos de um lote."""
+
+    @pytest.mark.parametrize("tipo", list(LOTTERY_CONFIG))
+    def test_jogos_validos_e_deterministicos(self, tipo):
+        """Testar que os jogos atendem às restrições e dependem só do descritor."""
+        config = LOTTERY_CONFIG[tipo]
+        gerador = GeradorLoteria()
+        lote = DescritorLote(tipo, seed=5, quantidade=50)
+        jogos = list(lote)
+        assert len(jogos) == 50
+        assert all(gerador._validar_jogo(config, j) for j in jogos)
+        assert jogos == list(DescritorLote(tipo, seed=5, quantidade=50))
+        assert jogos != list(DescritorLote(tipo, seed=6, quantidade=50))
+
+    def test_acesso_direto_igual_a_sequencia(self):
+        """Testar que o jogo i não depende dos anteriores nem do tamanho do lote."""
+        grande = DescritorLote("Mega-Sena", seed=1, quantidade=10**9)
+        pequeno = DescritorLote("Mega-Sena", seed=1, quantidade=20)
+        assert [grande.numeros(i) for i in range(20)] == list(pequeno)
+        assert grande.numeros(10**9 - 1) is not None
+        with pytest.raises(IndexError):
+            pequeno.numeros(20)
+
+    def test_extras(self):
+        """Testar os sorteios fora do volante."""
+        lote = DescritorLote("Dia de Sorte", seed=3, quantidade=200)
+        meses = LOTTERY_CONFIG["Dia de Sorte"]["sorteios_extras"]["Mês da Sorte"]
+        sorteados = {lote.extras(i)["Mês da Sorte"] for i in range(200)}
+        assert sorteados <= set(meses)
+        assert len(sorteados) > 6
+        assert DescritorLote("Mega-Sena", seed=3, quantidade=1).extras(0) is None
+
+    def test_serializacao(self):
+        """Testar JSON e pickle do descritor."""
+        lote = DescritorLote("Quina", seed=9, quantidade=1000)
+        copia = DescritorLote.de_dict(json.loads(json.dumps(lote.to_dict())))
+        assert copia == lote
+        assert copia.numeros(999) == lote.numeros(999)
+        assert pickle.loads(pickle.dumps(lote)).numeros(7) == lote.numeros(7)
+
+    def test_configuracao_alterada(self, monkeypatch):
+        """Testar recusa de descritor gerado com outra configuração."""
+        dados = DescritorLote("Quina", seed=9, quantidade=10).to_dict()
+        config = {**LOTTERY_CONFIG["Quina"], "range_soma": (150, 250)}
+        monkeypatch.setitem(LOTTERY_CONFIG, "Quina", config)
+        with pytest.raises(ValueError, match="outra configuração"):
+            DescritorLote.de_dict(dados)
+
+    def test_faixas_de_padrao(self, monkeypatch):
+        """Testar que as faixas de padrão configuradas são respeitadas."""
+        config = {**LOTTERY_CONFIG["Mega-Sena"], "range_max_dezena": (1, 2)}
+        monkeypatch.setitem(LOTTERY_CONFIG, "Mega-Sena", config)
+        medir = calculadora(60).medidor("max_dezena")
+        lote = DescritorLote("Mega-Sena", seed=2, quantidade=100)
+        assert all(medir(m) <= 2 for m in lote.iter_mascaras())
+
+    def test_contar_acertos(self):
+        """Testar a conferência contra a contagem direta."""
+        lote = DescritorLote("Mega-Sena", seed=4, quantidade=300)
+        sorteio = [4, 8, 15, 16, 23, 42]
+        esperado = [0] * 7
+        for jogo in lote:
+            esperado[len(set(jogo) & set(sorteio))] += 1
+        assert lote.contar_acertos(sorteio) == esperado
+
+
+class TestJogosDescritor:
+    """Testes para a sequência preguiçosa de GameResult."""
+
+    def test_fatias(self):
+        """Testar índices, fatias e estatísticas dos jogos."""
+        jogos = DescritorLote("Lotofácil", seed=1, quantidade=100).jogos()
+        assert len(jogos) == 100
+        trecho = jogos[10:20]
+        assert len(trecho) == 10
+        assert trecho[3] == jogos[13]
+        assert jogos[-1] == jogos[99]
+        assert len(jogos[95:200]) == 5
+        jogo = jogos[0]
+        assert jogo.soma == sum(jogo.numeros)
+        assert jogo.primos is not None
+        with pytest.raises(IndexError):
+            jogos[100]
+
+    def test_exportacoes(self):
+        """Testar CSV e PDF direto do descritor, iguais aos da lista."""
+        PDFGenerator = pytest.importorskip("pdf_generator").PDFGenerator
+        jogos = DescritorLote("Dia de Sorte", seed=8, quantidade=120).jogos()
+        lista = list(jogos)
+        assert gerar_csv(jogos, tipo="Dia de Sorte") == gerar_csv(
+            lista, tipo="Dia de Sorte"
+        )
+        gerador = PDFGenerator("Dia de Sorte")
+        assert gerador.paginar(jogos) == gerador.paginar(lista)
+        assert gerador.generate_report(jogos, workers=1).startswith(b"%PDF")
+        assert lista[0].mascara == empacotar_numeros(jogos.descritor.numeros(0))
@@ -0,0 +1,74 @@
+"""
+Testes unitários para o módulo diversidade.py
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+import diversidade
+from config import LOTTERY_CONFIG
+from core import GeradorLoteria
+from diversidade import IndiceSobreposicao
+
+
+def _max_em_comum(jogos) -> int:
+    """Maior quantidade de números em comum entre dois jogos (força bruta)."""
+    return max((len(set(a) & set(b)) for a, b in combinations(jogos, 2)), default=0)
+
+
+class TestIndiceSobreposicao:
+    """Testes para IndiceSobreposicao."""
+
+    @pytest.mark.parametrize("limite", [diversidade.LIMITE_SUBCONJUNTOS, 0])
+    def test_igual_forca_bruta(self, monkeypatch, limite):
+        """Testar o índice (subconjuntos e varredura) contra comparação direta."""
+        monkeypatch.setattr(diversidade, "LIMITE_SUBCONJUNTOS", limite)
+        indice = IndiceSobreposicao(2, 6)
+        rng = random.Random(1)
+        aceitos = []
+        for _ in range(300):
+            jogo = sorted(rng.sample(range(1, 31), 6))
+            esperado = all(len(set(jogo) & set(a)) <= 2 for a in aceitos)
+            assert indice.tentar_adicionar(jogo) == esperado
+            if esperado:
+                aceitos.append(jogo)
+        assert len(indice) == len(aceitos)
+        # Mais de C(6, 3) = 20 jogos aceitos: o set já foi montado
+        assert indice.por_subconjuntos == (limite > 0)
+
+    def test_jogo_repetido_recusado(self):
+        """Testar que o mesmo jogo não entra duas vezes."""
+        indice = IndiceSobreposicao(4, 5)
+        assert indice.tentar_adicionar([1, 2, 3, 4, 5])
+        assert not indice.tentar_adicionar([1, 2, 3, 4, 5])
+        assert indice.tentar_adicionar([1, 2, 3, 4, 6])
+
+    def test_sobreposicao_invalida(self):
+        """Testar erro para t fora de 0..k-1."""
+        with pytest.raises(ValueError):
+            IndiceSobreposicao(6, 6)
+        with pytest.raises(ValueError):
+            IndiceSobreposicao(-1, 6)
+
+
+class TestGerarJogosDiversos:
+    """Testes para GeradorLoteria.gerar_jogos_diversos."""
+
+    @pytest.mark.parametrize(
+        "tipo,quantidade,t", [("Mega-Sena", 200, 2), ("Quina", 100, 1)]
+    )
+    def test_sobreposicao_respeitada(self, tipo, quantidade, t):
+        """Testar que nenhum par de jogos passa da sobreposição máxima."""
+        jogos = GeradorLoteria(seed=4).gerar_jogos_diversos(tipo, quantidade, t)
+        assert len(jogos) == quantidade
+        assert _max_em_comum([j.numeros for j in jogos]) <= t
+
+    def test_restricao_impossivel_devolve_menos(self, monkeypatch):
+        """Testar que a geração para quando não há mais jogos compatíveis."""
+        config = {**LOTTERY_CONFIG["Lotofácil"], "max_tentativas": 500}
+        monkeypatch.setitem(LOTTERY_CONFIG, "Lotofácil", config)
+        # Dois jogos de 15 entre 25 números sempre compartilham ao menos 5
+        jogos = GeradorLoteria(seed=5).gerar_jogos_diversos("Lotofácil", 10, 4)
+        assert len(jogos) == 1
@@ -0,0 +1,127 @@
+"""
+Testes unitários para o módulo estendidos.py
+"""
+
+import random
+from itertools import combinations
+from math import comb
+
+import pytest
+
+from config import LOTTERY_CONFIG
+from core import GeradorLoteria
+from estendidos import (
+    conferir,
+    contar_subjogos_validos,
+    tabela_premios,
+    tamanhos_aposta,
+)
+from simulador import media_exata_acertos, simular
+from viabilidade import Restricoes
+
+
+class TestSubjogos:
+    """Testes para a contagem de sub-jogos válidos."""
+
+    @pytest.mark.parametrize(
+        "tipo,tamanho", [("Mega-Sena", 10), ("Quina", 9), ("Lotofácil", 18)]
+    )
+    def test_igual_a_expansao(self, tipo, tamanho):
+        """Testar a contagem contra a validação de cada sub-jogo."""
+        config = LOTTERY_CONFIG[tipo]
+        gerador = GeradorLoteria()
+        rng = random.Random(1)
+        for _ in range(3):
+            numeros = sorted(rng.sample(range(1, config["max_numero"] + 1), tamanho))
+            esperado = sum(
+                gerador._validar_jogo(config, list(c))
+                for c in combinations(numeros, config["qtd_selecionados"])
+            )
+            contagem = contar_subjogos_validos(Restricoes.de_config(config), numeros)
+            assert contagem == esperado
+
+    def test_sequencia(self):
+        """Testar sequências proibidas dentro da aposta (Quina)."""
+        config = LOTTERY_CONFIG["Quina"]
+        numeros = [10, 11, 12, 13, 40, 41, 60, 70, 75]
+        esperado = sum(
+            GeradorLoteria()._validar_jogo(config, list(c))
+            for c in combinations(numeros, 5)
+        )
+        assert (
+            contar_subjogos_validos(Restricoes.de_config(config), numeros) == esperado
+        )
+
+
+class TestPremios:
+    """Testes para a conferência combinatória."""
+
+    def test_igual_a_expansao(self):
+        """Testar faixas de uma aposta de 10 contra os 210 sub-jogos."""
+        numeros = list(range(1, 11))
+        for sorteio in (
+            [1, 2, 3, 4, 5, 6],
+            [1, 2, 3, 4, 50, 60],
+            [7, 8, 20, 30, 40, 50],
+        ):
+            esperado = {}
+            for sub in combinations(numeros, 6):
+                acertos = len(set(sub) & set(sorteio))
+                if acertos in LOTTERY_CONFIG["Mega-Sena"]["faixas_premio"]:
+                    esperado[acertos] = esperado.get(acertos, 0) + 1
+            assert conferir("Mega-Sena", numeros, sorteio) == esperado
+
+    def test_tamanhos(self):
+        """Testar tamanhos aceitos e aposta simples."""
+        assert tamanhos_aposta("Mega-Sena") == range(6, 16)
+        assert tamanhos_aposta("Timemania") == range(10, 11)
+        assert conferir("Quina", [1, 2, 3, 4, 5], [1, 2, 3, 70, 80]) == {3: 1}
+        with pytest.raises(ValueError):
+            tabela_premios("Timemania", 11)
+
+
+class TestGerarJogosEstendidos:
+    """Testes para GeradorLoteria.gerar_jogos_estendidos."""
+
+    def test_cobertura(self):
+        """Testar tamanho das apostas e fração mínima de sub-jogos válidos."""
+        config = LOTTERY_CONFIG["Mega-Sena"]
+        jogos = GeradorLoteria(seed=1).gerar_jogos_estendidos(
+            "Mega-Sena", 10, 9, cobertura_minima=0.7
+        )
+        assert len(jogos) == 10
+        for jogo in jogos:
+            assert len(jogo.numeros) == 9 == len(set(jogo.numeros))
+            validos = contar_subjogos_validos(
+                Restricoes.de_config(config), jogo.numeros
+            )
+            assert validos >= 0.7 * comb(9, 6)
+
+    def test_erros(self):
+        """Testar tamanho não aceito e cobertura inválida."""
+        gerador = GeradorLoteria(seed=2)
+        with pytest.raises(ValueError):
+            gerador.gerar_jogos_estendidos("Mega-Sena", 1, 16)
+        with pytest.raises(ValueError):
+            gerador.gerar_jogos_estendidos("Lotomania", 1, 51)
+        with pytest.raises(ValueError):
+            gerador.gerar_jogos_estendidos("Quina", 1, 7, cobertura_minima=1.5)
+
+
+class TestSimulacaoEstendida:
+    """Testes da simulação com apostas estendidas."""
+
+    def test_igual_aos_subjogos(self):
+        """Testar que a aposta estendida rende o mesmo que seus sub-jogos."""
+        aposta = [3, 9, 17, 28, 36, 44, 51, 60]
+        subjogos = [list(c) for c in combinations(aposta, 5)]
+        a = simular("Quina", [aposta], 3000, seed=1, workers=1)
+        b = simular("Quina", subjogos, 3000, seed=1, workers=1)
+        assert [f.ocorrencias for f in a.faixas] == [f.ocorrencias for f in b.faixas]
+        assert [f.media_exata for f in a.faixas] == pytest.approx(
+            [f.media_exata for f in b.faixas]
+        )
+
+    def test_media_exata(self):
+        """Testar a média exata de uma aposta de 7 (7 senas possíveis)."""
+        assert media_exata_acertos("Mega-Sena", 7, 6) == pytest.approx(7 / 50063860)
@@ -0,0 +1,155 @@
+"""
+Testes unitários para o módulo exportacao.py
+"""
+
+import threading
+import time
+
+import pytest
+
+from bilhetes import LeitorBilhetes
+from core import GeradorLoteria
+from exportacao import ArtifactCache, ExportQueue, gerar_csv
+
+
+def _aguardar(job, timeout=30.0):
+    """Aguardar a conclusão de um job da fila."""
+    limite = time.monotonic() + timeout
+    while job.status in ("pendente", "executando") and time.monotonic() < limite:
+        time.sleep(0.01)
+    return job
+
+
+class TestArtifactCache:
+    """Testes para ArtifactCache."""
+
+    def test_gravar_e_obter(self, tmp_path):
+        """Testar gravação e leitura de um artefato."""
+        cache = ArtifactCache(str(tmp_path))
+        caminho = cache.gravar("a.csv", b"conteudo")
+        assert cache.obter("a.csv") == caminho
+        assert cache.obter("b.csv") is None
+
+    def test_remocao_lru(self, tmp_path):
+        """Testar que o artefato menos usado é removido ao estourar o limite."""
+        cache = ArtifactCache(str(tmp_path), max_bytes=10)
+        cache.gravar("a", b"1234")
+        cache.gravar("b", b"1234")
+        cache.obter("a")  # "b" passa a ser o menos usado
+        cache.gravar("c", b"1234")
+        assert cache.obter("b") is None
+        assert cache.obter("a") is not None
+        assert cache.obter("c") is not None
+        assert cache.total_bytes == 8
+        assert not (tmp_path / "b").exists()
+
+    def test_reabrir_diretorio(self, tmp_path):
+        """Testar que o cache reconhece artefatos já gravados em disco."""
+        ArtifactCache(str(tmp_path)).gravar("a", b"123")
+        assert ArtifactCache(str(tmp_path)).obter("a") is not None
+
+
+class TestExportQueue:
+    """Testes para ExportQueue."""
+
+    def test_csv_em_segundo_plano(self, tmp_path):
+        """Testar exportação CSV concluída com o conteúdo esperado."""
+        jogos = GeradorLoteria(seed=1).gerar_jogos("Mega-Sena", 5)
+        fila = ExportQueue(ArtifactCache(str(tmp_path)))
+        job = _aguardar(fila.submeter("csv", "Mega-Sena", jogos))
+        assert job.pronto
+        assert job.progresso == 1.0
+        assert job.ler() == gerar_csv(jogos, tipo="Mega-Sena")
+        assert fila.obter(job.id) is job
+
+    def test_reaproveita_cache(self, tmp_path):
+        """Testar que exportação idêntica sai pronta do cache."""
+        jogos = GeradorLoteria(seed=2).gerar_jogos("Quina", 3)
+        cache = ArtifactCache(str(tmp_path))
+        _aguardar(ExportQueue(cache).submeter("csv", "Quina", jogos))
+        job = ExportQueue(cache).submeter("csv", "Quina", jogos)
+        assert job.pronto
+
+    def test_pdf_com_progresso(self, tmp_path):
+        """Testar exportação PDF com callback de progresso."""
+        pytest.importorskip("fpdf")
+        jogos = GeradorLoteria(seed=3).gerar_jogos("Quina", 600)
+        fila = ExportQueue(ArtifactCache(str(tmp_path)))
+        job = _aguardar(fila.submeter("pdf", "Quina", jogos), timeout=120)
+        assert job.pronto, job.erro
+        assert job.ler().startswith(b"%PDF")
+
+    def test_lotobin(self, tmp_path):
+        """Testar exportação binária legível pelo LeitorBilhetes."""
+        jogos = GeradorLoteria(seed=4).gerar_jogos("Mega-Sena", 20)
+        fila = ExportQueue(ArtifactCache(str(tmp_path / "cache")))
+        job = _aguardar(fila.submeter("lotobin", "Mega-Sena", jogos))
+        assert job.pronto, job.erro
+        with LeitorBilhetes(job.caminho) as leitor:
+            assert list(leitor) == [j.numeros for j in jogos]
+
+    def test_artefato_removido_do_cache(self, tmp_path):
+        """Testar job cujo artefato saiu do cache (LRU) e a poda dos jobs."""
+        gerador = GeradorLoteria(seed=5)
+        primeiros = gerador.gerar_jogos("Quina", 3)
+        fila = ExportQueue(ArtifactCache(str(tmp_path), max_bytes=1))
+        job = _aguardar(fila.submeter("csv", "Quina", primeiros))
+        assert fila.ler(job.id) == gerar_csv(primeiros, tipo="Quina")
+
+        outro = _aguardar(
+            fila.submeter("csv", "Quina", gerador.gerar_jogos("Quina", 3))
+        )
+        assert outro.pronto
+        with pytest.raises(FileNotFoundError):
+            job.ler()
+        assert fila.ler(job.id) is None
+        assert fila.obter(job.id) is None
+        assert list(fila._jobs) == [outro.id]
+        assert list(fila._por_chave) == [outro.chave]
+
+        # Nova submissão do mesmo conteúdo volta a exportar
+        refeito = _aguardar(fila.submeter("csv", "Quina", primeiros))
+        assert refeito.id != job.id
+        assert fila.ler(refeito.id) == gerar_csv(primeiros, tipo="Quina")
+
+    def test_poda_de_erros_e_jobs_antigos(self, tmp_path):
+        """Testar que jobs com erro e terminados além do limite são esquecidos."""
+        gerador = GeradorLoteria(seed=6)
+        fila = ExportQueue(ArtifactCache(str(tmp_path)), max_jobs=2)
+        falhos = [
+            _aguardar(
+                fila.submeter(
+                    "lotobin", "LoteriaBogus", gerador.gerar_jogos("Quina", 1)
+                )
+            )
+            for _ in range(3)
+        ]
+        assert all(job.status == "erro" for job in falhos)
+        assert fila.obter(falhos[0].id) is None
+        assert fila.obter(falhos[2].id) is falhos[2]
+
+        fila.validade_s = 0.0
+        assert fila.obter(falhos[2].id) is None
+        assert not fila._jobs and not fila._por_chave
+
+    def test_poda_de_job_sem_resposta(self, tmp_path):
+        """Testar que um job parado além do prazo é dado como falho e cancelado."""
+        fila = ExportQueue(ArtifactCache(str(tmp_path)), workers=1, prazo_s=0.0)
+        liberar = threading.Event()
+        fila._executor.submit(liberar.wait)  # ocupa a única thread
+        try:
+            job = fila.submeter(
+                "csv", "Quina", GeradorLoteria(seed=7).gerar_jogos("Quina", 2)
+            )
+            assert fila.obter(job.id) is job
+            assert job.status == "erro" and "sem resposta" in job.erro
+            assert not fila._futuros
+        finally:
+            liberar.set()
+        assert job.status == "erro"
+
+    def test_formato_invalido(self, tmp_path):
+        """Testar erro com formato desconhecido."""
+        fila = ExportQueue(ArtifactCache(str(tmp_path)))
+        with pytest.raises(ValueError):
+            fila.submeter("xlsx", "Quina", [])
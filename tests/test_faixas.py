@@ -0,0 +1,182 @@
+"""
+Testes unitários para o módulo faixas.py
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+import faixas as modulo_faixas
+from config import LOTTERY_CONFIG
+from core import GeradorLoteria
+from faixas import (
+    config_com_faixas,
+    dimensoes_disponiveis,
+    estimar,
+    estimar_config,
+    faixas_config,
+    limites,
+    tabela_faixas,
+)
+from precomputo import cache_padrao
+from selecao import selecionar_melhores
+from viabilidade import ContadorCombinacoes, Restricoes, analisar
+
+
+class TestTabelaFaixas:
+    """Testes para a contagem por faixas sem refazer a tabela."""
+
+    @pytest.mark.parametrize("tipo", list(LOTTERY_CONFIG))
+    def test_configuracao_atual(self, tipo):
+        """Testar que as faixas configuradas dão a contagem de viabilidade."""
+        config = LOTTERY_CONFIG[tipo]
+        faixas = faixas_config(config)
+        faixas = {d: faixas[d] for d in dimensoes_disponiveis(tipo)}
+        estimativa = estimar(tipo, faixas, config.get("evitar_sequencia", False))
+        viabilidade = analisar(tipo)
+        assert estimativa.validas == viabilidade.combinacoes_validas
+        assert estimativa.taxa_aceitacao == pytest.approx(viabilidade.taxa_aceitacao)
+        assert estimativa.estrategia == viabilidade.estrategia
+
+    @pytest.mark.parametrize("tipo", ["Mega-Sena", "Lotofácil", "Quina"])
+    def test_faixas_aleatorias(self, tipo):
+        """Testar faixas sorteadas contra a contagem exata com poda."""
+        config = LOTTERY_CONFIG[tipo]
+        rng = random.Random(3)
+        tabela = tabela_faixas(tipo, ("soma", "pares", "primos", "fibo"), True)
+        for _ in range(5):
+            faixas = {}
+            for dimensao in ("soma", "pares", "primos", "fibo"):
+                minimo, maximo = limites(tipo, dimensao)
+                a, b = sorted(rng.randint(minimo, maximo) for _ in range(2))
+                faixas[dimensao] = (a, b) if rng.random() < 0.7 else None
+            restricoes = Restricoes(
+                max_numero=config["max_numero"],
+                qtd=config["qtd_selecionados"],
+                evitar_sequencia=True,
+                **faixas,
+            )
+            assert tabela.contar(faixas) == ContadorCombinacoes(restricoes).total
+
+    def test_forca_bruta(self, monkeypatch):
+        """Testar um volante pequeno contra a enumeração das combinações."""
+        config = {
+            **LOTTERY_CONFIG["Mega-Sena"],
+            "max_numero": 14,
+            "qtd_selecionados": 4,
+        }
+        monkeypatch.setitem(LOTTERY_CONFIG, "Mini", config)
+        tabela = tabela_faixas("Mini", ("soma", "pares"), False)
+        faixas = {"soma": (20, 35), "pares": (1, 2)}
+        esperado = sum(
+            20 <= sum(c) <= 35 and 1 <= sum(1 for x in c if x % 2 == 0) <= 2
+            for c in combinations(range(1, 15), 4)
+        )
+        assert tabela.contar(faixas) == esperado
+        assert tabela.total == 1001
+
+    def test_reaproveita_tabela_maior(self, monkeypatch):
+        """Testar que desligar uma dimensão não monta outra tabela."""
+        monkeypatch.setattr(modulo_faixas, "_TABELAS", {})
+        maior = tabela_faixas("Dia de Sorte", ("soma", "pares", "primos"), False)
+        assert tabela_faixas("Dia de Sorte", ("pares",), False) is maior
+        assert tabela_faixas("Dia de Sorte", ("primos", "soma"), False) is maior
+        assert tabela_faixas("Dia de Sorte", ("pares",), True) is not maior
+
+    def test_dimensoes(self, monkeypatch):
+        """Testar dimensões disponíveis, limites e faixas fora da tabela."""
+        monkeypatch.setattr(modulo_faixas, "_TABELAS", {})
+        assert "soma" not in dimensoes_disponiveis("Lotomania")
+        assert "soma" in dimensoes_disponiveis("Mega-Sena")
+        assert limites("Mega-Sena", "soma") == (21, 345)
+        assert limites("Lotofácil", "pares") == (2, 12)
+        with pytest.raises(ValueError):
+            tabela_faixas("Lotomania", ("soma",), False)
+        with pytest.raises(ValueError):
+            tabela_faixas("Quina", ("pares",), True).contar({"soma": (1, 2)})
+
+    def test_inviavel(self):
+        """Testar faixas sem nenhuma combinação."""
+        estimativa = estimar("Mega-Sena", {"soma": (21, 21), "pares": (4, 6)}, False)
+        assert estimativa.validas == 0
+        assert estimativa.estrategia is None
+
+
+class TestConfigAjustada:
+    """Testes para a geração com faixas ajustadas."""
+
+    def test_config_com_faixas(self):
+        """Testar a cópia da configuração com outras faixas."""
+        config = LOTTERY_CONFIG["Mega-Sena"]
+        assert config_com_faixas(config, faixas_config(config), False) == config
+        nova = config_com_faixas(config, {"soma": None, "primos": (1, 2)}, True)
+        assert "range_soma" not in nova and nova["range_primos"] == (1, 2)
+        assert nova["evitar_sequencia"] is True
+        assert "range_soma" in config
+
+    def test_gerar_jogos_com_faixas(self):
+        """Testar que gerar_jogos respeita a configuração ajustada."""
+        config = config_com_faixas(
+            LOTTERY_CONFIG["Mega-Sena"], {"soma": (60, 90), "primos": (2, 3)}, False
+        )
+        jogos = GeradorLoteria(seed=1).gerar_jogos("Mega-Sena", 20, config)
+        assert len(jogos) == 20
+        assert all(60 <= j.soma <= 90 and 2 <= j.primos <= 3 for j in jogos)
+
+    def test_modos_com_faixas(self):
+        """Testar que os outros modos de geração do app respeitam a
+        configuração ajustada."""
+        config = config_com_faixas(
+            LOTTERY_CONFIG["Mega-Sena"], {"soma": (60, 90), "primos": (2, 3)}, False
+        )
+        gerador = GeradorLoteria(seed=1)
+        pesos = [0.0] + [1.0] * LOTTERY_CONFIG["Mega-Sena"]["max_numero"]
+        melhores = selecionar_melhores(
+            "Mega-Sena", 5, 200, seed=1, workers=1, config=config
+        )
+        for jogos in (
+            melhores.jogos,
+            gerador.gerar_jogos_diversos("Mega-Sena", 5, 5, config),
+            gerador.gerar_jogos_mcmc("Mega-Sena", 5, cadeias=2, config=config),
+            gerador.gerar_jogos_ponderados("Mega-Sena", 5, pesos, config),
+        ):
+            assert jogos
+            assert all(60 <= j.soma <= 90 and 2 <= j.primos <= 3 for j in jogos)
+
+    def test_estimar_config(self):
+        """Testar a estimativa de uma configuração ajustada."""
+        config = config_com_faixas(
+            LOTTERY_CONFIG["Timemania"], {"soma": (200, 400)}, False
+        )
+        estimativa = estimar_config("Timemania", config)
+        assert estimativa.validas == analisar("Timemania", config).combinacoes_validas
+        # Soma da Lotomania fora das tabelas; volante diferente
+        lotomania = {**LOTTERY_CONFIG["Lotomania"], "range_soma": (2000, 3000)}
+        assert estimar_config("Lotomania", lotomania) is None
+        assert (
+            estimar_config("Quina", {**LOTTERY_CONFIG["Quina"], "max_numero": 70})
+            is None
+        )
+
+    def test_geracao_ajustada_sem_contagem_podada(self, monkeypatch):
+        """Testar que a geração com faixas ajustadas não conta nem persiste a
+        configuração ajustada quando a rejeição basta."""
+        chamadas = []
+        original = ContadorCombinacoes.preencher
+        monkeypatch.setattr(
+            ContadorCombinacoes,
+            "preencher",
+            lambda self: chamadas.append(self.restricoes) or original(self),
+        )
+        config = config_com_faixas(
+            LOTTERY_CONFIG["Timemania"], {"soma": (200, 400)}, False
+        )
+        parcial = GeradorLoteria(seed=1).gerar_jogos_com_prazo(
+            "Timemania", 10, 60, config=config
+        )
+        assert parcial.concluido
+        assert all(200 <= j.soma <= 400 for j in parcial.jogos)
+        assert Restricoes.de_config(config) not in chamadas
+        nome = f"contagem:{Restricoes.de_config(config)!r}"
+        assert nome not in cache_padrao()._memoria
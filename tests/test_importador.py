@@ -0,0 +1,149 @@
+"""
+Testes unitários para o módulo importador.py
+"""
+
+import io
+import os
+import sys
+
+import pytest
+
+from bilhetes import LeitorBilhetes
+from importador import (
+    carregar_historico,
+    extrair_sorteios,
+    formato_arquivo,
+    importar,
+    ler_historico,
+)
+
+CABECALHO_MEGA = (
+    "Concurso;Data do Sorteio;Bola1;Bola2;Bola3;Bola4;Bola5;Bola6;"
+    "Ganhadores 6 acertos;Rateio 6 acertos\n"
+)
+
+
+def _csv_mega(concursos):
+    """CSV no layout oficial, com colunas extras depois das bolas."""
+    linhas = [CABECALHO_MEGA]
+    for c in concursos:
+        numeros = ";".join(f"{(c + 7 * i) % 60 + 1:02d}" for i in range(6))
+        linhas.append(f"{c};01/01/2020;{numeros};0;R$0,00\n")
+    return "".join(linhas)
+
+
+class TestExtrairSorteios:
+    """Testes para extrair_sorteios e os leitores de formato."""
+
+    def test_csv_com_cabecalho(self):
+        """Testar colunas pelo cabeçalho e recusa de sorteio inválido."""
+        texto = _csv_mega([1, 2]) + "3;08/01/2020;01;02;03;04;05;61;0;R$0,00\n"
+        linhas = [l.split(";") for l in texto.splitlines()]
+        resultado = list(extrair_sorteios(linhas, "Mega-Sena"))
+        assert resultado[0] == (1, [[2, 9, 16, 23, 30, 37]], None)
+        assert resultado[1][2] is None
+        assert resultado[2][0] == 3 and "fora de 1..60" in resultado[2][2]
+
+    def test_sem_cabecalho(self):
+        """Testar concurso, data e números sem cabeçalho, e só números."""
+        linhas = [
+            ["Resultados da Quina"],
+            ["6000", "10/10/2022", "5", "17", "33", "41", "80"],
+            ["1", "2", "3", "4", "5"],
+            ["6001", "9", "9", "10", "11", "12"],
+            ["6002", "1", "2"],
+        ]
+        resultado = list(extrair_sorteios(linhas, "Quina"))
+        assert resultado[0] == (6000, [[5, 17, 33, 41, 80]], None)
+        assert resultado[1] == (6001, [[1, 2, 3, 4, 5]], None)
+        assert "repetido" in resultado[2][2]
+        assert "esperados 5" in resultado[3][2]
+
+    def test_lotomania_e_dupla_sena(self):
+        """Testar o "00" da Lotomania e os dois sorteios da Dupla Sena."""
+        lotomania = [["10", *[str(n) for n in range(0, 96, 5)]]]
+        [(_, [sorteio], erro)] = extrair_sorteios(lotomania, "Lotomania")
+        assert erro is None and sorteio[-1] == 100 and len(sorteio) == 20
+        dupla = [["7", *[str(n) for n in range(12, 0, -1)]]]
+        [(_, sorteios, _)] = extrair_sorteios(dupla, "Dupla Sena")
+        assert sorteios == [[7, 8, 9, 10, 11, 12], [1, 2, 3, 4, 5, 6]]
+
+    def test_html_com_tabela_aninhada(self):
+        """Testar a tabela HTML oficial, com cidades em tabela dentro da célula."""
+        html = (
+            "<html><table><tr><th>Concurso</th><th>Data</th>"
+            + "".join(f"<th>{i}ª Dezena</th>" for i in range(1, 6))
+            + "<th>Cidade</th></tr>"
+            "<tr><td>1</td><td>13/03/1994</td><td>25</td><td>45</td><td>60</td>"
+            "<td>76</td><td>79</td><td><table><tr><td>SP</td></tr></table></td></tr>"
+            "<tr><td>2<td>17/03/1994<td>13<td>30<td>58<td>63<td>72</tr>"
+            "</table></html>"
+        ).encode("utf-8")
+        concursos, sorteios = ler_historico(io.BytesIO(html), "Quina", "html")
+        assert concursos == [1, 2]
+        assert sorteios == [[25, 45, 60, 76, 79], [13, 30, 58, 63, 72]]
+
+    def test_formato(self):
+        """Testar o formato pela extensão."""
+        assert formato_arquivo("resultados.CSV") == "csv"
+        assert formato_arquivo("/tmp/d_megasc.htm") == "html"
+        with pytest.raises(ValueError):
+            formato_arquivo("resultados.pdf")
+
+    def test_xlsx_sem_openpyxl(self, monkeypatch):
+        """Testar a mensagem quando o pacote opcional não está instalado."""
+        monkeypatch.setitem(sys.modules, "openpyxl", None)
+        with pytest.raises(ImportError, match="openpyxl"):
+            ler_historico(io.BytesIO(b""), "Quina", "xlsx")
+
+
+class TestImportar:
+    """Testes para importar e carregar_historico."""
+
+    def test_importar_e_acrescentar(self, tmp_path):
+        """Testar a importação inicial e o acréscimo só dos concursos novos."""
+        origem = tmp_path / "mega.csv"
+        destino = str(tmp_path / "mega.lotobin")
+        origem.write_text(_csv_mega(range(1, 101)), encoding="utf-8")
+        r = importar(str(origem), destino, "Mega-Sena")
+        assert (r.lidos, r.novos, r.total, r.ultimo_concurso) == (100, 100, 100, 100)
+        assert not r.inalterado
+
+        inode = os.stat(destino).st_ino
+
+        origem.write_text(_csv_mega(range(1, 111)), encoding="utf-8")
+        r = importar(str(origem), destino, "Mega-Sena")
+        assert (r.lidos, r.novos, r.total, r.ultimo_concurso) == (110, 10, 110, 110)
+        # Acrescentado no lugar, sem regravar o arquivo
+        assert os.stat(destino).st_ino == inode
+        concursos, sorteios = carregar_historico(destino)
+        assert concursos == list(range(1, 111))
+        assert sorteios[0] == [2, 9, 16, 23, 30, 37]
+        with LeitorBilhetes(destino) as leitor:
+            assert leitor.metadados["origem"]["arquivo"] == "mega.csv"
+
+    def test_reimportar_inalterado(self, tmp_path):
+        """Testar que o mesmo arquivo (ou uma cópia) não é relido."""
+        origem = tmp_path / "mega.csv"
+        destino = str(tmp_path / "mega.lotobin")
+        origem.write_text(_csv_mega(range(1, 51)), encoding="utf-8")
+        importar(str(origem), destino, "Mega-Sena")
+        modificado = os.stat(destino).st_mtime_ns
+
+        assert importar(str(origem), destino, "Mega-Sena").inalterado
+        copia = tmp_path / "copia.csv"
+        copia.write_bytes(origem.read_bytes())
+        r = importar(str(copia), destino, "Mega-Sena")
+        assert r.inalterado and r.total == 50
+        assert os.stat(destino).st_mtime_ns == modificado
+
+    def test_erros(self, tmp_path):
+        """Testar loteria desconhecida e histórico de outra loteria."""
+        origem = tmp_path / "mega.csv"
+        origem.write_text(_csv_mega([1]), encoding="utf-8")
+        destino = str(tmp_path / "mega.lotobin")
+        with pytest.raises(ValueError):
+            importar(str(origem), destino, "LoteriaBogus")
+        importar(str(origem), destino, "Mega-Sena")
+        with pytest.raises(ValueError):
+            importar(str(origem), destino, "Quina")
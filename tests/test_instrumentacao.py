@@ -0,0 +1,78 @@
+"""
+Testes unitários para o módulo instrumentacao.py
+"""
+
+import json
+
+from instrumentacao import Tracer, comparar_traces
+
+
+class TestTracer:
+    """Testes para Tracer."""
+
+    def test_inativo_nao_registra(self):
+        """Testar que o coletor inativo não grava spans."""
+        tracer = Tracer()
+        with tracer.span("core.gerar_jogos"):
+            pass
+        tracer.registrar("exportacao.pdf", 1.0)
+        assert tracer.spans == []
+
+    def test_spans_aninhados(self):
+        """Testar registro de spans com pai e atributos."""
+        tracer = Tracer(ativo=True)
+        with tracer.span("render", jogos=2):
+            with tracer.span("render.cartao"):
+                pass
+            with tracer.span("render.cartao"):
+                pass
+        assert [s["nome"] for s in tracer.spans] == [
+            "render.cartao",
+            "render.cartao",
+            "render",
+        ]
+        assert tracer.spans[0]["pai"] == "render"
+        assert tracer.spans[-1]["atributos"] == {"jogos": 2}
+        assert tracer.totais()["render.cartao"]["chamadas"] == 2
+
+    def test_registrar_externo(self):
+        """Testar span medido fora do coletor."""
+        tracer = Tracer(ativo=True)
+        tracer.registrar("exportacao.pdf", 0.25)
+        assert tracer.totais()["exportacao.pdf"]["total_ms"] == 250.0
+
+    def test_perfil(self):
+        """Testar captura do cProfile."""
+        tracer = Tracer(ativo=True, perfil=True)
+        sorted(range(1000), key=lambda n: -n)
+        assert tracer.resumo_perfil()
+
+    def test_perfil_ocupado(self):
+        """Testar que um segundo perfil no processo é pulado até o primeiro parar."""
+        primeiro = Tracer(ativo=True, perfil=True)
+        try:
+            segundo = Tracer(ativo=True, perfil=True)
+            assert segundo.perfil_ocupado
+            assert segundo.resumo_perfil() == []
+            segundo.parar_perfil()
+        finally:
+            primeiro.parar_perfil()
+        primeiro.parar_perfil()
+        terceiro = Tracer(ativo=True, perfil=True)
+        assert not terceiro.perfil_ocupado
+        terceiro.parar_perfil()
+
+    def test_salvar_e_comparar(self, tmp_path):
+        """Testar gravação do trace em JSON e comparação entre traces."""
+        base, novo = Tracer(ativo=True), Tracer(ativo=True)
+        base.registrar("core.gerar_jogos", 0.2)
+        novo.registrar("core.gerar_jogos", 0.1)
+        novo.registrar("graficos.soma", 0.05)
+
+        with open(base.salvar(str(tmp_path)), encoding="utf-8") as f:
+            dados = json.load(f)
+        assert dados["totais"]["core.gerar_jogos"]["total_ms"] == 200.0
+
+        linhas = {l["span"]: l for l in comparar_traces(dados, novo.to_dict())}
+        assert linhas["core.gerar_jogos"]["variacao_pct"] == -50.0
+        assert linhas["graficos.soma"]["base_ms"] is None
@@ -0,0 +1,84 @@
+"""
+Testes unitários para o módulo janelas.py
+"""
+
+import random
+
+import pytest
+
+from janelas import JanelasHistorico
+
+
+def _sorteios(quantidade, seed=1):
+    rng = random.Random(seed)
+    return [sorted(rng.sample(range(1, 61), 6)) for _ in range(quantidade)]
+
+
+class TestJanelasHistorico:
+    """Testes para as janelas deslizantes do histórico."""
+
+    def test_igual_a_recontar_a_janela(self):
+        """Testar, a cada sorteio, os contadores contra a recontagem direta."""
+        sorteios = _sorteios(40)
+        janelas = JanelasHistorico(60, tamanhos=(3, 10, 25))
+        for i, numeros in enumerate(sorteios, 1):
+            janelas.adicionar(numeros)
+            for tamanho in janelas.tamanhos:
+                ultimos = sorteios[max(0, i - tamanho) : i]
+                esperado = [0] * 61
+                for sorteio in ultimos:
+                    for n in sorteio:
+                        esperado[n] += 1
+                resumo = janelas.resumo(tamanho)
+                assert resumo.sorteios == len(ultimos)
+                assert resumo.frequencias == esperado
+                assert resumo.media_soma == pytest.approx(
+                    sum(map(sum, ultimos)) / len(ultimos)
+                )
+                pares = sum(n % 2 == 0 for s in ultimos for n in s)
+                assert resumo.media_pares == pytest.approx(pares / len(ultimos))
+
+    def test_buffer_limitado_a_maior_janela(self):
+        """Testar que o buffer guarda só a maior janela."""
+        janelas = JanelasHistorico(60, tamanhos=(5, 2))
+        janelas.adicionar_varios(_sorteios(12))
+        assert janelas.tamanhos == (2, 5)
+        assert janelas.total == 12
+        assert len(janelas) == 5
+        assert sum(janelas.frequencias(5)) == 5 * 6
+
+    def test_pesos(self):
+        """Testar pesos suavizados (índice = número, posição 0 com peso 0)."""
+        janelas = JanelasHistorico(10, tamanhos=(2,))
+        janelas.adicionar_varios([[1, 2], [2, 3], [3, 4]])
+        assert janelas.pesos(2, suavizacao=0.5) == [
+            0.0,
+            0.5,
+            1.5,
+            2.5,
+            1.5,
+            0.5,
+            0.5,
+            0.5,
+            0.5,
+            0.5,
+            0.5,
+        ]
+
+    def test_janela_vazia(self):
+        """Testar resumo antes do primeiro sorteio."""
+        resumo = JanelasHistorico(60).resumo(10)
+        assert resumo.sorteios == 0
+        assert resumo.media_soma == 0.0
+
+    def test_erros(self):
+        """Testar janela não configurada, números fora do volante e tamanhos."""
+        janelas = JanelasHistorico(60, tamanhos=(10,))
+        with pytest.raises(ValueError):
+            janelas.resumo(50)
+        with pytest.raises(ValueError):
+            janelas.adicionar([1, 61])
+        with pytest.raises(ValueError):
+            janelas.pesos(10, suavizacao=0)
+        with pytest.raises(ValueError):
+            JanelasHistorico(60, tamanhos=(0, 10))
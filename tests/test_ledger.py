@@ -0,0 +1,139 @@
+"""
+Testes unitários para o módulo ledger.py
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from core import GeradorLoteria
+from ledger import SCHEMA, TicketLedger
+
+
+@pytest.fixture
+def ledger():
+    """Registro em memória, descartado ao fim do teste."""
+    with TicketLedger(":memory:", tamanho_lote=7) as registro:
+        yield registro
+
+
+class TestTicketLedger:
+    """Testes para TicketLedger."""
+
+    def test_registrar_e_recuperar_lote(self, ledger):
+        """Testar que o lote volta na mesma ordem e com as mesmas estatísticas."""
+        jogos = GeradorLoteria(seed=1).gerar_jogos("Lotofácil", 20)
+        lote_id = ledger.registrar_lote(jogos, "Lotofácil", seed=1)
+        recuperados = ledger.jogos_do_lote(lote_id)
+        assert [j.to_dict() for j in recuperados] == [j.to_dict() for j in jogos]
+
+    @pytest.mark.parametrize("tipo", ["Timemania", "Dia de Sorte"])
+    def test_extras_ida_e_volta(self, ledger, tipo):
+        """Testar que time do coração e mês da sorte voltam do registro."""
+        jogos = GeradorLoteria(seed=9).gerar_jogos(tipo, 15)
+        lote_id = ledger.registrar_lote(jogos, tipo)
+        assert ledger.jogos_do_lote(lote_id) == jogos
+
+    def test_banco_sem_coluna_extras(self, tmp_path):
+        """Testar a abertura de um banco criado antes da coluna de extras."""
+        caminho = str(tmp_path / "antigo.db")
+        conn = sqlite3.connect(caminho)
+        antigo = SCHEMA.replace(",\n    extras BLOB", "")
+        assert "extras" not in antigo
+        conn.executescript(antigo)
+        conn.close()
+        with TicketLedger(caminho) as registro:
+            jogos = GeradorLoteria(seed=9).gerar_jogos("Timemania", 3)
+            assert (
+                registro.jogos_do_lote(registro.registrar_lote(jogos, "Timemania"))
+                == jogos
+            )
+
+    def test_lotes_concorrentes(self, tmp_path):
+        """Testar lotes registrados ao mesmo tempo por várias threads na mesma
+        conexão (como no app, com o registro compartilhado entre sessões)."""
+        with TicketLedger(str(tmp_path / "ledger.db"), tamanho_lote=50) as registro:
+            lotes = [
+                GeradorLoteria(seed=s).gerar_jogos("Mega-Sena", 600) for s in range(4)
+            ]
+            ids = [None] * 4
+            barreira = threading.Barrier(4)
+
+            def registrar(i):
+                barreira.wait()
+                ids[i] = registro.registrar_lote(lotes[i], "Mega-Sena")
+
+            threads = [threading.Thread(target=registrar, args=(i,)) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            for lote_id, jogos in zip(ids, lotes):
+                assert registro.jogos_do_lote(lote_id) == jogos
+            assert registro.contar() == 2400
+
+    def test_lotes_isolados(self, ledger):
+        """Testar que cada lote retorna apenas os próprios jogos."""
+        gerador = GeradorLoteria(seed=2)
+        lote_a = ledger.registrar_lote(gerador.gerar_jogos("Quina", 5), "Quina")
+        lote_b = ledger.registrar_lote(gerador.gerar_jogos("Quina", 3), "Quina")
+        assert len(ledger.jogos_do_lote(lote_a)) == 5
+        assert len(ledger.jogos_do_lote(lote_b)) == 3
+        assert ledger.jogos_do_lote(999) == []
+
+    def test_ja_emitido(self, ledger):
+        """Testar consulta de combinação já emitida, por loteria."""
+        jogos = GeradorLoteria(seed=3).gerar_jogos("Mega-Sena", 10)
+        ledger.registrar_lote(jogos, "Mega-Sena")
+        assert ledger.ja_emitido("Mega-Sena", jogos[0].numeros)
+        assert ledger.ja_emitido("Mega-Sena", list(reversed(jogos[0].numeros)))
+        assert not ledger.ja_emitido("Quina", jogos[0].numeros[:5])
+
+    def test_rank_acima_de_64_bits(self, ledger):
+        """Testar registro e consulta da Lotomania (rank até C(100, 50))."""
+        jogos = GeradorLoteria(seed=5).gerar_jogos("Lotomania", 10)
+        lote_id = ledger.registrar_lote(jogos, "Lotomania")
+        recuperados = ledger.jogos_do_lote(lote_id)
+        assert [j.numeros for j in recuperados] == [j.numeros for j in jogos]
+        assert ledger.ja_emitido("Lotomania", jogos[3].numeros)
+        outro = list(range(51, 101))
+        assert not ledger.ja_emitido("Lotomania", outro)
+        assert not ledger.ja_emitido("LoteriaBogus", outro)
+
+    def test_lotes_e_contagem(self, ledger):
+        """Testar metadados do lote e contagens."""
+        jogos = GeradorLoteria(seed=4).gerar_jogos("Mega-Sena", 4)
+        lote_id = ledger.registrar_lote(jogos, "Mega-Sena", seed=4, criado_em=10.0)
+        assert ledger.lotes() == [
+            {
+                "id": lote_id,
+                "loteria": "Mega-Sena",
+                "seed": 4,
+                "criado_em": 10.0,
+                "quantidade": 4,
+            }
+        ]
+        assert ledger.contar() == 4
+        assert ledger.contar("Mega-Sena") == 4
+        assert ledger.contar("Quina") == 0
+
+    def test_apostas_estendidas(self, ledger):
+        """Testar registro de apostas estendidas e recusa de tamanho inválido."""
+        jogos = GeradorLoteria(seed=6).gerar_jogos_estendidos("Mega-Sena", 3, 10)
+        lote_id = ledger.registrar_lote(jogos, "Mega-Sena")
+        recuperados = ledger.jogos_do_lote(lote_id)
+        assert [j.numeros for j in recuperados] == [j.numeros for j in jogos]
+        assert ledger.ja_emitido("Mega-Sena", jogos[0].numeros)
+        with pytest.raises(ValueError, match="tamanhos de aposta"):
+            ledger.registrar_lote(
+                GeradorLoteria(seed=6).gerar_jogos_estendidos("Mega-Sena", 1, 15)
+                + GeradorLoteria(seed=6).gerar_jogos("Quina", 1),
+                "Mega-Sena",
+            )
+        assert ledger.contar() == 3
+
+    def test_loteria_invalida(self, ledger):
+        """Testar erro com tipo de loteria inválido."""
+        with pytest.raises(ValueError):
+            ledger.registrar_lote([], "LoteriaBogus")
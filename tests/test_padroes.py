@@ -0,0 +1,130 @@
+"""
+Testes unitários para o módulo padroes.py
+"""
+
+import random
+
+import pytest
+
+from config import LOTTERY_CONFIG
+from core import GeradorLoteria, empacotar_numeros
+from exportacao import gerar_csv
+from padroes import (
+    PADROES,
+    calculadora,
+    colunas_padroes,
+    grupos_volante,
+    maior_corrida,
+    maior_intervalo,
+    verificacao_config,
+)
+
+
+def _padroes_ingenuos(numeros, max_numero):
+    """Padrões calculados número a número, para comparar."""
+    colunas = 5 if max_numero <= 25 else 10
+    linhas = (max_numero + colunas - 1) // colunas
+
+    def maximo(chave):
+        contagem = {}
+        for n in numeros:
+            contagem[chave(n)] = contagem.get(chave(n), 0) + 1
+        return max(contagem.values())
+
+    sequencia, atual = 1, 1
+    for a, b in zip(numeros, numeros[1:]):
+        atual = atual + 1 if b == a + 1 else 1
+        sequencia = max(sequencia, atual)
+    return {
+        "max_dezena": maximo(lambda n: n % 100 // 10),
+        "max_linha": maximo(lambda n: (n - 1) // colunas),
+        "max_coluna": maximo(lambda n: (n - 1) % colunas),
+        "max_quadrante": maximo(
+            lambda n: (
+                (n - 1) // colunas >= (linhas + 1) // 2,
+                (n - 1) % colunas >= colunas // 2,
+            )
+        ),
+        "finais_iguais": maximo(lambda n: n % 10),
+        "maior_intervalo": max(b - a for a, b in zip(numeros, numeros[1:])),
+        "maior_sequencia": sequencia,
+    }
+
+
+class TestPadroes:
+    """Testes para a medição dos padrões."""
+
+    @pytest.mark.parametrize("tipo", list(LOTTERY_CONFIG))
+    def test_igual_ao_calculo_ingenuo(self, tipo):
+        """Testar as máscaras de grupo contra a contagem número a número."""
+        config = LOTTERY_CONFIG[tipo]
+        rng = random.Random(1)
+        calc = calculadora(config["max_numero"])
+        for _ in range(200):
+            numeros = sorted(
+                rng.sample(
+                    range(1, config["max_numero"] + 1), config["qtd_selecionados"]
+                )
+            )
+            esperado = _padroes_ingenuos(numeros, config["max_numero"])
+            assert calc.medir(empacotar_numeros(numeros)) == esperado
+            lote = calc.medir_lote([empacotar_numeros(numeros)])
+            assert {p: v[0] for p, v in lote.items()} == esperado
+
+    def test_corridas(self):
+        """Testar maior corrida e maior intervalo em casos de borda."""
+        assert maior_corrida(0) == 0
+        assert maior_corrida(0b1011101111110) == 6
+        assert maior_corrida((1 << 100) - 2) == 99
+        assert maior_intervalo(empacotar_numeros([7])) == 0
+        assert maior_intervalo(empacotar_numeros([1, 60])) == 59
+
+    def test_grupos(self):
+        """Testar dezenas da Lotomania (o 100 é o "00") e a grade da Lotofácil."""
+        dezenas = grupos_volante(100)["dezena"]
+        assert len(dezenas) == 10 and dezenas[0] >> 100 & 1
+        grupos = grupos_volante(25)
+        assert len(grupos["linha"]) == 5 and len(grupos["quadrante"]) == 4
+        assert sum(g.bit_count() for g in grupos["coluna"]) == 25
+
+    def test_lote_e_distribuicao(self):
+        """Testar colunas do lote e contagem por dezena."""
+        mascaras = [
+            empacotar_numeros([1, 2, 3, 10]),
+            empacotar_numeros([5, 15, 25, 35]),
+        ]
+        colunas = colunas_padroes("Mega-Sena", mascaras)
+        assert list(colunas) == list(PADROES.values())
+        assert colunas["Maior sequência"] == [3, 1]
+        assert calculadora(60).distribuicao(mascaras, "dezena")[:4] == [4, 2, 1, 1]
+        with pytest.raises(ValueError):
+            calculadora(60).distribuicao(mascaras, "diagonal")
+
+
+class TestRestricoesPadroes:
+    """Testes para as faixas range_<padrão> na geração."""
+
+    def test_sem_faixas(self):
+        """Testar que sem faixas configuradas não há verificação."""
+        assert verificacao_config(LOTTERY_CONFIG["Mega-Sena"]) is None
+
+    @pytest.mark.parametrize("metodo", ["gerar_jogos", "gerar_jogos_mcmc"])
+    def test_geracao_respeita_faixas(self, monkeypatch, metodo):
+        """Testar no máximo um número por dezena e intervalo limitado na geração."""
+        config = LOTTERY_CONFIG["Mega-Sena"]
+        monkeypatch.setitem(config, "range_max_dezena", (1, 1))
+        monkeypatch.setitem(config, "range_maior_intervalo", (1, 15))
+        gerador = GeradorLoteria(seed=2)
+        jogos = getattr(gerador, metodo)("Mega-Sena", 20)
+        assert len(jogos) == 20
+        for jogo in jogos:
+            assert len({n // 10 for n in jogo.numeros}) == 6
+            assert max(b - a for a, b in zip(jogo.numeros, jogo.numeros[1:])) <= 15
+            assert gerador._validar_jogo(config, jogo.numeros)
+
+    def test_csv_com_padroes(self):
+        """Testar as colunas de padrões no CSV quando o tipo é informado."""
+        jogos = GeradorLoteria(seed=3).gerar_jogos("Quina", 3)
+        cabecalho = gerar_csv(jogos, tipo="Quina").decode().splitlines()[0]
+        assert cabecalho.endswith(",".join(PADROES.values()))
+        assert "Finais iguais" not in gerar_csv(jogos).decode()
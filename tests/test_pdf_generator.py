@@ -0,0 +1,105 @@
+"""
+Testes unitários para o módulo pdf_generator.py
+"""
+
+import io
+import re
+
+import pytest
+
+from core import GeradorLoteria
+
+# fpdf2 é opcional no ambiente de testes (ver tests/test_exportacao.py)
+FPDF = pytest.importorskip("fpdf").FPDF
+
+import pdf_generator  # noqa: E402
+from pdf_generator import PDFGenerator, _linhas_numeros  # noqa: E402
+
+
+def _paginas(pdf: bytes) -> int:
+    """Quantidade de páginas de um PDF gerado pelo fpdf."""
+    return len(re.findall(rb"/Type /Page(?!s)", pdf))
+
+
+class TestPaginacao:
+    """Testes para a paginação calculada antes do desenho."""
+
+    @pytest.mark.parametrize("tipo", ["Mega-Sena", "Lotomania", "Dia de Sorte"])
+    def test_paginas_iguais_ao_desenho(self, tipo):
+        """Testar que o PDF tem as páginas previstas por paginar."""
+        jogos = GeradorLoteria(seed=1).gerar_jogos(tipo, 300)
+        gerador = PDFGenerator(tipo)
+        paginacao = gerador.paginar(jogos)
+        paginas = paginacao.paginas
+        pdf = gerador.generate_report(jogos, workers=1)
+        assert _paginas(pdf) == paginacao.total_paginas
+        assert paginas[0].inicio == 0 and paginas[-1].fim == len(jogos)
+        assert all(a.fim == b.inicio for a, b in zip(paginas, paginas[1:]))
+        assert paginacao.media_soma == pytest.approx(
+            sum(j.soma for j in jogos) / len(jogos)
+        )
+
+    def test_linhas_cabem_no_cartao(self):
+        """Testar a quebra manual dos números da Lotomania."""
+        medidor = FPDF()
+        medidor.add_page()
+        medidor.set_font("Helvetica", "", 10)
+        util = medidor.epw - 2 * medidor.c_margin
+        for jogo in GeradorLoteria(seed=2).gerar_jogos("Lotomania", 20):
+            linhas = _linhas_numeros(jogo.numeros)
+            assert len(linhas) > 1
+            assert all(medidor.get_string_width(l) <= util for l in linhas)
+            texto = " ".join(linhas).removeprefix("Números: ")
+            assert texto == " - ".join(f"{n:02d}" for n in jogo.numeros)
+
+    def test_blocos_somam_o_relatorio(self):
+        """Testar que os blocos desenhados somam as páginas do relatório."""
+        jogos = GeradorLoteria(seed=3).gerar_jogos("Mega-Sena", 200)
+        gerador = PDFGenerator("Mega-Sena")
+        paginacao = gerador.paginar(jogos)
+        paginas, total = paginacao.paginas, paginacao.total_paginas
+        meio = len(paginas) // 2
+        corte = paginas[meio].inicio
+        primeiro = gerador.render_pages(
+            paginas[:meio], total, jogos[:corte], resumo=paginacao
+        )
+        segundo = gerador.render_pages(
+            paginas[meio:],
+            total,
+            jogos[corte:],
+            rodape_final=paginacao.assinatura_propria,
+        )
+        assert _paginas(primeiro) + _paginas(segundo) == total
+        assert f"Página {total} de {total}".encode("latin-1") not in primeiro
+
+    def test_relatorio_vazio(self):
+        """Testar relatório sem jogos."""
+        pdf = PDFGenerator("Quina").generate_report([])
+        assert pdf.startswith(b"%PDF")
+        assert _paginas(pdf) == 1
+
+
+class TestParalelo:
+    """Testes para a renderização em blocos com junção das páginas."""
+
+    def test_igual_ao_serial(self, monkeypatch):
+        """Testar que o relatório juntado tem as mesmas páginas do serial."""
+        pypdf = pytest.importorskip("pypdf")
+        monkeypatch.setattr(pdf_generator, "MINIMO_PARALELO", 1)
+        monkeypatch.setattr(pdf_generator, "PAGINAS_POR_BLOCO", 3)
+        jogos = GeradorLoteria(seed=4).gerar_jogos("Mega-Sena", 100)
+        gerador = PDFGenerator("Mega-Sena")
+        progresso = []
+
+        serial = pypdf.PdfReader(io.BytesIO(gerador.generate_report(jogos, workers=1)))
+        paralelo = pypdf.PdfReader(
+            io.BytesIO(
+                gerador.generate_report(
+                    jogos, workers=2, progresso=lambda i, n: progresso.append((i, n))
+                )
+            )
+        )
+        assert len(paralelo.pages) == len(serial.pages) > 3
+        for a, b in zip(serial.pages, paralelo.pages):
+            assert a.extract_text() == b.extract_text()
+        assert progresso[-1] == (100, 100)
@@ -0,0 +1,115 @@
+"""
+Testes unitários para o módulo precomputo.py
+"""
+
+import random
+import threading
+import time
+
+from config import LOTTERY_CONFIG
+from precomputo import CachePrecomputo, hash_config, tabelas_numeros
+from viabilidade import ContadorCombinacoes, Restricoes
+
+
+class TestCachePrecomputo:
+    """Testes para CachePrecomputo."""
+
+    def test_constroi_uma_vez(self):
+        """Testar falta na primeira chamada e acerto em memória depois."""
+        cache = CachePrecomputo()
+        chamadas = []
+        for _ in range(3):
+            valor = cache.obter("a", lambda: chamadas.append(1) or {"x": 1})
+        assert valor == {"x": 1}
+        assert len(chamadas) == 1
+        [estatistica] = cache.estatisticas()
+        assert (estatistica.faltas, estatistica.acertos_memoria) == (1, 2)
+
+    def test_persistencia_em_disco(self, tmp_path):
+        """Testar que outro processo (nova instância) lê o artefato do disco."""
+        CachePrecomputo(str(tmp_path), "abc").obter("a", lambda: {(1, 2): 3})
+        cache = CachePrecomputo(str(tmp_path), "abc")
+        valor = cache.obter("a", lambda: {"reconstruido": True})
+        assert valor == {(1, 2): 3}
+        [estatistica] = cache.estatisticas()
+        assert estatistica.acertos_disco == 1
+        assert estatistica.faltas == 0
+        assert estatistica.bytes_disco > 0
+
+    def test_outra_configuracao_invalida(self, tmp_path):
+        """Testar que artefatos de outro hash de configuração são removidos."""
+        CachePrecomputo(str(tmp_path), "antigo").obter("a", lambda: [1])
+        assert len(list(tmp_path.iterdir())) == 1
+        cache = CachePrecomputo(str(tmp_path), "novo")
+        assert list(tmp_path.iterdir()) == []
+        assert cache.obter("a", lambda: [2]) == [2]
+
+    def test_arquivo_corrompido_reconstroi(self, tmp_path):
+        """Testar que um arquivo ilegível conta como falta."""
+        CachePrecomputo(str(tmp_path), "abc").obter("a", lambda: [1, 2, 3])
+        [arquivo] = tmp_path.iterdir()
+        arquivo.write_bytes(b"\x00corrompido")
+        cache = CachePrecomputo(str(tmp_path), "abc")
+        assert cache.obter("a", lambda: [4]) == [4]
+        assert cache.estatisticas()[0].faltas == 1
+
+    def test_nao_persistir(self, tmp_path):
+        """Testar artefatos só em memória e não serializáveis."""
+        cache = CachePrecomputo(str(tmp_path), "abc")
+        cache.obter("barato", lambda: [1], persistir=False)
+        objeto = cache.obter("objeto", lambda: object())
+        assert cache.obter("objeto", lambda: None) is objeto
+        assert list(tmp_path.iterdir()) == []
+
+    def test_construcao_concorrente(self):
+        """Testar que chamadas simultâneas esperam a mesma construção."""
+        cache = CachePrecomputo()
+        chamadas = []
+
+        def construir():
+            chamadas.append(1)
+            time.sleep(0.05)
+            return [len(chamadas)]
+
+        resultados = []
+        threads = [
+            threading.Thread(
+                target=lambda: resultados.append(cache.obter("a", construir))
+            )
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(chamadas) == 1
+        assert all(r is resultados[0] for r in resultados)
+
+    def test_hash_config(self, monkeypatch):
+        """Testar que editar a configuração muda o hash."""
+        antes = hash_config()
+        monkeypatch.setitem(LOTTERY_CONFIG["Quina"], "range_soma", (150, 250))
+        assert hash_config() != antes
+
+    def test_tabelas_numeros(self):
+        """Testar as tabelas por número e o reaproveitamento entre chamadas."""
+        tabelas = tabelas_numeros("Mega-Sena")
+        assert len(tabelas["par"]) == 61
+        assert tabelas["bits"][5] == 1 << 5
+        assert tabelas["primo"][7] == 1 and tabelas["primo"][9] == 0
+        assert tabelas["fibo"][13] == 1
+        assert tabelas_numeros("Mega-Sena") is tabelas
+
+    def test_contador_com_tabela_carregada(self, tmp_path):
+        """Testar que a tabela lida do disco reproduz contagem e amostragem."""
+        restricoes = Restricoes.de_config(LOTTERY_CONFIG["Quina"])
+
+        original = CachePrecomputo(str(tmp_path), "abc").obter(
+            "q", ContadorCombinacoes(restricoes).preencher
+        )
+        memo = CachePrecomputo(str(tmp_path), "abc").obter("q", dict)
+        assert memo == original
+        carregado = ContadorCombinacoes(restricoes, memo=memo)
+        novo = ContadorCombinacoes(restricoes)
+        assert carregado.total == novo.total
+        assert carregado.amostrar(random.Random(1)) == novo.amostrar(random.Random(1))
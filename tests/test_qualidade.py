@@ -0,0 +1,111 @@
+"""
+Testes unitários para o módulo qualidade.py
+
+Os amostradores rápidos de core.py rodam aqui com sementes fixas contra as
+distribuições exatas das combinações válidas; a bateria completa (mais
+jogos, todas as loterias) roda com: python -m qualidade
+"""
+
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from config import PRIMOS
+from qualidade import (
+    ALFA,
+    avaliar,
+    avaliar_amostra,
+    distribuicoes_exatas,
+    p_valor_qui_quadrado,
+    qui_quadrado_aderencia,
+    qui_quadrado_independencia,
+)
+from viabilidade import Restricoes
+
+
+class TestEstatisticas:
+    """Testes para os testes qui-quadrado."""
+
+    def test_p_valor(self):
+        """Testar valores críticos conhecidos da qui-quadrado."""
+        assert p_valor_qui_quadrado(3.841, 1) == pytest.approx(0.05, abs=1e-4)
+        assert p_valor_qui_quadrado(18.307, 10) == pytest.approx(0.05, abs=1e-4)
+        assert p_valor_qui_quadrado(124.342, 100) == pytest.approx(0.05, abs=1e-4)
+        assert p_valor_qui_quadrado(0.0, 5) == 1.0
+
+    def test_aderencia_junta_classes(self):
+        """Testar classes raras juntas e ocorrência em classe impossível."""
+        r = qui_quadrado_aderencia("t", [1, 0, 50, 49, 0], [1, 1, 50, 47, 1])
+        assert r.graus == 1 and r.aprovado()
+        assert qui_quadrado_aderencia("t", [1, 10], [0, 11]).p_valor == 0.0
+
+    def test_independencia(self):
+        """Testar que dependência forte é detectada e independência não."""
+        rng = random.Random(1)
+        x = [rng.randrange(10) for _ in range(5000)]
+        y = [rng.randrange(10) for _ in range(5000)]
+        assert qui_quadrado_independencia("t", x, y).aprovado()
+        dependente = [v if rng.random() < 0.2 else w for v, w in zip(x, y)]
+        assert not qui_quadrado_independencia("t", x, dependente).aprovado()
+
+
+class TestDistribuicoesExatas:
+    """Testes para distribuicoes_exatas."""
+
+    def test_igual_a_enumeracao(self):
+        """Testar marginais, soma e pares contra a força bruta."""
+        r = Restricoes(
+            max_numero=14,
+            qtd=5,
+            soma=(25, 45),
+            pares=(1, 3),
+            primos=(1, 3),
+            evitar_sequencia=True,
+        )
+        validos = [
+            c
+            for c in combinations(range(1, 15), 5)
+            if 25 <= sum(c) <= 45
+            and 1 <= sum(1 - x % 2 for x in c) <= 3
+            and 1 <= sum(x in PRIMOS for x in c) <= 3
+            and not any(c[i] + 2 == c[i + 2] for i in range(3))
+        ]
+        d = distribuicoes_exatas(r)
+        assert d.total == len(validos)
+        assert d.marginais[1:] == [sum(x in c for c in validos) for x in range(1, 15)]
+        assert d.soma == dict(Counter(map(sum, validos)))
+        assert d.pares == dict(Counter(sum(1 - x % 2 for x in c) for c in validos))
+
+
+class TestAmostradores:
+    """Aderência e independência dos amostradores de core.py."""
+
+    @pytest.mark.parametrize(
+        "tipo,amostrador",
+        [
+            ("Lotofácil", "padrao"),  # sorteio construtivo
+            ("Mega-Sena", "padrao"),  # rejeição
+            ("Lotomania", "padrao"),  # complemento (metade do volante)
+            ("Quina", "ponderado"),
+            ("Dia de Sorte", "mcmc"),
+        ],
+    )
+    def test_sem_vies(self, tipo, amostrador):
+        """Testar o amostrador contra as distribuições exatas."""
+        for resultado in avaliar(tipo, amostrador, 4000, seed=7):
+            assert resultado.aprovado(), resultado
+
+    def test_detecta_vies(self):
+        """Testar que um lote enviesado (sem o número 1) é recusado."""
+        config = Restricoes(max_numero=25, qtd=15, soma=(180, 230), pares=(6, 9))
+        exatas = distribuicoes_exatas(config)
+        rng = random.Random(3)
+        jogos = []
+        while len(jogos) < 3000:
+            jogo = sorted(rng.sample(range(2, 26), 15))
+            if 180 <= sum(jogo) <= 230 and 6 <= sum(1 - x % 2 for x in jogo) <= 9:
+                jogos.append(jogo)
+        resultados = {r.nome: r for r in avaliar_amostra("Lotofácil", jogos, exatas)}
+        assert resultados["marginais"].p_valor < ALFA
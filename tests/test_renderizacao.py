@@ -0,0 +1,80 @@
+"""
+Testes unitários para o módulo renderizacao.py
+"""
+
+import pytest
+
+from core import GeradorLoteria
+from renderizacao import (
+    GRADIENTES,
+    CachePaginas,
+    fragmentos_bolas,
+    modelo_cartao,
+    renderizar_pagina,
+)
+from similaridade import SorteioSemelhante
+
+
+class TestRenderizacao:
+    """Testes para os modelos de cartão e o cache de páginas."""
+
+    def test_fragmentos_bolas(self):
+        """Testar uma bolinha por número, com dois dígitos."""
+        bolas = fragmentos_bolas(60)
+        assert len(bolas) == 61
+        assert bolas[7] == '<span class="bola">07</span>'
+        assert fragmentos_bolas(60) is bolas
+
+    def test_cartao(self):
+        """Testar bolinhas, título, análise e selo do melhor palpite."""
+        modelo = modelo_cartao("Mega-Sena")
+        html = modelo.renderizar(2, [4, 15, 60], "<b>Soma:</b> 79")
+        assert "Jogo #3" in html
+        assert html.count('class="bola"') == 3
+        assert ">04<" in html and ">60<" in html
+        assert "<b>Soma:</b> 79" in html
+        assert "TOP" not in html and "cartao melhor" not in html
+        destaque = modelo.renderizar(0, [1], "", score=87.6)
+        assert "TOP 87%" in destaque and "cartao melhor" in destaque
+        assert GRADIENTES["Mega-Sena"] in modelo.estilo
+
+    def test_pagina(self):
+        """Testar a página com todos os cartões e o sorteio mais parecido."""
+        jogos = GeradorLoteria(seed=1).gerar_jogos("Dia de Sorte", 3)
+        parecido = SorteioSemelhante(120, [1, 2, 3, 4, 5, 6, 7], 4, 6)
+        html, altura = renderizar_pagina(
+            "Dia de Sorte", jogos, [10.0, 50.0, 20.0], 1, [[], [parecido], []], None
+        )
+        assert html.count('class="cartao') == 3
+        assert html.count("TOP 50%") == 1
+        assert "concurso 120 (4 em comum)" in html
+        assert "Mês da Sorte" in html
+        assert altura == modelo_cartao("Dia de Sorte").altura_cartao * 2
+
+    def test_altura_apostas_estendidas(self):
+        """Testar que a altura da página acompanha o maior jogo do lote."""
+        jogos = GeradorLoteria(seed=3).gerar_jogos("Lotofácil", 3)
+        jogos += GeradorLoteria(seed=3).gerar_jogos_estendidos("Lotofácil", 1, 20)
+        _, altura = renderizar_pagina("Lotofácil", jogos, [1.0] * 4, 0, cache=None)
+        modelo = modelo_cartao("Lotofácil")
+        assert modelo.altura(20) > modelo.altura_cartao
+        assert altura == modelo.altura(20) * 2
+
+    def test_cache_por_conteudo(self):
+        """Testar que lotes iguais reaproveitam a página e diferentes não."""
+        cache = CachePaginas(capacidade=2)
+        jogos = GeradorLoteria(seed=2).gerar_jogos("Quina", 4)
+        scores = [1.0, 2.0, 3.0, 4.0]
+        primeira = renderizar_pagina("Quina", jogos, scores, 3, cache=cache)
+        copia = GeradorLoteria(seed=2).gerar_jogos("Quina", 4)
+        assert renderizar_pagina("Quina", copia, scores, 3, cache=cache) is primeira
+        assert (cache.acertos, cache.faltas) == (1, 1)
+        outra = renderizar_pagina("Quina", jogos[:3], scores, 2, cache=cache)
+        assert outra is not primeira
+        renderizar_pagina("Quina", jogos[:2], scores, 1, cache=cache)
+        assert len(cache) == 2
+
+    def test_loteria_desconhecida(self):
+        """Testar erro para loteria inexistente."""
+        with pytest.raises(ValueError):
+            modelo_cartao("LoteriaBogus")
@@ -0,0 +1,95 @@
+"""
+Testes unitários para o módulo selecao.py
+"""
+
+import random
+
+import pytest
+
+from config import LOTTERY_CONFIG
+from core import AnalisadorEstatistico, GeradorLoteria
+from selecao import PontuadorPadrao, selecionar_melhores
+
+
+def soma_como_score(jogo):
+    """Pontuador alternativo: a própria soma do jogo."""
+    return float(jogo.soma)
+
+
+class TestPontuadorPadrao:
+    """Testes para PontuadorPadrao."""
+
+    @pytest.mark.parametrize("tipo", list(LOTTERY_CONFIG))
+    def test_igual_calcular_score_probabilidade(self, tipo):
+        """Testar equivalência com o score de AnalisadorEstatistico."""
+        gerador = GeradorLoteria(seed=11)
+        pontuar = PontuadorPadrao(tipo)
+        config = LOTTERY_CONFIG[tipo]
+        for _ in range(500):
+            # Combinações sem filtro: cobrem também sequências e somas extremas
+            numeros = gerador._gerar_randomico(
+                config["max_numero"], config["qtd_selecionados"]
+            )
+            jogo = gerador.criar_resultado(tipo, numeros)
+            assert pontuar(
+                numeros
+            ) == AnalisadorEstatistico.calcular_score_probabilidade(jogo)
+
+
+class TestSelecionarMelhores:
+    """Testes para selecionar_melhores."""
+
+    def test_scores_ordenados_e_maximos(self):
+        """Testar que os K jogos são os de maior score entre os candidatos."""
+        resultado = selecionar_melhores(
+            "Quina", 10, 3000, seed=1, workers=1, tamanho_bloco=1000
+        )
+        assert len(resultado.jogos) == 10
+        assert resultado.scores == sorted(resultado.scores, reverse=True)
+        assert resultado.blocos == 3
+
+        # Reavaliar todos os candidatos dos três blocos
+        pontuar = PontuadorPadrao("Quina")
+        todos = []
+        for indice in range(3):
+            semente = random.Random(f"1:{indice}").getrandbits(63)
+            gerador = GeradorLoteria(seed=semente)
+            for numeros in gerador.gerar_combinacoes("Quina", 1000):
+                todos.append(pontuar(numeros))
+        assert resultado.scores == sorted(todos, reverse=True)[:10]
+
+    def test_reprodutivel_com_seed(self):
+        """Testar que a mesma seed seleciona os mesmos jogos."""
+        a = selecionar_melhores("Mega-Sena", 5, 2000, seed=7, workers=1)
+        b = selecionar_melhores("Mega-Sena", 5, 2000, seed=7, workers=1)
+        assert [j.numeros for j in a.jogos] == [j.numeros for j in b.jogos]
+
+    def test_independe_de_workers(self):
+        """Testar que o pool de processos seleciona os mesmos jogos."""
+        serial = selecionar_melhores(
+            "Quina", 5, 4000, seed=9, workers=1, tamanho_bloco=1000
+        )
+        paralelo = selecionar_melhores(
+            "Quina", 5, 4000, seed=9, workers=2, tamanho_bloco=1000
+        )
+        assert [j.numeros for j in paralelo.jogos] == [j.numeros for j in serial.jogos]
+
+    def test_pontuador_customizado(self):
+        """Testar seleção com pontuador alternativo."""
+        resultado = selecionar_melhores(
+            "Mega-Sena", 5, 2000, seed=3, workers=1, pontuador=soma_como_score
+        )
+        assert resultado.scores == [float(j.soma) for j in resultado.jogos]
+        assert resultado.scores[0] >= 200
+
+    def test_k_maior_que_candidatos(self):
+        """Testar K maior que a quantidade de candidatos."""
+        resultado = selecionar_melhores("Lotofácil", 50, 20, seed=5, workers=1)
+        assert len(resultado.jogos) == 20
+
+    def test_parametros_invalidos(self):
+        """Testar erros para loteria desconhecida e K não positivo."""
+        with pytest.raises(ValueError):
+            selecionar_melhores("Loteria Inexistente", 5, 100)
+        with pytest.raises(ValueError):
+            selecionar_melhores("Quina", 0, 100)
@@ -0,0 +1,62 @@
+"""
+Testes unitários para o módulo similaridade.py
+"""
+
+import random
+
+import pytest
+
+from similaridade import IndiceHistorico
+
+
+@pytest.fixture
+def historico():
+    """Sorteios aleatórios no formato da Mega-Sena."""
+    rng = random.Random(3)
+    return [sorted(rng.sample(range(1, 61), 6)) for _ in range(500)]
+
+
+class TestIndiceHistorico:
+    """Testes para IndiceHistorico."""
+
+    def test_contagens_iguais_forca_bruta(self, historico):
+        """Testar a contagem bit-sliced contra interseção de conjuntos."""
+        indice = IndiceHistorico(historico)
+        jogo = [5, 10, 23, 33, 41, 60]
+        assert indice.contagens(jogo) == [len(set(jogo) & set(s)) for s in historico]
+
+    def test_mais_proximos_iguais_forca_bruta(self, historico):
+        """Testar que o top-k tem as maiores contagens, empates pelos mais recentes."""
+        indice = IndiceHistorico(historico, range(1001, 1501))
+        rng = random.Random(4)
+        for _ in range(50):
+            jogo = sorted(rng.sample(range(1, 61), 6))
+            esperado = sorted(
+                ((len(set(jogo) & set(s)), i) for i, s in enumerate(historico)),
+                reverse=True,
+            )[:5]
+            obtido = indice.mais_proximos(jogo, k=5)
+            assert [(p.em_comum, p.concurso - 1001) for p in obtido] == esperado
+            assert all(p.distancia == 12 - 2 * p.em_comum for p in obtido)
+
+    def test_sorteio_identico(self, historico):
+        """Testar que um sorteio do histórico encontra a si mesmo."""
+        indice = IndiceHistorico(historico)
+        proximo = indice.mais_proximos(historico[123], k=1)[0]
+        assert proximo.concurso == 124
+        assert proximo.em_comum == 6 and proximo.distancia == 0
+
+    def test_lote(self, historico):
+        """Testar a consulta em lote."""
+        indice = IndiceHistorico(historico)
+        resultados = indice.mais_proximos_lote([historico[0], historico[1]], k=2)
+        assert [len(r) for r in resultados] == [2, 2]
+
+    def test_historico_vazio(self):
+        """Testar consulta sem sorteios."""
+        assert IndiceHistorico([]).mais_proximos([1, 2, 3, 4, 5, 6]) == []
+
+    def test_tamanhos_diferentes(self):
+        """Testar erro para concursos e sorteios desalinhados."""
+        with pytest.raises(ValueError):
+            IndiceHistorico([[1, 2, 3]], concursos=[1, 2])
@@ -0,0 +1,83 @@
+"""
+Testes unitários para o módulo simulador.py
+"""
+
+import pytest
+
+from simulador import media_exata_acertos, simular
+
+JOGOS_QUINA = [[1, 12, 23, 34, 45], [5, 16, 27, 38, 79], [2, 4, 6, 8, 10]]
+
+
+class TestSimulador:
+    """Testes para a simulação Monte Carlo."""
+
+    def test_media_exata_acertos(self):
+        """Testar probabilidade hipergeométrica da sena (1 em 50.063.860)."""
+        assert media_exata_acertos("Mega-Sena", 6, 6) == pytest.approx(1 / 50063860)
+
+    def test_reprodutivel_com_seed(self):
+        """Testar que a mesma seed gera o mesmo resultado."""
+        a = simular("Quina", JOGOS_QUINA, 6000, seed=1, workers=1, tamanho_bloco=2000)
+        b = simular("Quina", JOGOS_QUINA, 6000, seed=1, workers=1, tamanho_bloco=2000)
+        assert a.faixas == b.faixas
+        assert a.sorteios == 6000
+        assert not a.convergiu
+
+    def test_estimativa_proxima_da_exata(self):
+        """Testar que a média simulada do duque fica perto da exata."""
+        resultado = simular("Quina", JOGOS_QUINA, 20000, seed=2, workers=1)
+        duque = next(f for f in resultado.faixas if f.acertos == 2)
+        assert duque.media_por_sorteio == pytest.approx(duque.media_exata, rel=0.1)
+        assert duque.intervalo[0] <= duque.media_por_sorteio <= duque.intervalo[1]
+
+    def test_parada_antecipada(self):
+        """Testar que a simulação para ao atingir a precisão."""
+        resultado = simular(
+            "Lotofácil",
+            [list(range(1, 16))],
+            sorteios_max=100_000,
+            precisao=0.5,
+            seed=3,
+            workers=1,
+            tamanho_bloco=1000,
+        )
+        assert resultado.convergiu
+        assert resultado.sorteios < 100_000
+        assert resultado.blocos == resultado.sorteios // 1000
+
+    def test_pool_igual_ao_processo_atual(self):
+        """Testar que o pool dá o resultado de um processo só e para antes
+        de simular todos os blocos."""
+        argumentos = ("Lotofácil", [list(range(1, 16))])
+        opcoes = {"sorteios_max": 200_000, "precisao": 0.5, "seed": 3}
+        serial = simular(*argumentos, workers=1, **opcoes)
+        paralelo = simular(*argumentos, workers=2, **opcoes)
+        assert paralelo.faixas == serial.faixas
+        assert paralelo.convergiu and paralelo.sorteios < 200_000
+
+    def test_retorno_esperado(self):
+        """Testar retorno esperado com prêmio fixo em uma faixa."""
+        resultado = simular(
+            "Quina", JOGOS_QUINA, 5000, seed=4, workers=1, premios={2: 1.0}
+        )
+        duque = next(f for f in resultado.faixas if f.acertos == 2)
+        assert resultado.retorno_esperado == pytest.approx(duque.media_por_sorteio)
+
+    def test_dois_sorteios_por_concurso(self):
+        """Testar que a Dupla Sena soma os acertos dos dois sorteios."""
+        resultado = simular(
+            "Dupla Sena", [[1, 12, 23, 34, 45, 50]], 20000, seed=5, workers=1
+        )
+        terno = next(f for f in resultado.faixas if f.acertos == 3)
+        assert terno.media_exata == pytest.approx(
+            2 * media_exata_acertos("Dupla Sena", 6, 3)
+        )
+        assert terno.media_por_sorteio == pytest.approx(terno.media_exata, rel=0.15)
+
+    def test_erros(self):
+        """Testar erros com loteria inválida e conjunto vazio."""
+        with pytest.raises(ValueError):
+            simular("LoteriaBogus", JOGOS_QUINA)
+        with pytest.raises(ValueError):
+            simular("Quina", [])
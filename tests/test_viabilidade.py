@@ -0,0 +1,167 @@
+"""
+Testes unitários para o módulo viabilidade.py
+"""
+
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from config import FIBONACCI, LOTTERY_CONFIG, PRIMOS
+from core import AnalisadorEstatistico, GeradorLoteria
+from precomputo import cache_padrao
+from viabilidade import (
+    MAX_CONTADORES_AVULSOS,
+    ContadorCombinacoes,
+    Restricoes,
+    analisar,
+    contador,
+)
+
+
+def _aceita(r: Restricoes, jogo) -> bool:
+    """Validação direta das restrições (referência para a contagem)."""
+    faixas = [
+        (r.soma, sum(jogo)),
+        (r.pares, sum(1 for x in jogo if x % 2 == 0)),
+        (r.primos, sum(1 for x in jogo if x in PRIMOS)),
+        (r.fibo, sum(1 for x in jogo if x in FIBONACCI)),
+    ]
+    if any(f is not None and not f[0] <= v <= f[1] for f, v in faixas):
+        return False
+    return not (
+        r.evitar_sequencia
+        and AnalisadorEstatistico.tem_sequencia_consecutiva(list(jogo), 3)
+    )
+
+
+RESTRICOES = [
+    Restricoes(max_numero=20, qtd=5, soma=(40, 60), pares=(1, 3)),
+    Restricoes(max_numero=18, qtd=6, soma=(50, 70), primos=(2, 3), fibo=(1, 3)),
+    Restricoes(max_numero=16, qtd=5, pares=(2, 3), evitar_sequencia=True),
+    Restricoes(max_numero=12, qtd=4),
+]
+
+
+class TestContadorCombinacoes:
+    """Testes para ContadorCombinacoes."""
+
+    @pytest.mark.parametrize("restricoes", RESTRICOES)
+    def test_contagem_igual_forca_bruta(self, restricoes):
+        """Testar a contagem contra a enumeração de todas as combinações."""
+        esperado = sum(
+            _aceita(restricoes, c)
+            for c in combinations(range(1, restricoes.max_numero + 1), restricoes.qtd)
+        )
+        assert ContadorCombinacoes(restricoes).total == esperado
+
+    def test_amostragem_uniforme_entre_validas(self):
+        """Testar que o sorteio construtivo só produz combinações válidas e
+        cobre todas com frequências parecidas."""
+        restricoes = Restricoes(max_numero=10, qtd=3, soma=(12, 16), pares=(1, 2))
+        contador = ContadorCombinacoes(restricoes)
+        rng = random.Random(42)
+        amostras = Counter(tuple(contador.amostrar(rng)) for _ in range(20000))
+        assert all(_aceita(restricoes, c) for c in amostras)
+        assert len(amostras) == contador.total
+        esperado = 20000 / contador.total
+        assert all(abs(c - esperado) < 0.25 * esperado for c in amostras.values())
+
+    @pytest.mark.parametrize("restricoes", RESTRICOES)
+    def test_decodificar_percorre_todas_as_validas(self, restricoes):
+        """Testar que as posições 0..total-1 decodificam cada válida uma vez."""
+        contador = ContadorCombinacoes(restricoes)
+        validas = [
+            c
+            for c in combinations(range(1, restricoes.max_numero + 1), restricoes.qtd)
+            if _aceita(restricoes, c)
+        ]
+        decodificadas = [tuple(contador.decodificar(i)) for i in range(contador.total)]
+        assert sorted(decodificadas) == validas
+        with pytest.raises(ValueError):
+            contador.decodificar(contador.total)
+
+    def test_preencher_reaproveitado(self):
+        """Testar que a tabela preenchida dispensa nova contagem."""
+        restricoes = RESTRICOES[0]
+        memo = ContadorCombinacoes(restricoes).preencher()
+        copia = ContadorCombinacoes(restricoes, memo=dict(memo))
+        assert copia.total == ContadorCombinacoes(restricoes).total
+        assert copia.estados == len(memo)
+
+    def test_amostrar_inviavel(self):
+        """Testar erro ao sortear sem combinações válidas."""
+        contador = ContadorCombinacoes(Restricoes(max_numero=10, qtd=3, soma=(1, 5)))
+        assert contador.total == 0
+        with pytest.raises(ValueError):
+            contador.amostrar(random.Random(0))
+
+
+class TestAnalisar:
+    """Testes para analisar e a integração com GeradorLoteria."""
+
+    @pytest.mark.parametrize("tipo", list(LOTTERY_CONFIG))
+    def test_configuracoes_atuais_viaveis(self, tipo):
+        """Testar que as loterias configuradas aceitam combinações."""
+        v = analisar(tipo)
+        assert v.viavel
+        assert 0 < v.taxa_aceitacao <= 1
+        assert v.estrategia in ("rejeicao", "construtiva")
+
+    def test_configuracao_inviavel(self):
+        """Testar rejeição de faixa de soma impossível."""
+        config = {**LOTTERY_CONFIG["Mega-Sena"], "range_soma": (400, 500)}
+        with pytest.raises(ValueError, match="inviável"):
+            analisar("Mega-Sena", config)
+
+    def test_faixa_invertida(self):
+        """Testar rejeição de faixa com mínimo maior que o máximo."""
+        config = {**LOTTERY_CONFIG["Quina"], "range_pares": (4, 1)}
+        with pytest.raises(ValueError, match="range_pares"):
+            analisar("Quina", config)
+
+    def test_estrategia_construtiva_com_baixa_aceitacao(self):
+        """Testar a troca para sorteio construtivo quando a rejeição é cara."""
+        config = {**LOTTERY_CONFIG["Mega-Sena"], "range_soma": (21, 40)}
+        v = analisar("Mega-Sena", config)
+        assert v.tentativas_esperadas > 1000
+        assert v.estrategia == "construtiva"
+
+    def test_gerar_jogos_config_inviavel(self, monkeypatch):
+        """Testar que gerar_jogos recusa configuração inviável em vez de
+        devolver uma lista curta."""
+        config = {**LOTTERY_CONFIG["Quina"], "range_soma": (5, 10)}
+        monkeypatch.setitem(LOTTERY_CONFIG, "Quina", config)
+        with pytest.raises(ValueError):
+            GeradorLoteria(seed=1).gerar_jogos("Quina", 3)
+
+    def test_gerar_jogos_baixa_aceitacao_completo(self, monkeypatch):
+        """Testar que uma configuração apertada ainda gera todos os jogos."""
+        config = {**LOTTERY_CONFIG["Mega-Sena"], "range_soma": (21, 30)}
+        monkeypatch.setitem(LOTTERY_CONFIG, "Mega-Sena", config)
+        jogos = GeradorLoteria(seed=1).gerar_jogos("Mega-Sena", 20)
+        assert len(jogos) == 20
+        assert all(21 <= j.soma <= 30 for j in jogos)
+
+    def test_contadores_avulsos_limitados(self):
+        """Testar que restrições fora de LOTTERY_CONFIG não vão ao cache de
+        pré-cálculo e só as mais recentes ficam em memória."""
+        avulsas = [
+            Restricoes(max_numero=20, qtd=5, soma=(40, 40 + i))
+            for i in range(MAX_CONTADORES_AVULSOS + 2)
+        ]
+        contadores = [contador(r) for r in avulsas]
+        assert contador(avulsas[-1]) is contadores[-1]
+        assert contador(avulsas[0]) is not contadores[0]
+        assert not any(f"contagem:{r!r}" in cache_padrao()._memoria for r in avulsas)
+
+    def test_contagem_informada(self):
+        """Testar analisar com a contagem já conhecida (sem contar de novo)."""
+        config = {**LOTTERY_CONFIG["Quina"], "range_soma": (100, 250)}
+        v = analisar("Quina", config)
+        informada = analisar("Quina", config, validas=v.combinacoes_validas)
+        assert informada.to_dict() == v.to_dict()
+        assert informada.contador.total == v.combinacoes_validas
+        with pytest.raises(ValueError, match="inviável"):
+            analisar("Quina", config, validas=0)
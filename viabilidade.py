@@ -0,0 +1,418 @@
+"""
+Viabilidade das restrições de LOTTERY_CONFIG: contagem exata das combinações
+aceitas, taxa de aceitação e escolha da estratégia de amostragem.
+
+Verifique a configuração com: python -m viabilidade [loteria ...]
+"""
+
+import random
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from math import comb
+from typing import Dict, List, Optional, Tuple
+
+from config import FIBONACCI, LOTTERY_CONFIG, PRIMOS
+from precomputo import cache_padrao
+
+# Custo de uma tentativa de rejeição, por número do jogo, relativo a um passo
+# da amostragem construtiva (que dá um passo por número do volante). Medido:
+# a rejeição custa ~tentativas * qtd * 1.3 passos e a construtiva ~max_numero.
+CUSTO_TENTATIVA = 1.3
+
+# Contadores de restrições fora de LOTTERY_CONFIG (ex.: faixas ajustadas no
+# app) ficam só em memória, e só os mais recentes
+MAX_CONTADORES_AVULSOS = 4
+
+Faixa = Optional[Tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class Restricoes:
+    """Restrições de uma loteria, na forma hasheável usada pela contagem."""
+
+    max_numero: int
+    qtd: int
+    soma: Faixa = None
+    pares: Faixa = None
+    primos: Faixa = None
+    fibo: Faixa = None
+    evitar_sequencia: bool = False
+
+    @classmethod
+    def de_config(cls, config: dict) -> "Restricoes":
+        """
+        Extrair as restrições de uma entrada de LOTTERY_CONFIG.
+
+        Args:
+            config: Configuração da loteria.
+
+        Returns:
+            Restricoes equivalentes.
+        """
+        return cls(
+            max_numero=config["max_numero"],
+            qtd=config["qtd_selecionados"],
+            soma=config.get("range_soma"),
+            pares=config.get("range_pares"),
+            primos=config.get("range_primos"),
+            fibo=config.get("range_fibo"),
+            evitar_sequencia=config.get("evitar_sequencia", False),
+        )
+
+    def erros(self) -> List[str]:
+        """Inconsistências que dispensam a contagem (faixas invertidas etc.)."""
+        erros = []
+        if not 0 < self.qtd <= self.max_numero:
+            erros.append(
+                f"qtd_selecionados={self.qtd} fora de 1..max_numero={self.max_numero}"
+            )
+        for nome in ("soma", "pares", "primos", "fibo"):
+            faixa = getattr(self, nome)
+            if faixa is not None and faixa[0] > faixa[1]:
+                erros.append(f"range_{nome}={faixa} com mínimo maior que o máximo")
+        return erros
+
+
+class ContadorCombinacoes:
+    """
+    Contagem exata das combinações que atendem às restrições.
+
+    Programação dinâmica sobre os números 1..max_numero: o estado guarda
+    quantos números já foram escolhidos e os acumuladores restritos (soma,
+    pares, primos, Fibonacci e o tamanho da sequência em curso). Dimensões
+    sem restrição ficam fora do estado. A tabela de completamentos também
+    serve para sortear combinações válidas de forma uniforme.
+    """
+
+    def __init__(self, restricoes: Restricoes, memo: Optional[Dict[tuple, int]] = None):
+        """
+        Montar o contador (a contagem é feita sob demanda e memorizada).
+
+        Args:
+            restricoes: Restrições da loteria.
+            memo: Tabela de completamentos já calculada para as mesmas
+                restrições (ex.: carregada do cache de pré-cálculo).
+        """
+        self.restricoes = restricoes
+        r = restricoes
+        n = r.max_numero
+        self._memo: Dict[tuple, int] = {} if memo is None else memo
+        self._soma = r.soma
+        self._pares = r.pares or (0, r.qtd)
+        self._primos = r.primos or (0, r.qtd)
+        self._fibo = r.fibo or (0, r.qtd)
+        # Incremento de cada acumulador ao escolher x (0 se não restrito)
+        self._d_par = [int(r.pares is not None and x % 2 == 0) for x in range(n + 1)]
+        self._d_primo = [
+            int(r.primos is not None and x in PRIMOS) for x in range(n + 1)
+        ]
+        self._d_fibo = [
+            int(r.fibo is not None and x in FIBONACCI) for x in range(n + 1)
+        ]
+
+    def _completar(
+        self, x: int, k: int, soma: int, pares: int, primos: int, fibo: int, seq: int
+    ) -> int:
+        """Quantidade de formas de completar o estado usando os números x..max."""
+        r = self.restricoes
+        n = r.max_numero
+        faltam = r.qtd - k
+        # Poda: números insuficientes ou soma fora de alcance
+        if faltam > n - x + 1:
+            return 0
+        if self._soma is not None:
+            minima = soma + faltam * x + faltam * (faltam - 1) // 2
+            maxima = soma + faltam * n - faltam * (faltam - 1) // 2
+            if minima > self._soma[1] or maxima < self._soma[0]:
+                return 0
+        if faltam == 0:
+            return int(
+                self._pares[0] <= pares <= self._pares[1]
+                and self._primos[0] <= primos <= self._primos[1]
+                and self._fibo[0] <= fibo <= self._fibo[1]
+            )
+        if (
+            pares + faltam < self._pares[0]
+            or primos + faltam < self._primos[0]
+            or fibo + faltam < self._fibo[0]
+        ):
+            return 0
+
+        chave = (x, k, soma, pares, primos, fibo, seq)
+        total = self._memo.get(chave)
+        if total is not None:
+            return total
+
+        total = self._completar(x + 1, k, soma, pares, primos, fibo, 0)
+        p, q, f = (
+            pares + self._d_par[x],
+            primos + self._d_primo[x],
+            fibo + self._d_fibo[x],
+        )
+        if (
+            p <= self._pares[1]
+            and q <= self._primos[1]
+            and f <= self._fibo[1]
+            and not (r.evitar_sequencia and seq == 2)
+        ):
+            proxima = seq + 1 if r.evitar_sequencia else 0
+            # Soma fora do estado quando não é restrita
+            s = soma + x if self._soma is not None else 0
+            total += self._completar(x + 1, k + 1, s, p, q, f, proxima)
+        self._memo[chave] = total
+        return total
+
+    @property
+    def total(self) -> int:
+        """Quantidade de combinações que atendem às restrições."""
+        return self._completar(1, 0, 0, 0, 0, 0, 0)
+
+    def preencher(self) -> Dict[tuple, int]:
+        """
+        Fazer a contagem completa e devolver a tabela de completamentos
+        (usada pela contagem e pela amostragem; ver o parâmetro memo).
+        """
+        self._completar(1, 0, 0, 0, 0, 0, 0)
+        return self._memo
+
+    @property
+    def estados(self) -> int:
+        """Tamanho da tabela memorizada (custo de memória da contagem)."""
+        return len(self._memo)
+
+    def amostrar(self, rng: random.Random) -> List[int]:
+        """
+        Sortear uma combinação válida com probabilidade uniforme.
+
+        Um único número aleatório em 0..total-1 é decodificado percorrendo a
+        tabela de completamentos (ver decodificar).
+
+        Args:
+            rng: Gerador aleatório.
+
+        Returns:
+            Lista de números ordenada.
+
+        Raises:
+            ValueError: Se nenhuma combinação atender às restrições.
+        """
+        total = self.total
+        if total == 0:
+            raise ValueError("Nenhuma combinação atende às restrições")
+        return self.decodificar(rng.randrange(total))
+
+    def decodificar(self, indice: int) -> List[int]:
+        """
+        Combinação válida de uma posição 0..total-1, um passo por número do
+        volante. Cada posição dá uma combinação diferente (as que não usam
+        um número vêm antes das que usam).
+
+        Args:
+            indice: Posição da combinação entre as válidas.
+
+        Returns:
+            Lista de números ordenada.
+
+        Raises:
+            ValueError: Se a posição estiver fora de 0..total-1.
+        """
+        if not 0 <= indice < self.total:
+            raise ValueError(f"Posição fora de 0..{self.total - 1}: {indice}")
+        r = self.restricoes
+        alvo = indice
+        numeros: List[int] = []
+        soma = pares = primos = fibo = seq = 0
+        memo = self._memo
+        for x in range(1, r.max_numero + 1):
+            k = len(numeros)
+            if k == r.qtd:
+                break
+            # Estados podados não ficam na tabela: só esses pagam a chamada
+            sem_x = memo.get((x + 1, k, soma, pares, primos, fibo, 0))
+            if sem_x is None:
+                sem_x = self._completar(x + 1, k, soma, pares, primos, fibo, 0)
+            if alvo < sem_x:
+                seq = 0
+                continue
+            alvo -= sem_x
+            numeros.append(x)
+            if self._soma is not None:
+                soma += x
+            pares += self._d_par[x]
+            primos += self._d_primo[x]
+            fibo += self._d_fibo[x]
+            seq = seq + 1 if r.evitar_sequencia else 0
+        return numeros
+
+
+@dataclass
+class Viabilidade:
+    """Resultado da verificação de uma loteria configurada."""
+
+    tipo: str
+    total_combinacoes: int
+    combinacoes_validas: int
+    taxa_aceitacao: float
+    tentativas_esperadas: float
+    estrategia: str  # "rejeicao" ou "construtiva"
+    restricoes: Restricoes
+
+    @property
+    def contador(self) -> ContadorCombinacoes:
+        """Contador das restrições (a contagem é feita no primeiro acesso)."""
+        return contador(self.restricoes)
+
+    @property
+    def viavel(self) -> bool:
+        """Indica se existe ao menos uma combinação válida."""
+        return self.combinacoes_validas > 0
+
+    def to_dict(self) -> dict:
+        """Converter para dicionário (compatível com pandas.DataFrame)."""
+        return {
+            "tipo": self.tipo,
+            "total_combinacoes": self.total_combinacoes,
+            "combinacoes_validas": self.combinacoes_validas,
+            "taxa_aceitacao": self.taxa_aceitacao,
+            "tentativas_esperadas": self.tentativas_esperadas,
+            "estrategia": self.estrategia,
+        }
+
+
+def contador(restricoes: Restricoes) -> ContadorCombinacoes:
+    """
+    Contador memorizado por conjunto de restrições.
+
+    Restrições de uma loteria de LOTTERY_CONFIG têm a tabela de
+    completamentos no cache de pré-cálculo: montada na primeira vez e lida
+    do disco nas execuções seguintes. As demais (ajustes avulsos) são
+    contadas em memória e só as MAX_CONTADORES_AVULSOS mais recentes ficam
+    guardadas.
+    """
+    if any(Restricoes.de_config(c) == restricoes for c in LOTTERY_CONFIG.values()):
+        return _contador_configurado(restricoes)
+    return _contador_avulso(restricoes)
+
+
+@lru_cache(maxsize=None)
+def _contador_configurado(restricoes: Restricoes) -> ContadorCombinacoes:
+    """Contador de restrições configuradas (tabela no cache de pré-cálculo)."""
+
+    def construir() -> Dict[tuple, int]:
+        return ContadorCombinacoes(restricoes).preencher()
+
+    memo = cache_padrao().obter(f"contagem:{restricoes!r}", construir)
+    return ContadorCombinacoes(restricoes, memo=memo)
+
+
+@lru_cache(maxsize=MAX_CONTADORES_AVULSOS)
+def _contador_avulso(restricoes: Restricoes) -> ContadorCombinacoes:
+    """Contador de restrições avulsas (só em memória)."""
+    cont = ContadorCombinacoes(restricoes)
+    cont.preencher()
+    return cont
+
+
+def analisar(
+    tipo: str, config: Optional[dict] = None, validas: Optional[int] = None
+) -> Viabilidade:
+    """
+    Contar as combinações aceitas por uma loteria e escolher a amostragem.
+
+    A contagem é memorizada pelas restrições, então só a primeira chamada
+    (por configuração) paga o custo.
+
+    Args:
+        tipo: Tipo de loteria.
+        config: Configuração a analisar (padrão: LOTTERY_CONFIG[tipo]).
+        validas: Contagem já conhecida das combinações aceitas (ex.:
+            faixas.estimar); dispensa a contagem, e o contador só é montado
+            se for usado.
+
+    Returns:
+        Viabilidade com contagem, taxa de aceitação e estratégia.
+
+    Raises:
+        ValueError: Se tipo de loteria não for reconhecido ou se a
+            configuração for inconsistente ou não aceitar nenhuma combinação.
+    """
+    if config is None:
+        if tipo not in LOTTERY_CONFIG:
+            raise ValueError(f"Tipo de loteria desconhecido: {tipo}")
+        config = LOTTERY_CONFIG[tipo]
+
+    restricoes = Restricoes.de_config(config)
+    erros = restricoes.erros()
+    if erros:
+        raise ValueError(f"Configuração inválida para {tipo}: {'; '.join(erros)}")
+
+    if validas is None:
+        validas = contador(restricoes).total
+    if validas == 0:
+        raise ValueError(
+            f"Configuração inviável para {tipo}: nenhuma combinação atende às "
+            "restrições"
+        )
+
+    total = comb(restricoes.max_numero, restricoes.qtd)
+    taxa = validas / total
+    return Viabilidade(
+        tipo=tipo,
+        total_combinacoes=total,
+        combinacoes_validas=validas,
+        taxa_aceitacao=taxa,
+        tentativas_esperadas=1 / taxa,
+        estrategia=escolher_estrategia(restricoes, taxa),
+        restricoes=restricoes,
+    )
+
+
+def escolher_estrategia(restricoes: Restricoes, taxa: float) -> str:
+    """
+    Amostragem mais barata para uma taxa de aceitação.
+
+    Args:
+        restricoes: Restrições da loteria.
+        taxa: Fração das combinações aceitas (maior que 0).
+
+    Returns:
+        "rejeicao" ou "construtiva".
+    """
+    custo_rejeicao = restricoes.qtd * CUSTO_TENTATIVA / taxa
+    return "construtiva" if custo_rejeicao > restricoes.max_numero else "rejeicao"
+
+
+def validar_configuracoes() -> Dict[str, Viabilidade]:
+    """
+    Verificar todas as loterias de LOTTERY_CONFIG.
+
+    Returns:
+        Dicionário tipo -> Viabilidade.
+
+    Raises:
+        ValueError: Na primeira loteria inviável ou inconsistente.
+    """
+    return {tipo: analisar(tipo) for tipo in LOTTERY_CONFIG}
+
+
+def main(argv: List[str]) -> int:
+    tipos = argv or list(LOTTERY_CONFIG)
+    print(f"{'loteria':12} {'válidas':>12} {'total':>12} {'aceitação':>10} estratégia")
+    falhas = 0
+    for tipo in tipos:
+        try:
+            v = analisar(tipo)
+        except ValueError as e:
+            print(f"{tipo:12} ERRO: {e}")
+            falhas += 1
+            continue
+        print(
+            f"{tipo:12} {v.combinacoes_validas:>12} {v.total_combinacoes:>12} "
+            f"{v.taxa_aceitacao:>10.2%} {v.estrategia}"
+        )
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))